@@ -10,7 +10,75 @@ from .app import (
     joback_calc,
     joback_prop_calc,
     joback_heat_capacity_calc,
-    zabransky_ruzicka_calc
+    joback_liquid_viscosity_calc,
+    zabransky_ruzicka_calc,
+    joback_batch_calc,
+    joback_batch_screen,
+    zabransky_ruzicka_batch_calc,
+    zabransky_ruzicka_batch_screen,
+    joback_ideal_gas_calc,
+    joback_ideal_gas_batch_calc,
+    zabransky_ruzicka_liquid_calc,
+    joback_uncertainty,
+    zabransky_ruzicka_uncertainty,
+    joback_regression,
+    zabransky_ruzicka_regression
+)
+
+from .core import (
+    ParallelEstimator,
+    ShardingPolicy,
+    FixedSizeSharding,
+    EvenSharding,
+    set_kernel_backend,
+    kernel_backend
+)
+
+from .util import (
+    record_stages,
+    add_stage_callback,
+    remove_stage_callback,
+    StageRecorder
+)
+
+from .export import (
+    to_arrow_table,
+    write_parquet,
+    ParquetBatchWriter
+)
+
+from .ingest import (
+    load_group_counts,
+    read_wide,
+    read_long
+)
+
+from .tabulate import (
+    tabulate,
+    TabulatedProperties
+)
+
+from .jobs import (
+    run_job,
+    JobStore,
+    CheckpointMismatch
+)
+
+from .models import GridSpec, AntoineVaporPressureBatch
+
+from .aio import (
+    configure_async,
+    ajoback_calc,
+    ajoback_prop_calc,
+    ajoback_heat_capacity_calc,
+    ajoback_liquid_viscosity_calc,
+    ajoback_batch_calc,
+    azabransky_ruzicka_calc,
+    azabransky_ruzicka_batch_calc,
+    aestimate_coefficients,
+    aestimate_coefficients_from_experimental_data,
+    acalc_vapor_pressure,
+    afit_antoine_many
 )
 
 __all__ = [
@@ -24,5 +92,60 @@ __all__ = [
     "joback_calc",
     "joback_prop_calc",
     "joback_heat_capacity_calc",
+    "joback_liquid_viscosity_calc",
     "zabransky_ruzicka_calc",
+    "joback_batch_calc",
+    "joback_batch_screen",
+    "zabransky_ruzicka_batch_calc",
+    "zabransky_ruzicka_batch_screen",
+    "joback_ideal_gas_calc",
+    "joback_ideal_gas_batch_calc",
+    "zabransky_ruzicka_liquid_calc",
+    "joback_uncertainty",
+    "zabransky_ruzicka_uncertainty",
+    "joback_regression",
+    "zabransky_ruzicka_regression",
+    # parallel
+    "ParallelEstimator",
+    "ShardingPolicy",
+    "FixedSizeSharding",
+    "EvenSharding",
+    # compiled kernels
+    "set_kernel_backend",
+    "kernel_backend",
+    # instrumentation
+    "record_stages",
+    "add_stage_callback",
+    "remove_stage_callback",
+    "StageRecorder",
+    # export
+    "to_arrow_table",
+    "write_parquet",
+    "ParquetBatchWriter",
+    # ingestion
+    "load_group_counts",
+    "read_wide",
+    "read_long",
+    # tabulation
+    "tabulate",
+    "TabulatedProperties",
+    # checkpointed jobs
+    "run_job",
+    "JobStore",
+    "CheckpointMismatch",
+    "GridSpec",
+    "AntoineVaporPressureBatch",
+    # asyncio
+    "configure_async",
+    "ajoback_calc",
+    "ajoback_prop_calc",
+    "ajoback_heat_capacity_calc",
+    "ajoback_liquid_viscosity_calc",
+    "ajoback_batch_calc",
+    "azabransky_ruzicka_calc",
+    "azabransky_ruzicka_batch_calc",
+    "aestimate_coefficients",
+    "aestimate_coefficients_from_experimental_data",
+    "acalc_vapor_pressure",
+    "afit_antoine_many",
 ]
@@ -0,0 +1,269 @@
+# import libs
+import asyncio
+import functools
+import logging
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar
+import numpy as np
+# locals
+from .app import (
+    joback_calc,
+    joback_prop_calc,
+    joback_heat_capacity_calc,
+    joback_liquid_viscosity_calc,
+    joback_batch_calc,
+    zabransky_ruzicka_calc,
+    zabransky_ruzicka_batch_calc,
+)
+from .docs.antoine import (
+    estimate_coefficients,
+    estimate_coefficients_from_experimental_data,
+    calc_vapor_pressure,
+    fit_antoine_many,
+)
+from .models.antoine import AntoineFitResult
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRunner:
+    '''
+    Managed executor used by the asyncio API.
+
+    - Blocking calls are offloaded to a worker pool so the event loop stays responsive.
+    - At most `max_concurrency` calls run or wait in the pool at once; further calls wait on the event loop without occupying a worker.
+    - Cancelling the awaiting task cancels work that has not started yet; a call already running in a worker finishes and its result is discarded.
+    '''
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        '''
+        Initializes the runner.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Worker threads of the managed pool, by default None (executor default).
+        max_concurrency : int, optional
+            Maximum calls submitted at once, by default None (same as the pool size).
+        executor : Executor, optional
+            External executor to use instead of the managed thread pool; it is not shut down by `close()`.
+        '''
+        # NOTE: check inputs
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive.")
+
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+
+        # NOTE: one semaphore per event loop
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"AsyncRunner(max_workers={self.max_workers}, max_concurrency={self.max_concurrency})"
+
+    @property
+    def executor(self) -> Executor:
+        '''
+        Returns the executor, creating the managed pool on first use.
+        '''
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="pythermoest-aio",
+                )
+            return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        '''
+        Returns the concurrency cap of the running event loop.
+        '''
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sem = self._semaphores.get(loop)
+            if sem is None:
+                limit = self.max_concurrency
+                if limit is None:
+                    limit = getattr(self.executor, "_max_workers", None) or 32
+                sem = asyncio.Semaphore(limit)
+                self._semaphores[loop] = sem
+            return sem
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        '''
+        Runs a blocking call in the executor under the concurrency cap.
+
+        Parameters
+        ----------
+        fn : Callable[..., T]
+            Blocking function.
+        *args, **kwargs : Any
+            Arguments forwarded to `fn`.
+
+        Returns
+        -------
+        T
+            Result of `fn`.
+        '''
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            # ! cancelling the awaiting task cancels the pool future if it has not started
+            return await loop.run_in_executor(
+                self.executor,
+                functools.partial(fn, *args, **kwargs)
+            )
+
+    def close(self, wait: bool = True) -> None:
+        '''
+        Shuts down the managed pool and cancels queued work.
+        '''
+        with self._lock:
+            if self._executor is not None and self._owns_executor:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+            self._semaphores = weakref.WeakKeyDictionary()
+
+
+# NOTE: default runner
+_runner = AsyncRunner()
+
+
+def configure_async(
+    max_workers: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncRunner:
+    '''
+    Replaces the runner used by the asyncio API.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Worker threads of the managed pool, by default None.
+    max_concurrency : int, optional
+        Maximum calls submitted at once, by default None.
+    executor : Executor, optional
+        External executor to use instead of the managed thread pool.
+
+    Returns
+    -------
+    AsyncRunner
+        The new default runner.
+    '''
+    global _runner
+    old = _runner
+    _runner = AsyncRunner(
+        max_workers=max_workers,
+        max_concurrency=max_concurrency,
+        executor=executor,
+    )
+    old.close(wait=False)
+    return _runner
+
+
+def get_async_runner() -> AsyncRunner:
+    '''
+    Returns the runner used by the asyncio API.
+    '''
+    return _runner
+
+
+def _to_async(fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    '''
+    Builds the asyncio counterpart of a blocking API function.
+    '''
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await _runner.run(fn, *args, **kwargs)
+
+    wrapper.__name__ = f"a{fn.__name__}"
+    wrapper.__qualname__ = wrapper.__name__
+    wrapper.__doc__ = (
+        f"Asynchronous counterpart of `{fn.__name__}`, run in the managed executor; "
+        f"same parameters and return type.\n\n{fn.__doc__ or ''}"
+    )
+    return wrapper
+
+
+# SECTION: Joback / Zabransky-Ruzicka
+ajoback_calc = _to_async(joback_calc)
+ajoback_prop_calc = _to_async(joback_prop_calc)
+ajoback_heat_capacity_calc = _to_async(joback_heat_capacity_calc)
+ajoback_liquid_viscosity_calc = _to_async(joback_liquid_viscosity_calc)
+ajoback_batch_calc = _to_async(joback_batch_calc)
+azabransky_ruzicka_calc = _to_async(zabransky_ruzicka_calc)
+azabransky_ruzicka_batch_calc = _to_async(zabransky_ruzicka_batch_calc)
+
+# SECTION: Antoine
+aestimate_coefficients = _to_async(estimate_coefficients)
+aestimate_coefficients_from_experimental_data = _to_async(
+    estimate_coefficients_from_experimental_data
+)
+acalc_vapor_pressure = _to_async(calc_vapor_pressure)
+
+
+async def afit_antoine_many(
+    datasets: List[Tuple[np.ndarray, np.ndarray]],
+    *,
+    chunk_size: int = 8,
+    **fit_options: Any,
+) -> List[Optional[AntoineFitResult]]:
+    """
+    Asynchronous counterpart of `fit_antoine_many`.
+
+    Datasets are split into chunks that run concurrently in the managed executor, subject to its concurrency cap. Cancelling the call cancels every chunk that has not started.
+
+    Parameters
+    ----------
+    datasets : List[Tuple[np.ndarray, np.ndarray]]
+        List of (temperatures, pressures) array pairs in K and Pa.
+    chunk_size : int, optional
+        Datasets per executor call, by default 8.
+    **fit_options : Any
+        Keyword options forwarded to `fit_antoine_many`.
+
+    Returns
+    -------
+    List[Optional[AntoineFitResult]]
+        One AntoineFitResult per dataset in input order, None where the fit failed.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+
+    chunks = [
+        datasets[i:i + chunk_size]
+        for i in range(0, len(datasets), chunk_size)
+    ]
+    tasks = [
+        asyncio.ensure_future(_runner.run(fit_antoine_many, chunk, **fit_options))
+        for chunk in chunks
+    ]
+
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # NOTE: propagate cancellation/failure to the remaining chunks
+        for task in tasks:
+            task.cancel()
+        raise
+
+    return [res for chunk_res in results for res in chunk_res]
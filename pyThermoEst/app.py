@@ -1,6 +1,7 @@
 # import libs
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+import numpy as np
 # locals
 from .models import (
     JobackGroupContributions,
@@ -8,9 +9,31 @@ from .models import (
     ZabranskyRuzickaGroupContributionsCorrections,
     EstimatedProp,
     JobackProp,
-    JobackCalcProp
+    JobackCalcProp,
+    EstimatedBatchProp,
+    JobackIdealGas,
+    JobackIdealGasBatch,
+    ZabranskyRuzickaHeatCapacity,
+    UncertaintyProp,
+    GroupTable,
+    RegressionReport
+)
+from .core import (
+    Joback,
+    ZabranskyRuzicka,
+    JobackBatch,
+    ZabranskyRuzickaBatch,
+    JobackRegression,
+    ZabranskyRuzickaRegression,
+)
+from .core.tables import load_joback_table, load_zabransky_ruzicka_tables
+from .core.batch import JOBACK_BATCH_PROPERTIES
+from .core.uncertainty import (
+    DEFAULT_PERCENTILES,
+    joback_monte_carlo,
+    zabransky_ruzicka_monte_carlo,
+    summarize_samples,
 )
-from .core import Joback, ZabranskyRuzicka
 
 
 # NOTE: logger
@@ -21,8 +44,11 @@ logger = logging.getLogger(__name__)
 
 def joback_calc(
     groups: JobackGroupContributions | Dict[str, int] | Dict[str, float],
-    total_atoms_number: int
-) -> Optional[Dict[str, EstimatedProp]]:
+    total_atoms_number: int,
+    molecular_weight: Optional[float] = None,
+    properties: Optional[Sequence[str]] = None,
+    lazy: bool = False,
+) -> Optional[Mapping[str, EstimatedProp]]:
     """
     Using Joback method to calculate thermodynamic properties including
 
@@ -32,11 +58,17 @@ def joback_calc(
         Group contributions for Joback method.
     total_atoms_number : int
         Total number of atoms in the molecule.
+    molecular_weight : float, optional
+        Molecular weight (g/mol); when given, 'liquid_viscosity' holds the liquid viscosity function eta_L(T) in Pa·s.
+    properties : Sequence[str], optional
+        Properties to calculate, e.g. ['critical_temperature', 'critical_pressure'], by default None for all.
+    lazy : bool, optional
+        Return a read-only mapping that calculates each property on first access, by default False.
 
     Returns
     -------
-    Dict[str, EstimatedProp] | None
-        A dictionary containing calculated thermodynamic properties.
+    Dict[str, EstimatedProp] | JobackProperties | None
+        A dictionary (or lazy mapping) containing calculated thermodynamic properties.
 
     Notes
     -----
@@ -50,11 +82,12 @@ def joback_calc(
         # SECTION: initialize Joback method
         Joback_ = Joback(
             group_contributions=groups,
-            total_atoms_number=total_atoms_number
+            total_atoms_number=total_atoms_number,
+            molecular_weight=molecular_weight
         )
 
         # NOTE: calculate properties
-        return Joback_._calc()
+        return Joback_._calc(properties=properties, lazy=lazy)
     except Exception as e:
         logger.error(f"Error in Joback calculation: {e}")
         return None
@@ -63,6 +96,7 @@ def joback_calc(
 def joback_prop_calc(
     groups: JobackGroupContributions | Dict[str, int] | Dict[str, float],
     total_atoms_number: int,
+    properties: Optional[Sequence[str]] = None,
 ) -> Optional[Dict[str, JobackProp]]:
     """
     Using Joback method to calculate a only thermodynamic property.
@@ -73,6 +107,8 @@ def joback_prop_calc(
         Group contributions for Joback method.
     total_atoms_number : int
         Total number of atoms in the molecule.
+    properties : Sequence[str], optional
+        Scalar properties to calculate, by default None for all of them.
 
     Returns
     -------
@@ -87,7 +123,9 @@ def joback_prop_calc(
         # SECTION: initialize Joback method
         joback_calc_ = joback_calc(
             groups=groups,
-            total_atoms_number=total_atoms_number
+            total_atoms_number=total_atoms_number,
+            properties=properties if properties is not None
+            else list(JOBACK_BATCH_PROPERTIES),
         )
 
         # SECTION: return property (not callable ones in value)
@@ -144,7 +182,8 @@ def joback_heat_capacity_calc(
         # SECTION: initialize Joback method
         joback_calc_ = joback_calc(
             groups=groups,
-            total_atoms_number=total_atoms_number
+            total_atoms_number=total_atoms_number,
+            properties=['heat_capacity']
         )
 
         # SECTION: return heat capacity property
@@ -168,6 +207,371 @@ def joback_heat_capacity_calc(
         return None
 
 
+def joback_liquid_viscosity_calc(
+    groups: JobackGroupContributions | Dict[str, int] | Dict[str, float],
+    total_atoms_number: int,
+    molecular_weight: float,
+) -> Optional[JobackCalcProp]:
+    """
+    Using Joback method to retrieve the liquid viscosity equation (function of temperature [K]).
+
+    Parameters
+    ----------
+    groups : JobackGroupContributions | Dict[str, float] | Dict[str, int]
+        Group contributions for Joback method.
+    total_atoms_number : int
+        Total number of atoms in the molecule.
+    molecular_weight : float
+        Molecular weight (g/mol).
+
+    Returns
+    -------
+    JobackCalcProp | None
+        A dictionary containing:
+        - value: equation eta_L(T) = MW exp((Σηa - 597.82)/T + Σηb - 11.202).
+        - units: units of the liquid viscosity (Pa·s).
+        - symbol: symbol representing liquid viscosity (eta_L).
+    """
+    try:
+        # SECTION: initialize Joback method
+        joback_calc_ = joback_calc(
+            groups=groups,
+            total_atoms_number=total_atoms_number,
+            molecular_weight=molecular_weight,
+            properties=['liquid_viscosity']
+        )
+
+        # SECTION: return liquid viscosity property
+        if joback_calc_ and 'liquid_viscosity' in joback_calc_:
+            viscosity_data = joback_calc_['liquid_viscosity']
+
+            # check type
+            if not callable(viscosity_data['value']):
+                return None
+
+            # >> return liquid viscosity
+            return JobackCalcProp(
+                value=viscosity_data['value'],
+                unit=viscosity_data['unit'],
+                symbol=viscosity_data['symbol']
+            )
+
+        return None
+    except Exception as e:
+        logger.error(f"Error in Joback liquid viscosity calculation: {e}")
+        return None
+
+
+def joback_batch_calc(
+    groups: Sequence[JobackGroupContributions | Dict[str, int] | Dict[str, float]],
+    total_atoms_number: Sequence[int] | np.ndarray,
+    molecular_weight: Optional[Sequence[float] | np.ndarray] = None,
+    table_path: Optional[str] = None,
+    properties: Optional[Sequence[str]] = None,
+    dtype: Any = np.float64,
+) -> Optional[Dict[str, EstimatedBatchProp]]:
+    """
+    Using Joback method to calculate thermodynamic properties for a batch of molecules in one vectorized call.
+
+    Parameters
+    ----------
+    groups : Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule.
+    total_atoms_number : Sequence[int] | np.ndarray
+        Total number of atoms of each molecule.
+    molecular_weight : Sequence[float] | np.ndarray, optional
+        Molecular weight (g/mol) of each molecule; adds 'liquid_viscosity', by default None.
+    table_path : str, optional
+        Joback table in the `joback.csv` format (e.g. written by `joback_regression`), by default the packaged table.
+    properties : Sequence[str], optional
+        Properties to calculate, by default None for all; unused sigma columns are skipped.
+    dtype : Any, optional
+        np.float64, or np.float32 to halve the result buffers for screening, by default np.float64.
+
+    Returns
+    -------
+    Dict[str, EstimatedBatchProp] | None
+        A dictionary keyed as in `joback_calc`, where each value holds an array of shape (N,) and
+        heat capacity (and liquid viscosity) hold vectorized functions of T returning one value per molecule.
+
+    Notes
+    -----
+    Dictionary keys may be either the group aliases or the field names.
+    """
+    try:
+        # SECTION: build count matrix
+        counts = JobackBatch.count_matrix(groups)
+
+        # NOTE: check sizes
+        atoms = np.asarray(total_atoms_number, dtype=float).ravel()
+        if atoms.size != counts.shape[0]:
+            logger.error(
+                "total_atoms_number must have one entry per molecule.")
+            return None
+
+        # NOTE: calculate properties
+        return JobackBatch.to_estimated_props(
+            JobackBatch.calc(
+                counts, atoms, load_joback_table(table_path), properties, dtype),
+            molecular_weight=molecular_weight
+        )
+    except Exception as e:
+        logger.error(f"Error in Joback batch calculation: {e}")
+        return None
+
+
+def joback_batch_screen(
+    groups: Sequence[JobackGroupContributions | Dict[str, int] | Dict[str, float]],
+    total_atoms_number: Sequence[int] | np.ndarray,
+    criteria: Dict[str, Tuple[Optional[float], Optional[float]]],
+    properties: Optional[Sequence[str]] = None,
+    table_path: Optional[str] = None,
+) -> Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+    """
+    Using Joback method to screen a batch of molecules against property windows, first in float32 and then in float64 for the candidates.
+
+    Parameters
+    ----------
+    groups : Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule.
+    total_atoms_number : Sequence[int] | np.ndarray
+        Total number of atoms of each molecule.
+    criteria : Dict[str, Tuple[Optional[float], Optional[float]]]
+        (lower, upper) window per scalar property, e.g. {'boiling_point_temperature': (350.0, 450.0)}; None for an open side.
+    properties : Sequence[str], optional
+        Further properties to return for the hits, by default None.
+    table_path : str, optional
+        Joback table in the `joback.csv` format, by default the packaged table.
+
+    Returns
+    -------
+    Tuple[np.ndarray, Dict[str, np.ndarray]] | None
+        Indices of the molecules that pass in float64, and their float64 property arrays.
+
+    Notes
+    -----
+    The float32 windows are widened by a rounding error bound, so the hits are exactly those of a full float64 run.
+    """
+    try:
+        counts = JobackBatch.count_matrix(groups)
+        atoms = np.asarray(total_atoms_number, dtype=float).ravel()
+        if atoms.size != counts.shape[0]:
+            logger.error(
+                "total_atoms_number must have one entry per molecule.")
+            return None
+
+        return JobackBatch.screen(
+            counts, atoms, criteria, load_joback_table(table_path), properties)
+    except Exception as e:
+        logger.error(f"Error in Joback batch screening: {e}")
+        return None
+
+
+def joback_ideal_gas_calc(
+    groups: JobackGroupContributions | Dict[str, int] | Dict[str, float],
+    total_atoms_number: int,
+) -> Optional[JobackIdealGas]:
+    """
+    Using Joback method to build closed-form ideal-gas enthalpy, entropy and Gibbs energy functions.
+
+    Parameters
+    ----------
+    groups : JobackGroupContributions | Dict[str, float] | Dict[str, int]
+        Group contributions for Joback method.
+    total_atoms_number : int
+        Total number of atoms in the molecule.
+
+    Returns
+    -------
+    JobackIdealGas | None
+        Ideal-gas model with:
+        - enthalpy_change(T1, T2): ΔH (J/mol) from the integrated Cp polynomial.
+        - entropy_change(T1, T2): ΔS (J/mol·K).
+        - enthalpy(T), entropy(T), gibbs_energy(T): H, S, G (J/mol, J/mol·K) referenced to EnFo_IG and GiEnFo_IG at 298.15 K.
+
+    Notes
+    -----
+    All functions accept scalar or array temperatures [K], replacing numerical integration of the heat capacity equation.
+    """
+    try:
+        # SECTION: initialize Joback method
+        Joback_ = Joback(
+            group_contributions=groups,
+            total_atoms_number=total_atoms_number
+        )
+
+        # NOTE: build ideal-gas model
+        return Joback_._calc_ideal_gas()
+    except Exception as e:
+        logger.error(f"Error in Joback ideal-gas calculation: {e}")
+        return None
+
+
+def joback_ideal_gas_batch_calc(
+    groups: Sequence[JobackGroupContributions | Dict[str, int] | Dict[str, float]],
+    total_atoms_number: Sequence[int] | np.ndarray,
+) -> Optional[JobackIdealGasBatch]:
+    """
+    Using Joback method to build closed-form ideal-gas enthalpy, entropy and Gibbs energy functions for a batch of molecules.
+
+    Parameters
+    ----------
+    groups : Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule.
+    total_atoms_number : Sequence[int] | np.ndarray
+        Total number of atoms of each molecule.
+
+    Returns
+    -------
+    JobackIdealGasBatch | None
+        Vectorized ideal-gas model; functions of temperature return arrays of shape (N, *T.shape).
+    """
+    try:
+        # SECTION: build count matrix
+        counts = JobackBatch.count_matrix(groups)
+
+        # NOTE: check sizes
+        atoms = np.asarray(total_atoms_number, dtype=float).ravel()
+        if atoms.size != counts.shape[0]:
+            logger.error(
+                "total_atoms_number must have one entry per molecule.")
+            return None
+
+        # NOTE: build ideal-gas model
+        return JobackBatch.to_ideal_gas(JobackBatch.calc(counts, atoms))
+    except Exception as e:
+        logger.error(f"Error in Joback ideal-gas batch calculation: {e}")
+        return None
+
+
+def joback_uncertainty(
+    groups: JobackGroupContributions | Dict[str, int] | Dict[str, float],
+    total_atoms_number: int,
+    n_samples: int = 10000,
+    rel_sigma: float | Dict[str, float] = 0.05,
+    count_sigma: float = 0.0,
+    temperatures: Sequence[float] = (),
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    chunk_size: int = 4096,
+    seed: Optional[int | np.random.Generator] = None,
+) -> Optional[Dict[str, UncertaintyProp]]:
+    """
+    Using Monte Carlo sampling to estimate the uncertainty of Joback properties.
+
+    Parameters
+    ----------
+    groups : JobackGroupContributions | Dict[str, float] | Dict[str, int]
+        Group contributions for Joback method.
+    total_atoms_number : int
+        Total number of atoms in the molecule.
+    n_samples : int, optional
+        Number of Monte Carlo samples, by default 10000.
+    rel_sigma : float | Dict[str, float], optional
+        Relative standard deviation of the group contributions, for all table columns or per column
+        (e.g. {'Tc': 0.05, 'Tb': 0.02}), by default 0.05.
+    count_sigma : float, optional
+        Absolute standard deviation of the group counts, by default 0.0.
+    temperatures : Sequence[float], optional
+        Temperatures [K] at which Cp_IG is sampled, by default none.
+    percentiles : Sequence[float], optional
+        Percentiles to report, by default (2.5, 50, 97.5).
+    chunk_size : int, optional
+        Samples evaluated per chunk, bounding memory, by default 4096.
+    seed : int | np.random.Generator, optional
+        Seed for reproducible sampling, by default None.
+
+    Returns
+    -------
+    Dict[str, UncertaintyProp] | None
+        Mean, standard deviation and percentiles keyed as in `joback_calc`, plus 'Cp_IG@<T>K' per temperature.
+
+    Notes
+    -----
+    Each chunk of samples is evaluated as one (samples × columns) product over the groups present in the molecule.
+    """
+    try:
+        # SECTION: count vector
+        counts = JobackBatch.count_matrix([groups])[0]
+
+        # SECTION: sample
+        samples = joback_monte_carlo(
+            counts, total_atoms_number, n_samples,
+            rel_sigma=rel_sigma, count_sigma=count_sigma,
+            temperatures=temperatures, chunk_size=chunk_size, seed=seed
+        )
+
+        # SECTION: summarize
+        res: Dict[str, UncertaintyProp] = {}
+        for name, values in samples.items():
+            unit, symbol = JOBACK_BATCH_PROPERTIES.get(name, ('J/mol·K', 'Cp_IG'))
+            res[name] = summarize_samples(values, unit, symbol, percentiles)
+        return res
+    except Exception as e:
+        logger.error(f"Error in Joback uncertainty calculation: {e}")
+        return None
+
+
+def joback_regression(
+    groups: Sequence[JobackGroupContributions | Dict[str, int] | Dict[str, float]],
+    targets: Dict[str, Sequence[float] | np.ndarray],
+    total_atoms_number: Optional[Sequence[int] | np.ndarray] = None,
+    heat_capacity: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    weights: Optional[Dict[str, Sequence[float] | np.ndarray]] = None,
+    ridge: float = 0.0,
+    output_path: Optional[str] = None,
+) -> Optional[Tuple[GroupTable, Dict[str, RegressionReport]]]:
+    """
+    Regressing Joback group contributions from experimental data with sparse least squares.
+
+    Parameters
+    ----------
+    groups : Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule.
+    targets : Dict[str, Sequence[float] | np.ndarray]
+        Experimental values per molecule keyed as in `joback_calc` (units of `joback_calc`); NaN marks a missing value.
+    total_atoms_number : Sequence[int] | np.ndarray, optional
+        Total number of atoms of each molecule, required for 'critical_pressure', by default None.
+    heat_capacity : Tuple[np.ndarray, np.ndarray, np.ndarray], optional
+        Ideal-gas Cp observations as (molecule index, T [K], Cp [J/mol.K]) arrays, by default None.
+    weights : Dict[str, Sequence[float] | np.ndarray], optional
+        Observation weights keyed like targets (and 'heat_capacity'), by default 1.
+    ridge : float, optional
+        Tikhonov damping toward the packaged contributions, by default 0.0.
+    output_path : str, optional
+        CSV file to write the revised table to, in the `joback.csv` format, by default None.
+
+    Returns
+    -------
+    Tuple[GroupTable, Dict[str, RegressionReport]] | None
+        Revised table and one report per fitted property.
+
+    Notes
+    -----
+    Load the written table with `joback_batch_calc(..., table_path=output_path)`.
+    """
+    try:
+        # SECTION: sparse design matrix
+        X = JobackRegression.design_matrix(groups)
+
+        # SECTION: fit
+        table, reports = JobackRegression.fit(
+            X,
+            targets,
+            total_atoms_number=total_atoms_number,
+            heat_capacity=heat_capacity,
+            weights=weights,
+            ridge=ridge,
+        )
+
+        # NOTE: write table
+        if output_path is not None:
+            JobackRegression.write(table, output_path)
+        return table, reports
+    except Exception as e:
+        logger.error(f"Error in Joback regression: {e}")
+        return None
+
+
 # SECTION: Zabransky-Ruzicka Group Contributions
 
 
@@ -217,3 +621,282 @@ def zabransky_ruzicka_calc(
     except Exception as e:
         logger.error(f"Error in Zabransky-Ruzicka calculation: {e}")
         return None
+
+
+def zabransky_ruzicka_liquid_calc(
+    group_contributions: ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int],
+    group_corrections: Optional[
+        ZabranskyRuzickaGroupContributionsCorrections |
+        Dict[str, float] |
+        Dict[str, int]
+    ] = None
+) -> Optional[ZabranskyRuzickaHeatCapacity]:
+    """
+    Using Zabransky-Ruzicka method to build the liquid heat capacity with closed-form enthalpy and entropy changes.
+
+    Parameters
+    ----------
+    group_contributions : ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]
+        Group contributions for Zabransky-Ruzicka method.
+    group_corrections : Optional[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int]]
+        Group correction contributions for Zabransky-Ruzicka method.
+
+    Returns
+    -------
+    ZabranskyRuzickaHeatCapacity | None
+        Liquid heat capacity model with:
+        - __call__(T): Cp_LIQ (J/mol·K).
+        - H_LIQ(T1, T2): sensible enthalpy change (J/mol).
+        - S_LIQ(T1, T2): sensible entropy change (J/mol·K).
+
+    Notes
+    -----
+    Temperatures [K] may be scalars or arrays that broadcast together. For a batch of molecules, the
+    `value` returned by `zabransky_ruzicka_batch_calc` provides the same `H_LIQ` and `S_LIQ` methods.
+    """
+    try:
+        # SECTION: initialize Zabransky-Ruzicka method
+        ZabranskyRuzicka_ = ZabranskyRuzicka(
+            group_contributions=group_contributions,
+            group_corrections=group_corrections
+        )
+
+        # NOTE: aggregate coefficients
+        return ZabranskyRuzicka_._calc_heat_capacity_model()
+    except Exception as e:
+        logger.error(f"Error in Zabransky-Ruzicka liquid calculation: {e}")
+        return None
+
+
+def zabransky_ruzicka_batch_calc(
+    group_contributions: Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]],
+    group_corrections: Optional[
+        Sequence[
+            Optional[
+                ZabranskyRuzickaGroupContributionsCorrections |
+                Dict[str, float] |
+                Dict[str, int]
+            ]
+        ]
+    ] = None,
+    table_paths: Optional[Tuple[str, str]] = None,
+    dtype: Any = np.float64,
+) -> Optional[EstimatedBatchProp]:
+    """
+    Using Zabransky-Ruzicka method to calculate liquid heat capacity for a batch of molecules in one vectorized call.
+
+    Parameters
+    ----------
+    group_contributions : Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule.
+    group_corrections : Optional[Sequence[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int] | None]]
+        Group corrections of each molecule.
+    table_paths : Tuple[str, str], optional
+        Contribution and correction tables in the packaged format (e.g. written by `zabransky_ruzicka_regression`), by default the packaged tables.
+    dtype : Any, optional
+        np.float64, or np.float32 to halve the coefficient buffers for screening, by default np.float64.
+
+    Returns
+    -------
+    EstimatedBatchProp | None
+        A dictionary containing:
+        - value: vectorized equation returning the heat capacity of every molecule.
+        - units: units of the heat capacity (J/mol.K).
+        - symbol: symbol representing heat capacity (Cp_LIQ).
+    """
+    try:
+        # SECTION: build count matrices
+        counts, corrections = ZabranskyRuzickaBatch.count_matrices(
+            group_contributions=group_contributions,
+            group_corrections=group_corrections
+        )
+
+        # NOTE: calculate coefficients
+        return ZabranskyRuzickaBatch.to_estimated_prop(
+            ZabranskyRuzickaBatch.calc(
+                counts, corrections, load_zabransky_ruzicka_tables(table_paths), dtype)
+        )
+    except Exception as e:
+        logger.error(f"Error in Zabransky-Ruzicka batch calculation: {e}")
+        return None
+
+
+def zabransky_ruzicka_batch_screen(
+    group_contributions: Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]],
+    criteria: Dict[str, Tuple[Optional[float], Optional[float]]],
+    group_corrections: Optional[
+        Sequence[
+            Optional[
+                ZabranskyRuzickaGroupContributionsCorrections |
+                Dict[str, float] |
+                Dict[str, int]
+            ]
+        ]
+    ] = None,
+    temperature: float = 298.15,
+    table_paths: Optional[Tuple[str, str]] = None,
+) -> Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+    """
+    Using Zabransky-Ruzicka method to screen a batch of molecules, first in float32 and then in float64 for the candidates.
+
+    Parameters
+    ----------
+    group_contributions : Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule.
+    criteria : Dict[str, Tuple[Optional[float], Optional[float]]]
+        (lower, upper) window for 'A', 'B', 'D' or 'heat_capacity' (J/mol·K at `temperature`); None for an open side.
+    group_corrections : Optional[Sequence[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int] | None]]
+        Group corrections of each molecule.
+    temperature : float, optional
+        Temperature (K) of the 'heat_capacity' window, by default 298.15.
+    table_paths : Tuple[str, str], optional
+        Contribution and correction tables in the packaged format, by default the packaged tables.
+
+    Returns
+    -------
+    Tuple[np.ndarray, Dict[str, np.ndarray]] | None
+        Indices of the molecules that pass in float64, and their float64 coefficients.
+    """
+    try:
+        counts, corrections = ZabranskyRuzickaBatch.count_matrices(
+            group_contributions=group_contributions,
+            group_corrections=group_corrections
+        )
+        return ZabranskyRuzickaBatch.screen(
+            counts, corrections, criteria, temperature,
+            load_zabransky_ruzicka_tables(table_paths))
+    except Exception as e:
+        logger.error(f"Error in Zabransky-Ruzicka batch screening: {e}")
+        return None
+
+
+def zabransky_ruzicka_uncertainty(
+    group_contributions: ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int],
+    group_corrections: Optional[
+        ZabranskyRuzickaGroupContributionsCorrections |
+        Dict[str, float] |
+        Dict[str, int]
+    ] = None,
+    temperatures: Sequence[float] = (298.15,),
+    n_samples: int = 10000,
+    rel_sigma: float | Dict[str, float] = 0.05,
+    count_sigma: float = 0.0,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    chunk_size: int = 4096,
+    seed: Optional[int | np.random.Generator] = None,
+) -> Optional[Dict[str, UncertaintyProp]]:
+    """
+    Using Monte Carlo sampling to estimate the uncertainty of the Zabransky-Ruzicka liquid heat capacity.
+
+    Parameters
+    ----------
+    group_contributions : ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]
+        Group contributions for Zabransky-Ruzicka method.
+    group_corrections : Optional[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int]]
+        Group correction contributions for Zabransky-Ruzicka method.
+    temperatures : Sequence[float], optional
+        Temperatures [K] at which Cp_LIQ is sampled, by default (298.15,).
+    n_samples : int, optional
+        Number of Monte Carlo samples, by default 10000.
+    rel_sigma : float | Dict[str, float], optional
+        Relative standard deviation of a_i, b_i, d_i, for all columns or per column, by default 0.05.
+    count_sigma : float, optional
+        Absolute standard deviation of the group and correction counts, by default 0.0.
+    percentiles : Sequence[float], optional
+        Percentiles to report, by default (2.5, 50, 97.5).
+    chunk_size : int, optional
+        Samples evaluated per chunk, bounding memory, by default 4096.
+    seed : int | np.random.Generator, optional
+        Seed for reproducible sampling, by default None.
+
+    Returns
+    -------
+    Dict[str, UncertaintyProp] | None
+        Mean, standard deviation and percentiles of 'A', 'B', 'D' and 'Cp_LIQ@<T>K' per temperature.
+    """
+    try:
+        # SECTION: count vectors
+        counts, corrections = ZabranskyRuzickaBatch.count_matrices(
+            [group_contributions], [group_corrections])
+
+        # SECTION: sample
+        samples = zabransky_ruzicka_monte_carlo(
+            counts[0], corrections[0], n_samples,
+            temperatures=temperatures, rel_sigma=rel_sigma, count_sigma=count_sigma,
+            chunk_size=chunk_size, seed=seed
+        )
+
+        # SECTION: summarize
+        return {
+            name: summarize_samples(
+                values,
+                '-' if name in ('A', 'B', 'D') else 'J/mol·K',
+                name if name in ('A', 'B', 'D') else 'Cp_LIQ',
+                percentiles
+            )
+            for name, values in samples.items()
+        }
+    except Exception as e:
+        logger.error(f"Error in Zabransky-Ruzicka uncertainty calculation: {e}")
+        return None
+
+
+def zabransky_ruzicka_regression(
+    group_contributions: Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]],
+    heat_capacity: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    group_corrections: Optional[
+        Sequence[
+            Optional[
+                ZabranskyRuzickaGroupContributionsCorrections |
+                Dict[str, float] |
+                Dict[str, int]
+            ]
+        ]
+    ] = None,
+    weights: Optional[Sequence[float] | np.ndarray] = None,
+    ridge: float = 0.0,
+    output_paths: Optional[Tuple[str, str]] = None,
+) -> Optional[Tuple[Tuple[GroupTable, GroupTable], RegressionReport]]:
+    """
+    Regressing Zabransky-Ruzicka group parameters from liquid heat capacity data with sparse least squares.
+
+    Parameters
+    ----------
+    group_contributions : Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule.
+    heat_capacity : Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Liquid Cp observations as (molecule index, T [K], Cp [J/mol.K]) arrays.
+    group_corrections : Optional[Sequence[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int] | None]]
+        Group corrections of each molecule, by default None.
+    weights : Sequence[float] | np.ndarray, optional
+        Weight of each observation, by default 1.
+    ridge : float, optional
+        Tikhonov damping toward the packaged parameters, by default 0.0.
+    output_paths : Tuple[str, str], optional
+        CSV files to write the revised contribution and correction tables to, by default None.
+
+    Returns
+    -------
+    Tuple[Tuple[GroupTable, GroupTable], RegressionReport] | None
+        Revised contribution and correction tables, and the fit report (residuals in J/mol.K).
+
+    Notes
+    -----
+    Load the written tables with `zabransky_ruzicka_batch_calc(..., table_paths=output_paths)`.
+    """
+    try:
+        # SECTION: sparse design matrix
+        X = ZabranskyRuzickaRegression.design_matrix(
+            group_contributions, group_corrections)
+
+        # SECTION: fit
+        tables, report = ZabranskyRuzickaRegression.fit(
+            X, heat_capacity, weights=weights, ridge=ridge)
+
+        # NOTE: write tables
+        if output_paths is not None:
+            ZabranskyRuzickaRegression.write(tables, output_paths)
+        return tables, report
+    except Exception as e:
+        logger.error(f"Error in Zabransky-Ruzicka regression: {e}")
+        return None
@@ -0,0 +1,631 @@
+# import libs
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+# locals
+from .models import MemoryBudget, MemoryReport, BackendTiming
+from .core import Antoine, JobackBatch, ZabranskyRuzickaBatch
+from .core import kernels
+from .core.batch import split_rows, scatter_count_columns
+from .core.tables import load_joback_table, load_zabransky_ruzicka_tables
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class MemoryBudgetExceeded(Exception):
+    '''
+    Raised when a benchmark scenario exceeds its memory budget.
+    '''
+
+    def __init__(self, reports: List[MemoryReport]):
+        self.reports = reports
+        failed = [f"{r['name']}: {'; '.join(r['violations'])}" for r in reports]
+        super().__init__("Memory budget exceeded!, " + " | ".join(failed))
+
+
+# SECTION: memory probes
+
+def current_rss() -> Optional[int]:
+    '''
+    Returns the resident set size of this process in bytes.
+
+    Returns
+    -------
+    int | None
+        Current RSS from /proc on Linux, otherwise the peak RSS reported by `resource`; None when neither is available.
+    '''
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ! bytes on macOS, kilobytes elsewhere
+        return int(peak if sys.platform == 'darwin' else peak * 1024)
+    except ImportError:
+        return None
+
+
+class _RSSSampler(threading.Thread):
+    '''
+    Samples the process RSS in the background and keeps the maximum.
+    '''
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def stop(self) -> Optional[int]:
+        self._stop_event.set()
+        self.join()
+        self._sample()
+        return self.peak
+
+
+def check_budget(
+    report: MemoryReport,
+    budget: Optional[MemoryBudget],
+) -> List[str]:
+    '''
+    Lists the budget limits a report exceeds.
+
+    Parameters
+    ----------
+    report : MemoryReport
+        Measured scenario.
+    budget : MemoryBudget, optional
+        Limits to check, by default none.
+
+    Returns
+    -------
+    violations : List[str]
+        One message per exceeded limit.
+    '''
+    violations: List[str] = []
+    if budget is None:
+        return violations
+
+    if budget.peak_bytes_per_row is not None and report['peak_bytes_per_row'] > budget.peak_bytes_per_row:
+        violations.append(
+            f"peak {report['peak_bytes_per_row']:.1f} B/row > {budget.peak_bytes_per_row:.1f} B/row")
+    if budget.steady_bytes_per_row is not None and report['steady_bytes_per_row'] > budget.steady_bytes_per_row:
+        violations.append(
+            f"steady {report['steady_bytes_per_row']:.1f} B/row > {budget.steady_bytes_per_row:.1f} B/row")
+    if budget.peak_rss_bytes is not None and report['peak_rss_bytes'] is not None \
+            and report['rss_before_bytes'] is not None:
+        growth = report['peak_rss_bytes'] - report['rss_before_bytes']
+        if growth > budget.peak_rss_bytes:
+            violations.append(
+                f"RSS growth {growth / 2**20:.1f} MiB > {budget.peak_rss_bytes / 2**20:.1f} MiB")
+    return violations
+
+
+def measure_memory(
+    fn: Callable[[], Any],
+    rows: int,
+    *,
+    name: str = "benchmark",
+    budget: Optional[MemoryBudget] = None,
+    sample_interval: float = 0.005,
+    trace: bool = True,
+) -> MemoryReport:
+    '''
+    Runs a workload under tracemalloc and RSS sampling.
+
+    Parameters
+    ----------
+    fn : Callable[[], Any]
+        Workload; its return value is kept alive until the steady-state memory is read.
+    rows : int
+        Number of rows (molecules or datasets) processed, used for per-row figures.
+    name : str, optional
+        Scenario name, by default "benchmark".
+    budget : MemoryBudget, optional
+        Limits checked against the measurement, by default none.
+    sample_interval : float, optional
+        RSS sampling period in seconds, by default 0.005.
+    trace : bool, optional
+        Use tracemalloc (True) or RSS alone (False), by default True; tracing slows allocation-heavy Python code several times.
+
+    Returns
+    -------
+    MemoryReport
+        Traced peak and steady-state bytes (total and per row), RSS before and at peak, wall time and budget violations.
+
+    Notes
+    -----
+    The peak is the largest traced allocation above the starting point during the run; the steady state is what the returned result still holds after a garbage collection. Without tracing both come from RSS growth, which also counts allocator caching.
+    '''
+    rows = max(int(rows), 1)
+    gc.collect()
+
+    started_here = trace and not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    try:
+        if trace:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        # SECTION: run with RSS sampling
+        sampler = _RSSSampler(sample_interval)
+        rss_before = sampler.peak
+        sampler.start()
+        t0 = time.perf_counter()
+        try:
+            result = fn()
+        finally:
+            seconds = time.perf_counter() - t0
+            peak_rss = sampler.stop()
+
+        # SECTION: steady state, with the result still alive
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1] - base
+            gc.collect()
+            steady = tracemalloc.get_traced_memory()[0] - base
+        else:
+            gc.collect()
+            rss_after = current_rss()
+            peak = (peak_rss or 0) - (rss_before or 0)
+            steady = (rss_after or 0) - (rss_before or 0)
+        del result
+    finally:
+        if started_here:
+            tracemalloc.stop()
+
+    report = MemoryReport(
+        name=name,
+        rows=rows,
+        traced=trace,
+        seconds=seconds,
+        peak_bytes=int(peak),
+        steady_bytes=int(steady),
+        peak_bytes_per_row=peak / rows,
+        steady_bytes_per_row=steady / rows,
+        rss_before_bytes=rss_before,
+        peak_rss_bytes=peak_rss,
+        passed=True,
+        violations=[],
+    )
+    report['violations'] = check_budget(report, budget)
+    report['passed'] = not report['violations']
+    return report
+
+
+# SECTION: scenarios
+
+def _random_counts(
+    rng: np.random.Generator,
+    rows: int,
+    n_groups: int,
+    density: float,
+) -> np.ndarray:
+    '''
+    Random sparse group counts (1 to 3 per present group) with at least one group per molecule.
+    '''
+    counts = rng.integers(1, 4, (rows, n_groups)) * (rng.random((rows, n_groups)) < density)
+    counts[np.arange(rows), rng.integers(0, n_groups, rows)] += 1
+    return counts.astype(float)
+
+
+def _antoine_datasets(
+    rng: np.random.Generator,
+    rows: int,
+    points: Tuple[int, int] = (10, 11),
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    '''
+    Synthetic (T, P) datasets with 0.2 % noise and `points[0]` to `points[1] - 1` points each.
+    '''
+    datasets: List[Tuple[np.ndarray, np.ndarray]] = []
+    for _ in range(rows):
+        A, B, C = rng.uniform(8.5, 10.5), rng.uniform(1200, 2200), rng.uniform(-80, -20)
+        T = np.linspace(280.0, 400.0, rng.integers(*points))
+        P = 10 ** (A - B / (T + C)) * (1 + 0.002 * rng.standard_normal(T.size))
+        datasets.append((T, P))
+    return datasets
+
+
+def joback_batch_scenario(
+    rows: int,
+    chunk_size: int = 10000,
+    seed: Optional[int] = 0,
+) -> Callable[[], Dict[str, np.ndarray]]:
+    '''
+    Chunked `JobackBatch.calc` over `rows` random molecules, keeping every property array.
+    '''
+    n_groups = len(load_joback_table().groups)
+
+    def run() -> Dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        out: Dict[str, np.ndarray] = {}
+        for rows_ in split_rows(rows, chunk_size):
+            n = rows_.stop - rows_.start
+            counts = _random_counts(rng, n, n_groups, 0.08)
+            props = JobackBatch.calc(counts, counts.sum(axis=1) * 3)
+            for key, value in props.items():
+                if key not in out:
+                    out[key] = np.empty(rows)
+                out[key][rows_] = value
+        return out
+
+    return run
+
+
+def zabransky_ruzicka_batch_scenario(
+    rows: int,
+    chunk_size: int = 10000,
+    seed: Optional[int] = 0,
+) -> Callable[[], Dict[str, np.ndarray]]:
+    '''
+    Chunked `ZabranskyRuzickaBatch.calc` over `rows` random molecules, keeping A, B, D, Tmin and Tmax.
+    '''
+    contributions_table, _ = load_zabransky_ruzicka_tables()
+    n_groups = len(contributions_table.groups)
+
+    def run() -> Dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        out: Dict[str, np.ndarray] = {}
+        for rows_ in split_rows(rows, chunk_size):
+            n = rows_.stop - rows_.start
+            coefficients = ZabranskyRuzickaBatch.calc(
+                _random_counts(rng, n, n_groups, 0.03))
+            for key, value in coefficients.items():
+                if key not in out:
+                    out[key] = np.empty(rows)
+                out[key][rows_] = value
+        return out
+
+    return run
+
+
+def antoine_fit_scenario(
+    rows: int,
+    chunk_size: int = 10000,
+    seed: Optional[int] = 0,
+) -> Callable[[], List[Dict[str, Any]]]:
+    '''
+    `Antoine.fit_antoine_many` over `rows` synthetic 10-point datasets, keeping every fit report.
+    '''
+    datasets = _antoine_datasets(np.random.default_rng(seed), rows)
+
+    def run() -> List[Dict[str, Any]]:
+        return Antoine.fit_antoine_many(datasets)
+
+    return run
+
+
+def joback_single_scenario(
+    rows: int,
+    chunk_size: int = 10000,
+    seed: Optional[int] = 0,
+) -> Callable[[], List[Any]]:
+    '''
+    One `joback_calc` call per molecule, keeping every result dict (the per-call object path).
+    '''
+    from .app import joback_calc
+
+    table = load_joback_table()
+    rng = np.random.default_rng(seed)
+    molecules = [
+        {table.groups[j]: float(c) for j, c in enumerate(row) if c}
+        for row in _random_counts(rng, rows, len(table.groups), 0.08)
+    ]
+
+    def run() -> List[Any]:
+        return [joback_calc(m, total_atoms_number=int(3 * sum(m.values()))) for m in molecules]
+
+    return run
+
+
+# NOTE: scenario name: (setup, default rows, default budget); per-row budgets are calibrated at the default rows and chunk size
+SCENARIOS: Dict[str, Tuple[Callable[..., Callable[[], Any]], int, MemoryBudget]] = {
+    'joback_batch': (
+        joback_batch_scenario, 1_000_000,
+        MemoryBudget(peak_bytes_per_row=256, steady_bytes_per_row=128),
+    ),
+    'zabransky_ruzicka_batch': (
+        zabransky_ruzicka_batch_scenario, 1_000_000,
+        MemoryBudget(peak_bytes_per_row=128, steady_bytes_per_row=48),
+    ),
+    'antoine_fit': (
+        antoine_fit_scenario, 10_000,
+        MemoryBudget(peak_bytes_per_row=4096, steady_bytes_per_row=4096),
+    ),
+    'joback_single': (
+        joback_single_scenario, 2_000,
+        MemoryBudget(peak_bytes_per_row=8192, steady_bytes_per_row=8192),
+    ),
+}
+
+
+# SECTION: kernel backends
+
+def antoine_batch_backend_scenario(
+    rows: int,
+    seed: Optional[int] = 0,
+) -> Callable[[], np.ndarray]:
+    '''
+    `Antoine.fit_antoine_batch` over `rows` synthetic 10-20 point datasets; returns the (rows, 3) coefficients.
+    '''
+    datasets = _antoine_datasets(np.random.default_rng(seed), rows, points=(10, 21))
+
+    def run() -> np.ndarray:
+        fits = Antoine.fit_antoine_batch(datasets)
+        return np.column_stack([fits['A'], fits['B'], fits['C']])
+
+    return run
+
+
+def count_matrix_backend_scenario(
+    rows: int,
+    seed: Optional[int] = 0,
+) -> Callable[[], np.ndarray]:
+    '''
+    Wide group-count columns in shuffled order scattered into a (rows, n_groups) Joback count matrix.
+    '''
+    n_groups = len(load_joback_table().groups)
+    rng = np.random.default_rng(seed)
+    values = _random_counts(rng, rows, n_groups, 0.08)
+    src = rng.permutation(n_groups)
+    dst = np.arange(n_groups)
+
+    def run() -> np.ndarray:
+        return scatter_count_columns(values, src, dst, n_groups)
+
+    return run
+
+
+# NOTE: scenario name: (setup, default rows)
+BACKEND_SCENARIOS: Dict[str, Tuple[Callable[..., Callable[[], np.ndarray]], int]] = {
+    'antoine_batch': (antoine_batch_backend_scenario, 10_000),
+    'count_matrix': (count_matrix_backend_scenario, 200_000),
+}
+
+
+def compare_backends(
+    scenarios: Optional[Sequence[str]] = None,
+    *,
+    rows: Optional[int] = None,
+    repeat: int = 3,
+    seed: Optional[int] = 0,
+) -> List[BackendTiming]:
+    '''
+    Times the NumPy and numba kernel backends on the same inputs and checks that they agree.
+
+    Parameters
+    ----------
+    scenarios : Sequence[str], optional
+        Names from `BACKEND_SCENARIOS`, by default all.
+    rows : int, optional
+        Rows per scenario, by default the scenario default.
+    repeat : int, optional
+        Timed runs per backend, the best one is reported, by default 3.
+    seed : int, optional
+        Seed of the synthetic inputs, by default 0.
+
+    Returns
+    -------
+    List[BackendTiming]
+        One timing per scenario; the numba fields are None when numba is not installed.
+
+    Notes
+    -----
+    Compilation is excluded: each backend runs once untimed before the timed runs. The previously selected backend is restored afterwards.
+    '''
+    names = list(scenarios) if scenarios else list(BACKEND_SCENARIOS)
+    unknown = [n for n in names if n not in BACKEND_SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown backend scenarios: {unknown}")
+    backends = ['numpy', 'numba'] if kernels.HAS_NUMBA else ['numpy']
+
+    timings: List[BackendTiming] = []
+    previous = kernels._backend
+    try:
+        for name in names:
+            setup, default_rows = BACKEND_SCENARIOS[name]
+            n = rows if rows is not None else default_rows
+            fn = setup(n, seed=seed)
+
+            seconds: Dict[str, float] = {}
+            results: Dict[str, np.ndarray] = {}
+            for backend in backends:
+                kernels.set_kernel_backend(backend)
+                results[backend] = fn()
+                best = np.inf
+                for _ in range(max(repeat, 1)):
+                    start = time.perf_counter()
+                    fn()
+                    best = min(best, time.perf_counter() - start)
+                seconds[backend] = best
+
+            numba_seconds = seconds.get('numba')
+            max_abs_diff = None
+            if 'numba' in results:
+                with np.errstate(invalid='ignore'):
+                    diff = np.abs(results['numpy'] - results['numba'])
+                max_abs_diff = float(np.nanmax(diff)) if diff.size else 0.0
+            timings.append(BackendTiming(
+                name=name,
+                rows=n,
+                numpy_seconds=seconds['numpy'],
+                numba_seconds=numba_seconds,
+                speedup=seconds['numpy'] / numba_seconds if numba_seconds else None,
+                max_abs_diff=max_abs_diff,
+            ))
+            logger.info(
+                f"{name}: numpy {seconds['numpy']:.3f} s, "
+                f"numba {'-' if numba_seconds is None else f'{numba_seconds:.3f} s'}")
+            del fn, results
+    finally:
+        kernels._backend = previous
+    return timings
+
+
+def run_benchmarks(
+    scenarios: Optional[Sequence[str]] = None,
+    *,
+    rows: Optional[int] = None,
+    chunk_size: int = 10000,
+    budgets: Optional[Dict[str, MemoryBudget]] = None,
+    seed: Optional[int] = 0,
+    trace: bool = True,
+    fail: bool = True,
+) -> List[MemoryReport]:
+    '''
+    Runs memory benchmark scenarios and checks them against their budgets.
+
+    Parameters
+    ----------
+    scenarios : Sequence[str], optional
+        Names from `SCENARIOS`, by default all.
+    rows : int, optional
+        Rows per scenario, by default the scenario default (1M molecules, 10k Antoine datasets).
+    chunk_size : int, optional
+        Molecules per vectorized chunk, by default 10000.
+    budgets : Dict[str, MemoryBudget], optional
+        Budgets replacing the defaults, keyed by scenario name.
+    seed : int, optional
+        Seed of the synthetic inputs, by default 0.
+    trace : bool, optional
+        Measure with tracemalloc (True) or RSS alone (False), by default True.
+    fail : bool, optional
+        Raise `MemoryBudgetExceeded` when any scenario is over budget, by default True.
+
+    Returns
+    -------
+    List[MemoryReport]
+        One report per scenario.
+    '''
+    names = list(scenarios) if scenarios else list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenarios: {unknown}")
+
+    reports: List[MemoryReport] = []
+    for name in names:
+        setup, default_rows, default_budget = SCENARIOS[name]
+        n = rows if rows is not None else default_rows
+        budget = (budgets or {}).get(name, default_budget)
+
+        # NOTE: inputs are built before the measurement starts
+        fn = setup(n, chunk_size=chunk_size, seed=seed)
+        report = measure_memory(fn, n, name=name, budget=budget, trace=trace)
+        del fn
+        reports.append(report)
+        logger.info(
+            f"{name}: {report['peak_bytes_per_row']:.1f} B/row peak, "
+            f"{report['steady_bytes_per_row']:.1f} B/row steady, {report['seconds']:.2f} s")
+
+    failed = [r for r in reports if not r['passed']]
+    if fail and failed:
+        raise MemoryBudgetExceeded(failed)
+    return reports
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    '''
+    Entry point of `python -m pyThermoEst.bench`; exits with 1 when a budget is exceeded.
+    '''
+    parser = argparse.ArgumentParser(
+        prog='python -m pyThermoEst.bench',
+        description="Peak and steady-state memory benchmarks of the batch methods.",
+    )
+    parser.add_argument('scenario', nargs='*',
+                        help=f"scenarios to run: {', '.join(SCENARIOS)} (default all)")
+    parser.add_argument('--rows', type=int,
+                        help="rows per scenario (default 1M molecules, 10k Antoine datasets)")
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help="molecules per vectorized chunk (default 10000)")
+    parser.add_argument('--peak-per-row', type=float,
+                        help="peak bytes per row budget for every scenario")
+    parser.add_argument('--steady-per-row', type=float,
+                        help="steady-state bytes per row budget for every scenario")
+    parser.add_argument('--peak-rss', type=float,
+                        help="RSS growth budget in MiB for every scenario")
+    parser.add_argument('--rss-only', action='store_true',
+                        help="measure RSS only, without tracemalloc (much faster for the Antoine fits)")
+    parser.add_argument('--json', dest='json_path',
+                        help="write the reports to this JSON file")
+    parser.add_argument('--compare-backends', action='store_true',
+                        help=f"time the numpy and numba kernels instead: {', '.join(BACKEND_SCENARIOS)}")
+    args = parser.parse_args(argv)
+
+    if args.compare_backends:
+        try:
+            timings = compare_backends(args.scenario or None, rows=args.rows)
+        except ValueError as e:
+            sys.stderr.write(f"{parser.prog}: error: {e}\n")
+            return 2
+        for t in timings:
+            numba_ = "       -  " if t['numba_seconds'] is None else f"{t['numba_seconds']:8.3f} s"
+            speedup = "-" if t['speedup'] is None else f"{t['speedup']:.1f}x"
+            diff = "-" if t['max_abs_diff'] is None else f"{t['max_abs_diff']:.3g}"
+            sys.stdout.write(
+                f"{t['name']:<24} rows={t['rows']:<9} numpy={t['numpy_seconds']:8.3f} s  "
+                f"numba={numba_}  speedup={speedup}  max|diff|={diff}\n")
+        if args.json_path:
+            with open(args.json_path, 'w') as f:
+                json.dump(timings, f, indent=2)
+        return 0
+
+    names = args.scenario or list(SCENARIOS)
+    budgets = None
+    if args.peak_per_row or args.steady_per_row or args.peak_rss:
+        budgets = {
+            name: MemoryBudget(
+                peak_bytes_per_row=args.peak_per_row,
+                steady_bytes_per_row=args.steady_per_row,
+                peak_rss_bytes=args.peak_rss * 2**20 if args.peak_rss else None,
+            )
+            for name in names
+        }
+
+    try:
+        reports = run_benchmarks(
+            names, rows=args.rows, chunk_size=args.chunk_size, budgets=budgets,
+            trace=not args.rss_only, fail=False)
+    except ValueError as e:
+        sys.stderr.write(f"{parser.prog}: error: {e}\n")
+        return 2
+
+    for r in reports:
+        rss = (
+            f"{(r['peak_rss_bytes'] - r['rss_before_bytes']) / 2**20:8.1f} MiB"
+            if r['peak_rss_bytes'] is not None and r['rss_before_bytes'] is not None else "       -    "
+        )
+        sys.stdout.write(
+            f"{r['name']:<24} rows={r['rows']:<9} {r['seconds']:8.2f} s  "
+            f"peak={r['peak_bytes_per_row']:10.1f} B/row  steady={r['steady_bytes_per_row']:10.1f} B/row  "
+            f"rss+={rss}  {'ok' if r['passed'] else 'FAIL: ' + '; '.join(r['violations'])}\n")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+    return 0 if all(r['passed'] for r in reports) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
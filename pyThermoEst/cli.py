@@ -0,0 +1,410 @@
+# import libs
+import argparse
+import csv
+import io
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, TextIO, Tuple
+import numpy as np
+# locals
+from .configs import __version__
+from .core import JobackBatch, ZabranskyRuzickaBatch
+from .core.batch import JOBACK_BATCH_PROPERTIES
+from .core.tables import load_joback_table, load_zabransky_ruzicka_tables
+from .export import METHOD_METADATA, ParquetBatchWriter, columns_to_arrow
+from .ingest import ATOMS_COLUMN, ID_COLUMN, read_wide
+from .models import GroupTable
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# SECTION: readers
+
+def _read_jsonl(
+    stream: TextIO,
+    chunk_size: int,
+) -> Iterator[List[Dict[str, Any]]]:
+    '''
+    Yields lists of JSON records of at most `chunk_size` rows.
+    '''
+    chunk: List[Dict[str, Any]] = []
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_no}: {e}")
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_no} is not a JSON object.")
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _split_record(
+    record: Dict[str, Any],
+    method: str,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    '''
+    Splits a JSON record into group contributions and group corrections.
+
+    Nested records use "groups" (Joback) or "group_contributions"/"group_corrections" (Zabransky-Ruzicka); flat records hold group counts next to the reserved columns.
+    '''
+    if method == 'joback':
+        if 'groups' in record:
+            return record['groups'], {}
+        return {
+            k: v for k, v in record.items()
+            if k not in (ID_COLUMN, ATOMS_COLUMN)
+        }, {}
+
+    if 'group_contributions' in record:
+        return record['group_contributions'], record.get('group_corrections') or {}
+
+    # NOTE: flat record, route each key to its table
+    _, corrections_table = load_zabransky_ruzicka_tables()
+    contributions, corrections = {}, {}
+    for k, v in record.items():
+        if k == ID_COLUMN:
+            continue
+        (corrections if k in corrections_table.index else contributions)[k] = v
+    return contributions, corrections
+
+
+# SECTION: evaluation
+
+def _evaluate_chunk(
+    method: str,
+    counts: np.ndarray,
+    corrections: Optional[np.ndarray],
+    atoms: Optional[np.ndarray],
+    temperatures: Sequence[float],
+) -> Dict[str, np.ndarray]:
+    '''
+    Evaluates one chunk and returns output columns.
+    '''
+    out: Dict[str, np.ndarray] = {}
+    T = np.asarray(temperatures, dtype=float)
+
+    if method == 'joback':
+        props = JobackBatch.calc(counts, atoms)
+        for name in JOBACK_BATCH_PROPERTIES:
+            out[name] = props[name]
+        for k in ('a', 'b', 'c', 'd'):
+            out[f"Cp_IG_{k}"] = props[k]
+        if T.size:
+            cp = JobackBatch.to_estimated_props(props)['heat_capacity']['value'](T)
+            for j, t in enumerate(T):
+                out[f"Cp_IG@{t:g}K"] = cp[:, j]
+    else:
+        coeffs = ZabranskyRuzickaBatch.calc(counts, corrections)
+        for k in ('A', 'B', 'D', 'Tmin', 'Tmax'):
+            out[f"Cp_LIQ_{k}"] = coeffs[k]
+        if T.size:
+            cp = ZabranskyRuzickaBatch.to_estimated_prop(coeffs)['value'](T)
+            for j, t in enumerate(T):
+                out[f"Cp_LIQ@{t:g}K"] = cp[:, j]
+    return out
+
+
+def _unknown_groups(
+    groups: Sequence[Dict[str, Any]],
+    table: GroupTable,
+) -> Dict[str, int]:
+    '''
+    Counts, per group name missing from the table, the records that use it with a non-zero count.
+    '''
+    unknown: Dict[str, int] = {}
+    for g in groups:
+        for k, v in g.items():
+            if k not in table.index and v:
+                unknown[k] = unknown.get(k, 0) + 1
+    return unknown
+
+
+def _known_groups(
+    groups: Dict[str, Any],
+    table: GroupTable,
+) -> Dict[str, Any]:
+    '''
+    Drops the group names missing from the table, which _check_unknown has already reported.
+    '''
+    return {k: v for k, v in groups.items() if k in table.index}
+
+
+def _check_unknown(
+    unknown: Dict[str, int],
+    reported: Set[str],
+    strict: bool,
+    what: str,
+) -> None:
+    '''
+    Warns once per unknown group name, or raises in strict mode.
+    '''
+    if not unknown:
+        return
+    if strict:
+        raise ValueError(f"Unknown {what}: {sorted(unknown)}")
+    new = [k for k in unknown if k not in reported]
+    if new:
+        logger.warning(f"Ignoring unknown {what}: {new}")
+        reported.update(new)
+
+
+def _iter_chunks(
+    stream: TextIO,
+    input_format: str,
+    method: str,
+    chunk_size: int,
+    strict: bool = False,
+) -> Iterator[Tuple[Optional[List[Any]], np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]]:
+    '''
+    Yields (ids, counts, corrections, atoms) per input chunk.
+
+    Unknown group names are ignored with one warning per name, or raise ValueError when `strict`.
+    '''
+    reported: Set[str] = set()
+    if input_format == 'csv':
+        # NOTE: wide format, one column per group
+        for chunk in read_wide(stream, method, chunk_size=chunk_size,
+                               input_format='csv'):
+            if method == 'joback' and chunk['atoms'] is None:
+                raise ValueError(
+                    f"CSV input for Joback needs a '{ATOMS_COLUMN}' column.")
+            _check_unknown(chunk['unknown'], reported, strict, "group columns")
+            yield chunk['ids'], chunk['counts'], chunk['corrections'], chunk['atoms']
+        return
+
+    for records in _read_jsonl(stream, chunk_size):
+        ids = [r.get(ID_COLUMN) for r in records] \
+            if any(ID_COLUMN in r for r in records) else None
+        split = [_split_record(r, method) for r in records]
+        if method == 'joback':
+            if any(ATOMS_COLUMN not in r for r in records):
+                raise ValueError(
+                    f"Every Joback record needs '{ATOMS_COLUMN}'.")
+            table = load_joback_table()
+            _check_unknown(_unknown_groups(
+                [g for g, _ in split], table), reported, strict, "groups")
+            atoms = np.array([r[ATOMS_COLUMN] for r in records], dtype=float)
+            yield ids, JobackBatch.count_matrix(
+                [_known_groups(g, table) for g, _ in split]), None, atoms
+        else:
+            contributions_table, corrections_table = load_zabransky_ruzicka_tables()
+            unknown = _unknown_groups([g for g, _ in split], contributions_table)
+            for k, n in _unknown_groups([c for _, c in split], corrections_table).items():
+                unknown[k] = unknown.get(k, 0) + n
+            _check_unknown(unknown, reported, strict, "groups")
+            counts, corrections = ZabranskyRuzickaBatch.count_matrices(
+                [_known_groups(g, contributions_table) for g, _ in split],
+                [_known_groups(c, corrections_table) for _, c in split])
+            yield ids, counts, corrections, None
+
+
+# SECTION: writers
+
+class _Writer:
+    '''
+    Incremental CSV / JSONL / Parquet writer.
+    '''
+
+    def __init__(self, path: Optional[str], output_format: str):
+        self.path = path
+        self.output_format = output_format
+        self._stream: Optional[TextIO] = None
+        self._csv: Optional[Any] = None
+        self._parquet: Optional[ParquetBatchWriter] = None
+
+        if output_format == 'parquet':
+            if path is None or path == '-':
+                raise ValueError("Parquet output needs a file path (-o).")
+            try:
+                self._parquet = ParquetBatchWriter(path)
+            except ImportError as e:
+                raise ValueError(str(e))
+        elif path is None or path == '-':
+            self._stream = sys.stdout
+        else:
+            self._stream = open(path, 'w', newline='', encoding='utf-8')
+
+    def write(self, columns: Dict[str, Any], method: str) -> None:
+        if self._parquet is not None:
+            self._parquet.write(columns_to_arrow(
+                columns, schema_metadata=METHOD_METADATA[method.replace('-', '_')]))
+            return
+
+        names = list(columns)
+        rows = zip(*(np.asarray(columns[k]).tolist() for k in names))
+
+        if self.output_format == 'csv':
+            if self._csv is None:
+                self._csv = csv.writer(self._stream)
+                self._csv.writerow(names)
+            self._csv.writerows(rows)
+        else:
+            buf = io.StringIO()
+            for row in rows:
+                buf.write(json.dumps(
+                    {k: (None if isinstance(v, float) and not np.isfinite(v) else v)
+                     for k, v in zip(names, row)}
+                ))
+                buf.write('\n')
+            self._stream.write(buf.getvalue())
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        elif self._stream is not None:
+            self._stream.flush()
+
+
+def _guess_format(path: Optional[str], default: str) -> str:
+    if path and path != '-':
+        suffix = path.rsplit('.', 1)[-1].lower()
+        if suffix in ('csv', 'parquet'):
+            return suffix
+        if suffix in ('jsonl', 'ndjson', 'json'):
+            return 'jsonl'
+    return default
+
+
+def run(
+    method: str,
+    input_path: Optional[str] = None,
+    output_path: Optional[str] = None,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    chunk_size: int = 10000,
+    temperatures: Sequence[float] = (),
+    quiet: bool = False,
+    strict: bool = False,
+) -> int:
+    '''
+    Streams an input file through a batch estimation method.
+
+    Parameters
+    ----------
+    method : str
+        'joback' or 'zabransky-ruzicka'.
+    input_path : str, optional
+        Input file, by default None (stdin).
+    output_path : str, optional
+        Output file, by default None (stdout).
+    input_format : str, optional
+        'jsonl' or 'csv', by default guessed from the file name (jsonl for stdin).
+    output_format : str, optional
+        'csv', 'jsonl' or 'parquet', by default guessed from the file name (csv for stdout).
+    chunk_size : int, optional
+        Rows per vectorized chunk, by default 10000.
+    temperatures : Sequence[float], optional
+        Temperatures (K) at which to tabulate heat capacity, by default none.
+    quiet : bool, optional
+        Suppress the throughput report on stderr, by default False.
+    strict : bool, optional
+        Fail on unknown group names instead of ignoring them with a warning, by default False.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    '''
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+
+    input_format = input_format or _guess_format(input_path, 'jsonl')
+    output_format = output_format or _guess_format(output_path, 'csv')
+
+    stream = sys.stdin if input_path in (None, '-') else \
+        open(input_path, 'r', newline='', encoding='utf-8')
+    writer = _Writer(output_path, output_format)
+
+    n_rows = 0
+    t0 = time.perf_counter()
+    try:
+        for ids, counts, corrections, atoms in _iter_chunks(
+                stream, input_format, method, chunk_size, strict):
+            columns: Dict[str, Any] = {}
+            if ids is not None:
+                columns[ID_COLUMN] = ids
+            columns.update(_evaluate_chunk(
+                method, counts, corrections, atoms, temperatures))
+            writer.write(columns, method)
+
+            n_rows += counts.shape[0]
+            if not quiet:
+                elapsed = time.perf_counter() - t0
+                sys.stderr.write(
+                    f"\r{n_rows:,} rows  {n_rows / max(elapsed, 1e-9):,.0f} rows/s")
+                sys.stderr.flush()
+    finally:
+        writer.close()
+        if stream is not sys.stdin:
+            stream.close()
+
+    if not quiet:
+        elapsed = time.perf_counter() - t0
+        sys.stderr.write(
+            f"\r{n_rows:,} rows in {elapsed:.2f} s  "
+            f"({n_rows / max(elapsed, 1e-9):,.0f} rows/s)\n")
+    return n_rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    '''
+    Entry point of the `pythermoest` command.
+    '''
+    parser = argparse.ArgumentParser(
+        prog='pythermoest',
+        description="Stream group compositions through the batch estimation methods.",
+    )
+    parser.add_argument('--version', action='version',
+                        version=f"%(prog)s {__version__}")
+    parser.add_argument('method', choices=['joback', 'zabransky-ruzicka'])
+    parser.add_argument('input', nargs='?', default='-',
+                        help="input file (JSON Lines or wide CSV), '-' for stdin")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file, '-' for stdout")
+    parser.add_argument('--input-format', choices=['jsonl', 'csv'])
+    parser.add_argument('--output-format', choices=['csv', 'jsonl', 'parquet'])
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help="rows per vectorized chunk (default 10000)")
+    parser.add_argument('-T', '--temperature', type=float, action='append', default=[],
+                        help="tabulate heat capacity at this temperature in K (repeatable)")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="do not report throughput on stderr")
+    parser.add_argument('--strict', action='store_true',
+                        help="fail on unknown group names instead of ignoring them")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    try:
+        run(
+            method=args.method,
+            input_path=args.input,
+            output_path=args.output,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            chunk_size=args.chunk_size,
+            temperatures=args.temperature,
+            quiet=args.quiet,
+            strict=args.strict,
+        )
+    except BrokenPipeError:
+        return 0
+    except (ValueError, OSError) as e:
+        sys.stderr.write(f"pythermoest: error: {e}\n")
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
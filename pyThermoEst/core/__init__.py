@@ -1,9 +1,38 @@
-from .joback import Joback
+from .joback import Joback, JobackProperties
 from .zabransky_ruzicka import ZabranskyRuzicka
 from .antoine import Antoine
+from .batch import JobackBatch, ZabranskyRuzickaBatch
+from .vapor_pressure import (
+    VaporPressureCorrelation,
+    AntoineCorrelation,
+    ExtendedAntoineCorrelation,
+    WagnerCorrelation,
+    DIPPR101Correlation,
+    get_correlation,
+)
+from .regression import JobackRegression, ZabranskyRuzickaRegression
+from .parallel import ParallelEstimator, ShardingPolicy, FixedSizeSharding, EvenSharding
+from .kernels import set_kernel_backend, kernel_backend
 
 __all__ = [
     'Joback',
+    'JobackProperties',
     'ZabranskyRuzicka',
     'Antoine',
+    'JobackBatch',
+    'ZabranskyRuzickaBatch',
+    'ParallelEstimator',
+    'ShardingPolicy',
+    'FixedSizeSharding',
+    'EvenSharding',
+    'VaporPressureCorrelation',
+    'AntoineCorrelation',
+    'ExtendedAntoineCorrelation',
+    'WagnerCorrelation',
+    'DIPPR101Correlation',
+    'get_correlation',
+    'JobackRegression',
+    'ZabranskyRuzickaRegression',
+    'set_kernel_backend',
+    'kernel_backend',
 ]
@@ -9,6 +9,7 @@ from scipy.optimize import least_squares
 from pathlib import Path
 import pycuc
 # local
+from . import kernels
 
 # NOTE: set up logger
 logger = logging.getLogger(__name__)
@@ -22,6 +23,9 @@ class Antoine:
     - VaPr(T) = exp(A - B/(T + C))
     """
 
+    # NOTE: default (A, B, C) bounds used by the fitters
+    DEFAULT_BOUNDS = ((-200.0, 1e-6, -1e4), (200.0, 1e7, 1e4))
+
     def __init__(self):
         """
         Initialize with vapor pressure and derivative functions.
@@ -96,24 +100,102 @@ class Antoine:
         Dict[str, Any]
             Returns a fit report dict with coefficients, metrics, warnings, and solver info.
         """
-        # SECTION: Input validation and conversion
-        # NOTE: Convert inputs to arrays
-        T = np.asarray(T_data, dtype=float).ravel()
-        P = np.asarray(P_data, dtype=float).ravel()
+        # NOTE: the shared correlation fitter does unit normalization, weighting, the solve,
+        # metrics and validation; imported here since vapor_pressure imports this module
+        from .vapor_pressure import AntoineCorrelation
 
-        # Check sizes
-        if T.size != P.size or T.size < 3:
-            logger.error(
-                "T_data and P_data must have same length and at least 3 points.")
+        base = base.lower()
+        if base not in ("log10", "ln"):
+            logger.error("base must be 'log10' or 'ln'.")
+            return {}
+        ln_base = math.log(10.0) if base == "log10" else 1.0
+
+        # NOTE: log-space residuals are in ln P there, i.e. ln_base times the log_b residuals of this
+        # method; scaling f_scale the same way solves the identical (robust) problem
+        scale = ln_base if fit_in_log_space else 1.0
+        if f_scale is None and fit_in_log_space:
+            f_scale = Antoine.auto_f_scale(loss, True, np.empty(0))
+
+        report = AntoineCorrelation(base).fit(
+            T_data,
+            P_data,
+            T_unit=T_unit,
+            p_unit=p_unit,
+            fit_in_log_space=fit_in_log_space,
+            weights=weights,
+            x0=x0,
+            bounds=bounds,
+            max_nfev=max_nfev,
+            validate=validate,
+            min_margin_kelvin=min_margin_kelvin,
+            loss=loss,
+            f_scale=None if f_scale is None else float(f_scale) * scale,
+        )
+        if not report:
             return {}
 
-        # SECTION: Unit normalization
-        # ! Temperature and pressure will be converted to K and Pa internally for fitting, regardless of input units. The fit report will indicate the internal units used.
-        # NOTE: Normalize string inputs
+        # SECTION: Return fit report
+        # ! metrics in log_b P are the ln P metrics divided by ln(b); r2 and cov do not depend on the scale
+        params = report["parameters"]
+        return {
+            "A": params["A"],
+            "B": params["B"],
+            "C": params["C"],
+            "base": base,
+            "p_unit": report["p_unit"],
+            "T_unit_internal": report["T_unit_internal"],
+            "fit_in_log_space": report["fit_in_log_space"],
+            "success": report["success"],
+            "message": report["message"],
+            "cost": report["cost"] / scale**2,
+            "rmse_logP": report["rmse_lnP"] / ln_base,
+            "mae_logP": report["mae_lnP"] / ln_base,
+            "r2_logP": report["r2_lnP"],
+            "rmse_lnP": report["rmse_lnP"],
+            "mae_lnP": report["mae_lnP"],
+            "r2_lnP": report["r2_lnP"],
+            "rmse_P": report["rmse_P"],
+            "mae_P": report["mae_P"],
+            "cov": report["cov"],
+            "warnings": report["warnings"],
+            "Tmin_K": report["Tmin_K"],
+            "Tmax_K": report["Tmax_K"],
+            # robust metadata
+            "loss": report["loss"],
+            "f_scale": report["f_scale"] / scale,
+        }
+
+    @staticmethod
+    def normalize_data(
+        T_data: np.ndarray,
+        P_data: np.ndarray,
+        *,
+        T_unit: str = "K",
+        p_unit: str = "Pa",
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Convert (T, P) data to K and Pa and check that every pressure is positive.
+
+        Parameters
+        ----------
+        T_data : np.ndarray
+            Array of temperature data points.
+        P_data : np.ndarray
+            Array of vapor pressure data points.
+        T_unit : str, optional
+            Unit of temperature data: 'K' or 'C' (default 'K').
+        p_unit : str, optional
+            Unit of pressure data: 'Pa', 'kPa', 'bar', 'atm' or 'psi' (default 'Pa').
+
+        Returns
+        -------
+        Optional[Tuple[np.ndarray, np.ndarray]]
+            Temperatures in K and pressures in Pa, or None on invalid units or pressures.
+        """
+        T = np.asarray(T_data, dtype=float).ravel()
+        P = np.asarray(P_data, dtype=float).ravel()
         T_unit = T_unit.lower()
-        base = base.lower()
         p_unit = p_unit.lower()
-        loss = loss.lower()
 
         # >> Convert temperature to K
         if T_unit in ("k", "kelvin"):
@@ -122,7 +204,7 @@ class Antoine:
             T_k = T + 273.15
         else:
             logger.error("T_unit must be 'K' or 'C'.")
-            return {}
+            return None
 
         # >> Convert pressure to Pa
         if p_unit == "pa":
@@ -137,185 +219,642 @@ class Antoine:
             P_pa = P * 6894.76
         else:
             logger.error("p_unit must be 'Pa' or 'bar'.")
-            return {}
+            return None
 
         # >> Check pressures > 0
         if np.any(P_pa <= 0):
-            logger.error("All pressures must be > 0 for Antoine fitting.")
-            return {}
+            logger.error("All pressures must be > 0 for vapor pressure fitting.")
+            return None
 
-        # NOTE: Choose log target
-        if base == "log10":
-            y = np.log10(P_pa)
-        elif base == "ln":
-            y = np.log(P_pa)
-        else:
-            logger.error("base must be 'log10' or 'ln'.")
-            return {}
+        return T_k, P_pa
 
-        # NOTE: weights (sqrt form)
-        if weights is None:
-            w = np.ones_like(T_k)
-        else:
-            w_raw = np.asarray(weights, dtype=float).ravel()
-            if w_raw.size != T_k.size:
-                logger.error("weights must have same length as data.")
-                return {}
+    @staticmethod
+    def auto_f_scale(
+        loss: str,
+        fit_in_log_space: bool,
+        P_pa: np.ndarray,
+    ) -> float:
+        """
+        Default f_scale of a robust loss: 0.02 in log space, 2 % of the median pressure (at least 1 Pa) in pressure space, 1.0 for the linear loss.
+        """
+        if loss.lower() == "linear":
+            return 1.0
+        if fit_in_log_space:
+            return 0.02
+        return max(1.0, float(np.median(P_pa) * 0.02))
 
-            # Ensure non-negative weights
-            w = np.sqrt(np.clip(w_raw, 0.0, np.inf))
+    @staticmethod
+    def search_box(
+        T_k: np.ndarray,
+        *,
+        base: str = "log10",
+        bounds: Optional[
+            Tuple[
+                Tuple[float, float, float],
+                Tuple[float, float, float]
+            ]
+        ] = None,
+        min_margin_kelvin: float = 1.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finite (A, B, C) box for sampling starting points, in K and Pa.
 
-        # SECTION: Define model and residuals
-        def model_log(params: np.ndarray) -> np.ndarray:
-            A_, B_, C_ = params
-            return A_ - B_ / (T_k + C_)
+        A in [0, 20] and B in [10, 1e4] (scaled by ln(10) for base 'ln'), C in [-min(T) + margin, 100] K, intersected with bounds.
 
-        # NOTE: Define residuals
-        if fit_in_log_space:
-            def residuals(params: np.ndarray) -> np.ndarray:
-                return w * (model_log(params) - y)
-        else:
-            if base == "log10":
-                def Pmodel(params: np.ndarray) -> np.ndarray:
-                    return 10.0 ** model_log(params)
-            else:
-                def Pmodel(params: np.ndarray) -> np.ndarray:
-                    return np.exp(model_log(params))
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Lower and upper corners, each of shape (3,).
+        """
+        if bounds is None:
+            bounds = Antoine.DEFAULT_BOUNDS
+        s = 1.0 if base.lower() == "log10" else math.log(10.0)
+        lo = np.array([0.0, 10.0 * s, -float(np.min(T_k)) + min_margin_kelvin])
+        hi = np.array([20.0 * s, 1e4 * s, 100.0])
+
+        lo = np.maximum(lo, np.asarray(bounds[0], dtype=float))
+        hi = np.minimum(hi, np.asarray(bounds[1], dtype=float))
+        if np.any(hi <= lo):
+            # ! the bounds exclude the default box, sample inside the bounds
+            lo = np.asarray(bounds[0], dtype=float)
+            hi = np.asarray(bounds[1], dtype=float)
+        return lo, hi
 
-            def residuals(params: np.ndarray) -> np.ndarray:
-                return w * (Pmodel(params) - P_pa)
+    @staticmethod
+    def latin_hypercube(
+        n_points: int,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        seed: Optional[int | np.random.Generator] = None,
+    ) -> np.ndarray:
+        """
+        Latin-hypercube sample of n_points in the box [lower, upper]: each dimension is split into n_points strata, each stratum is hit exactly once.
+
+        Returns
+        -------
+        np.ndarray
+            Points of shape (n_points, len(lower)).
+        """
+        if n_points <= 0:
+            raise ValueError("n_points must be positive.")
+        rng = np.random.default_rng(seed)
+        lower = np.asarray(lower, dtype=float)
+        upper = np.asarray(upper, dtype=float)
+        d = lower.size
+
+        # NOTE: one random point per stratum, strata shuffled per dimension
+        u = (rng.random((n_points, d)) +
+             np.arange(n_points)[:, None]) / n_points
+        for j in range(d):
+            u[:, j] = u[rng.permutation(n_points), j]
+        return lower + u * (upper - lower)
+
+    @staticmethod
+    def fit_antoine_many(
+        datasets: List[Tuple[np.ndarray, np.ndarray]],
+        **fit_options: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fit Antoine coefficients to several independent datasets.
+
+        Parameters
+        ----------
+        datasets : List[Tuple[np.ndarray, np.ndarray]]
+            List of (T_data, P_data) pairs.
+        **fit_options : Any
+            Keyword options forwarded to fit_antoine().
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One fit report per dataset in input order; an empty dict marks a failed fit.
+        """
+        reports: List[Dict[str, Any]] = []
+        for i, (T_data, P_data) in enumerate(datasets):
+            try:
+                reports.append(
+                    Antoine.fit_antoine(T_data, P_data, **fit_options)
+                )
+            except Exception as e:
+                logger.error(f"Antoine fit failed for dataset {i}: {e}")
+                reports.append({})
+        return reports
+
+    @staticmethod
+    def fit_antoine_batch(
+        datasets: List[Tuple[np.ndarray, np.ndarray]],
+        *,
+        base: str = "log10",
+        fit_in_log_space: bool = True,
+        weights: Optional[List[Optional[np.ndarray]]] = None,
+        bounds: Optional[
+            Tuple[
+                Tuple[float, float, float],
+                Tuple[float, float, float]
+            ]
+        ] = None,
+        max_nfev: int = 200,
+        min_margin_kelvin: float = 1.0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Fit Antoine coefficients to many small datasets in one batched solve.
 
-        # NOTE: Initial guess
-        if x0 is None:
-            C0 = -50.0
-            if np.min(T_k + C0) <= min_margin_kelvin:
-                # ! C0 too low, adjust
-                C0 = -np.min(T_k) + 10.0
+        Datasets of any length are padded with zero-weight points, started from the same initial guess as fit_antoine(), and solved by the batched Levenberg-Marquardt of refit_many(); rows it cannot finish go to least_squares. Only coefficients, cost and fit quality are returned (no covariance or validation), which removes the per-dataset Python overhead for datasets of 10-20 points.
 
-            # ! A0: mean logP
-            A0 = float(np.mean(y))
+        Parameters
+        ----------
+        datasets : List[Tuple[np.ndarray, np.ndarray]]
+            List of (T_data, P_data) pairs in K and Pa.
+        base : str, optional
+            Logarithm base for Antoine equation: 'log10' or 'ln' (default 'log10').
+        fit_in_log_space : bool, optional
+            If True, fit in log space; else fit in pressure space (default True).
+        weights : Optional[List[Optional[np.ndarray]]], optional
+            Weights per dataset, None entries for equal weights (default None).
+        bounds : Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]], optional
+            Bounds for (A, B, C) (default None = DEFAULT_BOUNDS).
+        max_nfev : int, optional
+            Maximum number of iterations per dataset (default 200).
+        min_margin_kelvin : float, optional
+            Minimum margin for (T + C) of the initial guess (default 1.0 K).
 
-            # ! B0: from rough slope
-            m, _b = np.polyfit(1.0 / T_k, y, 1)
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays of shape (n_datasets,): 'A', 'B', 'C', 'cost', 'rmse_logP', 'success'; failed fits are NaN with success False.
+        """
+        base = base.lower()
+        if base not in ("log10", "ln"):
+            raise ValueError("base must be 'log10' or 'ln'.")
+        n_fits = len(datasets)
+        sizes = np.array([np.asarray(T).size for T, _ in datasets], dtype=int)
+        # NOTE: at least one padded column, so empty batches reduce cleanly
+        n_max = max(int(sizes.max()) if n_fits else 0, 1)
+
+        # SECTION: pad to (n_fits, n_max); padded points carry zero weight
+        T = np.ones((n_fits, n_max))
+        P = np.ones((n_fits, n_max))
+        w = np.zeros((n_fits, n_max))
+        for k, (T_data, P_data) in enumerate(datasets):
+            T_k = np.asarray(T_data, dtype=float).ravel()
+            P_k = np.asarray(P_data, dtype=float).ravel()
+            if T_k.size != P_k.size or T_k.size < 3:
+                sizes[k] = 0
+                continue
+            n = T_k.size
+            T[k, :n], P[k, :n] = T_k, P_k
+            T[k, n:], P[k, n:] = T_k[-1], P_k[-1]
+            w_k = np.ones(n) if weights is None or weights[k] is None \
+                else np.sqrt(np.clip(np.asarray(weights[k], dtype=float).ravel(), 0.0, np.inf))
+            w[k, :n] = w_k
+
+        with np.errstate(all="ignore"):
+            valid = (sizes >= 3) & np.all(np.isfinite(T), axis=1) & np.all(P > 0, axis=1)
+            mask = (np.arange(n_max)[None, :] < sizes[:, None]) & valid[:, None]
+            y = np.log10(P) if base == "log10" else np.log(P)
+
+            # SECTION: initial guess, vectorized form of fit_antoine()
+            cnt = np.maximum(mask.sum(axis=1), 1)
+            T_min = np.where(mask, T, np.inf).min(axis=1)
+            C0 = np.where(T_min - 50.0 <= min_margin_kelvin, -T_min + 10.0, -50.0)
+            A0 = np.where(mask, y, 0.0).sum(axis=1) / cnt
+            u = np.where(mask, 1.0 / T, 0.0)
+            u_mean = u.sum(axis=1) / cnt
+            du = np.where(mask, u - u_mean[:, None], 0.0)
+            slope = (du * np.where(mask, y - A0[:, None], 0.0)).sum(axis=1) / (du**2).sum(axis=1)
+            T_mean = np.where(mask, T, 0.0).sum(axis=1) / cnt
+            B0 = np.abs(slope) * ((T_mean + C0) / T_mean) ** 2
+            B0 = np.where(np.isfinite(B0) & (B0 > 1e-6), B0, 2000.0)
+            x0 = np.column_stack([A0, B0, C0])
+
+            # SECTION: batched solve
+            coef = np.full((n_fits, 3), np.nan)
+            costs = np.full(n_fits, np.nan)
+            if valid.any():
+                targets = y if fit_in_log_space else P
+                coef[valid], costs[valid] = Antoine.refit_many(
+                    T[valid], targets[valid], w[valid], x0[valid],
+                    base=base, fit_in_log_space=fit_in_log_space, bounds=bounds,
+                    max_nfev=max_nfev, return_cost=True)
+
+            # NOTE: unweighted log-space rmse over the real points
+            y_hat = coef[:, :1] - coef[:, 1:2] / (T + coef[:, 2:3])
+            sq = np.where(mask, (y_hat - y) ** 2, 0.0)
+            rmse = np.sqrt(sq.sum(axis=1) / cnt)
+
+        success = valid & np.all(np.isfinite(coef), axis=1)
+        rmse[~success] = np.nan
+        return {
+            "A": coef[:, 0],
+            "B": coef[:, 1],
+            "C": coef[:, 2],
+            "cost": costs,
+            "rmse_logP": rmse,
+            "success": success,
+        }
 
-            Tmean = float(np.mean(T_k))
-            ratio = (float(np.mean(T_k + C0)) / Tmean) ** 2
-            B0 = float(abs(m) * ratio)
+    @staticmethod
+    def refit_many(
+        T_samples: np.ndarray,
+        Y_samples: np.ndarray,
+        w_samples: np.ndarray,
+        x0: Tuple[float, float, float] | np.ndarray,
+        *,
+        base: str = "log10",
+        fit_in_log_space: bool = True,
+        bounds: Optional[
+            Tuple[
+                Tuple[float, float, float],
+                Tuple[float, float, float]
+            ]
+        ] = None,
+        max_nfev: int = 100,
+        loss: str = "linear",
+        f_scale: float = 1.0,
+        return_cost: bool = False,
+        keep_unconverged: bool = False,
+    ) -> np.ndarray | Tuple[np.ndarray, np.ndarray]:
+        """
+        Refit (A, B, C) to many datasets of equal length, warm-started from one solution or from one start per row.
 
-            # >> sanity check B0
-            if not np.isfinite(B0) or B0 <= 1e-6:
-                B0 = 2000.0
+        Only the coefficients are computed (no metrics or validation), and the Jacobian is analytic, so each refit costs a few residual evaluations.
 
-            # ! > assemble x0
-            x0 = (A0, B0, C0)
+        Parameters
+        ----------
+        T_samples : np.ndarray
+            Temperatures in K, shape (n_fits, n_points).
+        Y_samples : np.ndarray
+            Fit targets, shape (n_fits, n_points): log(P) in the given base if fit_in_log_space, else P in Pa.
+        w_samples : np.ndarray
+            Square-root weights, shape (n_fits, n_points).
+        x0 : Tuple[float, float, float] | np.ndarray
+            Starting point (A, B, C), usually the base fit, or starts of shape (n_fits, 3).
+        base : str, optional
+            Logarithm base: 'log10' or 'ln' (default 'log10').
+        fit_in_log_space : bool, optional
+            Whether the targets are log pressures (default True).
+        bounds : Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]], optional
+            Bounds for (A, B, C) (default None = DEFAULT_BOUNDS).
+        max_nfev : int, optional
+            Maximum number of function evaluations per refit (default 100).
+        loss : str, optional
+            Robust loss of the base fit (default 'linear').
+        f_scale : float, optional
+            Scaling parameter of the robust loss (default 1.0).
+        return_cost : bool, optional
+            Whether to also return the final cost of each refit (default False).
+        keep_unconverged : bool, optional
+            Continue a refit that runs out of max_nfev once with ten times the budget, and keep it even if it is still unconverged (default False). Bootstrap refits use this, since dropping the slow resamples narrows the intervals.
 
-        # >> Convert x0 to array
-        x0_array = np.asarray(x0, dtype=float)
+        Returns
+        -------
+        np.ndarray | Tuple[np.ndarray, np.ndarray]
+            Coefficients of shape (n_fits, 3), and the costs of shape (n_fits,) if return_cost; failed refits are NaN.
+        """
+        T_samples = np.atleast_2d(np.asarray(T_samples, dtype=float))
+        Y_samples = np.atleast_2d(np.asarray(Y_samples, dtype=float))
+        w_samples = np.atleast_2d(np.asarray(w_samples, dtype=float))
 
-        # NOTE: Default bounds
         if bounds is None:
-            bounds = ((-200.0, 1e-6, -1e4), (200.0, 1e7, 1e4))
+            bounds = Antoine.DEFAULT_BOUNDS
+        ln_base = math.log(10.0) if base.lower() == "log10" else 1.0
+        x0_array = np.broadcast_to(np.clip(
+            np.asarray(x0, dtype=float), bounds[0], bounds[1]),
+            (T_samples.shape[0], 3))
+
+        out = np.full((T_samples.shape[0], 3), np.nan)
+        cost = np.full(T_samples.shape[0], np.nan)
+        todo = np.arange(T_samples.shape[0])
+
+        # NOTE: least squares refits run together as one batched Levenberg-Marquardt
+        if loss.lower() == "linear":
+            x, done, c = Antoine._refit_batched_lm(
+                T_samples, Y_samples, w_samples, x0_array,
+                fit_in_log_space=fit_in_log_space, ln_base=ln_base,
+                bounds=bounds, max_iter=max_nfev)
+            out[done], cost[done] = x[done], c[done]
+            todo = np.flatnonzero(~done)
+
+        # NOTE: robust losses and unconverged rows fall back to scipy
+        for k in todo:
+            T_k, y, w = T_samples[k], Y_samples[k], w_samples[k]
+
+            # NOTE: a resample needs three distinct temperatures
+            if np.unique(T_k).size < 3:
+                continue
+
+            if kernels.use_numba():
+                # NOTE: compiled residual/Jacobian kernel
+                def residuals(params: np.ndarray) -> np.ndarray:
+                    return kernels.antoine_residual_jacobian(
+                        params, T_k, y, w, bool(fit_in_log_space), ln_base)[0]
+
+                def jacobian(params: np.ndarray) -> np.ndarray:
+                    return kernels.antoine_residual_jacobian(
+                        params, T_k, y, w, bool(fit_in_log_space), ln_base)[1]
+            else:
+                def residuals(params: np.ndarray) -> np.ndarray:
+                    A_, B_, C_ = params
+                    m = A_ - B_ / (T_k + C_)
+                    if fit_in_log_space:
+                        return w * (m - y)
+                    return w * (np.exp(ln_base * m) - y)
+
+                def jacobian(params: np.ndarray) -> np.ndarray:
+                    _A, B_, C_ = params
+                    inv = 1.0 / (T_k + C_)
+                    J = np.column_stack([np.ones_like(T_k), -inv, B_ * inv**2])
+                    if fit_in_log_space:
+                        return w[:, None] * J
+                    P_hat = np.exp(ln_base * (_A - B_ * inv))
+                    return (w * P_hat * ln_base)[:, None] * J
+
+            try:
+                with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+                    res = least_squares(
+                        residuals,
+                        x0=x0_array[k],
+                        jac=jacobian,
+                        bounds=bounds,
+                        max_nfev=max_nfev,
+                        loss=loss,
+                        f_scale=float(f_scale),
+                    )
+                    if res.status == 0 and keep_unconverged:
+                        # NOTE: out of budget (slow along the A-B-C valley), continue once with more
+                        res = least_squares(
+                            residuals,
+                            x0=res.x,
+                            jac=jacobian,
+                            bounds=bounds,
+                            max_nfev=10 * max_nfev,
+                            loss=loss,
+                            f_scale=float(f_scale),
+                        )
+                converged = res.status > 0 or (keep_unconverged and res.status == 0)
+                if converged and np.all(np.isfinite(res.x)):
+                    out[k], cost[k] = res.x, res.cost
+            except Exception as e:
+                logger.debug(f"Antoine refit {k} failed: {e}")
+
+        return (out, cost) if return_cost else out
 
-        # NOTE: Auto f_scale for robust loss if not provided
-        if f_scale is None:
-            if loss != "linear":
-                f_scale = 0.02 if fit_in_log_space else max(
-                    1.0, float(np.median(P_pa) * 0.02))
+    @staticmethod
+    def _refit_batched_lm(
+        T: np.ndarray,
+        Y: np.ndarray,
+        w: np.ndarray,
+        x0: np.ndarray,
+        *,
+        fit_in_log_space: bool,
+        ln_base: float,
+        bounds: Tuple[Tuple[float, float, float], Tuple[float, float, float]],
+        max_iter: int = 100,
+        xtol: float = 1e-10,
+        ftol: float = 1e-12,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Levenberg-Marquardt over many datasets at once, with Marquardt scaling and steps clipped to the bounds.
+
+        Returns the coefficients (n_fits, 3), a mask of the rows that converged strictly inside the bounds, and the costs (n_fits,); rows outside the mask should be refitted by `least_squares`.
+
+        Runs the compiled kernel when the numba backend is active (see `kernels.set_kernel_backend`); this NumPy loop is the reference.
+        """
+        n_fits = T.shape[0]
+        lo, hi = np.asarray(bounds[0], dtype=float), np.asarray(
+            bounds[1], dtype=float)
+
+        # NOTE: compiled per-row loop, same iteration as below
+        if kernels.use_numba():
+            return kernels.batched_lm(
+                np.ascontiguousarray(T, dtype=float),
+                np.ascontiguousarray(Y, dtype=float),
+                np.ascontiguousarray(w, dtype=float),
+                np.ascontiguousarray(np.broadcast_to(x0, (n_fits, 3)), dtype=float),
+                lo, hi, bool(fit_in_log_space), float(ln_base),
+                int(max_iter), float(xtol), float(ftol))
+
+        def _eval(x: np.ndarray, rows: np.ndarray, jac: bool):
+            A_, B_, C_ = x[:, :1], x[:, 1:2], x[:, 2:3]
+            inv = 1.0 / (T[rows] + C_)
+            m = A_ - B_ * inv
+            if fit_in_log_space:
+                r = w[rows] * (m - Y[rows])
+                scale = w[rows]
             else:
-                f_scale = 1.0
+                P_hat = np.exp(ln_base * m)
+                r = w[rows] * (P_hat - Y[rows])
+                scale = w[rows] * P_hat * ln_base
+            if not jac:
+                return r, None
+            J = np.stack([scale, -scale * inv, scale * B_ * inv**2], axis=-1)
+            return r, J
+
+        x = np.broadcast_to(x0, (n_fits, 3)).copy()
+        lam = np.full(n_fits, 1e-3)
+        active = np.ones(n_fits, dtype=bool)
+        converged = np.zeros(n_fits, dtype=bool)
+
+        with np.errstate(all="ignore"):
+            rows = np.arange(n_fits)
+            r, J = _eval(x, rows, jac=True)
+            cost = 0.5 * np.einsum('bn,bn->b', r, r)
+            active &= np.isfinite(cost)
+
+            for _ in range(max_iter):
+                rows = np.flatnonzero(active)
+                if rows.size == 0:
+                    break
+
+                # NOTE: damped normal equations, (b, 3, 3)
+                Jr, rr = J[rows], r[rows]
+                H = np.einsum('bni,bnj->bij', Jr, Jr)
+                g = np.einsum('bni,bn->bi', Jr, rr)
+                d = np.diagonal(H, axis1=1, axis2=2)
+                D = np.maximum(d, 1e-12 * d.max(axis=1, keepdims=True) + 1e-300)
+                M = H + (lam[rows, None] * D)[:, :, None] * np.eye(3)
+                try:
+                    step = -np.linalg.solve(M, g[..., None])[..., 0]
+                except np.linalg.LinAlgError:
+                    step = -np.einsum('bij,bj->bi', np.linalg.pinv(M), g)
+
+                x_new = np.clip(x[rows] + step, lo, hi)
+                r_new, J_new = _eval(x_new, rows, jac=True)
+                cost_new = 0.5 * np.einsum('bn,bn->b', r_new, r_new)
+
+                # NOTE: accept improving steps, adapt the damping
+                better = np.isfinite(cost_new) & (cost_new <= cost[rows])
+                acc = rows[better]
+                dx = np.abs(x_new[better] - x[acc])
+                small = np.all(
+                    dx <= xtol * (np.abs(x[acc]) + xtol), axis=1) | (
+                    cost[acc] - cost_new[better] <= ftol * cost[acc])
+                x[acc], r[acc], J[acc] = x_new[better], r_new[better], J_new[better]
+                cost[acc] = cost_new[better]
+                lam[acc] = np.maximum(lam[acc] / 3.0, 1e-12)
+                lam[rows[~better]] *= 4.0
+
+                # NOTE: stop on tiny accepted steps or cost changes, or hopeless damping
+                converged[acc[small]] = True
+                active[acc[small]] = False
+                active[rows[~better][lam[rows[~better]] > 1e12]] = False
+
+            # NOTE: rows pinned at a bound are left to the bounded solver
+            inside = np.all((x > lo) & (x < hi), axis=1)
+            # >> damping blow-up at a minimum counts as converged when the gradient vanishes
+            g_all = np.einsum('bni,bn->bi', J, r)
+            flat = np.all(np.abs(g_all) <= 1e-8 * (np.sqrt(2.0 * cost)[:, None] *
+                          np.sqrt(np.einsum('bni,bni->bi', J, J)) + 1e-300), axis=1)
+
+        ok = (converged | flat) & inside & np.all(np.isfinite(x), axis=1)
+        return x, ok, cost
 
-        # SECTION: Perform least squares fitting
-        res = least_squares(
-            residuals,
-            x0=x0_array,
-            bounds=bounds,
-            max_nfev=max_nfev,
-            loss=loss,
-            f_scale=float(f_scale),
-        )
+    @staticmethod
+    def bootstrap_samples(
+        T_data: np.ndarray,
+        P_data: np.ndarray,
+        fit_report: Dict[str, Any],
+        n_boot: int,
+        *,
+        method: str = "residual",
+        weights: Optional[np.ndarray] = None,
+        seed: Optional[int | np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Draw bootstrap datasets around a fit, in the space the fit was made in.
 
-        # NOTE: Extract fitted parameters
-        A, B, C = map(float, res.x)
+        - 'residual': keeps the temperatures and adds resampled, centered and dof-inflated weighted residuals to the fitted curve.
+        - 'pairs': resamples (T, P) points with replacement.
 
-        # NOTE: Predictions and metrics
-        y_hat = A - B / (T_k + C)
-        if base == "log10":
-            P_hat = 10.0 ** y_hat
-        else:
-            P_hat = np.exp(y_hat)
+        Parameters
+        ----------
+        T_data : np.ndarray
+            Temperatures in K.
+        P_data : np.ndarray
+            Vapor pressures in Pa.
+        fit_report : Dict[str, Any]
+            Fit report dict from fit_antoine().
+        n_boot : int
+            Number of bootstrap datasets.
+        method : str, optional
+            'residual' or 'pairs' (default 'residual').
+        weights : Optional[np.ndarray], optional
+            Weights of the base fit (default None = equal weights).
+        seed : int | np.random.Generator, optional
+            Seed or generator (default None).
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Temperatures, targets and square-root weights, each of shape (n_boot, n_points).
+        """
+        method = method.lower()
+        if method not in ("residual", "pairs"):
+            raise ValueError("method must be 'residual' or 'pairs'.")
+        if n_boot <= 0:
+            raise ValueError("n_boot must be positive.")
+
+        rng = np.random.default_rng(seed)
+        T = np.asarray(T_data, dtype=float).ravel()
+        P = np.asarray(P_data, dtype=float).ravel()
+        n = T.size
 
-        log_res = y_hat - y
+        w = np.ones(n) if weights is None else np.sqrt(
+            np.clip(np.asarray(weights, dtype=float).ravel(), 0.0, np.inf))
 
-        # NOTE: Metrics
-        rmse_log = float(np.sqrt(np.mean(log_res ** 2)))
-        mae_log = float(np.mean(np.abs(log_res)))
+        # NOTE: targets and fitted curve in the fit space
+        A, B, C = float(fit_report["A"]), float(
+            fit_report["B"]), float(fit_report["C"])
+        ln_base = math.log(10.0) if str(
+            fit_report.get("base", "log10")).lower() == "log10" else 1.0
+        m = A - B / (T + C)
+        if fit_report.get("fit_in_log_space", True):
+            y, y_hat = np.log(P) / ln_base, m
+        else:
+            y, y_hat = P, np.exp(ln_base * m)
 
-        P_res = P_hat - P_pa
-        rmse_P = float(np.sqrt(np.mean(P_res ** 2)))
-        mae_P = float(np.mean(np.abs(P_res)))
+        idx = rng.integers(0, n, size=(n_boot, n))
+        if method == "pairs":
+            return T[idx], y[idx], w[idx]
 
-        y_mean = float(np.mean(y))
-        ss_res = float(np.sum((y - y_hat) ** 2))
-        ss_tot = float(np.sum((y - y_mean) ** 2))
-        r2_log = float(1.0 - ss_res / ss_tot) if ss_tot > 0 else float("nan")
+        # NOTE: weighted residuals, centered and inflated by sqrt(n / (n - p))
+        r = w * (y - y_hat)
+        r = (r - r.mean()) * math.sqrt(n / max(1, n - 3))
+        w_safe = np.where(w > 0, w, 1.0)
+        Y = y_hat + r[idx] / w_safe
+        return np.broadcast_to(T, (n_boot, n)), Y, np.broadcast_to(w, (n_boot, n))
 
-        # NOTE: Covariance estimate (approx)
-        cov = None
-        try:
-            J = res.jac
-            dof = max(1, T_k.size - 3)
-            s2 = 2.0 * float(res.cost) / dof
-            cov = (s2 * np.linalg.inv(J.T @ J)).tolist()
-        except Exception:
-            cov = None
-
-        # SECTION: Validation checks
-        warnings: List[str] = []
-        if validate:
-            denom_min = float(np.min(T_k + C))
-            if denom_min <= min_margin_kelvin:
-                warnings.append(
-                    f"Risky fit: min(T + C) = {denom_min:.6g} K (<= {min_margin_kelvin} K). "
-                    "Denominator near zero can make the fit unstable."
-                )
+    @staticmethod
+    def bootstrap_summary(
+        samples: np.ndarray,
+        fit_report: Dict[str, Any],
+        *,
+        temperatures: Optional[np.ndarray] = None,
+        level: float = 0.95,
+    ) -> Dict[str, Any]:
+        """
+        Percentile confidence intervals from bootstrap coefficient samples.
 
-            idx = np.argsort(T_k)
-            if np.any(np.diff(P_hat[idx]) <= 0):
-                warnings.append(
-                    "Non-physical trend: fitted VaPr(T) is not strictly increasing over the data range.")
+        Parameters
+        ----------
+        samples : np.ndarray
+            Bootstrap coefficients of shape (n_boot, 3); NaN rows are failed refits and are dropped.
+        fit_report : Dict[str, Any]
+            Fit report dict from fit_antoine(), providing the point estimates.
+        temperatures : Optional[np.ndarray], optional
+            Temperatures in K at which Psat intervals are reported (default None).
+        level : float, optional
+            Confidence level (default 0.95).
 
-            if B < 10.0:
-                warnings.append(
-                    "Unusually small B; data range may be too narrow or units may be inconsistent.")
-            if B > 1e6:
-                warnings.append(
-                    "Very large B; check units and outliers in experimental data.")
+        Returns
+        -------
+        Dict[str, Any]
+            'A', 'B', 'C' and 'Psat' (one per temperature) intervals with 'estimate', 'lower', 'upper', 'std', plus 'n_boot' and 'n_success'.
+        """
+        if not 0.0 < level < 1.0:
+            raise ValueError("level must be in (0, 1).")
+
+        samples = np.asarray(samples, dtype=float).reshape(-1, 3)
+        ok = samples[np.all(np.isfinite(samples), axis=1)]
+        q = 50.0 * np.array([1.0 - level, 1.0 + level])
+        x_hat = np.array([fit_report["A"], fit_report["B"],
+                         fit_report["C"]], dtype=float)
+
+        def _interval(estimate: np.ndarray, draws: np.ndarray) -> List[Dict[str, float]]:
+            # NOTE: draws has shape (n_success, k)
+            if draws.shape[0] == 0:
+                lo = hi = sd = np.full(estimate.shape, np.nan)
+            else:
+                lo, hi = np.percentile(draws, q, axis=0)
+                sd = draws.std(axis=0, ddof=1) if draws.shape[0] > 1 \
+                    else np.zeros(estimate.shape)
+            return [
+                {"estimate": float(e), "lower": float(a),
+                 "upper": float(b), "std": float(s)}
+                for e, a, b, s in zip(estimate, lo, hi, sd)
+            ]
 
-        # SECTION: Return fit report
-        return {
-            "A": A,
-            "B": B,
-            "C": C,
-            "base": base,
-            "p_unit": "Pa",
-            "T_unit_internal": "K",
-            "fit_in_log_space": bool(fit_in_log_space),
-            "success": bool(res.success),
-            "message": str(res.message),
-            "cost": float(res.cost),
-            "rmse_logP": rmse_log,
-            "mae_logP": mae_log,
-            "r2_logP": r2_log,
-            "rmse_P": rmse_P,
-            "mae_P": mae_P,
-            "cov": cov,
-            "warnings": warnings,
-            "Tmin_K": float(np.min(T_k)),
-            "Tmax_K": float(np.max(T_k)),
-            # robust metadata
-            "loss": loss,
-            "f_scale": float(f_scale),
-        }
+        res: Dict[str, Any] = dict(zip(("A", "B", "C"), _interval(x_hat, ok)))
+
+        # NOTE: Psat draws, (n_success, n_T)
+        T = np.asarray(
+            temperatures if temperatures is not None else [], dtype=float).ravel()
+        ln_base = math.log(10.0) if str(
+            fit_report.get("base", "log10")).lower() == "log10" else 1.0
+        P_hat = np.exp(ln_base * (x_hat[0] - x_hat[1] / (T + x_hat[2])))
+        P_draws = np.exp(ln_base * (
+            ok[:, :1] - ok[:, 1:2] / (T[None, :] + ok[:, 2:3])))
+
+        res["temperatures"] = T.tolist()
+        res["Psat"] = _interval(P_hat, P_draws)
+        res["level"] = float(level)
+        res["n_boot"] = int(samples.shape[0])
+        res["n_success"] = int(ok.shape[0])
+        res["p_unit"] = "Pa"
+        if res["n_success"] < res["n_boot"]:
+            logger.warning(
+                f"{res['n_boot'] - res['n_success']} of {res['n_boot']} bootstrap refits failed and were dropped; the intervals may be too narrow.")
+        return res
 
     @staticmethod
     def _robust_weight(loss: str, z: float) -> float:
@@ -0,0 +1,1157 @@
+# import libs
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Any
+import numpy as np
+from pydantic import BaseModel
+from scipy.sparse import csr_matrix, issparse
+# locals
+from ..models import (
+    JobackGroupContributions,
+    ZabranskyRuzickaGroupContributions,
+    ZabranskyRuzickaGroupContributionsCorrections,
+    GroupUnit,
+    GroupTable,
+    EstimatedBatchProp,
+    JobackHeatCapacityBatch,
+    JobackIdealGasBatch,
+    JobackLiquidViscosityBatch,
+    ZabranskyRuzickaHeatCapacityBatch,
+)
+from .tables import load_joback_table, load_zabransky_ruzicka_tables
+from . import kernels
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: Joback batch properties (name: (unit, symbol))
+JOBACK_BATCH_PROPERTIES: Dict[str, Tuple[str, str]] = {
+    'freezing_point_temperature': ('K', 'Tf'),
+    'boiling_point_temperature': ('K', 'Tb'),
+    'critical_temperature': ('K', 'Tc'),
+    'critical_pressure': ('bar', 'Pc'),
+    'critical_volume': ('cm3/mol', 'Vc'),
+    'standard_enthalpy_of_formation_ideal_gas': ('kJ/mol', 'EnFo_IG'),
+    'standard_gibbs_energy_of_formation_ideal_gas': ('kJ/mol', 'GiEnFo_IG'),
+    'standard_enthalpy_of_fusion': ('kJ/mol', 'EnFus'),
+    'standard_enthalpy_of_vaporization': ('kJ/mol', 'EnVap'),
+}
+
+# NOTE: Joback sigma columns
+JOBACK_SIGMA_COLUMNS: Tuple[str, ...] = (
+    'Tc', 'Pc', 'Vc', 'Tb', 'Tf', 'EnFo_IG', 'GiEnFo_IG',
+    'a', 'b', 'c', 'd', 'EnFus', 'EnVap', 'ηa', 'ηb'
+)
+
+# NOTE: sigma columns needed by each Joback property (Tc also needs Tb)
+JOBACK_PROPERTY_SIGMA: Dict[str, Tuple[str, ...]] = {
+    'freezing_point_temperature': ('Tf',),
+    'boiling_point_temperature': ('Tb',),
+    'critical_temperature': ('Tc', 'Tb'),
+    'critical_pressure': ('Pc',),
+    'critical_volume': ('Vc',),
+    'standard_enthalpy_of_formation_ideal_gas': ('EnFo_IG',),
+    'standard_gibbs_energy_of_formation_ideal_gas': ('GiEnFo_IG',),
+    'standard_enthalpy_of_fusion': ('EnFus',),
+    'standard_enthalpy_of_vaporization': ('EnVap',),
+    'heat_capacity': ('a', 'b', 'c', 'd'),
+    'liquid_viscosity': ('ηa', 'ηb'),
+}
+
+
+def joback_sigma_columns(
+    properties: Optional[Sequence[str]] = None,
+) -> Tuple[str, ...]:
+    '''
+    Returns the sigma columns needed by a selection of Joback properties.
+
+    Parameters
+    ----------
+    properties : Sequence[str], optional
+        Property names (keys of `JOBACK_PROPERTY_SIGMA`), by default None for all.
+
+    Returns
+    -------
+    columns : Tuple[str, ...]
+        Sigma columns in `JOBACK_SIGMA_COLUMNS` order.
+    '''
+    if properties is None:
+        return JOBACK_SIGMA_COLUMNS
+    unknown = [p for p in properties if p not in JOBACK_PROPERTY_SIGMA]
+    if unknown:
+        raise ValueError(
+            f"Unknown Joback properties: {unknown}; choose from {list(JOBACK_PROPERTY_SIGMA)}.")
+    needed = {c for p in properties for c in JOBACK_PROPERTY_SIGMA[p]}
+    return tuple(c for c in JOBACK_SIGMA_COLUMNS if c in needed)
+
+
+def batch_dtype(
+    dtype: Any = np.float64,
+) -> np.dtype:
+    '''
+    Validates the floating-point dtype of the batch kernels.
+
+    Parameters
+    ----------
+    dtype : Any, optional
+        np.float32 (reduced-precision screening) or np.float64, by default np.float64.
+
+    Returns
+    -------
+    np.dtype
+        The validated dtype.
+    '''
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}.")
+    return dtype
+
+
+def rounding_gamma(
+    n: int,
+    dtype: Any = np.float32,
+) -> float:
+    '''
+    Returns gamma_n = n u / (1 - n u), the relative error bound of an n-term dot product in `dtype` (u the unit roundoff).
+    '''
+    u = float(np.finfo(dtype).eps) / 2
+    return n * u / (1 - n * u)
+
+
+def _criteria_mask(
+    values: Dict[str, np.ndarray],
+    criteria: Dict[str, Tuple[Optional[float], Optional[float]]],
+    errors: Optional[Dict[str, np.ndarray]] = None,
+) -> np.ndarray:
+    '''
+    Rows whose values lie in every (lower, upper) window, each window widened by `errors` when given; NaN never passes.
+    '''
+    mask: Optional[np.ndarray] = None
+    with np.errstate(invalid='ignore'):
+        for name, (lower, upper) in criteria.items():
+            value = values[name]
+            slack = errors[name] if errors is not None else 0.0
+            ok = ~np.isnan(value)
+            if lower is not None:
+                ok &= value + slack >= lower
+            if upper is not None:
+                ok &= value - slack <= upper
+            mask = ok if mask is None else mask & ok
+    return mask
+
+
+def build_count_matrix(
+    group_contributions: Sequence[BaseModel | Dict[str, float] | Dict[str, int]],
+    table: GroupTable,
+    model: Type[BaseModel],
+) -> np.ndarray:
+    '''
+    Builds a (molecules × groups) count matrix aligned with a group table.
+
+    Parameters
+    ----------
+    group_contributions : Sequence[BaseModel | Dict[str, float] | Dict[str, int]]
+        Group contributions of each molecule, as models or dictionaries keyed by alias or field name.
+    table : GroupTable
+        Group table that defines the column order.
+    model : Type[BaseModel]
+        Group contribution model accepted for each molecule.
+
+    Returns
+    -------
+    counts : np.ndarray
+        Count matrix of shape (N, G).
+
+    Notes
+    -----
+    Groups that are not part of the table are logged and ignored, as in the single-molecule path. A count that is not a number raises ValueError and an unsupported entry raises TypeError.
+    '''
+    try:
+        # NOTE: model fields that map to a table row
+        model_rows = [
+            (field_name, table.index[field_info.alias])
+            for field_name, field_info in model.model_fields.items()
+            if field_info.alias is not None and field_info.alias in table.index
+        ]
+
+        # NOTE: fill matrix
+        counts = np.zeros((len(group_contributions), len(table.groups)))
+        unknown: Dict[str, None] = {}
+
+        for i, groups in enumerate(group_contributions):
+            if isinstance(groups, dict):
+                # ! dictionary type
+                for group_name, group_value in groups.items():
+                    j = table.index.get(group_name)
+                    if j is None:
+                        unknown[group_name] = None
+                        continue
+                    try:
+                        counts[i, j] = float(group_value)
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(
+                            f"Invalid count for group '{group_name}': {group_value!r}") from e
+            elif isinstance(groups, model):
+                # ! model type
+                for field_name, j in model_rows:
+                    group_unit: GroupUnit = getattr(groups, field_name)
+                    if group_unit is not None and group_unit.value > 0:
+                        counts[i, j] = float(group_unit.value)
+            else:
+                raise TypeError(
+                    f"Invalid type for group contributions at index {i}!")
+
+        if unknown:
+            logger.warning(f"Ignoring unknown groups: {list(unknown)}")
+
+        return counts
+    except (TypeError, ValueError):
+        raise
+    except Exception as e:
+        raise Exception("Building count matrix failed!, ", e)
+
+
+class JobackBatch:
+    '''
+    Vectorized Joback method over a batch of molecules.
+
+    Group counts are arranged as a (molecules × groups) matrix aligned with the shared Joback table, so all sigma values come from a single matrix product. The kernels hold no state and only read the shared table, so they can run concurrently from any number of threads or processes.
+    '''
+
+    @staticmethod
+    def count_matrix(
+        group_contributions: Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]],
+    ) -> np.ndarray:
+        '''
+        Builds the Joback count matrix.
+
+        Parameters
+        ----------
+        group_contributions : Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]]
+            Group contributions of each molecule.
+
+        Returns
+        -------
+        counts : np.ndarray
+            Count matrix of shape (N, 41).
+        '''
+        return build_count_matrix(
+            group_contributions=group_contributions,
+            table=load_joback_table(),
+            model=JobackGroupContributions,
+        )
+
+    @staticmethod
+    def calc_sigma(
+        counts: np.ndarray,
+        table: Optional[GroupTable] = None,
+        columns: Optional[Sequence[str]] = None,
+        dtype: Any = np.float64,
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Calculates sigma columns for all molecules.
+
+        Parameters
+        ----------
+        counts : np.ndarray | csr_matrix
+            Count matrix of shape (N, 41).
+        table : GroupTable, optional
+            Joback table with the packaged group order (e.g. `load_joback_table(path)`), by default the packaged table.
+        columns : Sequence[str], optional
+            Sigma columns to compute, by default all of `JOBACK_SIGMA_COLUMNS`.
+        dtype : Any, optional
+            np.float64, or np.float32 to halve the count and sigma buffers, by default np.float64.
+
+        Returns
+        -------
+        sigma : Dict[str, np.ndarray]
+            Sigma arrays of shape (N,) and the given dtype, keyed by table column.
+        '''
+        table = table if table is not None else load_joback_table()
+        columns = JOBACK_SIGMA_COLUMNS if columns is None else tuple(columns)
+        dtype = batch_dtype(dtype)
+        idx = [table.columns.index(col) for col in columns]
+        weights = table.values[:, idx].astype(dtype, copy=False)
+
+        if issparse(counts):
+            # NOTE: sparse (N, G) @ (G, K), transposed once so each sigma row is contiguous
+            sigma = np.ascontiguousarray((counts.astype(dtype) @ weights).T)
+        else:
+            # NOTE: (K, G) @ (G, N), so each sigma row is contiguous
+            sigma = weights.T @ np.asarray(counts, dtype=dtype).T
+
+        return {col: sigma[k] for k, col in enumerate(columns)}
+
+    @staticmethod
+    def calc(
+        counts: np.ndarray,
+        total_atoms_number: np.ndarray | Sequence[int],
+        table: Optional[GroupTable] = None,
+        properties: Optional[Sequence[str]] = None,
+        dtype: Any = np.float64,
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Calculates Joback properties for all molecules.
+
+        Parameters
+        ----------
+        counts : np.ndarray | csr_matrix
+            Count matrix of shape (N, 41).
+        total_atoms_number : np.ndarray | Sequence[int]
+            Total number of atoms of each molecule.
+        table : GroupTable, optional
+            Joback table to use instead of the packaged one, by default None.
+        properties : Sequence[str], optional
+            Properties to calculate (keys of `JOBACK_PROPERTY_SIGMA`), by default None for all; only the sigma columns they need are computed.
+        dtype : Any, optional
+            np.float64, or np.float32 for reduced-precision screening, by default np.float64; see `JobackBatch.error_bound`.
+
+        Returns
+        -------
+        properties : Dict[str, np.ndarray]
+            Property arrays of shape (N,) and the given dtype, plus the heat capacity coefficients 'a', 'b', 'c', 'd' and the viscosity sums 'eta_a', 'eta_b'.
+        '''
+        try:
+            columns = joback_sigma_columns(properties)
+            return JobackBatch.calc_from_sigma(
+                JobackBatch.calc_sigma(counts, table, columns, dtype),
+                total_atoms_number,
+                properties,
+            )
+        except Exception as e:
+            raise Exception("Calculating batch properties failed!, ", e)
+
+    @staticmethod
+    def calc_from_sigma(
+        sigma: Dict[str, np.ndarray],
+        total_atoms_number: np.ndarray | Sequence[int],
+        properties: Optional[Sequence[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Applies the Joback correlations to group sums.
+
+        Parameters
+        ----------
+        sigma : Dict[str, np.ndarray]
+            Group sums keyed by table column, as returned by `JobackBatch.calc_sigma`.
+        total_atoms_number : np.ndarray | Sequence[int]
+            Total number of atoms, broadcastable against the sums.
+        properties : Sequence[str], optional
+            Properties to calculate, by default None for all; `sigma` needs their `joback_sigma_columns`.
+
+        Returns
+        -------
+        properties : Dict[str, np.ndarray]
+            Same keys as `JobackBatch.calc`, restricted to the selection; 'heat_capacity' gives 'a'-'d' and 'liquid_viscosity' gives 'eta_a', 'eta_b'.
+        '''
+        try:
+            selected = JOBACK_PROPERTY_SIGMA if properties is None else properties
+            # NOTE: float32 sums stay float32 through the correlations
+            dtype = np.result_type(*sigma.values()) if sigma else np.float64
+            atoms = np.asarray(total_atoms_number, dtype=dtype)
+            if atoms.ndim > 1:
+                atoms = atoms.ravel()
+
+            # NOTE: correlations, evaluated only when selected
+            formulas = {
+                'freezing_point_temperature': lambda: 122.5 + sigma['Tf'],
+                'boiling_point_temperature': lambda: 198.2 + sigma['Tb'],
+                'critical_temperature': lambda: (198.2 + sigma['Tb']) / (
+                    0.584 + 0.965 * sigma['Tc'] - sigma['Tc'] ** 2
+                ),
+                'critical_pressure': lambda: (
+                    0.113 + 0.0032 * atoms - sigma['Pc']
+                ) ** -2,
+                'critical_volume': lambda: 17.5 + sigma['Vc'],
+                'standard_enthalpy_of_formation_ideal_gas': lambda: 68.29 + sigma['EnFo_IG'],
+                'standard_gibbs_energy_of_formation_ideal_gas': lambda: 53.88 + sigma['GiEnFo_IG'],
+                'standard_enthalpy_of_fusion': lambda: -0.88 + sigma['EnFus'],
+                'standard_enthalpy_of_vaporization': lambda: 15.30 + sigma['EnVap'],
+            }
+
+            res: Dict[str, np.ndarray] = {}
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for name in selected:
+                    if name in formulas:
+                        res[name] = formulas[name]()
+
+            # NOTE: heat capacity coefficients
+            if 'heat_capacity' in selected:
+                for col in ('a', 'b', 'c', 'd'):
+                    res[col] = sigma[col]
+
+            # NOTE: liquid viscosity sums
+            if 'liquid_viscosity' in selected:
+                res['eta_a'] = sigma['ηa']
+                res['eta_b'] = sigma['ηb']
+
+            return res
+        except Exception as e:
+            raise Exception("Calculating batch properties failed!, ", e)
+
+    @staticmethod
+    def error_bound(
+        counts: np.ndarray,
+        total_atoms_number: np.ndarray | Sequence[int],
+        table: Optional[GroupTable] = None,
+        properties: Optional[Sequence[str]] = None,
+        dtype: Any = np.float32,
+        sigma: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Bounds the rounding error of `JobackBatch.calc` run in `dtype`.
+
+        Parameters
+        ----------
+        counts : np.ndarray | csr_matrix
+            Count matrix of shape (N, 41).
+        total_atoms_number : np.ndarray | Sequence[int]
+            Total number of atoms of each molecule.
+        table : GroupTable, optional
+            Joback table to use instead of the packaged one, by default None.
+        properties : Sequence[str], optional
+            Properties to bound, by default None for all.
+        dtype : Any, optional
+            Precision of the evaluation to bound, by default np.float32.
+        sigma : Dict[str, np.ndarray], optional
+            Sums already computed by `JobackBatch.calc_sigma` in `dtype`, by default None to compute them.
+
+        Returns
+        -------
+        bounds : Dict[str, np.ndarray]
+            Absolute float64 error bounds of shape (N,), keyed as the output of `JobackBatch.calc`.
+
+        Notes
+        -----
+        Each sum over G = 41 groups satisfies |sigma_hat - sigma| <= gamma_(G+2) sum_g |n_g t_g| with gamma_n = n u / (1 - n u) and u = 2^-24 for float32, covering the rounding of the table, the counts and the accumulation in any order. The correlations add a few roundings each, and their first-order sensitivities carry the sum errors to the properties. The bound is stated against exact arithmetic; a float64 evaluation lies about 2^29 times closer. It grows without limit where Tc or Pc are near their poles, and such rows always go to float64 in `JobackBatch.screen`.
+        '''
+        try:
+            table = table if table is not None else load_joback_table()
+            dtype = batch_dtype(dtype)
+            columns = joback_sigma_columns(properties)
+            selected = JOBACK_PROPERTY_SIGMA if properties is None else properties
+            if sigma is None:
+                sigma = JobackBatch.calc_sigma(counts, table, columns, dtype)
+
+            # NOTE: magnitudes sum_g |n_g t_g| of every sum
+            idx = [table.columns.index(col) for col in columns]
+            weights = np.abs(table.values[:, idx]).astype(dtype)
+            if issparse(counts):
+                magnitude = np.ascontiguousarray((abs(counts).astype(dtype) @ weights).T)
+            else:
+                magnitude = weights.T @ np.abs(np.asarray(counts, dtype=dtype)).T
+
+            # NOTE: sum errors, with slack for the rounding of the bound itself
+            u = float(np.finfo(dtype).eps) / 2
+            gamma = rounding_gamma(len(table.groups) + 2, dtype) * (1 + 1e-3)
+            d = {col: gamma * magnitude[k].astype(float) for k, col in enumerate(columns)}
+            s = {col: sigma[col].astype(float) for col in columns}
+            atoms = np.asarray(total_atoms_number, dtype=float)
+            if atoms.ndim > 1:
+                atoms = atoms.ravel()
+
+            def offset(constant: float, col: str) -> np.ndarray:
+                # >> constant + sigma: sum error plus the rounding of the constant and the addition
+                return d[col] + 2 * u * (abs(constant) + np.abs(s[col]))
+
+            def critical_temperature() -> np.ndarray:
+                num = 198.2 + s['Tb']
+                den = 0.584 + 0.965 * s['Tc'] - s['Tc'] ** 2
+                d_num = offset(198.2, 'Tb')
+                d_den = np.abs(0.965 - 2 * s['Tc']) * d['Tc'] + \
+                    4 * u * (0.584 + 0.965 * np.abs(s['Tc']) + s['Tc'] ** 2)
+                return d_num / np.abs(den) + np.abs(num) * d_den / den ** 2 + \
+                    2 * u * np.abs(num / den)
+
+            def critical_pressure() -> np.ndarray:
+                x = 0.113 + 0.0032 * atoms - s['Pc']
+                d_x = d['Pc'] + 4 * u * (0.113 + 0.0032 * np.abs(atoms) + np.abs(s['Pc']))
+                return 2 * d_x / np.abs(x) ** 3 + 3 * u / x ** 2
+
+            formulas = {
+                'freezing_point_temperature': lambda: offset(122.5, 'Tf'),
+                'boiling_point_temperature': lambda: offset(198.2, 'Tb'),
+                'critical_temperature': critical_temperature,
+                'critical_pressure': critical_pressure,
+                'critical_volume': lambda: offset(17.5, 'Vc'),
+                'standard_enthalpy_of_formation_ideal_gas': lambda: offset(68.29, 'EnFo_IG'),
+                'standard_gibbs_energy_of_formation_ideal_gas': lambda: offset(53.88, 'GiEnFo_IG'),
+                'standard_enthalpy_of_fusion': lambda: offset(-0.88, 'EnFus'),
+                'standard_enthalpy_of_vaporization': lambda: offset(15.30, 'EnVap'),
+            }
+
+            res: Dict[str, np.ndarray] = {}
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                for name in selected:
+                    if name in formulas:
+                        res[name] = formulas[name]()
+            if 'heat_capacity' in selected:
+                for col in ('a', 'b', 'c', 'd'):
+                    res[col] = d[col]
+            if 'liquid_viscosity' in selected:
+                res['eta_a'] = d['ηa']
+                res['eta_b'] = d['ηb']
+            return res
+        except Exception as e:
+            raise Exception("Bounding batch rounding errors failed!, ", e)
+
+    @staticmethod
+    def screen(
+        counts: np.ndarray,
+        total_atoms_number: np.ndarray | Sequence[int],
+        criteria: Dict[str, Tuple[Optional[float], Optional[float]]],
+        table: Optional[GroupTable] = None,
+        properties: Optional[Sequence[str]] = None,
+        dtype: Any = np.float32,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        '''
+        Screens molecules in reduced precision and re-evaluates the survivors in float64.
+
+        Parameters
+        ----------
+        counts : np.ndarray | csr_matrix
+            Count matrix of shape (N, 41).
+        total_atoms_number : np.ndarray | Sequence[int]
+            Total number of atoms of each molecule.
+        criteria : Dict[str, Tuple[Optional[float], Optional[float]]]
+            (lower, upper) window per scalar property (keys of `JOBACK_BATCH_PROPERTIES`), None for an open side.
+        table : GroupTable, optional
+            Joback table to use instead of the packaged one, by default None.
+        properties : Sequence[str], optional
+            Further properties to return for the hits (keys of `JOBACK_PROPERTY_SIGMA`), by default None.
+        dtype : Any, optional
+            Precision of the first pass, by default np.float32.
+
+        Returns
+        -------
+        indices, properties : Tuple[np.ndarray, Dict[str, np.ndarray]]
+            Rows whose float64 properties satisfy every window, and their float64 properties as returned by `JobackBatch.calc`.
+
+        Notes
+        -----
+        The first pass only computes the sums the criteria need and widens every window by `JobackBatch.error_bound`, so no molecule that passes in float64 is dropped. Only the candidates are re-evaluated in float64, and the windows are then applied without slack.
+        '''
+        try:
+            unknown = [name for name in criteria if name not in JOBACK_BATCH_PROPERTIES]
+            if unknown:
+                raise ValueError(
+                    f"Screening criteria must be scalar properties, got {unknown}; choose from {list(JOBACK_BATCH_PROPERTIES)}.")
+            table = table if table is not None else load_joback_table()
+            screened = list(criteria)
+            atoms = np.asarray(total_atoms_number, dtype=float).ravel()
+
+            # SECTION: reduced-precision pass with widened windows
+            sigma = JobackBatch.calc_sigma(
+                counts, table, joback_sigma_columns(screened), dtype)
+            values = JobackBatch.calc_from_sigma(sigma, atoms, screened)
+            errors = JobackBatch.error_bound(
+                counts, atoms, table, screened, dtype, sigma=sigma)
+            candidates = np.flatnonzero(_criteria_mask(values, criteria, errors))
+            del sigma, values, errors
+
+            # SECTION: float64 re-evaluation of the candidates
+            exact = JobackBatch.calc(
+                counts[candidates],
+                atoms[candidates] if atoms.size > 1 else atoms,
+                table,
+                list(dict.fromkeys(screened + list(properties or []))),
+            )
+            keep = _criteria_mask(exact, criteria)
+            logger.debug(
+                f"Joback screen: {candidates.size} candidates, {int(keep.sum())} hits.")
+            return candidates[keep], {name: value[keep] for name, value in exact.items()}
+        except Exception as e:
+            raise Exception("Screening batch properties failed!, ", e)
+
+    @staticmethod
+    def to_estimated_props(
+        properties: Dict[str, np.ndarray],
+        molecular_weight: Optional[np.ndarray | Sequence[float]] = None,
+    ) -> Dict[str, EstimatedBatchProp]:
+        '''
+        Wraps raw property arrays with units and symbols.
+
+        Parameters
+        ----------
+        properties : Dict[str, np.ndarray]
+            Output of `JobackBatch.calc`; only the properties it holds are wrapped.
+        molecular_weight : np.ndarray | Sequence[float], optional
+            Molecular weight (g/mol) of each molecule; adds 'liquid_viscosity', by default None.
+
+        Returns
+        -------
+        Dict[str, EstimatedBatchProp]
+            Property arrays keyed as in `joback_calc`, with 'heat_capacity' as a vectorized Cp(T) function and, when molecular weights are given, 'liquid_viscosity' as a vectorized eta_L(T) function.
+        '''
+        res: Dict[str, EstimatedBatchProp] = {
+            name: EstimatedBatchProp(
+                value=properties[name],
+                unit=unit,
+                symbol=symbol
+            )
+            for name, (unit, symbol) in JOBACK_BATCH_PROPERTIES.items()
+            if name in properties
+        }
+
+        if 'a' in properties:
+            res['heat_capacity'] = EstimatedBatchProp(
+                value=JobackHeatCapacityBatch(
+                    a=properties['a'],
+                    b=properties['b'],
+                    c=properties['c'],
+                    d=properties['d'],
+                ),
+                unit='J/mol·K',
+                symbol='Cp_IG'
+            )
+
+        if molecular_weight is not None and 'eta_a' in properties:
+            mw = np.asarray(molecular_weight, dtype=float).ravel()
+            if mw.size != properties['eta_a'].size:
+                raise ValueError(
+                    "molecular_weight must have one entry per molecule.")
+            res['liquid_viscosity'] = EstimatedBatchProp(
+                value=JobackLiquidViscosityBatch(
+                    eta_a=properties['eta_a'],
+                    eta_b=properties['eta_b'],
+                    molecular_weight=mw,
+                ),
+                unit='Pa·s',
+                symbol='eta_L'
+            )
+        return res
+
+    @staticmethod
+    def to_ideal_gas(
+        properties: Dict[str, np.ndarray],
+    ) -> JobackIdealGasBatch:
+        '''
+        Builds the closed-form ideal-gas H, S and G model of every molecule.
+
+        Parameters
+        ----------
+        properties : Dict[str, np.ndarray]
+            Output of `JobackBatch.calc`.
+
+        Returns
+        -------
+        JobackIdealGasBatch
+            Ideal-gas model referenced to the standard formation properties at 298.15 K.
+        '''
+        return JobackIdealGasBatch(
+            heat_capacity=JobackHeatCapacityBatch(
+                a=properties['a'],
+                b=properties['b'],
+                c=properties['c'],
+                d=properties['d'],
+            ),
+            EnFo_IG=properties['standard_enthalpy_of_formation_ideal_gas'],
+            GiEnFo_IG=properties['standard_gibbs_energy_of_formation_ideal_gas'],
+        )
+
+
+class ZabranskyRuzickaBatch:
+    '''
+    Vectorized Zabransky-Ruzicka method over a batch of molecules.
+
+    Group contributions and corrections are arranged as two count matrices aligned with the shared tables; the liquid heat capacity of every molecule reduces to the aggregated sums A, B and D.
+    '''
+
+    @staticmethod
+    def count_matrices(
+        group_contributions: Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]],
+        group_corrections: Optional[
+            Sequence[
+                Optional[
+                    ZabranskyRuzickaGroupContributionsCorrections |
+                    Dict[str, float] |
+                    Dict[str, int]
+                ]
+            ]
+        ] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Builds the contribution and correction count matrices.
+
+        Parameters
+        ----------
+        group_contributions : Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]]
+            Group contributions of each molecule.
+        group_corrections : Sequence[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int] | None], optional
+            Group corrections of each molecule, by default None.
+
+        Returns
+        -------
+        counts, corrections : Tuple[np.ndarray, np.ndarray]
+            Count matrices of shape (N, 130) and (N, 28).
+        '''
+        contributions_table, corrections_table = load_zabransky_ruzicka_tables()
+
+        # NOTE: corrections default to none
+        if group_corrections is None:
+            group_corrections = [None] * len(group_contributions)
+
+        if len(group_corrections) != len(group_contributions):
+            raise ValueError(
+                "group_corrections must have the same length as group_contributions.")
+
+        counts = build_count_matrix(
+            group_contributions=group_contributions,
+            table=contributions_table,
+            model=ZabranskyRuzickaGroupContributions,
+        )
+        corrections = build_count_matrix(
+            group_contributions=[g if g else {} for g in group_corrections],
+            table=corrections_table,
+            model=ZabranskyRuzickaGroupContributionsCorrections,
+        )
+        return counts, corrections
+
+    @staticmethod
+    def calc(
+        counts: np.ndarray,
+        corrections: Optional[np.ndarray] = None,
+        tables: Optional[Tuple[GroupTable, GroupTable]] = None,
+        dtype: Any = np.float64,
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Calculates the aggregated heat capacity coefficients.
+
+        Parameters
+        ----------
+        counts : np.ndarray | csr_matrix
+            Contribution count matrix of shape (N, 130).
+        corrections : np.ndarray | csr_matrix, optional
+            Correction count matrix of shape (N, 28), by default None.
+        tables : Tuple[GroupTable, GroupTable], optional
+            Contribution and correction tables to use instead of the packaged ones (e.g. `load_zabransky_ruzicka_tables(paths)`), by default None.
+        dtype : Any, optional
+            np.float64, or np.float32 for reduced-precision screening, by default np.float64; see `ZabranskyRuzickaBatch.error_bound`.
+
+        Returns
+        -------
+        coefficients : Dict[str, np.ndarray]
+            Arrays 'A', 'B', 'D' of shape (N,) and the given dtype such that Cp/R = A + B(T/100) + D(T/100)², and the validity window 'Tmin', 'Tmax' (K) of each molecule.
+
+        Notes
+        -----
+        The validity window is the largest group Tmin and the smallest group Tmax over the groups and corrections with a non-zero count; it is NaN for a molecule without groups.
+        '''
+        try:
+            contributions_table, corrections_table = tables if tables is not None \
+                else load_zabransky_ruzicka_tables()
+            cols = ['a_i', 'b_i', 'd_i']
+            dtype = batch_dtype(dtype)
+            counts = counts.toarray().astype(dtype, copy=False) if issparse(counts) \
+                else np.asarray(counts, dtype=dtype)
+
+            # NOTE: (3, G) @ (G, N), so each coefficient row is contiguous
+            idx = [contributions_table.columns.index(c) for c in cols]
+            abd = contributions_table.values[:, idx].T.astype(dtype) @ counts.T
+
+            # NOTE: validity window over non-zero groups
+            present = counts != 0
+            Tmin = np.max(
+                np.broadcast_to(contributions_table.column('Tmin').astype(dtype), counts.shape),
+                axis=1, where=present, initial=-np.inf)
+            Tmax = np.min(
+                np.broadcast_to(contributions_table.column('Tmax').astype(dtype), counts.shape),
+                axis=1, where=present, initial=np.inf)
+
+            if corrections is not None:
+                corrections = corrections.toarray().astype(dtype, copy=False) if issparse(corrections) \
+                    else np.asarray(corrections, dtype=dtype)
+                idx = [corrections_table.columns.index(c) for c in cols]
+                abd += corrections_table.values[:, idx].T.astype(dtype) @ corrections.T
+
+                present_c = corrections != 0
+                Tmin = np.maximum(Tmin, np.max(
+                    np.broadcast_to(corrections_table.column('Tmin').astype(dtype), corrections.shape),
+                    axis=1, where=present_c, initial=-np.inf))
+                Tmax = np.minimum(Tmax, np.min(
+                    np.broadcast_to(corrections_table.column('Tmax').astype(dtype), corrections.shape),
+                    axis=1, where=present_c, initial=np.inf))
+
+            # NOTE: no groups, no window
+            empty = np.isinf(Tmin) & np.isinf(Tmax)
+            Tmin[empty] = np.nan
+            Tmax[empty] = np.nan
+
+            return {'A': abd[0], 'B': abd[1], 'D': abd[2], 'Tmin': Tmin, 'Tmax': Tmax}
+        except Exception as e:
+            raise Exception("Calculating batch coefficients failed!, ", e)
+
+    @staticmethod
+    def error_bound(
+        counts: np.ndarray,
+        corrections: Optional[np.ndarray] = None,
+        tables: Optional[Tuple[GroupTable, GroupTable]] = None,
+        dtype: Any = np.float32,
+        temperature: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Bounds the rounding error of `ZabranskyRuzickaBatch.calc` run in `dtype`.
+
+        Parameters
+        ----------
+        counts : np.ndarray | csr_matrix
+            Contribution count matrix of shape (N, 130).
+        corrections : np.ndarray | csr_matrix, optional
+            Correction count matrix of shape (N, 28), by default None.
+        tables : Tuple[GroupTable, GroupTable], optional
+            Contribution and correction tables to use instead of the packaged ones, by default None.
+        dtype : Any, optional
+            Precision of the evaluation to bound, by default np.float32.
+        temperature : float, optional
+            Also bound Cp_LIQ (J/mol·K) at this temperature (K) as 'heat_capacity', by default None.
+
+        Returns
+        -------
+        bounds : Dict[str, np.ndarray]
+            Absolute float64 error bounds of 'A', 'B', 'D' (and 'heat_capacity'), each of shape (N,).
+
+        Notes
+        -----
+        A, B and D are plain sums over the contribution and correction groups, so |A_hat - A| <= gamma_(G+3) sum_g |n_g a_g| with gamma_n = n u / (1 - n u), u = 2^-24 for float32 and G the number of groups of both tables. Cp_LIQ = R (A + B θ + D θ²) adds the sum errors weighted by 1, θ, θ² and a few roundings.
+        '''
+        try:
+            contributions_table, corrections_table = tables if tables is not None \
+                else load_zabransky_ruzicka_tables()
+            dtype = batch_dtype(dtype)
+            cols = ['a_i', 'b_i', 'd_i']
+            n_groups = len(contributions_table.groups)
+
+            def magnitude(table: GroupTable, matrix: Any) -> np.ndarray:
+                idx = [table.columns.index(c) for c in cols]
+                weights = np.abs(table.values[:, idx]).astype(dtype)
+                if issparse(matrix):
+                    return np.ascontiguousarray((abs(matrix).astype(dtype) @ weights).T)
+                return weights.T @ np.abs(np.asarray(matrix, dtype=dtype)).T
+
+            # NOTE: magnitudes of the coefficient sums
+            mag = magnitude(contributions_table, counts)
+            if corrections is not None:
+                mag += magnitude(corrections_table, corrections)
+                n_groups += len(corrections_table.groups)
+
+            gamma = rounding_gamma(n_groups + 3, dtype) * (1 + 1e-3)
+            res = {name: gamma * mag[k].astype(float) for k, name in enumerate(('A', 'B', 'D'))}
+
+            if temperature is not None:
+                # NOTE: sum errors weighted by 1, θ, θ², plus 6 roundings of the polynomial
+                u = float(np.finfo(dtype).eps) / 2
+                theta = abs(temperature) / 100
+                res['heat_capacity'] = 8.314472 * (
+                    res['A'] + theta * res['B'] + theta ** 2 * res['D'] +
+                    6 * u * theta ** 2 * mag.astype(float).sum(axis=0)
+                )
+            return res
+        except Exception as e:
+            raise Exception("Bounding batch rounding errors failed!, ", e)
+
+    @staticmethod
+    def screen(
+        counts: np.ndarray,
+        corrections: Optional[np.ndarray] = None,
+        criteria: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        temperature: float = 298.15,
+        tables: Optional[Tuple[GroupTable, GroupTable]] = None,
+        dtype: Any = np.float32,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        '''
+        Screens molecules in reduced precision and re-evaluates the survivors in float64.
+
+        Parameters
+        ----------
+        counts : np.ndarray | csr_matrix
+            Contribution count matrix of shape (N, 130).
+        corrections : np.ndarray | csr_matrix, optional
+            Correction count matrix of shape (N, 28), by default None.
+        criteria : Dict[str, Tuple[Optional[float], Optional[float]]]
+            (lower, upper) window for 'A', 'B', 'D' or 'heat_capacity' (Cp_LIQ in J/mol·K at `temperature`), None for an open side.
+        temperature : float, optional
+            Temperature (K) of the 'heat_capacity' criterion, by default 298.15.
+        tables : Tuple[GroupTable, GroupTable], optional
+            Contribution and correction tables to use instead of the packaged ones, by default None.
+        dtype : Any, optional
+            Precision of the first pass, by default np.float32.
+
+        Returns
+        -------
+        indices, coefficients : Tuple[np.ndarray, Dict[str, np.ndarray]]
+            Rows whose float64 values satisfy every window, and their float64 output of `ZabranskyRuzickaBatch.calc` (plus 'heat_capacity' when screened on).
+
+        Notes
+        -----
+        The first pass widens every window by `ZabranskyRuzickaBatch.error_bound`, so no molecule that passes in float64 is dropped.
+        '''
+        try:
+            criteria = criteria or {}
+            unknown = [name for name in criteria if name not in ('A', 'B', 'D', 'heat_capacity')]
+            if unknown:
+                raise ValueError(
+                    f"Screening criteria must be 'A', 'B', 'D' or 'heat_capacity', got {unknown}.")
+            tables = tables if tables is not None else load_zabransky_ruzicka_tables()
+            theta = temperature / 100
+
+            def with_heat_capacity(coefficients: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+                if 'heat_capacity' in criteria:
+                    coefficients['heat_capacity'] = 8.314472 * (
+                        coefficients['A'] + coefficients['B'] * theta + coefficients['D'] * theta ** 2)
+                return coefficients
+
+            # SECTION: reduced-precision pass with widened windows
+            values = with_heat_capacity(
+                ZabranskyRuzickaBatch.calc(counts, corrections, tables, dtype))
+            errors = ZabranskyRuzickaBatch.error_bound(
+                counts, corrections, tables, dtype,
+                temperature if 'heat_capacity' in criteria else None)
+            candidates = np.flatnonzero(_criteria_mask(values, criteria, errors)) \
+                if criteria else np.arange(counts.shape[0])
+            del values, errors
+
+            # SECTION: float64 re-evaluation of the candidates
+            exact = with_heat_capacity(ZabranskyRuzickaBatch.calc(
+                counts[candidates],
+                corrections[candidates] if corrections is not None else None,
+                tables,
+            ))
+            keep = _criteria_mask(exact, criteria) if criteria \
+                else np.ones(candidates.size, dtype=bool)
+            logger.debug(
+                f"Zabransky-Ruzicka screen: {candidates.size} candidates, {int(keep.sum())} hits.")
+            return candidates[keep], {name: value[keep] for name, value in exact.items()}
+        except Exception as e:
+            raise Exception("Screening batch coefficients failed!, ", e)
+
+    @staticmethod
+    def to_estimated_prop(
+        coefficients: Dict[str, Any],
+    ) -> EstimatedBatchProp:
+        '''
+        Wraps aggregated coefficients as a vectorized Cp_LIQ(T) function.
+
+        Parameters
+        ----------
+        coefficients : Dict[str, Any]
+            Output of `ZabranskyRuzickaBatch.calc`.
+
+        Returns
+        -------
+        EstimatedBatchProp
+            Vectorized liquid heat capacity with units and symbol.
+        '''
+        return EstimatedBatchProp(
+            value=ZabranskyRuzickaHeatCapacityBatch(
+                A=coefficients['A'],
+                B=coefficients['B'],
+                D=coefficients['D'],
+                Tmin=coefficients.get('Tmin'),
+                Tmax=coefficients.get('Tmax'),
+            ),
+            unit="J/mol·K",
+            symbol="Cp_LIQ"
+        )
+
+
+def split_rows(
+    n_rows: int,
+    chunk_size: int,
+) -> List[slice]:
+    '''
+    Splits row indices into contiguous chunks.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of rows.
+    chunk_size : int
+        Maximum rows per chunk.
+
+    Returns
+    -------
+    List[slice]
+        Slices covering [0, n_rows) in order.
+    '''
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    # NOTE: an empty batch is one empty chunk
+    if n_rows == 0:
+        return [slice(0, 0)]
+    return [
+        slice(start, min(start + chunk_size, n_rows))
+        for start in range(0, n_rows, chunk_size)
+    ]
+
+
+def map_group_columns(
+    columns: Sequence[str],
+    table: GroupTable,
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    '''
+    Maps column headers to table rows once, so every chunk of a file can reuse the mapping.
+
+    Parameters
+    ----------
+    columns : Sequence[str]
+        Column headers, given as group aliases or field names.
+    table : GroupTable
+        Group table that defines the output column order.
+
+    Returns
+    -------
+    src, dst, unknown : Tuple[np.ndarray, np.ndarray, List[str]]
+        Positions of the group headers, their table rows, and the headers that are not groups of the table.
+    '''
+    src, dst, unknown = [], [], []
+    for k, col in enumerate(columns):
+        j = table.index.get(str(col).strip())
+        if j is None:
+            unknown.append(col)
+        else:
+            src.append(k)
+            dst.append(j)
+    return np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp), unknown
+
+
+def scatter_count_columns(
+    values: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    n_groups: int,
+    sparse: bool = False,
+) -> np.ndarray | csr_matrix:
+    '''
+    Scatters mapped columns of a wide block into a count matrix.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Counts of shape (N, n_columns).
+    src, dst : np.ndarray
+        Column mapping from `map_group_columns`.
+    n_groups : int
+        Number of table groups.
+    sparse : bool, optional
+        Return a CSR matrix instead of a dense array, by default False.
+
+    Returns
+    -------
+    counts : np.ndarray | csr_matrix
+        Count matrix of shape (N, n_groups).
+
+    Notes
+    -----
+    Missing cells count as zero; repeated headers accumulate.
+    '''
+    values = np.asarray(values, dtype=float)
+    n_rows = values.shape[0]
+    if src.size and not sparse and kernels.use_numba():
+        return kernels.scatter_columns(
+            np.ascontiguousarray(values), src, dst, n_groups)
+
+    block = np.nan_to_num(values[:, src]) if src.size else np.zeros((n_rows, 0))
+
+    if sparse:
+        rows, cols = np.nonzero(block)
+        return csr_matrix(
+            (block[rows, cols], (rows, dst[cols])), shape=(n_rows, n_groups))
+
+    counts = np.zeros((n_rows, n_groups))
+    if src.size:
+        np.add.at(counts.T, dst, block.T)
+    return counts
+
+
+def build_count_matrix_from_columns(
+    columns: Sequence[str],
+    values: np.ndarray,
+    table: GroupTable,
+    sparse: bool = False,
+) -> Tuple[np.ndarray | csr_matrix, List[str]]:
+    '''
+    Builds a count matrix from a wide (molecules × columns) block in one vectorized step.
+
+    Parameters
+    ----------
+    columns : Sequence[str]
+        Column headers, given as group aliases or field names.
+    values : np.ndarray
+        Counts of shape (N, len(columns)).
+    table : GroupTable
+        Group table that defines the output column order.
+    sparse : bool, optional
+        Return a CSR matrix instead of a dense array, by default False.
+
+    Returns
+    -------
+    counts, unknown : Tuple[np.ndarray | csr_matrix, List[str]]
+        Count matrix of shape (N, G) and the headers that are not groups of the table.
+    '''
+    src, dst, unknown = map_group_columns(columns, table)
+    return scatter_count_columns(values, src, dst, len(table.groups), sparse), unknown
+
+
+def build_count_matrix_from_long(
+    molecule_index: np.ndarray | Sequence[int],
+    groups: np.ndarray | Sequence[str],
+    counts: np.ndarray | Sequence[float],
+    n_molecules: int,
+    table: GroupTable,
+    sparse: bool = False,
+) -> Tuple[np.ndarray | csr_matrix, Dict[str, int]]:
+    '''
+    Builds a count matrix from long (molecule, group, count) rows in one vectorized step.
+
+    Parameters
+    ----------
+    molecule_index : np.ndarray | Sequence[int]
+        Row of each entry in the output, in [0, n_molecules).
+    groups : np.ndarray | Sequence[str]
+        Group alias or field name of each entry.
+    counts : np.ndarray | Sequence[float]
+        Count of each entry.
+    n_molecules : int
+        Number of output rows.
+    table : GroupTable
+        Group table that defines the output column order.
+    sparse : bool, optional
+        Return a CSR matrix instead of a dense array, by default False.
+
+    Returns
+    -------
+    matrix, unknown : Tuple[np.ndarray | csr_matrix, Dict[str, int]]
+        Count matrix of shape (n_molecules, G), and the number of entries of each group name that is not in the table.
+
+    Notes
+    -----
+    Each distinct group name is looked up once; repeated (molecule, group) entries accumulate and missing counts are ignored.
+    '''
+    mol = np.asarray(molecule_index, dtype=np.intp).ravel()
+    values = np.asarray(counts, dtype=float).ravel()
+    names, inverse = np.unique(np.asarray(groups, dtype=str).ravel(), return_inverse=True)
+    if not (mol.size == values.size == inverse.size):
+        raise ValueError("molecule_index, groups and counts must have the same length.")
+
+    # NOTE: one lookup per distinct name
+    lookup = np.array(
+        [table.index.get(name.strip(), -1) for name in names], dtype=np.intp)
+    codes = lookup[inverse]
+    known = codes >= 0
+    unknown_hits = np.bincount(inverse[~known], minlength=names.size)
+    unknown = {str(names[k]): int(unknown_hits[k]) for k in np.flatnonzero(unknown_hits)}
+
+    keep = known & np.isfinite(values) & (values != 0)
+    n_groups = len(table.groups)
+    if sparse:
+        matrix = csr_matrix(
+            (values[keep], (mol[keep], codes[keep])), shape=(n_molecules, n_groups))
+        matrix.sum_duplicates()
+        return matrix, unknown
+
+    if kernels.use_numba():
+        return kernels.accumulate_counts(
+            mol[keep], codes[keep], values[keep], n_molecules, n_groups), unknown
+
+    flat = np.bincount(
+        mol[keep] * n_groups + codes[keep], weights=values[keep], minlength=n_molecules * n_groups)
+    return flat.reshape(n_molecules, n_groups), unknown
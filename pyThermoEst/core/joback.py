@@ -1,17 +1,22 @@
 # import libs
 import logging
-from typing import Dict
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Sequence, Tuple
 from math import pow
-import os
 # locals
 from ..models import (
     JobackGroupContributions,
     GroupUnit,
     JobackGroupData,
     JobackHeatCapacity,
+    JobackIdealGas,
+    JobackCpEvaluator,
+    JobackViscosityEvaluator,
     EstimatedProp
 )
-from ..util import ReferenceLoader
+from .tables import load_reference_dataframe, resolve_group_names
+from .batch import JOBACK_PROPERTY_SIGMA, JOBACK_SIGMA_COLUMNS, joback_sigma_columns
+from ..util.timing import stage
 from ..configs import JOBACK_DATA_FILE, JOBACK_TABLE_COLUMN_GROUP
 
 # NOTE: logger
@@ -32,6 +37,7 @@ class Joback:
         self,
         group_contributions: JobackGroupContributions | Dict[str, float] | Dict[str, int],
         total_atoms_number: int,
+        molecular_weight: Optional[float] = None,
     ):
         '''
         Initializes Joback method with group contributions.
@@ -40,20 +46,30 @@ class Joback:
         ----------
         group_contributions : JobackGroupContributions | Dict[str, float] | Dict[str, int]
             Group contributions for Joback method.
+        total_atoms_number : int
+            Total number of atoms in the molecule.
+        molecular_weight : float, optional
+            Molecular weight (g/mol), required for liquid viscosity, by default None.
         '''
         # NOTE: group contributions
         self.group_contributions = group_contributions
         # NOTE: total atoms number
         self.total_atoms_number = total_atoms_number
+        # NOTE: molecular weight
+        self.molecular_weight = molecular_weight
 
         # SECTION: load Joback parameters
-        self.joback_params = self.load_joback_parameters()
+        with stage('joback.table_load'):
+            # NOTE: shared cached table, only read by the instance
+            self.joback_params = load_reference_dataframe(
+                JOBACK_DATA_FILE, shared=True)
 
-        # SECTION: get group contribution
-        self.group_id = self._get_group_contribution()
+            # SECTION: get group contribution
+            self.group_id = self._get_group_contribution()
 
         # SECTION: valid groups
-        self.valid_groups = self._check_group_contributions()
+        with stage('joback.group_validation'):
+            self.valid_groups = self._check_group_contributions()
 
     def __repr__(self) -> str:
         return f"""Joback Method with {len(self.group_id)} groups  \n
@@ -80,26 +96,11 @@ class Joback:
         Returns
         -------
         joback_params : pd.DataFrame
-            DataFrame of Joback parameters.
+            Copy of the Joback parameters; the parsed file is cached per process.
         '''
         try:
-            # load reference file
-            ref_loader = ReferenceLoader()
-
-            # current folder
-            current_folder = os.path.dirname(os.path.abspath(__file__))
-            #  data folder
-            data_folder = os.path.join(
-                current_folder,
-                '..',
-                'data',
-            )
-
-            # NOTE: load CSV reference
-            joback_df = ref_loader.load_csv_ref(
-                reference_name=JOBACK_DATA_FILE,
-                reference_folder=data_folder,
-            )
+            # NOTE: load CSV reference (copy of the cached table)
+            joback_df = load_reference_dataframe(JOBACK_DATA_FILE)
 
             # return Joback parameters
             return joback_df
@@ -196,19 +197,28 @@ class Joback:
             # count each group
             if isinstance(self.group_contributions, dict):
                 # ! dictionary type
+                # NOTE: keys are group names or model field names, as in the batch path
+                names = resolve_group_names(
+                    self.group_id.values(), JobackGroupContributions)
+                unknown = []
                 # iterate over group contributions
                 for group_name, group_value in self.group_contributions.items():
                     # check if group exists in Joback parameters
-                    if group_name in self.group_id.values():
-                        # add to count dictionary
-                        res_ = JobackGroupData(
-                            id=group_name,
-                            name=group_name,
-                            count=float(group_value),
-                            data=self._get_group_contribution_data(group_name)
-                        )
-                        # append
-                        valid_groups[group_name] = res_
+                    alias = names.get(group_name)
+                    if alias is None:
+                        unknown.append(group_name)
+                        continue
+                    # add to count dictionary
+                    res_ = JobackGroupData(
+                        id=alias,
+                        name=group_name,
+                        count=float(group_value),
+                        data=self._get_group_contribution_data(alias)
+                    )
+                    # append
+                    valid_groups[alias] = res_
+                if unknown:
+                    logger.warning(f"Ignoring unknown Joback groups: {unknown}")
             elif isinstance(self.group_contributions, JobackGroupContributions):
                 # ! dataclass type
                 # iterate over dataclass fields
@@ -249,183 +259,156 @@ class Joback:
             raise Exception("Checking group contributions failed!, ", e)
 
     def _calc_sigma(
-            self
-    ):
+            self,
+            columns: Optional[Sequence[str]] = None,
+            sigma: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, float]:
         '''
         Calculates sigma for all valid groups.
 
+        Parameters
+        ----------
+        columns : Sequence[str], optional
+            Sigma columns to calculate, by default None for all.
+        sigma : Dict[str, float], optional
+            Sigma values already calculated; only the missing columns are added, by default None.
+
+        Returns
+        -------
+        sigma : Dict[str, float]
+            Group sums keyed by table column.
         '''
         try:
             # SECTION: calculate sigma
-            # initialize critical temperature
-            sigma = {
-                'Tc': 0.0,
-                'Pc': 0.0,
-                'Vc': 0.0,
-                'Tb': 0.0,
-                'Tf': 0.0,
-                'EnFo_IG': 0.0,
-                'GiEnFo_IG': 0.0,
-                'a': 0.0,
-                'b': 0.0,
-                'c': 0.0,
-                'd': 0.0,
-                'EnFus': 0.0,
-                'EnVap': 0.0
-            }
-
-            # iterate over valid groups
-            for group_name, group_info in self.valid_groups.items():
-                # get group count
-                group_count = group_info.count
-                # get contribution data
-                contribution_data = group_info.data
-                # get contribution
-                val_Tc = contribution_data.get('Tc', None)
-                val_Pc = contribution_data.get('Pc', None)
-                val_Vc = contribution_data.get('Vc', None)
-                val_Tb = contribution_data.get('Tb', None)
-                val_Tm = contribution_data.get('Tf', None)
-                val_EnFo_IG = contribution_data.get('EnFo_IG', None)
-                val_GiEnFo_IG = contribution_data.get('GiEnFo_IG', None)
-                val_a = contribution_data.get('a', None)
-                val_b = contribution_data.get('b', None)
-                val_c = contribution_data.get('c', None)
-                val_d = contribution_data.get('d', None)
-                val_EnFus = contribution_data.get('EnFus', None)
-                val_EnVap = contribution_data.get('EnVap', None)
-
-                # check if contribution is valid
-                if val_Tc is not None:
-                    # update critical temperature
-                    sigma['Tc'] += group_count * float(val_Tc)
-
-                if val_Pc is not None:
-                    # update critical temperature
-                    sigma['Pc'] += group_count * float(val_Pc)
-
-                if val_Vc is not None:
-                    # update critical temperature
-                    sigma['Vc'] += group_count * float(val_Vc)
-
-                if val_Tb is not None:
-                    # update critical temperature
-                    sigma['Tb'] += group_count * float(val_Tb)
-
-                if val_Tm is not None:
-                    # update critical temperature
-                    sigma['Tf'] += group_count * float(val_Tm)
-
-                if val_EnFo_IG is not None:
-                    # update critical temperature
-                    sigma['EnFo_IG'] += group_count * float(val_EnFo_IG)
-
-                if val_GiEnFo_IG is not None:
-                    # update critical temperature
-                    sigma['GiEnFo_IG'] += group_count * float(val_GiEnFo_IG)
-
-                if val_a is not None:
-                    # update critical temperature
-                    sigma['a'] += group_count * float(val_a)
-
-                if val_b is not None:
-                    # update critical temperature
-                    sigma['b'] += group_count * float(val_b)
-
-                if val_c is not None:
-                    # update critical temperature
-                    sigma['c'] += group_count * float(val_c)
-
-                if val_d is not None:
-                    # update critical temperature
-                    sigma['d'] += group_count * float(val_d)
-
-                if val_EnFus is not None:
-                    # update critical temperature
-                    sigma['EnFus'] += group_count * float(val_EnFus)
-
-                if val_EnVap is not None:
-                    sigma['EnVap'] += group_count * float(val_EnVap)
+            sigma = {} if sigma is None else sigma
+            missing = [
+                col for col in (JOBACK_SIGMA_COLUMNS if columns is None else columns)
+                if col not in sigma
+            ]
+            if not missing:
+                return sigma
+
+            with stage('joback.sigma'):
+                for col in missing:
+                    sigma[col] = 0.0
+
+                # iterate over valid groups
+                for group_name, group_info in self.valid_groups.items():
+                    # get group count
+                    group_count = group_info.count
+                    # get contribution data
+                    contribution_data = group_info.data
+
+                    for col in missing:
+                        val = contribution_data.get(col, None)
+                        # check if contribution is valid
+                        if val is not None:
+                            sigma[col] += group_count * float(val)
 
             return sigma
         except Exception as e:
-            raise Exception("Calculating critical temperature failed!, ", e)
+            raise Exception("Calculating sigma failed!, ", e)
 
-    def _calc(
-            self
-    ):
+    def _select_properties(
+            self,
+            properties: Optional[Sequence[str]] = None,
+    ) -> Tuple[str, ...]:
         '''
-        Calculates properties using Joback method.
+        Validates a property selection.
+
+        Parameters
+        ----------
+        properties : Sequence[str], optional
+            Property names, by default None for all (liquid viscosity only with a molecular weight).
 
         Returns
         -------
-        properties : dict
-            Dictionary of calculated properties.
+        names : Tuple[str, ...]
+            Selected property names in request order, without duplicates.
         '''
-        try:
-            # SECTION: calculate properties
-            properties: Dict[str, EstimatedProp] = {}
-
-            # SECTION: calculate sigma
-            sigma = self._calc_sigma()
-
-            # NOTE: freezing point temperature
-            properties['freezing_point_temperature'] = EstimatedProp(
-                **self._calc_freezing_point_temperature(sigma)
+        if properties is None:
+            return tuple(
+                name for name in JOBACK_PROPERTY_SIGMA
+                if name != 'liquid_viscosity' or self.molecular_weight is not None
             )
 
-            # NOTE: boiling point temperature
-            boiling_point_temp = self._calc_boiling_point_temperature(sigma)
-            properties['boiling_point_temperature'] = EstimatedProp(
-                **boiling_point_temp
-            )
-
-            # NOTE: critical temperature
-            res_ = \
-                self._calc_critical_temperature(
-                    sigma,
-                    boiling_point_temperature=boiling_point_temp['value'] if boiling_point_temp else None
-                )
-            properties['critical_temperature'] = EstimatedProp(
-                **res_
-            )
+        names = tuple(dict.fromkeys(properties))
+        unknown = [name for name in names if name not in JOBACK_PROPERTY_SIGMA]
+        if unknown:
+            raise ValueError(
+                f"Unknown Joback properties: {unknown}; choose from {list(JOBACK_PROPERTY_SIGMA)}.")
+        if 'liquid_viscosity' in names and self.molecular_weight is None:
+            raise ValueError("'liquid_viscosity' needs the molecular weight.")
+        return names
 
-            # NOTE: critical pressure
-            properties['critical_pressure'] = EstimatedProp(
-                **self._calc_critical_pressure(sigma)
-            )
+    def _calc_property(
+            self,
+            name: str,
+            sigma: Dict[str, float],
+            boiling_point_temperature: Optional[float] = None,
+    ) -> EstimatedProp:
+        '''
+        Calculates one property from sigma.
 
-            # NOTE: critical volume
-            properties['critical_volume'] = EstimatedProp(
-                **self._calc_critical_volume(sigma)
-            )
+        Parameters
+        ----------
+        name : str
+            Property name.
+        sigma : Dict[str, float]
+            Sigma values, holding at least the columns of the property.
+        boiling_point_temperature : float, optional
+            Boiling point temperature (K), required by the critical temperature, by default None.
 
-            # NOTE: standard enthalpy of formation in ideal gas
-            properties['standard_enthalpy_of_formation_ideal_gas'] = EstimatedProp(
-                **self._calc_standard_enthalpy_of_formation_ideal_gas(sigma)
-            )
+        Returns
+        -------
+        EstimatedProp
+            Value, unit and symbol of the property.
+        '''
+        # NOTE: closures are timed under their own stage names
+        if name == 'heat_capacity':
+            with stage('joback.heat_capacity_closure'):
+                return EstimatedProp(**self._calc_heat_capacity(sigma))
+        if name == 'liquid_viscosity':
+            with stage('joback.liquid_viscosity_closure'):
+                return EstimatedProp(**self._calc_liquid_viscosity(sigma))
+
+        with stage(f'joback.formula.{name}'):
+            if name == 'critical_temperature':
+                return EstimatedProp(**self._calc_critical_temperature(
+                    sigma, boiling_point_temperature=boiling_point_temperature))
+            return EstimatedProp(**getattr(self, f'_calc_{name}')(sigma))
 
-            # NOTE: standard Gibbs energy of formation in ideal gas
-            properties['standard_gibbs_energy_of_formation_ideal_gas'] = EstimatedProp(
-                **self._calc_standard_gibbs_energy_of_formation_ideal_gas(sigma)
-            )
+    def _calc(
+            self,
+            properties: Optional[Sequence[str]] = None,
+            lazy: bool = False,
+    ) -> "Dict[str, EstimatedProp] | JobackProperties":
+        '''
+        Calculates properties using Joback method.
 
-            # NOTE: standard enthalpy of fusion
-            properties['standard_enthalpy_of_fusion'] = EstimatedProp(
-                **self._calc_standard_enthalpy_of_fusion(sigma)
-            )
+        Parameters
+        ----------
+        properties : Sequence[str], optional
+            Properties to calculate, by default None for all.
+        lazy : bool, optional
+            Return a `JobackProperties` mapping that calculates each property on first access, by default False.
 
-            # NOTE: standard enthalpy of vaporization
-            properties['standard_enthalpy_of_vaporization'] = EstimatedProp(
-                **self._calc_standard_enthalpy_of_vaporization(sigma)
-            )
+        Returns
+        -------
+        properties : Dict[str, EstimatedProp] | JobackProperties
+            Dictionary of calculated properties.
+        '''
+        try:
+            # SECTION: select properties
+            names = self._select_properties(properties)
+            if lazy:
+                return JobackProperties(self, names)
 
-            # NOTE: heat capacity function
-            properties['heat_capacity'] = EstimatedProp(
-                **self._calc_heat_capacity(sigma)
-            )
+            # SECTION: calculate sigma once for the selection
+            sigma = self._calc_sigma(joback_sigma_columns(names))
 
-            return properties
+            # SECTION: calculate properties
+            return JobackProperties(self, names, sigma=sigma).to_dict()
         except Exception as e:
             raise Exception("Calculating properties failed!, ", e)
 
@@ -722,7 +705,7 @@ class Joback:
             sigma: Dict[str, float],
     ):
         """
-        Create a placeholder for heat capacity calculation.
+        Creates the heat capacity function.
 
         Parameters
         ----------
@@ -732,11 +715,11 @@ class Joback:
         Returns
         -------
         Cp_func : dict
-            Heat capacity function Cp(T).
+            Heat capacity function Cp(T) as a `JobackCpEvaluator`.
         """
         try:
-            # create heat capacity function
-            res_ = JobackHeatCapacity(
+            # create heat capacity function (coefficients only, picklable)
+            res_ = JobackCpEvaluator(
                 a=sigma['a'],
                 b=sigma['b'],
                 c=sigma['c'],
@@ -744,7 +727,7 @@ class Joback:
             )
 
             return {
-                'value': res_.Cp,
+                'value': res_,
                 'unit': 'J/mol·K',
                 'symbol': 'Cp_IG'
             }
@@ -752,3 +735,153 @@ class Joback:
             logger.error(
                 f"Creating heat capacity function failed!, {e}")
             return {'value': None, 'unit': 'J/mol·K', 'symbol': 'Cp_IG'}
+
+    def _calc_liquid_viscosity(
+            self,
+            sigma: Dict[str, float],
+    ):
+        """
+        Create the liquid viscosity function.
+
+        Parameters
+        ----------
+        sigma : Dict[str, float]
+            Dictionary of sigma values.
+
+        Returns
+        -------
+        eta_func : dict
+            Liquid viscosity function eta_L(T) = MW exp((Σηa - 597.82)/T + Σηb - 11.202) in Pa·s, as a `JobackViscosityEvaluator`.
+        """
+        try:
+            # create liquid viscosity function (coefficients only, picklable)
+            res_ = JobackViscosityEvaluator(
+                eta_a=sigma['ηa'],
+                eta_b=sigma['ηb'],
+                molecular_weight=self.molecular_weight
+            )
+
+            return {
+                'value': res_,
+                'unit': 'Pa·s',
+                'symbol': 'eta_L'
+            }
+        except Exception as e:
+            logger.error(
+                f"Creating liquid viscosity function failed!, {e}")
+            return {'value': None, 'unit': 'Pa·s', 'symbol': 'eta_L'}
+
+    def _calc_ideal_gas(
+            self,
+    ) -> JobackIdealGas:
+        """
+        Builds the closed-form ideal-gas H, S and G model.
+
+        Returns
+        -------
+        JobackIdealGas
+            Ideal-gas model referenced to the standard formation properties at 298.15 K.
+        """
+        try:
+            # SECTION: calculate sigma
+            sigma = self._calc_sigma(
+                joback_sigma_columns(['heat_capacity',
+                                      'standard_enthalpy_of_formation_ideal_gas',
+                                      'standard_gibbs_energy_of_formation_ideal_gas']))
+
+            return JobackIdealGas(
+                heat_capacity=JobackHeatCapacity(
+                    a=sigma['a'],
+                    b=sigma['b'],
+                    c=sigma['c'],
+                    d=sigma['d']
+                ),
+                EnFo_IG=self._calc_standard_enthalpy_of_formation_ideal_gas(sigma)[
+                    'value'],
+                GiEnFo_IG=self._calc_standard_gibbs_energy_of_formation_ideal_gas(sigma)[
+                    'value'],
+            )
+        except Exception as e:
+            raise Exception("Creating ideal-gas model failed!, ", e)
+
+
+class JobackProperties(Mapping):
+    '''
+    Read-only mapping of Joback properties that calculates each property on first access.
+
+    Only the sigma columns a property needs are summed, and each column is summed once; the critical temperature calculates the boiling point temperature first.
+    '''
+
+    def __init__(
+        self,
+        joback: Joback,
+        properties: Sequence[str],
+        sigma: Optional[Dict[str, float]] = None,
+    ):
+        '''
+        Initializes the mapping.
+
+        Parameters
+        ----------
+        joback : Joback
+            Joback instance with validated groups.
+        properties : Sequence[str]
+            Property names exposed by the mapping.
+        sigma : Dict[str, float], optional
+            Sigma values already calculated, by default None.
+        '''
+        self._joback = joback
+        self._names = tuple(properties)
+        self._sigma: Dict[str, float] = {} if sigma is None else sigma
+        self._values: Dict[str, EstimatedProp] = {}
+
+    def __getitem__(self, name: str) -> EstimatedProp:
+        if name not in self._names:
+            raise KeyError(name)
+        return self._get(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        done = sum(name in self._values for name in self._names)
+        return f"JobackProperties({done}/{len(self._names)} calculated: {list(self._names)})"
+
+    @property
+    def calculated(self) -> Tuple[str, ...]:
+        '''
+        Returns the names of the properties calculated so far, including dependencies.
+        '''
+        return tuple(self._values)
+
+    def _get(
+        self,
+        name: str,
+    ) -> EstimatedProp:
+        prop = self._values.get(name)
+        if prop is not None:
+            return prop
+
+        # NOTE: the critical temperature depends on the boiling point temperature
+        Tb = None
+        if name == 'critical_temperature':
+            Tb = self._get('boiling_point_temperature')['value']
+
+        sigma = self._joback._calc_sigma(JOBACK_PROPERTY_SIGMA[name], self._sigma)
+        prop = self._joback._calc_property(name, sigma, boiling_point_temperature=Tb)
+        self._values[name] = prop
+        return prop
+
+    def to_dict(self) -> Dict[str, EstimatedProp]:
+        '''
+        Calculates every selected property.
+
+        Returns
+        -------
+        Dict[str, EstimatedProp]
+            Selected properties in selection order.
+        '''
+        return {name: self._get(name) for name in self._names}
@@ -0,0 +1,336 @@
+# import libs
+import logging
+import os
+from typing import Literal
+import numpy as np
+
+# NOTE: numba is optional; without it every kernel runs on the NumPy reference path
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: requested backend, 'auto' uses numba when it is installed
+_BACKENDS = ('auto', 'numpy', 'numba')
+_backend = os.environ.get('PYTHERMOEST_KERNELS', 'auto').lower()
+if _backend not in _BACKENDS:
+    logger.warning(
+        f"Ignoring PYTHERMOEST_KERNELS={_backend!r}; expected one of {_BACKENDS}.")
+    _backend = 'auto'
+
+# NOTE: on-disk JIT cache, on by default so only the first process pays the compilation;
+# PYTHERMOEST_JIT_CACHE=0 turns it off
+_JIT_CACHE = os.environ.get('PYTHERMOEST_JIT_CACHE', '1').lower() not in ('0', 'false', 'no')
+
+
+def _njit(func):
+    '''
+    Compiles a kernel with numba, cached on disk when a cache directory is usable.
+
+    Numba writes the cache next to the package, or in the user cache directory when the package is read-only; with neither available the kernel is compiled per process.
+    '''
+    if _JIT_CACHE:
+        try:
+            return numba.njit(cache=True)(func)
+        except RuntimeError as e:
+            # ! no writable cache location
+            logger.debug(f"JIT cache unavailable for {func.__name__}: {e}")
+    return numba.njit(func)
+
+
+def set_kernel_backend(
+    name: Literal['auto', 'numpy', 'numba'],
+) -> None:
+    '''
+    Selects the backend of the compiled kernels.
+
+    Parameters
+    ----------
+    name : str
+        'auto' (numba when installed), 'numpy' (reference path) or 'numba'.
+
+    Notes
+    -----
+    The initial value comes from the PYTHERMOEST_KERNELS environment variable, by default 'auto'.
+    '''
+    global _backend
+    name = name.lower()
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown kernel backend '{name}'; choose from {_BACKENDS}.")
+    if name == 'numba' and not HAS_NUMBA:
+        raise ImportError(
+            "The numba kernel backend requires numba (pip install pyThermoEst[jit]).")
+    _backend = name
+
+
+def kernel_backend() -> Literal['numpy', 'numba']:
+    '''
+    Returns the backend the kernels currently run on.
+
+    Returns
+    -------
+    str
+        'numba' or 'numpy'.
+    '''
+    return 'numba' if use_numba() else 'numpy'
+
+
+def use_numba() -> bool:
+    '''
+    Returns True when the numba kernels should be used.
+    '''
+    return HAS_NUMBA and _backend != 'numpy'
+
+
+# SECTION: numba kernels
+# NOTE: each kernel mirrors its NumPy reference operation by operation, so both
+# paths agree to rounding; the references live next to their call sites.
+
+if HAS_NUMBA:
+
+    @_njit
+    def _antoine_eval(A, B, C, T, y, w, log_space, ln_base, r, J):
+        '''
+        Fills the residuals r and Jacobian J of one Antoine problem and returns the cost.
+        '''
+        cost = 0.0
+        for i in range(T.shape[0]):
+            inv = 1.0 / (T[i] + C)
+            m = A - B * inv
+            if log_space:
+                r[i] = w[i] * (m - y[i])
+                s = w[i]
+            else:
+                P_hat = np.exp(ln_base * m)
+                r[i] = w[i] * (P_hat - y[i])
+                s = w[i] * P_hat * ln_base
+            J[i, 0] = s
+            J[i, 1] = -s * inv
+            J[i, 2] = s * B * (inv * inv)
+            cost += r[i] * r[i]
+        return 0.5 * cost
+
+    @_njit
+    def antoine_residual_jacobian(x, T, y, w, log_space, ln_base):
+        '''
+        Residuals (n,) and Jacobian (n, 3) of one weighted Antoine problem.
+        '''
+        n = T.shape[0]
+        r = np.empty(n)
+        J = np.empty((n, 3))
+        _antoine_eval(x[0], x[1], x[2], T, y, w, log_space, ln_base, r, J)
+        return r, J
+
+    @_njit
+    def _solve3(M, g, step):
+        '''
+        Solves M step = g for a 3x3 system by Gaussian elimination with partial pivoting, falling back to the pseudo-inverse.
+        '''
+        for a in range(3):
+            if not np.isfinite(g[a]):
+                step[:] = np.nan
+                return
+            for b in range(3):
+                if not np.isfinite(M[a, b]):
+                    step[:] = np.nan
+                    return
+
+        U = M.copy()
+        v = g.copy()
+        for c in range(3):
+            p = c
+            for i in range(c + 1, 3):
+                if abs(U[i, c]) > abs(U[p, c]):
+                    p = i
+            if U[p, c] == 0.0:
+                # ! singular, same fallback as np.linalg.solve -> pinv
+                step[:] = np.linalg.pinv(M) @ g
+                return
+            if p != c:
+                for b in range(3):
+                    U[c, b], U[p, b] = U[p, b], U[c, b]
+                v[c], v[p] = v[p], v[c]
+            for i in range(c + 1, 3):
+                f = U[i, c] / U[c, c]
+                for b in range(c, 3):
+                    U[i, b] -= f * U[c, b]
+                v[i] -= f * v[c]
+        for c in range(2, -1, -1):
+            s = v[c]
+            for b in range(c + 1, 3):
+                s -= U[c, b] * step[b]
+            step[c] = s / U[c, c]
+
+    @_njit
+    def _lm_row(T, y, w, x, lo, hi, log_space, ln_base, max_iter, xtol, ftol):
+        '''
+        Levenberg-Marquardt for one Antoine problem, updating x in place; returns (cost, ok).
+        '''
+        n = T.shape[0]
+        r = np.empty(n)
+        J = np.empty((n, 3))
+        r_new = np.empty(n)
+        J_new = np.empty((n, 3))
+        x_new = np.empty(3)
+        g = np.empty(3)
+        M = np.empty((3, 3))
+        step = np.empty(3)
+
+        lam = 1e-3
+        cost = _antoine_eval(x[0], x[1], x[2], T, y, w, log_space, ln_base, r, J)
+        active = np.isfinite(cost)
+        converged = False
+
+        for _ in range(max_iter):
+            if not active:
+                break
+
+            # NOTE: damped normal equations
+            for a in range(3):
+                ga = 0.0
+                for i in range(n):
+                    ga += J[i, a] * r[i]
+                g[a] = ga
+                for b in range(3):
+                    h = 0.0
+                    for i in range(n):
+                        h += J[i, a] * J[i, b]
+                    M[a, b] = h
+            d0, d1, d2 = M[0, 0], M[1, 1], M[2, 2]
+            if d0 != d0 or d1 != d1 or d2 != d2:
+                d_max = np.nan
+            else:
+                d_max = max(d0, max(d1, d2))
+            floor = 1e-12 * d_max + 1e-300
+            for a in range(3):
+                # NOTE: np.maximum semantics, NaN propagates through the floor
+                D = M[a, a] if M[a, a] >= floor else floor
+                M[a, a] += lam * D
+            _solve3(M, g, step)
+
+            for a in range(3):
+                v = x[a] - step[a]
+                if v == v:
+                    v = min(max(v, lo[a]), hi[a])
+                x_new[a] = v
+            cost_new = _antoine_eval(
+                x_new[0], x_new[1], x_new[2], T, y, w, log_space, ln_base, r_new, J_new)
+
+            # NOTE: accept improving steps, adapt the damping
+            if np.isfinite(cost_new) and cost_new <= cost:
+                small = True
+                for a in range(3):
+                    if not (abs(x_new[a] - x[a]) <= xtol * (abs(x[a]) + xtol)):
+                        small = False
+                if not small and cost - cost_new <= ftol * cost:
+                    small = True
+                x[:] = x_new
+                r[:] = r_new
+                J[:, :] = J_new
+                cost = cost_new
+                lam = max(lam / 3.0, 1e-12)
+                if small:
+                    converged = True
+                    active = False
+            else:
+                lam *= 4.0
+                if lam > 1e12:
+                    active = False
+
+        # NOTE: rows pinned at a bound are left to the bounded solver
+        ok = True
+        for a in range(3):
+            if not (x[a] > lo[a] and x[a] < hi[a]) or not np.isfinite(x[a]):
+                ok = False
+
+        # >> damping blow-up at a minimum counts as converged when the gradient vanishes
+        flat = True
+        rms = np.sqrt(2.0 * cost)
+        for a in range(3):
+            ga = 0.0
+            na = 0.0
+            for i in range(n):
+                ga += J[i, a] * r[i]
+                na += J[i, a] * J[i, a]
+            if not (abs(ga) <= 1e-8 * (rms * np.sqrt(na) + 1e-300)):
+                flat = False
+
+        return cost, ok and (converged or flat)
+
+    @_njit
+    def batched_lm(T, Y, w, x0, lo, hi, log_space, ln_base, max_iter, xtol, ftol):
+        '''
+        Levenberg-Marquardt over many equal-length Antoine problems; returns (x, ok, cost).
+        '''
+        n_fits = T.shape[0]
+        x = x0.copy()
+        ok = np.zeros(n_fits, dtype=np.bool_)
+        cost = np.empty(n_fits)
+        for k in range(n_fits):
+            c, o = _lm_row(T[k], Y[k], w[k], x[k], lo, hi,
+                           log_space, ln_base, max_iter, xtol, ftol)
+            cost[k] = c
+            ok[k] = o
+        return x, ok, cost
+
+    @_njit
+    def accumulate_counts(rows, cols, values, n_rows, n_cols):
+        '''
+        Dense (n_rows, n_cols) matrix with values summed at (rows, cols).
+        '''
+        out = np.zeros((n_rows, n_cols))
+        for k in range(rows.shape[0]):
+            out[rows[k], cols[k]] += values[k]
+        return out
+
+    @_njit
+    def scatter_columns(block, src, dst, n_groups):
+        '''
+        Dense (N, n_groups) matrix with block[:, src[k]] added to column dst[k]; NaN counts as zero.
+        '''
+        n = block.shape[0]
+        out = np.zeros((n, n_groups))
+        big = np.finfo(np.float64).max
+        for i in range(n):
+            for k in range(src.shape[0]):
+                v = block[i, src[k]]
+                if v != v:
+                    continue
+                if v == np.inf:
+                    v = big
+                elif v == -np.inf:
+                    v = -big
+                out[i, dst[k]] += v
+        return out
+
+
+def warmup() -> bool:
+    '''
+    Compiles the numba kernels ahead of the first real call.
+
+    Returns
+    -------
+    bool
+        True when the kernels were compiled, False on the NumPy backend.
+    '''
+    if not use_numba():
+        return False
+    T = np.linspace(300.0, 400.0, 5)[None, :]
+    y = 10.0 - 1500.0 / (T - 50.0)
+    w = np.ones_like(T)
+    lo, hi = np.array([-200.0, 1e-6, -1e4]), np.array([200.0, 1e7, 1e4])
+    x0 = np.array([[9.0, 1400.0, -40.0]])
+    for log_space in (True, False):
+        batched_lm(T, y, w, x0, lo, hi, log_space, 1.0, 5, 1e-10, 1e-12)
+        antoine_residual_jacobian(x0[0], T[0], y[0], w[0], log_space, 1.0)
+    accumulate_counts(np.zeros(1, dtype=np.intp), np.zeros(1, dtype=np.intp),
+                      np.ones(1), 1, 1)
+    scatter_columns(np.ones((1, 1)), np.zeros(1, dtype=np.intp),
+                    np.zeros(1, dtype=np.intp), 1)
+    return True
+
@@ -0,0 +1,947 @@
+# import libs
+import logging
+import threading
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait)
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+import numpy as np
+from scipy.sparse import csr_matrix, issparse
+# locals
+from ..models import (
+    JobackGroupContributions,
+    ZabranskyRuzickaGroupContributions,
+    ZabranskyRuzickaGroupContributionsCorrections,
+    EstimatedBatchProp,
+)
+from ..models.antoine import AntoineFitResult
+from ..models.vapor_pressure import VaporPressureFitResult
+from .batch import JobackBatch, ZabranskyRuzickaBatch, build_count_matrix, split_rows
+from .tables import load_zabransky_ruzicka_tables
+from .antoine import Antoine
+from .vapor_pressure import VaporPressureCorrelation, get_correlation
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+# SECTION: sharding policies
+
+class ShardingPolicy(ABC):
+    '''
+    Splits a batch into contiguous, ordered shards.
+
+    Subclasses must implement `split(n_items, kind)`, where kind is 'rows' for group-count rows and 'datasets' for vapor-pressure datasets. Policies must be picklable when they are sent along with an estimator.
+    '''
+
+    @abstractmethod
+    def split(
+        self,
+        n_items: int,
+        kind: Literal['rows', 'datasets'] = 'rows',
+    ) -> List[slice]:
+        '''
+        Returns the shards of `n_items` items.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of items.
+        kind : Literal['rows', 'datasets'], optional
+            What is being split, by default 'rows'.
+
+        Returns
+        -------
+        List[slice]
+            Contiguous slices covering range(n_items) in order.
+        '''
+
+
+class FixedSizeSharding(ShardingPolicy):
+    '''
+    Shards of a fixed number of rows or datasets, for pools of similar workers.
+    '''
+
+    def __init__(self, chunk_size: int = 4096, fit_chunk_size: int = 8):
+        '''
+        Initializes the policy.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Molecules per shard, by default 4096.
+        fit_chunk_size : int, optional
+            Datasets per shard, by default 8.
+        '''
+        if chunk_size <= 0 or fit_chunk_size <= 0:
+            raise ValueError("chunk sizes must be positive.")
+        self.chunk_size = int(chunk_size)
+        self.fit_chunk_size = int(fit_chunk_size)
+
+    def __repr__(self) -> str:
+        return f"FixedSizeSharding(chunk_size={self.chunk_size}, fit_chunk_size={self.fit_chunk_size})"
+
+    def split(
+        self,
+        n_items: int,
+        kind: Literal['rows', 'datasets'] = 'rows',
+    ) -> List[slice]:
+        return split_rows(n_items, self.chunk_size if kind == 'rows' else self.fit_chunk_size)
+
+
+class EvenSharding(ShardingPolicy):
+    '''
+    A fixed number of near-equal shards, e.g. one per node of a multi-node executor.
+    '''
+
+    def __init__(self, n_shards: int, min_size: int = 1):
+        '''
+        Initializes the policy.
+
+        Parameters
+        ----------
+        n_shards : int
+            Number of shards.
+        min_size : int, optional
+            Smallest shard; small batches get fewer shards, by default 1.
+        '''
+        if n_shards <= 0 or min_size <= 0:
+            raise ValueError("n_shards and min_size must be positive.")
+        self.n_shards = int(n_shards)
+        self.min_size = int(min_size)
+
+    def __repr__(self) -> str:
+        return f"EvenSharding(n_shards={self.n_shards}, min_size={self.min_size})"
+
+    def split(
+        self,
+        n_items: int,
+        kind: Literal['rows', 'datasets'] = 'rows',
+    ) -> List[slice]:
+        n = max(min(self.n_shards, n_items // self.min_size), 1)
+        bounds = np.linspace(0, n_items, n + 1).round().astype(int)
+        return [slice(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+# SECTION: compact shard payloads
+
+def _is_matrix(x: Any) -> bool:
+    '''
+    Returns True for a dense or sparse count matrix.
+    '''
+    return isinstance(x, np.ndarray) or issparse(x)
+
+
+def _pack_counts(
+    counts: np.ndarray,
+) -> np.ndarray | csr_matrix:
+    '''
+    Packs a block of counts for transfer: CSR when mostly zero, with the smallest integer dtype that holds integral counts exactly.
+    '''
+    if issparse(counts):
+        block = counts.tocsr()
+        values = block.data
+    else:
+        block = np.asarray(counts)
+        values = block
+
+    # NOTE: integral counts travel as the smallest exact integer dtype
+    if values.size and values.dtype.kind == 'f' and np.all(np.isfinite(values)) and \
+            np.array_equal(values, np.round(values)):
+        peak = np.abs(values).max()
+        for dtype in (np.int8, np.int16, np.int32):
+            if peak <= np.iinfo(dtype).max:
+                block = block.astype(dtype)
+                break
+
+    if not issparse(block) and block.ndim == 2 and block.size and \
+            np.count_nonzero(block) <= block.size // 4:
+        block = csr_matrix(block)
+    return block
+
+
+def _pack_datasets(
+    datasets: Sequence[Tuple[np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Packs (T, P) datasets into flat T and P arrays and (n + 1) offsets.
+    '''
+    sizes = [np.asarray(T).size for T, _ in datasets]
+    offsets = np.zeros(len(datasets) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    if not datasets:
+        return np.empty(0), np.empty(0), offsets
+    T = np.concatenate([np.asarray(T, dtype=float).ravel() for T, _ in datasets])
+    P = np.concatenate([np.asarray(P, dtype=float).ravel() for _, P in datasets])
+    return T, P, offsets
+
+
+def _unpack_datasets(
+    T: np.ndarray,
+    P: np.ndarray,
+    offsets: np.ndarray,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    return [(T[a:b], P[a:b]) for a, b in zip(offsets[:-1], offsets[1:])]
+
+
+# SECTION: shard workers (module level so process pools can pickle them)
+
+def _joback_shard(
+    counts: np.ndarray,
+    total_atoms_number: np.ndarray,
+    properties: Optional[Sequence[str]] = None,
+    dtype: Any = np.float64,
+) -> Dict[str, np.ndarray]:
+    return JobackBatch.calc(counts, total_atoms_number, properties=properties, dtype=dtype)
+
+
+def _zabransky_ruzicka_shard(
+    counts: np.ndarray,
+    corrections: np.ndarray,
+    dtype: Any = np.float64,
+) -> Dict[str, np.ndarray]:
+    return ZabranskyRuzickaBatch.calc(counts, corrections, dtype=dtype)
+
+
+def _antoine_batch_shard(
+    T: np.ndarray,
+    P: np.ndarray,
+    offsets: np.ndarray,
+    fit_options: Dict[str, Any],
+) -> Dict[str, np.ndarray]:
+    return Antoine.fit_antoine_batch(_unpack_datasets(T, P, offsets), **fit_options)
+
+
+def _antoine_shard(
+    datasets: List[Tuple[np.ndarray, np.ndarray]],
+    fit_options: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    return Antoine.fit_antoine_many(datasets, **fit_options)
+
+
+def _correlation_shard(
+    correlation: VaporPressureCorrelation,
+    datasets: List[Tuple[np.ndarray, np.ndarray]],
+    fit_options: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    return correlation.fit_many(datasets, **fit_options)
+
+
+def _antoine_bootstrap_shard(
+    T_samples: np.ndarray,
+    Y_samples: np.ndarray,
+    w_samples: np.ndarray,
+    x0: Tuple[float, float, float],
+    refit_options: Dict[str, Any],
+) -> np.ndarray:
+    return Antoine.refit_many(T_samples, Y_samples, w_samples, x0, **refit_options)
+
+
+def _antoine_start_shard(
+    T_k: np.ndarray,
+    y: np.ndarray,
+    w: np.ndarray,
+    starts: np.ndarray,
+    refit_options: Dict[str, Any],
+) -> Tuple[np.ndarray, np.ndarray]:
+    shape = (starts.shape[0], T_k.size)
+    return Antoine.refit_many(
+        np.broadcast_to(T_k, shape), np.broadcast_to(y, shape), np.broadcast_to(w, shape),
+        starts, return_cost=True, **refit_options)
+
+
+def _concat_shards(
+    shards: List[Dict[str, np.ndarray]],
+) -> Dict[str, np.ndarray]:
+    '''
+    Concatenates per-shard result arrays in shard order.
+    '''
+    if not shards:
+        return {}
+    return {
+        key: np.concatenate([shard[key] for shard in shards])
+        for key in shards[0]
+    }
+
+
+class ParallelEstimator:
+    '''
+    Parallel batch executor for the estimation methods.
+
+    - Batch Joback and Zabransky-Ruzicka inputs are converted once into count matrices, split into row chunks and evaluated by the vectorized kernels on a thread or process pool.
+    - Antoine datasets are fitted in chunks of independent datasets.
+    - Results are assembled in input order.
+
+    Workers only read the shared, read-only parameter tables, so the same instance can be used from several threads. Use it as a context manager, or call `close()`, to release the pool.
+
+    Any `concurrent.futures.Executor`-compatible object (one whose `submit` returns a `concurrent.futures.Future`) can replace the built-in pools, e.g. a multi-node executor, with a `ShardingPolicy` deciding the shard sizes. Shards travel as count arrays (CSR with a small integer dtype when sparse) and flat (T, P) arrays, and results come back as plain arrays.
+    '''
+
+    def __init__(
+        self,
+        executor: Literal['thread', 'process'] | Executor = 'thread',
+        max_workers: Optional[int] = None,
+        chunk_size: int = 4096,
+        fit_chunk_size: int = 8,
+        sharding: Optional[ShardingPolicy] = None,
+    ):
+        '''
+        Initializes the parallel estimator.
+
+        Parameters
+        ----------
+        executor : Literal['thread', 'process'] | Executor, optional
+            Pool type, or an executor instance that stays owned by the caller (not shut down by `close()`), by default 'thread'.
+        max_workers : int, optional
+            Maximum number of workers of a built-in pool, by default None (executor default).
+        chunk_size : int, optional
+            Molecules per shard for group contribution methods, by default 4096.
+        fit_chunk_size : int, optional
+            Datasets per shard for Antoine fitting, by default 8.
+        sharding : ShardingPolicy, optional
+            Policy replacing `FixedSizeSharding(chunk_size, fit_chunk_size)`, by default None. Must be a ShardingPolicy subclass instance.
+        '''
+        # NOTE: check inputs
+        if isinstance(executor, str):
+            if executor not in ('thread', 'process'):
+                raise ValueError("executor must be 'thread', 'process' or an Executor.")
+        elif not callable(getattr(executor, 'submit', None)):
+            raise TypeError("executor must be 'thread', 'process' or an object with submit().")
+        if chunk_size <= 0 or fit_chunk_size <= 0:
+            raise ValueError("chunk sizes must be positive.")
+        if sharding is not None and not isinstance(sharding, ShardingPolicy):
+            raise TypeError("sharding must be a ShardingPolicy.")
+
+        self.executor = executor
+        self.max_workers = max_workers
+        self.chunk_size = int(chunk_size)
+        self.fit_chunk_size = int(fit_chunk_size)
+        self.sharding = sharding if sharding is not None \
+            else FixedSizeSharding(self.chunk_size, self.fit_chunk_size)
+
+        # NOTE: built-in pools are created on first use, external ones are used as given
+        self._pool: Optional[Executor] = None if isinstance(executor, str) else executor
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        executor = self.executor if isinstance(self.executor, str) \
+            else type(self.executor).__name__
+        return (
+            f"ParallelEstimator(executor={executor!r}, max_workers={self.max_workers}, "
+            f"sharding={self.sharding!r})"
+        )
+
+    def __enter__(self) -> "ParallelEstimator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _get_pool(self) -> Executor:
+        '''
+        Returns the worker pool, creating it on first use.
+        '''
+        with self._lock:
+            if self._pool is None:
+                if self.executor == 'process':
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="pythermoest",
+                    )
+            return self._pool
+
+    def _n_workers(self, pool: Executor) -> int:
+        '''
+        Returns the number of workers of the pool, or the CPU count when it is unknown.
+        '''
+        n = self.max_workers or getattr(pool, '_max_workers', None) or os.cpu_count() or 1
+        return max(int(n), 1)
+
+    def close(self) -> None:
+        '''
+        Shuts down a built-in worker pool; an executor passed in is left running.
+        '''
+        with self._lock:
+            if self._pool is not None and isinstance(self.executor, str):
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def _shards(
+        self,
+        n_items: int,
+        kind: Literal['rows', 'datasets'],
+    ) -> List[slice]:
+        '''
+        Splits a batch with the sharding policy and checks that the shards cover it in order.
+        '''
+        slices = list(self.sharding.split(n_items, kind))
+        stop = 0
+        for s in slices:
+            if s.start != stop or s.stop < s.start or s.step not in (None, 1):
+                raise ValueError(
+                    f"{self.sharding!r} returned non-contiguous shards for {n_items} items.")
+            stop = s.stop
+        if stop != n_items:
+            raise ValueError(
+                f"{self.sharding!r} covered {stop} of {n_items} items.")
+        return slices
+
+    def _map(
+        self,
+        fn: Callable[..., Any],
+        *iterables: Sequence[Any],
+    ) -> List[Any]:
+        '''
+        Submits a shard worker per shard and collects the results in shard order.
+        '''
+        # NOTE: single shard runs inline
+        if len(iterables[0]) <= 1:
+            return [fn(*args) for args in zip(*iterables)]
+
+        # NOTE: submit only, so executors without map() work as well
+        pool = self._get_pool()
+        futures = [pool.submit(fn, *args) for args in zip(*iterables)]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def joback(
+        self,
+        group_contributions: np.ndarray | Sequence[
+            JobackGroupContributions | Dict[str, float] | Dict[str, int]
+        ],
+        total_atoms_number: np.ndarray | Sequence[int],
+        molecular_weight: Optional[np.ndarray | Sequence[float]] = None,
+        properties: Optional[Sequence[str]] = None,
+        dtype: Any = np.float64,
+        raw: bool = False,
+    ) -> Dict[str, EstimatedBatchProp] | Dict[str, np.ndarray]:
+        '''
+        Runs the Joback method over a batch of molecules.
+
+        Parameters
+        ----------
+        group_contributions : np.ndarray | csr_matrix | Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]]
+            Count matrix of shape (N, 41), or group contributions of each molecule.
+        total_atoms_number : np.ndarray | Sequence[int]
+            Total number of atoms of each molecule.
+        molecular_weight : np.ndarray | Sequence[float], optional
+            Molecular weight (g/mol) of each molecule; adds 'liquid_viscosity', by default None.
+        properties : Sequence[str], optional
+            Properties to calculate, by default None for all.
+        dtype : Any, optional
+            np.float64, or np.float32 for reduced-precision screening, by default np.float64.
+        raw : bool, optional
+            Return the concatenated arrays of `JobackBatch.calc` instead of wrapped properties, by default False.
+
+        Returns
+        -------
+        Dict[str, EstimatedBatchProp] | Dict[str, np.ndarray]
+            Property arrays of shape (N,) keyed as in `joback_calc`, or the raw arrays.
+        '''
+        counts = group_contributions if _is_matrix(group_contributions) \
+            else JobackBatch.count_matrix(group_contributions)
+        atoms = np.asarray(total_atoms_number, dtype=float).ravel()
+
+        if atoms.size != counts.shape[0]:
+            raise ValueError(
+                "total_atoms_number must have one entry per molecule.")
+
+        # NOTE: shard rows
+        slices = self._shards(counts.shape[0], 'rows')
+        shards = self._map(
+            _joback_shard,
+            [_pack_counts(counts[s]) for s in slices],
+            [atoms[s] for s in slices],
+            [properties] * len(slices),
+            [dtype] * len(slices),
+        )
+
+        res = _concat_shards(shards)
+        if raw:
+            return res
+        return JobackBatch.to_estimated_props(res, molecular_weight=molecular_weight)
+
+    def zabransky_ruzicka(
+        self,
+        group_contributions: np.ndarray | Sequence[
+            ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]
+        ],
+        group_corrections: Optional[
+            np.ndarray | Sequence[
+                Optional[
+                    ZabranskyRuzickaGroupContributionsCorrections |
+                    Dict[str, float] |
+                    Dict[str, int]
+                ]
+            ]
+        ] = None,
+        dtype: Any = np.float64,
+        raw: bool = False,
+    ) -> EstimatedBatchProp | Dict[str, np.ndarray]:
+        '''
+        Runs the Zabransky-Ruzicka method over a batch of molecules.
+
+        Parameters
+        ----------
+        group_contributions : np.ndarray | Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]]
+            Contribution count matrix of shape (N, 130), or group contributions of each molecule.
+        group_corrections : np.ndarray | Sequence[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int] | None], optional
+            Correction count matrix of shape (N, 28), or group corrections of each molecule, by default None.
+        dtype : Any, optional
+            np.float64, or np.float32 for reduced-precision screening, by default np.float64.
+        raw : bool, optional
+            Return the concatenated arrays of `ZabranskyRuzickaBatch.calc` instead of the wrapped Cp_LIQ(T), by default False.
+
+        Returns
+        -------
+        EstimatedBatchProp | Dict[str, np.ndarray]
+            Vectorized liquid heat capacity Cp_LIQ(T), or the raw coefficient arrays.
+        '''
+        # NOTE: matrices are used as given, sequences are converted table-aligned
+        contributions_table, corrections_table = load_zabransky_ruzicka_tables()
+        if _is_matrix(group_contributions):
+            counts = group_contributions
+        else:
+            counts = build_count_matrix(
+                group_contributions=group_contributions,
+                table=contributions_table,
+                model=ZabranskyRuzickaGroupContributions,
+            )
+
+        if group_corrections is None:
+            corrections = None
+        elif _is_matrix(group_corrections):
+            corrections = group_corrections
+        else:
+            corrections = build_count_matrix(
+                group_contributions=[g if g else {} for g in group_corrections],
+                table=corrections_table,
+                model=ZabranskyRuzickaGroupContributionsCorrections,
+            )
+
+        if corrections is not None and corrections.shape[0] != counts.shape[0]:
+            raise ValueError(
+                "group_corrections must have the same number of molecules as group_contributions.")
+
+        # NOTE: empty corrections mean no correction terms
+        if corrections is not None and corrections.shape[1] == 0:
+            corrections = None
+
+        # NOTE: shard rows
+        slices = self._shards(counts.shape[0], 'rows')
+        shards = self._map(
+            _zabransky_ruzicka_shard,
+            [_pack_counts(counts[s]) for s in slices],
+            [None if corrections is None else _pack_counts(corrections[s]) for s in slices],
+            [dtype] * len(slices),
+        )
+
+        res = _concat_shards(shards)
+        if raw:
+            return res
+        return ZabranskyRuzickaBatch.to_estimated_prop(res)
+
+    def fit_antoine(
+        self,
+        datasets: Sequence[Tuple[np.ndarray, np.ndarray]],
+        **fit_options: Any,
+    ) -> List[Optional[AntoineFitResult]]:
+        '''
+        Fits Antoine coefficients to many datasets.
+
+        Parameters
+        ----------
+        datasets : Sequence[Tuple[np.ndarray, np.ndarray]]
+            List of (T_data, P_data) pairs in K and Pa.
+        **fit_options : Any
+            Keyword options forwarded to `Antoine.fit_antoine`.
+
+        Returns
+        -------
+        List[Optional[AntoineFitResult]]
+            One result per dataset in input order, None for failed fits.
+        '''
+        datasets = [
+            (np.asarray(T, dtype=float), np.asarray(P, dtype=float))
+            for T, P in datasets
+        ]
+
+        # NOTE: shard datasets
+        slices = self._shards(len(datasets), 'datasets')
+        shards = self._map(
+            _antoine_shard,
+            [datasets[s] for s in slices],
+            [fit_options] * len(slices),
+        )
+
+        return [
+            AntoineFitResult(**report) if report else None
+            for shard in shards
+            for report in shard
+        ]
+
+    def fit_antoine_batch(
+        self,
+        datasets: Sequence[Tuple[np.ndarray, np.ndarray]],
+        **fit_options: Any,
+    ) -> Dict[str, np.ndarray]:
+        '''
+        Fits Antoine coefficients to many small datasets with the batched solver, one solve per shard.
+
+        Parameters
+        ----------
+        datasets : Sequence[Tuple[np.ndarray, np.ndarray]]
+            List of (T_data, P_data) pairs in K and Pa.
+        **fit_options : Any
+            Keyword options forwarded to `Antoine.fit_antoine_batch`.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays 'A', 'B', 'C', 'cost', 'rmse_logP', 'success' of shape (n_datasets,), in input order.
+
+        Notes
+        -----
+        Each shard travels as flat T and P arrays with offsets and returns coefficient arrays, so no fit reports are pickled.
+        '''
+        slices = self._shards(len(datasets), 'datasets')
+        packed = [_pack_datasets(datasets[s]) for s in slices]
+        shards = self._map(
+            _antoine_batch_shard,
+            [p[0] for p in packed],
+            [p[1] for p in packed],
+            [p[2] for p in packed],
+            [fit_options] * len(slices),
+        )
+        if not shards:
+            return Antoine.fit_antoine_batch([], **fit_options)
+        return _concat_shards(shards)
+
+    def fit_vapor_pressure(
+        self,
+        correlation: str | VaporPressureCorrelation,
+        datasets: Sequence[Tuple[np.ndarray, np.ndarray]],
+        **fit_options: Any,
+    ) -> List[Optional[VaporPressureFitResult]]:
+        '''
+        Fits a vapor pressure correlation to many datasets.
+
+        Parameters
+        ----------
+        correlation : str | VaporPressureCorrelation
+            Correlation instance, or the name of one without constants ('antoine', 'extended_antoine', 'dippr101').
+        datasets : Sequence[Tuple[np.ndarray, np.ndarray]]
+            List of (T_data, P_data) pairs in K and Pa.
+        **fit_options : Any
+            Keyword options forwarded to `VaporPressureCorrelation.fit`.
+
+        Returns
+        -------
+        List[Optional[VaporPressureFitResult]]
+            One result per dataset in input order, None for failed fits.
+        '''
+        correlation = get_correlation(correlation)
+        datasets = [
+            (np.asarray(T, dtype=float), np.asarray(P, dtype=float))
+            for T, P in datasets
+        ]
+
+        # NOTE: shard datasets
+        slices = self._shards(len(datasets), 'datasets')
+        shards = self._map(
+            _correlation_shard,
+            [correlation] * len(slices),
+            [datasets[s] for s in slices],
+            [fit_options] * len(slices),
+        )
+
+        return [
+            VaporPressureFitResult(**report) if report else None
+            for shard in shards
+            for report in shard
+        ]
+
+    def bootstrap_antoine(
+        self,
+        T_data: np.ndarray,
+        P_data: np.ndarray,
+        fit_report: Dict[str, Any],
+        *,
+        n_boot: int = 1000,
+        method: Literal['residual', 'pairs'] = 'residual',
+        temperatures: Optional[Sequence[float]] = None,
+        level: float = 0.95,
+        weights: Optional[np.ndarray] = None,
+        bounds: Optional[
+            Tuple[
+                Tuple[float, float, float],
+                Tuple[float, float, float]
+            ]
+        ] = None,
+        max_nfev: int = 100,
+        boot_chunk_size: int = 64,
+        seed: Optional[int | np.random.Generator] = None,
+        return_samples: bool = False,
+    ) -> Dict[str, Any]:
+        '''
+        Bootstraps the Antoine coefficients of one fit on the pool.
+
+        Parameters
+        ----------
+        T_data : np.ndarray
+            Temperatures in K used in the base fit.
+        P_data : np.ndarray
+            Vapor pressures in Pa used in the base fit.
+        fit_report : Dict[str, Any]
+            Fit report from `Antoine.fit_antoine`; refits reuse its base, fit space, loss and f_scale and are warm-started from its (A, B, C).
+        n_boot : int, optional
+            Number of bootstrap refits, by default 1000.
+        method : Literal['residual', 'pairs'], optional
+            Resampling scheme, by default 'residual'.
+        temperatures : Sequence[float], optional
+            Temperatures in K at which Psat intervals are reported, by default None.
+        level : float, optional
+            Confidence level of the percentile intervals, by default 0.95.
+        weights : np.ndarray, optional
+            Weights of the base fit, by default None.
+        bounds : Tuple[Tuple[float, float, float], Tuple[float, float, float]], optional
+            Bounds of the base fit, by default None (fit_antoine defaults).
+        max_nfev : int, optional
+            Function evaluations allowed per refit, by default 100; a refit that runs out is continued once with ten times the budget and kept.
+        boot_chunk_size : int, optional
+            Refits per shard, by default 64.
+        seed : int | np.random.Generator, optional
+            Seed for the resampling, by default None.
+        return_samples : bool, optional
+            Whether to include the (n_boot, 3) coefficient samples as 'samples', by default False.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Intervals as returned by `Antoine.bootstrap_summary`, plus 'method'.
+        '''
+        if boot_chunk_size <= 0:
+            raise ValueError("boot_chunk_size must be positive.")
+
+        # NOTE: resampled datasets are drawn once, in the caller
+        T_b, Y_b, w_b = Antoine.bootstrap_samples(
+            T_data, P_data, fit_report, n_boot,
+            method=method, weights=weights, seed=seed)
+
+        x0 = (float(fit_report["A"]), float(
+            fit_report["B"]), float(fit_report["C"]))
+        refit_options = {
+            "base": str(fit_report.get("base", "log10")),
+            "fit_in_log_space": bool(fit_report.get("fit_in_log_space", True)),
+            "bounds": bounds,
+            "max_nfev": int(max_nfev),
+            "loss": str(fit_report.get("loss", "linear")),
+            "f_scale": float(fit_report.get("f_scale", 1.0)),
+            "keep_unconverged": True,
+        }
+
+        # NOTE: shard refits
+        slices = split_rows(n_boot, boot_chunk_size)
+        shards = self._map(
+            _antoine_bootstrap_shard,
+            [np.ascontiguousarray(T_b[s]) for s in slices],
+            [np.ascontiguousarray(Y_b[s]) for s in slices],
+            [np.ascontiguousarray(w_b[s]) for s in slices],
+            [x0] * len(slices),
+            [refit_options] * len(slices),
+        )
+        samples = np.concatenate(shards)
+
+        res = Antoine.bootstrap_summary(
+            samples, fit_report, temperatures=temperatures, level=level)
+        res["method"] = method
+        if return_samples:
+            res["samples"] = samples
+        return res
+
+    def fit_antoine_multistart(
+        self,
+        T_data: np.ndarray,
+        P_data: np.ndarray,
+        *,
+        n_starts: int = 32,
+        starts_per_task: int = 4,
+        early_stop: Optional[int] = 3,
+        rtol: float = 1e-6,
+        search_bounds: Optional[
+            Tuple[
+                Tuple[float, float, float],
+                Tuple[float, float, float]
+            ]
+        ] = None,
+        start_max_nfev: int = 200,
+        seed: Optional[int | np.random.Generator] = None,
+        **fit_options: Any,
+    ) -> Dict[str, Any]:
+        '''
+        Global Antoine fit from a Latin-hypercube set of starting points run on the pool.
+
+        Starts are refitted in tasks of `starts_per_task`, with about one task per worker in flight. Once `early_stop` distinct tasks have a start within `rtol` of the best cost so far, no further tasks are submitted and the queued ones are cancelled; tasks already running finish but are not waited for. The best start is then polished by `Antoine.fit_antoine`, which produces the usual report.
+
+        Parameters
+        ----------
+        T_data : np.ndarray
+            Temperatures in K.
+        P_data : np.ndarray
+            Vapor pressures in Pa.
+        n_starts : int, optional
+            Number of Latin-hypercube starts, by default 32.
+        starts_per_task : int, optional
+            Starts refitted per worker task, by default 4.
+        early_stop : int, optional
+            Number of distinct tasks reaching the best basin that ends the search, by default 3; None runs every start. It never triggers when it exceeds the number of tasks.
+        rtol : float, optional
+            Relative cost tolerance defining the best basin, by default 1e-6.
+        search_bounds : Tuple[Tuple[float, float, float], Tuple[float, float, float]], optional
+            Box the starts are drawn from, by default `Antoine.search_box` of the data and bounds.
+        start_max_nfev : int, optional
+            Function evaluations allowed per start, by default 200.
+        seed : int | np.random.Generator, optional
+            Seed for the starts, by default None.
+        **fit_options : Any
+            Options of `Antoine.fit_antoine` (base, fit_in_log_space, weights, bounds, max_nfev, validate, min_margin_kelvin, loss, f_scale); x0 and units are ignored.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Fit report of `Antoine.fit_antoine` with a 'multistart' entry: n_starts, n_evaluated, n_converged, n_best_basin (starts), n_best_basin_tasks, early_stopped and best_start.
+        '''
+        if n_starts <= 0 or starts_per_task <= 0:
+            raise ValueError("n_starts and starts_per_task must be positive.")
+
+        T_k = np.asarray(T_data, dtype=float).ravel()
+        P_pa = np.asarray(P_data, dtype=float).ravel()
+        if T_k.size != P_pa.size or T_k.size < 3 or np.any(P_pa <= 0):
+            raise ValueError(
+                "T_data and P_data must have the same length, at least 3 points and positive pressures.")
+
+        # NOTE: fit space shared by every start
+        for key in ("x0", "T_unit", "p_unit"):
+            fit_options.pop(key, None)
+        base = str(fit_options.get("base", "log10")).lower()
+        fit_in_log_space = bool(fit_options.get("fit_in_log_space", True))
+        loss = str(fit_options.get("loss", "linear")).lower()
+        bounds = fit_options.get("bounds")
+        weights = fit_options.get("weights")
+        f_scale = fit_options.get("f_scale")
+        if f_scale is None:
+            f_scale = Antoine.auto_f_scale(loss, fit_in_log_space, P_pa)
+
+        ln_base = np.log(10.0) if base == "log10" else 1.0
+        y = np.log(P_pa) / ln_base if fit_in_log_space else P_pa
+        w = np.ones_like(T_k) if weights is None else np.sqrt(
+            np.clip(np.asarray(weights, dtype=float).ravel(), 0.0, np.inf))
+
+        # NOTE: Latin-hypercube starts
+        if search_bounds is None:
+            lo, hi = Antoine.search_box(
+                T_k, base=base, bounds=bounds,
+                min_margin_kelvin=float(fit_options.get("min_margin_kelvin", 1.0)))
+        else:
+            lo, hi = np.asarray(search_bounds[0], dtype=float), np.asarray(
+                search_bounds[1], dtype=float)
+        starts = Antoine.latin_hypercube(n_starts, lo, hi, seed=seed)
+
+        refit_options = {
+            "base": base,
+            "fit_in_log_space": fit_in_log_space,
+            "bounds": bounds,
+            "max_nfev": int(start_max_nfev),
+            "loss": loss,
+            "f_scale": float(f_scale),
+        }
+        slices = split_rows(n_starts, starts_per_task)
+
+        x = np.full((n_starts, 3), np.nan)
+        cost = np.full(n_starts, np.nan)
+        evaluated = np.zeros(n_starts, dtype=bool)
+        # NOTE: task of each start; the basin is confirmed by distinct tasks, so the
+        # starts of a single task cannot end the search on their own
+        task = np.full(n_starts, -1)
+
+        def _best_basin() -> np.ndarray:
+            ok = np.isfinite(cost)
+            if not ok.any():
+                return np.zeros(n_starts, dtype=bool)
+            best = np.min(cost[ok])
+            return ok & (np.where(ok, cost, np.inf) <= best * (1.0 + rtol) + 1e-300)
+
+        def _collect(i: int, shard: Tuple[np.ndarray, np.ndarray]) -> bool:
+            s = slices[i]
+            x[s], cost[s] = shard
+            evaluated[s] = True
+            task[s] = i
+            if early_stop is None:
+                return False
+            return np.unique(task[_best_basin()]).size >= early_stop
+
+        # SECTION: run starts, stopping early once the best basin is confirmed
+        early_stopped = False
+        if len(slices) <= 1:
+            for i, s in enumerate(slices):
+                early_stopped = _collect(i, _antoine_start_shard(
+                    T_k, y, w, starts[s], refit_options))
+        else:
+            # NOTE: keep about one task per worker in flight, so an early stop skips
+            # the remaining tasks instead of cancelling futures that already run
+            pool = self._get_pool()
+            in_flight = self._n_workers(pool)
+            pending = iter(range(len(slices)))
+            futures: Dict[Future, int] = {}
+
+            def _submit() -> None:
+                i = next(pending, None)
+                if i is not None:
+                    s = slices[i]
+                    futures[pool.submit(
+                        _antoine_start_shard, T_k, y, w, starts[s], refit_options)] = i
+
+            for _ in range(in_flight):
+                _submit()
+            try:
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if _collect(futures.pop(future), future.result()):
+                            early_stopped = True
+                    if early_stopped:
+                        break
+                    for _ in done:
+                        _submit()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        ok = np.isfinite(cost)
+        if not ok.any():
+            raise ValueError("No multistart run converged.")
+        k = int(np.argmin(np.where(ok, cost, np.inf)))
+
+        # SECTION: polish the best start
+        report = Antoine.fit_antoine(
+            T_k, P_pa, T_unit="K", p_unit="Pa", x0=tuple(x[k]), **fit_options)
+        if not report:
+            raise ValueError("Polishing the best multistart fit failed.")
+
+        report["multistart"] = {
+            "n_starts": int(n_starts),
+            "n_evaluated": int(evaluated.sum()),
+            "n_converged": int(ok.sum()),
+            "n_best_basin": int(_best_basin().sum()),
+            "n_best_basin_tasks": int(np.unique(task[_best_basin()]).size),
+            "early_stopped": bool(early_stopped),
+            "best_start": starts[k].tolist(),
+        }
+        return report
@@ -0,0 +1,668 @@
+# import libs
+import logging
+from typing import Dict, Optional, Sequence, Tuple, Type
+import numpy as np
+from pydantic import BaseModel
+from scipy import sparse
+from scipy.optimize import least_squares
+from scipy.sparse.linalg import lsqr
+# locals
+from ..models import (
+    JobackGroupContributions,
+    ZabranskyRuzickaGroupContributions,
+    ZabranskyRuzickaGroupContributionsCorrections,
+    GroupTable,
+    RegressionReport,
+)
+from ..configs import (
+    JOBACK_DATA_FILE,
+    JOBACK_TABLE_COLUMN_GROUP,
+    ZABRANSKY_RUZICKA_DATA_FILE_1,
+    ZABRANSKY_RUZICKA_DATA_FILE_2,
+    ZABRANSKY_RUZICKA_TABLE_COLUMN_GROUP,
+)
+from .batch import build_count_matrix, split_rows
+from .tables import (
+    load_joback_table,
+    load_zabransky_ruzicka_tables,
+    load_reference_dataframe,
+    clear_table_caches,
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: linear Joback forms (property: (table column, offset))
+JOBACK_LINEAR_FORMS: Dict[str, Tuple[str, float]] = {
+    'freezing_point_temperature': ('Tf', 122.5),
+    'boiling_point_temperature': ('Tb', 198.2),
+    'critical_volume': ('Vc', 17.5),
+    'standard_enthalpy_of_formation_ideal_gas': ('EnFo_IG', 68.29),
+    'standard_gibbs_energy_of_formation_ideal_gas': ('GiEnFo_IG', 53.88),
+    'standard_enthalpy_of_fusion': ('EnFus', -0.88),
+    'standard_enthalpy_of_vaporization': ('EnVap', 15.30),
+}
+
+# NOTE: Joback ideal-gas Cp offsets of a, b, c, d
+JOBACK_CP_OFFSETS: Tuple[float, ...] = (-37.93, 0.210, -3.91e-4, 2.06e-7)
+
+# NOTE: gas constant of the Zabransky-Ruzicka correlation [J/mol.K]
+ZABRANSKY_RUZICKA_R = 8.314472
+
+
+def sparse_count_matrix(
+    group_contributions: Sequence[BaseModel | Dict[str, float] | Dict[str, int]] | np.ndarray | sparse.spmatrix,
+    table: GroupTable,
+    model: Type[BaseModel],
+    chunk_size: int = 65536,
+) -> sparse.csr_matrix:
+    '''
+    Builds a sparse (molecules × groups) design matrix aligned with a group table.
+
+    Parameters
+    ----------
+    group_contributions : Sequence[BaseModel | Dict[str, float] | Dict[str, int]] | np.ndarray | sparse.spmatrix
+        Group contributions of each molecule, or an existing (N, G) count matrix.
+    table : GroupTable
+        Group table that defines the column order.
+    model : Type[BaseModel]
+        Group contribution model accepted for each molecule.
+    chunk_size : int, optional
+        Molecules converted per dense block, by default 65536.
+
+    Returns
+    -------
+    X : sparse.csr_matrix
+        Count matrix of shape (N, G).
+    '''
+    try:
+        if sparse.issparse(group_contributions) or isinstance(group_contributions, np.ndarray):
+            X = sparse.csr_matrix(group_contributions, dtype=float)
+        else:
+            # NOTE: dense blocks bound the transient memory
+            blocks = [
+                sparse.csr_matrix(build_count_matrix(
+                    group_contributions[rows], table, model))
+                for rows in split_rows(len(group_contributions), chunk_size)
+            ]
+            X = sparse.vstack(blocks, format='csr')
+
+        if X.shape[1] != len(table.groups):
+            raise ValueError(
+                f"Count matrix must have {len(table.groups)} columns, got {X.shape[1]}.")
+        X.eliminate_zeros()
+        return X
+    except Exception as e:
+        raise Exception("Building sparse count matrix failed!, ", e)
+
+
+def _rmse(r: np.ndarray) -> float:
+    '''
+    Root mean square of a residual vector (NaN when empty).
+    '''
+    return float(np.sqrt(np.mean(r**2))) if r.size else float('nan')
+
+
+def _observed_rows(
+    y: Optional[np.ndarray | Sequence[float]],
+    w: Optional[np.ndarray | Sequence[float]],
+    n_rows: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Selects finite, positively weighted observations.
+
+    Returns
+    -------
+    rows, y, sqrt_w : Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Row indices, their targets and the square roots of their weights.
+    '''
+    y = np.asarray(y, dtype=float).ravel()
+    if y.size != n_rows:
+        raise ValueError(f"Expected {n_rows} observations, got {y.size}.")
+    w = np.ones(n_rows) if w is None else np.asarray(w, dtype=float).ravel()
+    if w.size != n_rows:
+        raise ValueError(f"Expected {n_rows} weights, got {w.size}.")
+
+    rows = np.flatnonzero(np.isfinite(y) & np.isfinite(w) & (w > 0))
+    return rows, y[rows], np.sqrt(w[rows])
+
+
+def weighted_linear_fit(
+    X: sparse.csr_matrix,
+    y: np.ndarray,
+    sqrt_w: np.ndarray,
+    c0: np.ndarray,
+    ridge: float = 0.0,
+    col_scale: Optional[np.ndarray] = None,
+    iter_lim: Optional[int] = None,
+) -> Tuple[np.ndarray, RegressionReport]:
+    '''
+    Fits contributions c of y ≈ X c by weighted sparse least squares, anchored to the prior values c0.
+
+    Parameters
+    ----------
+    X : sparse.csr_matrix
+        Design matrix of shape (M, K).
+    y : np.ndarray
+        Targets of shape (M,).
+    sqrt_w : np.ndarray
+        Square roots of the observation weights, shape (M,).
+    c0 : np.ndarray
+        Prior contributions of shape (K,).
+    ridge : float, optional
+        Tikhonov damping of (c - c0), by default 0.0.
+    col_scale : np.ndarray, optional
+        Column scales that equilibrate the design matrix, by default None.
+    iter_lim : int, optional
+        LSQR iteration limit, by default None (scipy default).
+
+    Returns
+    -------
+    c, report : Tuple[np.ndarray, RegressionReport]
+        Fitted contributions and fit report.
+
+    Notes
+    -----
+    The correction (c - c0) is solved with LSQR from zero, so columns without data keep their prior value and rank-deficient directions take the minimum-norm change.
+    '''
+    try:
+        c0 = np.asarray(c0, dtype=float)
+        used = np.flatnonzero(np.diff(X.tocsc().indptr))
+        r0 = y - X @ c0
+
+        if used.size == 0:
+            return c0.copy(), RegressionReport(
+                columns=(), n_observations=int(y.size), n_groups=0,
+                rmse_before=_rmse(r0), rmse_after=_rmse(r0),
+                success=False, message="No observation involves a table group.")
+
+        # NOTE: weighted design over the observed groups, columns equilibrated to unit norm
+        A = (sparse.diags(sqrt_w) @ X[:, used]).tocsc()
+        scale = 1 / sparse.linalg.norm(A, axis=0)
+        if col_scale is not None:
+            scale = np.asarray(col_scale, dtype=float)[used]
+        A = A @ sparse.diags(scale)
+        res = lsqr(A, sqrt_w * r0, damp=float(np.sqrt(ridge)), atol=1e-14, btol=1e-14,
+                   iter_lim=iter_lim if iter_lim is not None else 20 * used.size)
+
+        c = c0.copy()
+        c[used] += res[0] * scale
+        return c, RegressionReport(
+            columns=(),
+            n_observations=int(y.size),
+            n_groups=int(used.size),
+            rmse_before=_rmse(r0),
+            rmse_after=_rmse(y - X @ c),
+            success=bool(res[1] in (0, 1, 2, 4, 5)),
+            message=f"lsqr istop={res[1]} after {res[2]} iterations",
+        )
+    except Exception as e:
+        raise Exception("Weighted linear fit failed!, ", e)
+
+
+def _nonlinear_fit(
+    X: sparse.csr_matrix,
+    y: np.ndarray,
+    sqrt_w: np.ndarray,
+    c0: np.ndarray,
+    form,
+    ridge: float,
+    max_nfev: Optional[int],
+) -> Tuple[np.ndarray, RegressionReport]:
+    '''
+    Fits contributions c of y ≈ f(X c) by sparse nonlinear least squares.
+
+    `form(s)` returns the prediction and its derivative with respect to the group sum s; the Jacobian diag(sqrt_w · f'(s)) · X keeps the sparsity of the design matrix.
+    '''
+    c0 = np.asarray(c0, dtype=float)
+    used = np.flatnonzero(np.diff(X.tocsc().indptr))
+    Xu = X[:, used].tocsr()
+    damp = float(np.sqrt(ridge))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r0 = form(X @ c0)[0] - y
+
+    if used.size == 0:
+        return c0.copy(), RegressionReport(
+            columns=(), n_observations=int(y.size), n_groups=0,
+            rmse_before=_rmse(r0), rmse_after=_rmse(r0),
+            success=False, message="No observation involves a table group.")
+
+    def fun(x):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = sqrt_w * (form(Xu @ x)[0] - y)
+        return np.concatenate([r, damp * (x - c0[used])]) if damp else r
+
+    def jac(x):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            g = sqrt_w * form(Xu @ x)[1]
+        J = sparse.diags(g) @ Xu
+        if damp:
+            J = sparse.vstack([J, damp * sparse.identity(used.size)])
+        return J.tocsr()
+
+    res = least_squares(
+        fun, c0[used], jac=jac, method='trf', tr_solver='lsmr',
+        x_scale='jac', max_nfev=max_nfev)
+
+    c = c0.copy()
+    c[used] = res.x
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = form(X @ c)[0] - y
+    return c, RegressionReport(
+        columns=(),
+        n_observations=int(y.size),
+        n_groups=int(used.size),
+        rmse_before=_rmse(r0),
+        rmse_after=_rmse(r),
+        success=bool(res.success and np.all(np.isfinite(r))),
+        message=str(res.message),
+    )
+
+
+def _replace_columns(
+    table: GroupTable,
+    columns: Dict[str, np.ndarray],
+) -> GroupTable:
+    '''
+    Returns a copy of a group table with some columns replaced.
+    '''
+    values = table.values.copy()
+    for name, col in columns.items():
+        values[:, table.columns.index(name)] = col
+    values.flags.writeable = False
+    return GroupTable(
+        groups=table.groups,
+        columns=table.columns,
+        values=values,
+        index=table.index,
+    )
+
+
+def _write_table(
+    table: GroupTable,
+    path: str,
+    reference_name: str,
+    group_column: str,
+    unit_rows: int,
+) -> None:
+    '''
+    Writes a group table in the layout of a packaged reference file.
+    '''
+    df = load_reference_dataframe(reference_name)
+    # NOTE: the byte order mark is written back by the encoding
+    df.columns = [str(c).lstrip('\ufeff') for c in df.columns]
+
+    groups = tuple(str(g).strip() for g in df[group_column].iloc[unit_rows:])
+    if groups != table.groups:
+        raise ValueError(
+            f"Table groups do not match the row order of '{reference_name}'.")
+
+    df = df.astype({col: object for col in table.columns})
+    for k, col in enumerate(table.columns):
+        df.iloc[unit_rows:, df.columns.get_loc(col)] = [
+            format(v, '.10g') for v in table.values[:, k]]
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+
+    # NOTE: tables are cached by path, drop any stale copy
+    clear_table_caches()
+
+
+class JobackRegression:
+    '''
+    Regression of Joback group contributions from experimental data.
+
+    Molecules are arranged as a sparse (molecules × groups) design matrix. The linear forms (Tf, Tb, Vc, formation properties, EnFus, EnVap) and the ideal-gas Cp coefficients are fitted by weighted sparse linear least squares; Tc and Pc keep their nonlinear forms and are fitted with a sparse Jacobian. Every fit starts from the current table and only moves the groups that appear in the data.
+    '''
+
+    @staticmethod
+    def design_matrix(
+        group_contributions: Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]] | np.ndarray | sparse.spmatrix,
+        table: Optional[GroupTable] = None,
+    ) -> sparse.csr_matrix:
+        '''
+        Builds the sparse Joback design matrix.
+
+        Parameters
+        ----------
+        group_contributions : Sequence[JobackGroupContributions | Dict[str, float] | Dict[str, int]] | np.ndarray | sparse.spmatrix
+            Group contributions of each molecule, or an existing (N, 41) count matrix.
+        table : GroupTable, optional
+            Joback table, by default the packaged table.
+
+        Returns
+        -------
+        X : sparse.csr_matrix
+            Count matrix of shape (N, 41).
+        '''
+        return sparse_count_matrix(
+            group_contributions,
+            table if table is not None else load_joback_table(),
+            JobackGroupContributions,
+        )
+
+    @staticmethod
+    def fit(
+        X: sparse.csr_matrix,
+        targets: Dict[str, np.ndarray | Sequence[float]],
+        total_atoms_number: Optional[np.ndarray | Sequence[int]] = None,
+        heat_capacity: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+        weights: Optional[Dict[str, np.ndarray | Sequence[float]]] = None,
+        ridge: float = 0.0,
+        max_nfev: Optional[int] = None,
+        table: Optional[GroupTable] = None,
+    ) -> Tuple[GroupTable, Dict[str, RegressionReport]]:
+        '''
+        Fits Joback contributions to experimental properties.
+
+        Parameters
+        ----------
+        X : sparse.csr_matrix
+            Design matrix of shape (N, 41), from `JobackRegression.design_matrix`.
+        targets : Dict[str, np.ndarray | Sequence[float]]
+            Experimental values of shape (N,) keyed as in `joback_calc` (e.g. 'boiling_point_temperature' in K, 'critical_pressure' in bar); NaN marks a missing value.
+        total_atoms_number : np.ndarray | Sequence[int], optional
+            Total number of atoms of each molecule, required for 'critical_pressure', by default None.
+        heat_capacity : Tuple[np.ndarray, np.ndarray, np.ndarray], optional
+            Ideal-gas Cp observations as (molecule index, T [K], Cp [J/mol.K]) arrays, by default None.
+        weights : Dict[str, np.ndarray | Sequence[float]], optional
+            Observation weights keyed like targets (and 'heat_capacity'), by default 1.
+        ridge : float, optional
+            Tikhonov damping toward the current contributions, by default 0.0.
+        max_nfev : int, optional
+            Function evaluation limit of the Tc and Pc fits, by default None.
+        table : GroupTable, optional
+            Starting Joback table, by default the packaged table.
+
+        Returns
+        -------
+        table, reports : Tuple[GroupTable, Dict[str, RegressionReport]]
+            Revised table and one report per fitted property ('heat_capacity' for a, b, c, d).
+
+        Notes
+        -----
+        Tc is fitted with the experimental Tb of each molecule where given, otherwise with the Tb of the revised table. The viscosity columns are kept.
+        '''
+        try:
+            table = table if table is not None else load_joback_table()
+            X = sparse.csr_matrix(X, dtype=float)
+            n = X.shape[0]
+            weights = weights or {}
+            unknown = set(targets) - set(JOBACK_LINEAR_FORMS) - \
+                {'critical_temperature', 'critical_pressure'}
+            if unknown:
+                raise ValueError(f"Unknown target properties: {sorted(unknown)}")
+
+            columns: Dict[str, np.ndarray] = {}
+            reports: Dict[str, RegressionReport] = {}
+
+            # SECTION: linear forms
+            for name, (col, offset) in JOBACK_LINEAR_FORMS.items():
+                if name not in targets:
+                    continue
+                rows, y, sw = _observed_rows(targets[name], weights.get(name), n)
+                c, report = weighted_linear_fit(
+                    X[rows], y - offset, sw, table.column(col), ridge)
+                report['columns'] = (col,)
+                columns[col], reports[name] = c, report
+
+            # SECTION: critical temperature, Tc = Tb / (0.584 + 0.965 s - s²)
+            if 'critical_temperature' in targets:
+                Tb = 198.2 + X @ columns.get('Tb', table.column('Tb'))
+                if 'boiling_point_temperature' in targets:
+                    Tb_exp = np.asarray(
+                        targets['boiling_point_temperature'], dtype=float).ravel()
+                    Tb = np.where(np.isfinite(Tb_exp), Tb_exp, Tb)
+
+                rows, y, sw = _observed_rows(
+                    targets['critical_temperature'], weights.get('critical_temperature'), n)
+                Tb_rows = Tb[rows]
+
+                def tc_form(s):
+                    q = 0.584 + 0.965 * s - s**2
+                    return Tb_rows / q, -Tb_rows * (0.965 - 2 * s) / q**2
+
+                c, report = _nonlinear_fit(
+                    X[rows], y, sw, table.column('Tc'), tc_form, ridge, max_nfev)
+                report['columns'] = ('Tc',)
+                columns['Tc'], reports['critical_temperature'] = c, report
+
+            # SECTION: critical pressure, Pc = (0.113 + 0.0032 nA - s)^-2
+            if 'critical_pressure' in targets:
+                if total_atoms_number is None:
+                    raise ValueError(
+                        "total_atoms_number is required to fit critical_pressure.")
+                atoms = np.asarray(total_atoms_number, dtype=float).ravel()
+                if atoms.size != n:
+                    raise ValueError(
+                        "total_atoms_number must have one entry per molecule.")
+
+                rows, y, sw = _observed_rows(
+                    targets['critical_pressure'], weights.get('critical_pressure'), n)
+                q0 = 0.113 + 0.0032 * atoms[rows]
+
+                def pc_form(s):
+                    q = q0 - s
+                    return q**-2, 2 * q**-3
+
+                c, report = _nonlinear_fit(
+                    X[rows], y, sw, table.column('Pc'), pc_form, ridge, max_nfev)
+                report['columns'] = ('Pc',)
+                columns['Pc'], reports['critical_pressure'] = c, report
+
+            # SECTION: ideal-gas heat capacity, block design [X, XT, XT², XT³]
+            if heat_capacity is not None:
+                mol, T, Cp = (np.asarray(v).ravel() for v in heat_capacity)
+                mol = mol.astype(int)
+                T = T.astype(float)
+                rows, y, sw = _observed_rows(
+                    Cp, weights.get('heat_capacity'), Cp.size)
+                mol, T = mol[rows], T[rows]
+
+                Xr = X[mol]
+                powers = [T**k for k in range(4)]
+                D = sparse.hstack(
+                    [sparse.diags(p) @ Xr for p in powers], format='csr')
+                y = y - sum(o * p for o, p in zip(JOBACK_CP_OFFSETS, powers))
+
+                G = len(table.groups)
+                c0 = np.concatenate([table.column(col) for col in 'abcd'])
+                # NOTE: (T/1000)^k equilibrates the block columns
+                scale = np.repeat(1e-3 ** np.arange(4), G)
+                c, report = weighted_linear_fit(D, y, sw, c0, ridge, scale)
+                report['columns'] = ('a', 'b', 'c', 'd')
+                for k, col in enumerate('abcd'):
+                    columns[col] = c[k * G:(k + 1) * G]
+                reports['heat_capacity'] = report
+
+            return _replace_columns(table, columns), reports
+        except Exception as e:
+            raise Exception("Joback regression failed!, ", e)
+
+    @staticmethod
+    def write(
+        table: GroupTable,
+        path: str,
+    ) -> str:
+        '''
+        Writes a Joback table in the `joback.csv` format, loadable with `load_joback_table(path)`.
+
+        Parameters
+        ----------
+        table : GroupTable
+            Joback table in the packaged group order.
+        path : str
+            Output CSV file.
+
+        Returns
+        -------
+        path : str
+            Output CSV file.
+        '''
+        try:
+            _write_table(table, path, JOBACK_DATA_FILE,
+                         JOBACK_TABLE_COLUMN_GROUP, unit_rows=1)
+            return path
+        except Exception as e:
+            raise Exception("Writing Joback table failed!, ", e)
+
+
+class ZabranskyRuzickaRegression:
+    '''
+    Regression of Zabransky-Ruzicka group parameters from liquid heat capacity data.
+
+    Contributions and corrections share one sparse design matrix, and a_i, b_i, d_i of Cp/R = Σ n_i (a_i + b_i θ + d_i θ²), θ = T/100, are fitted together by weighted sparse linear least squares from the current tables.
+    '''
+
+    @staticmethod
+    def design_matrix(
+        group_contributions: Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]] | np.ndarray | sparse.spmatrix,
+        group_corrections: Optional[
+            Sequence[
+                Optional[
+                    ZabranskyRuzickaGroupContributionsCorrections |
+                    Dict[str, float] |
+                    Dict[str, int]
+                ]
+            ] | np.ndarray | sparse.spmatrix
+        ] = None,
+        tables: Optional[Tuple[GroupTable, GroupTable]] = None,
+    ) -> sparse.csr_matrix:
+        '''
+        Builds the sparse Zabransky-Ruzicka design matrix.
+
+        Parameters
+        ----------
+        group_contributions : Sequence[ZabranskyRuzickaGroupContributions | Dict[str, float] | Dict[str, int]] | np.ndarray | sparse.spmatrix
+            Group contributions of each molecule, or an existing (N, 130) count matrix.
+        group_corrections : Sequence[ZabranskyRuzickaGroupContributionsCorrections | Dict[str, float] | Dict[str, int] | None] | np.ndarray | sparse.spmatrix, optional
+            Group corrections of each molecule, or an existing (N, 28) count matrix, by default None.
+        tables : Tuple[GroupTable, GroupTable], optional
+            Contribution and correction tables, by default the packaged tables.
+
+        Returns
+        -------
+        X : sparse.csr_matrix
+            Count matrix of shape (N, 130 + 28), contributions first.
+        '''
+        contributions_table, corrections_table = tables if tables is not None \
+            else load_zabransky_ruzicka_tables()
+        X1 = sparse_count_matrix(
+            group_contributions, contributions_table, ZabranskyRuzickaGroupContributions)
+
+        if group_corrections is None:
+            X2 = sparse.csr_matrix((X1.shape[0], len(corrections_table.groups)))
+        else:
+            if not (sparse.issparse(group_corrections) or isinstance(group_corrections, np.ndarray)):
+                group_corrections = [g if g else {} for g in group_corrections]
+            X2 = sparse_count_matrix(
+                group_corrections, corrections_table, ZabranskyRuzickaGroupContributionsCorrections)
+
+        if X2.shape[0] != X1.shape[0]:
+            raise ValueError(
+                "group_corrections must have the same length as group_contributions.")
+        return sparse.hstack([X1, X2], format='csr')
+
+    @staticmethod
+    def fit(
+        X: sparse.csr_matrix,
+        heat_capacity: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        weights: Optional[np.ndarray | Sequence[float]] = None,
+        ridge: float = 0.0,
+        tables: Optional[Tuple[GroupTable, GroupTable]] = None,
+    ) -> Tuple[Tuple[GroupTable, GroupTable], RegressionReport]:
+        '''
+        Fits Zabransky-Ruzicka parameters to liquid heat capacity data.
+
+        Parameters
+        ----------
+        X : sparse.csr_matrix
+            Design matrix of shape (N, 158), from `ZabranskyRuzickaRegression.design_matrix`.
+        heat_capacity : Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Liquid Cp observations as (molecule index, T [K], Cp [J/mol.K]) arrays.
+        weights : np.ndarray | Sequence[float], optional
+            Weight of each observation, by default 1.
+        ridge : float, optional
+            Tikhonov damping toward the current parameters, by default 0.0.
+        tables : Tuple[GroupTable, GroupTable], optional
+            Starting contribution and correction tables, by default the packaged tables.
+
+        Returns
+        -------
+        tables, report : Tuple[Tuple[GroupTable, GroupTable], RegressionReport]
+            Revised contribution and correction tables, and the fit report.
+
+        Notes
+        -----
+        Tmin and Tmax are kept.
+        '''
+        try:
+            contributions_table, corrections_table = tables if tables is not None \
+                else load_zabransky_ruzicka_tables()
+            X = sparse.csr_matrix(X, dtype=float)
+            G1 = len(contributions_table.groups)
+            G = G1 + len(corrections_table.groups)
+            if X.shape[1] != G:
+                raise ValueError(f"Design matrix must have {G} columns, got {X.shape[1]}.")
+
+            # SECTION: observations
+            mol, T, Cp = (np.asarray(v).ravel() for v in heat_capacity)
+            rows, y, sw = _observed_rows(Cp, weights, Cp.size)
+            mol = mol[rows].astype(int)
+            theta = T[rows].astype(float) / 100
+
+            # SECTION: block design [X, Xθ, Xθ²] against Cp/R
+            Xr = X[mol]
+            D = sparse.hstack(
+                [sparse.diags(theta**k) @ Xr for k in range(3)], format='csr')
+            cols = ('a_i', 'b_i', 'd_i')
+            c0 = np.concatenate([
+                np.concatenate([contributions_table.column(col), corrections_table.column(col)])
+                for col in cols
+            ])
+            c, report = weighted_linear_fit(
+                D, y / ZABRANSKY_RUZICKA_R, sw, c0, ridge)
+            report['columns'] = cols
+            # NOTE: report residuals in J/mol.K
+            report['rmse_before'] *= ZABRANSKY_RUZICKA_R
+            report['rmse_after'] *= ZABRANSKY_RUZICKA_R
+
+            # SECTION: split back into the two tables
+            blocks = {col: c[k * G:(k + 1) * G] for k, col in enumerate(cols)}
+            return (
+                _replace_columns(
+                    contributions_table, {col: v[:G1] for col, v in blocks.items()}),
+                _replace_columns(
+                    corrections_table, {col: v[G1:] for col, v in blocks.items()}),
+            ), report
+        except Exception as e:
+            raise Exception("Zabransky-Ruzicka regression failed!, ", e)
+
+    @staticmethod
+    def write(
+        tables: Tuple[GroupTable, GroupTable],
+        paths: Tuple[str, str],
+    ) -> Tuple[str, str]:
+        '''
+        Writes Zabransky-Ruzicka tables in the packaged format, loadable with `load_zabransky_ruzicka_tables(paths)`.
+
+        Parameters
+        ----------
+        tables : Tuple[GroupTable, GroupTable]
+            Contribution and correction tables in the packaged group order.
+        paths : Tuple[str, str]
+            Output CSV files of the contributions and corrections.
+
+        Returns
+        -------
+        paths : Tuple[str, str]
+            Output CSV files.
+        '''
+        try:
+            for table, path, name in zip(
+                tables, paths, (ZABRANSKY_RUZICKA_DATA_FILE_1, ZABRANSKY_RUZICKA_DATA_FILE_2)
+            ):
+                _write_table(table, path, name,
+                             ZABRANSKY_RUZICKA_TABLE_COLUMN_GROUP, unit_rows=0)
+            return tuple(paths)
+        except Exception as e:
+            raise Exception("Writing Zabransky-Ruzicka tables failed!, ", e)
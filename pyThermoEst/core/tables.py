@@ -0,0 +1,253 @@
+# import libs
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple, Type
+import pandas as pd
+from pydantic import BaseModel
+# locals
+from ..models import (
+    JobackGroupContributions,
+    ZabranskyRuzickaGroupContributions,
+    ZabranskyRuzickaGroupContributionsCorrections,
+    GroupTable,
+)
+from ..util import ReferenceLoader
+from ..configs import (
+    JOBACK_DATA_FILE,
+    JOBACK_TABLE_COLUMN_GROUP,
+    ZABRANSKY_RUZICKA_DATA_FILE_1,
+    ZABRANSKY_RUZICKA_DATA_FILE_2,
+    ZABRANSKY_RUZICKA_TABLE_COLUMN_GROUP,
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: numeric columns of each reference table
+JOBACK_TABLE_COLUMNS: Tuple[str, ...] = (
+    'Tc', 'Pc', 'Vc', 'Tb', 'Tf', 'EnFo_IG', 'GiEnFo_IG',
+    'a', 'b', 'c', 'd', 'EnFus', 'EnVap', 'ηa', 'ηb'
+)
+ZABRANSKY_RUZICKA_TABLE_COLUMNS: Tuple[str, ...] = (
+    'a_i', 'b_i', 'd_i', 'Tmin', 'Tmax'
+)
+
+
+@lru_cache(maxsize=None)
+def _read_reference_dataframe(
+    reference_name: str,
+    reference_folder: Optional[str] = None,
+) -> pd.DataFrame:
+    '''
+    Parses a CSV reference file once per process; the result is shared and never modified.
+    '''
+    # current folder
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    #  data folder
+    data_folder = reference_folder or os.path.join(
+        current_folder,
+        '..',
+        'data',
+    )
+
+    # NOTE: load CSV reference
+    return ReferenceLoader().load_csv_ref(
+        reference_name=reference_name,
+        reference_folder=data_folder,
+    )
+
+
+def load_reference_dataframe(
+    reference_name: str,
+    reference_folder: Optional[str] = None,
+    shared: bool = False,
+) -> pd.DataFrame:
+    '''
+    Loads a CSV reference file, parsed once per process.
+
+    Parameters
+    ----------
+    reference_name : str
+        Name of the reference file.
+    reference_folder : str, optional
+        Folder of the reference file, by default the package data folder.
+    shared : bool, optional
+        Return the cached DataFrame itself instead of a copy, by default False. Callers that pass True must not modify it.
+
+    Returns
+    -------
+    ref_df : pd.DataFrame
+        DataFrame of the reference file.
+    '''
+    df = _read_reference_dataframe(reference_name, reference_folder)
+    return df if shared else df.copy()
+
+
+def clear_table_caches() -> None:
+    '''
+    Drops the cached reference DataFrames and group tables, e.g. after a table file was rewritten.
+    '''
+    _read_reference_dataframe.cache_clear()
+    load_joback_table.cache_clear()
+    load_zabransky_ruzicka_tables.cache_clear()
+
+
+def resolve_group_names(
+    groups: Iterable[str],
+    model: Type[BaseModel],
+) -> Dict[str, str]:
+    '''
+    Maps every accepted group key to its table group name.
+
+    Parameters
+    ----------
+    groups : Iterable[str]
+        Group names of the reference table.
+    model : Type[BaseModel]
+        Group contribution model whose field names are accepted as keys.
+
+    Returns
+    -------
+    Dict[str, str]
+        Group name (alias) or model field name -> table group name.
+
+    Notes
+    -----
+    The single-molecule and batch paths both resolve dictionary keys through this mapping, so they accept the same keys.
+    '''
+    names: Dict[str, str] = {group: group for group in groups}
+    for field_name, field_info in model.model_fields.items():
+        alias = field_info.alias
+        if alias is not None and alias in names:
+            names.setdefault(field_name, alias)
+    return names
+
+
+def _build_group_table(
+    df: pd.DataFrame,
+    group_column: str,
+    columns: Tuple[str, ...],
+    model: Type[BaseModel],
+) -> GroupTable:
+    '''
+    Builds a read-only group table from a reference DataFrame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Reference DataFrame (unit rows already removed).
+    group_column : str
+        Name of the group identifier column.
+    columns : Tuple[str, ...]
+        Numeric columns to keep.
+    model : Type[BaseModel]
+        Group contribution model used to index field names.
+
+    Returns
+    -------
+    GroupTable
+        Shared group table.
+    '''
+    # NOTE: groups in row order
+    groups = tuple(str(g).strip() for g in df[group_column].tolist())
+
+    # NOTE: numeric matrix
+    values = df.loc[:, list(columns)].astype(float).to_numpy(copy=True)
+    values.flags.writeable = False
+
+    # NOTE: index by alias and field name
+    position = {group: i for i, group in enumerate(groups)}
+    index: Dict[str, int] = {
+        name: position[group]
+        for name, group in resolve_group_names(groups, model).items()
+    }
+
+    return GroupTable(
+        groups=groups,
+        columns=columns,
+        values=values,
+        index=index,
+    )
+
+
+def _split_path(path: Optional[str], default_name: str) -> Tuple[str, Optional[str]]:
+    '''
+    Splits a table path into (file name, folder); no path means the packaged file.
+    '''
+    if path is None:
+        return default_name, None
+    folder, name = os.path.split(os.path.abspath(path))
+    return name, folder
+
+
+@lru_cache(maxsize=None)
+def load_joback_table(path: Optional[str] = None) -> GroupTable:
+    '''
+    Loads the shared Joback group table.
+
+    Parameters
+    ----------
+    path : str, optional
+        CSV file in the `joback.csv` format (e.g. a regressed table), by default the packaged table.
+
+    Returns
+    -------
+    GroupTable
+        Joback contributions (41 groups), read-only.
+
+    Notes
+    -----
+    Tables are cached by path; writing a table with `JobackRegression.write` clears the cache.
+    '''
+    try:
+        df = load_reference_dataframe(*_split_path(path, JOBACK_DATA_FILE), shared=True)
+        # ! first row holds units
+        df = df.iloc[1:]
+
+        return _build_group_table(
+            df=df,
+            group_column=JOBACK_TABLE_COLUMN_GROUP,
+            columns=JOBACK_TABLE_COLUMNS,
+            model=JobackGroupContributions,
+        )
+    except Exception as e:
+        raise Exception("Loading Joback table failed!, ", e)
+
+
+@lru_cache(maxsize=None)
+def load_zabransky_ruzicka_tables(
+    paths: Optional[Tuple[str, str]] = None,
+) -> Tuple[GroupTable, GroupTable]:
+    '''
+    Loads the shared Zabransky-Ruzicka group tables.
+
+    Parameters
+    ----------
+    paths : Tuple[str, str], optional
+        Contribution and correction CSV files in the packaged format, by default the packaged tables.
+
+    Returns
+    -------
+    Tuple[GroupTable, GroupTable]
+        Group contribution and group correction tables, read-only.
+    '''
+    try:
+        path_1, path_2 = paths if paths is not None else (None, None)
+        contributions = _build_group_table(
+            df=load_reference_dataframe(
+                *_split_path(path_1, ZABRANSKY_RUZICKA_DATA_FILE_1), shared=True),
+            group_column=ZABRANSKY_RUZICKA_TABLE_COLUMN_GROUP,
+            columns=ZABRANSKY_RUZICKA_TABLE_COLUMNS,
+            model=ZabranskyRuzickaGroupContributions,
+        )
+        corrections = _build_group_table(
+            df=load_reference_dataframe(
+                *_split_path(path_2, ZABRANSKY_RUZICKA_DATA_FILE_2), shared=True),
+            group_column=ZABRANSKY_RUZICKA_TABLE_COLUMN_GROUP,
+            columns=ZABRANSKY_RUZICKA_TABLE_COLUMNS,
+            model=ZabranskyRuzickaGroupContributionsCorrections,
+        )
+        return contributions, corrections
+    except Exception as e:
+        raise Exception("Loading Zabransky-Ruzicka tables failed!, ", e)
@@ -0,0 +1,265 @@
+# import libs
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+# locals
+from ..models import JobackHeatCapacityBatch, UncertaintyProp
+from .batch import (
+    JOBACK_BATCH_PROPERTIES,
+    JOBACK_SIGMA_COLUMNS,
+    JobackBatch,
+    split_rows,
+)
+from .tables import load_joback_table, load_zabransky_ruzicka_tables
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: default percentiles reported per property
+DEFAULT_PERCENTILES: Tuple[float, ...] = (2.5, 50.0, 97.5)
+
+
+def _relative_sigma(
+    rel_sigma: float | Dict[str, float],
+    columns: Sequence[str],
+) -> np.ndarray:
+    '''
+    Expands a relative standard deviation into one value per table column.
+    '''
+    if isinstance(rel_sigma, dict):
+        unknown = set(rel_sigma) - set(columns)
+        if unknown:
+            raise ValueError(f"Unknown contribution columns: {sorted(unknown)}")
+        return np.array([float(rel_sigma.get(c, 0.0)) for c in columns])
+    return np.full(len(columns), float(rel_sigma))
+
+
+def _sample_sums(
+    counts: np.ndarray,
+    contributions: np.ndarray,
+    rel: np.ndarray,
+    count_sigma: float,
+    n_samples: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    '''
+    Draws perturbed group sums for one chunk of samples.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Counts of the groups present in the molecule, shape (g,).
+    contributions : np.ndarray
+        Their contribution rows, shape (g, K).
+    rel : np.ndarray
+        Relative standard deviation of each column, shape (K,).
+    count_sigma : float
+        Absolute standard deviation of the group counts; perturbed counts are clipped at zero.
+    n_samples : int
+        Samples in the chunk.
+    rng : np.random.Generator
+        Random generator.
+
+    Returns
+    -------
+    np.ndarray
+        Sums of shape (n_samples, K).
+    '''
+    # NOTE: perturbed counts, (S, g)
+    if count_sigma > 0:
+        c = np.clip(
+            counts + count_sigma * rng.standard_normal((n_samples, counts.size)),
+            0.0, None)
+    else:
+        c = np.broadcast_to(counts, (n_samples, counts.size))
+
+    # NOTE: unperturbed contributions reduce to one (S, g) @ (g, K) product
+    if not rel.any():
+        return c @ contributions
+
+    # NOTE: perturbed contributions, (S, g, K)
+    W = contributions * (1.0 + rel * rng.standard_normal(
+        (n_samples,) + contributions.shape))
+    return np.einsum('sg,sgk->sk', c, W)
+
+
+def summarize_samples(
+    samples: np.ndarray,
+    unit: str,
+    symbol: str,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> UncertaintyProp:
+    '''
+    Reduces Monte Carlo samples of one property to summary statistics.
+
+    Non-finite samples (e.g. a perturbed Joback denominator crossing zero) are ignored.
+    '''
+    finite = samples[np.isfinite(samples)]
+    if finite.size == 0:
+        return UncertaintyProp(
+            mean=float('nan'), std=float('nan'),
+            percentiles={f"{q:g}": float('nan') for q in percentiles},
+            n_samples=0, unit=unit, symbol=symbol)
+
+    q = np.percentile(finite, percentiles)
+    return UncertaintyProp(
+        mean=float(finite.mean()),
+        std=float(finite.std(ddof=1)) if finite.size > 1 else 0.0,
+        percentiles={f"{p:g}": float(v) for p, v in zip(percentiles, q)},
+        n_samples=int(finite.size),
+        unit=unit,
+        symbol=symbol
+    )
+
+
+def joback_monte_carlo(
+    counts: np.ndarray,
+    total_atoms_number: float,
+    n_samples: int,
+    rel_sigma: float | Dict[str, float] = 0.05,
+    count_sigma: float = 0.0,
+    temperatures: Sequence[float] = (),
+    chunk_size: int = 4096,
+    seed: Optional[int | np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
+    '''
+    Samples Joback properties of one molecule under perturbed contributions.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Count vector of the molecule, shape (41,).
+    total_atoms_number : float
+        Total number of atoms in the molecule.
+    n_samples : int
+        Number of Monte Carlo samples.
+    rel_sigma : float | Dict[str, float], optional
+        Relative standard deviation of the group contributions, for all columns or per column (e.g. {'Tc': 0.05, 'Tb': 0.02}), by default 0.05.
+    count_sigma : float, optional
+        Absolute standard deviation of the group counts, by default 0.0.
+    temperatures : Sequence[float], optional
+        Temperatures (K) at which Cp_IG is sampled, by default none.
+    chunk_size : int, optional
+        Samples drawn per chunk, by default 4096.
+    seed : int | np.random.Generator, optional
+        Seed or generator, by default None.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Samples of shape (n_samples,) keyed by property name, plus 'Cp_IG@<T>K' per temperature.
+    '''
+    if n_samples <= 0 or chunk_size <= 0:
+        raise ValueError("n_samples and chunk_size must be positive.")
+
+    rng = np.random.default_rng(seed)
+    table = load_joback_table()
+    counts = np.asarray(counts, dtype=float).ravel()
+
+    # NOTE: only the groups present in the molecule are sampled
+    present = counts != 0
+    idx = [table.columns.index(col) for col in JOBACK_SIGMA_COLUMNS]
+    contributions = table.values[present][:, idx]
+    rel = _relative_sigma(rel_sigma, JOBACK_SIGMA_COLUMNS)
+    T = np.asarray(temperatures, dtype=float).ravel()
+
+    out: Dict[str, np.ndarray] = {
+        name: np.empty(n_samples) for name in JOBACK_BATCH_PROPERTIES}
+    for t in T:
+        out[f"Cp_IG@{t:g}K"] = np.empty(n_samples)
+
+    for rows in split_rows(n_samples, chunk_size):
+        m = rows.stop - rows.start
+        sums = _sample_sums(
+            counts[present], contributions, rel, count_sigma, m, rng)
+        sigma = {col: sums[:, k] for k, col in enumerate(JOBACK_SIGMA_COLUMNS)}
+        props = JobackBatch.calc_from_sigma(sigma, total_atoms_number)
+
+        for name in JOBACK_BATCH_PROPERTIES:
+            out[name][rows] = props[name]
+        if T.size:
+            cp = JobackHeatCapacityBatch(
+                a=props['a'], b=props['b'], c=props['c'], d=props['d'])(T)
+            for j, t in enumerate(T):
+                out[f"Cp_IG@{t:g}K"][rows] = cp[:, j]
+
+    return out
+
+
+def zabransky_ruzicka_monte_carlo(
+    counts: np.ndarray,
+    corrections: Optional[np.ndarray],
+    n_samples: int,
+    temperatures: Sequence[float] = (298.15,),
+    rel_sigma: float | Dict[str, float] = 0.05,
+    count_sigma: float = 0.0,
+    chunk_size: int = 4096,
+    seed: Optional[int | np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
+    '''
+    Samples the Zabransky-Ruzicka coefficients and liquid heat capacity of one molecule.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Contribution count vector, shape (130,).
+    corrections : np.ndarray, optional
+        Correction count vector, shape (28,).
+    n_samples : int
+        Number of Monte Carlo samples.
+    temperatures : Sequence[float], optional
+        Temperatures (K) at which Cp_LIQ is sampled, by default (298.15,).
+    rel_sigma : float | Dict[str, float], optional
+        Relative standard deviation of a_i, b_i, d_i, for all columns or per column, by default 0.05.
+    count_sigma : float, optional
+        Absolute standard deviation of the group and correction counts, by default 0.0.
+    chunk_size : int, optional
+        Samples drawn per chunk, by default 4096.
+    seed : int | np.random.Generator, optional
+        Seed or generator, by default None.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Samples of shape (n_samples,) for 'A', 'B', 'D' and 'Cp_LIQ@<T>K' per temperature.
+    '''
+    if n_samples <= 0 or chunk_size <= 0:
+        raise ValueError("n_samples and chunk_size must be positive.")
+
+    rng = np.random.default_rng(seed)
+    contributions_table, corrections_table = load_zabransky_ruzicka_tables()
+    cols = ('a_i', 'b_i', 'd_i')
+
+    # NOTE: stack the groups and corrections present in the molecule
+    counts = np.asarray(counts, dtype=float).ravel()
+    present = counts != 0
+    c = [counts[present]]
+    W = [contributions_table.values[present][:, [
+        contributions_table.columns.index(k) for k in cols]]]
+    if corrections is not None:
+        corrections = np.asarray(corrections, dtype=float).ravel()
+        present_c = corrections != 0
+        c.append(corrections[present_c])
+        W.append(corrections_table.values[present_c][:, [
+            corrections_table.columns.index(k) for k in cols]])
+    c, W = np.concatenate(c), np.concatenate(W)
+
+    rel = _relative_sigma(rel_sigma, cols)
+    T = np.asarray(temperatures, dtype=float).ravel()
+    theta = T / 100
+
+    out: Dict[str, np.ndarray] = {k: np.empty(n_samples) for k in ('A', 'B', 'D')}
+    for t in T:
+        out[f"Cp_LIQ@{t:g}K"] = np.empty(n_samples)
+
+    for rows in split_rows(n_samples, chunk_size):
+        m = rows.stop - rows.start
+        abd = _sample_sums(c, W, rel, count_sigma, m, rng)
+        out['A'][rows], out['B'][rows], out['D'][rows] = abd.T
+
+        # NOTE: (S, 3) @ (3, n_T)
+        cp = 8.314472 * (abd @ np.vstack([np.ones_like(theta), theta, theta**2]))
+        for j, t in enumerate(T):
+            out[f"Cp_LIQ@{t:g}K"][rows] = cp[:, j]
+
+    return out
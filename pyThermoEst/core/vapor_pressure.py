@@ -0,0 +1,605 @@
+# import libs
+from __future__ import annotations
+import logging
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from scipy.optimize import least_squares
+# locals
+from ..util.timing import stage
+from .antoine import Antoine
+
+# NOTE: set up logger
+logger = logging.getLogger(__name__)
+
+
+def _lstsq_scaled(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    '''
+    Linear least squares with unit-norm columns, for design matrices mixing T and T^6 terms.
+    '''
+    norm = np.linalg.norm(X, axis=0)
+    norm[norm == 0] = 1.0
+    coef, *_ = np.linalg.lstsq(X / norm, y, rcond=None)
+    return coef / norm
+
+
+class VaporPressureCorrelation(ABC):
+    """
+    Base class of the vapor pressure correlations, written as ln P(T; params) with T in K and P in Pa.
+
+    A correlation supplies the vectorized kernel `ln_p`, its analytic Jacobian `jacobian`, and a starting point. Fitting, weighting, robust losses, validation and the fit report are shared by every correlation.
+
+    Array API: params of shape (k,) evaluate to T.shape, a table of params of shape (N, k) evaluates to (N, *T.shape).
+    """
+
+    # NOTE: correlation name and fitted parameter names
+    name: str = ""
+    parameters: Tuple[str, ...] = ()
+
+    def __repr__(self) -> str:
+        constants = ", ".join(f"{k}={v!r}" for k, v in self.constants().items())
+        return f"{type(self).__name__}({constants})"
+
+    def constants(self) -> Dict[str, Any]:
+        """
+        Fixed constants of the correlation (not fitted).
+        """
+        return {}
+
+    # SECTION: kernels
+    @abstractmethod
+    def ln_p(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """
+        Natural logarithm of the vapor pressure (Pa).
+        """
+
+    @abstractmethod
+    def jacobian(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """
+        Derivatives of ln P with respect to the parameters, shape (..., k).
+        """
+
+    @abstractmethod
+    def initial_guess(self, T_k: np.ndarray, ln_P: np.ndarray) -> np.ndarray:
+        """
+        Starting point of the fit, shape (k,).
+        """
+
+    def default_bounds(
+        self,
+        T_k: np.ndarray,
+        min_margin_kelvin: float = 1.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parameter bounds used when none are given; unbounded by default.
+        """
+        k = len(self.parameters)
+        return np.full(k, -np.inf), np.full(k, np.inf)
+
+    def check(
+        self,
+        T_k: np.ndarray,
+        params: np.ndarray,
+        min_margin_kelvin: float = 1.0,
+    ) -> List[str]:
+        """
+        Correlation-specific validation warnings of a fitted parameter set.
+        """
+        return []
+
+    # SECTION: evaluation
+    def _split(self, T: np.ndarray, params: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+        '''
+        Broadcasts T against a single parameter set (k,) or a table (N, k) and returns the parameter columns.
+        '''
+        T = np.asarray(T, dtype=float)
+        params = np.asarray(params, dtype=float)
+        if params.shape[-1] != len(self.parameters):
+            raise ValueError(
+                f"{self.name} expects {len(self.parameters)} parameters {self.parameters}.")
+        if params.ndim == 1:
+            return T, list(params)
+        shape = (-1,) + (1,) * T.ndim
+        return T, [params[:, j].reshape(shape) for j in range(params.shape[1])]
+
+    @staticmethod
+    def _linear_jacobian(X: np.ndarray, cols: List[np.ndarray]) -> np.ndarray:
+        '''
+        Jacobian of a model linear in its parameters: the design terms X (*T.shape, k), repeated per row of a parameter table.
+        '''
+        if np.ndim(cols[0]):
+            return np.broadcast_to(X, (np.shape(cols[0])[0],) + X.shape)
+        return X
+
+    def vapor_pressure(self, T: float | np.ndarray, params: np.ndarray) -> np.ndarray:
+        """
+        Vapor pressure (Pa) at temperature T (K).
+
+        Parameters
+        ----------
+        T : float | np.ndarray
+            Temperatures in K.
+        params : np.ndarray
+            Parameters of shape (k,), or a table of shape (N, k).
+
+        Returns
+        -------
+        np.ndarray
+            Pressures of shape T.shape, or (N, *T.shape) for a table.
+        """
+        return np.exp(self.ln_p(T, params))
+
+    # SECTION: fitting
+    def fit(
+        self,
+        T_data: np.ndarray,
+        P_data: np.ndarray,
+        *,
+        T_unit: str = "K",
+        p_unit: str = "Pa",
+        fit_in_log_space: bool = True,
+        weights: Optional[np.ndarray] = None,
+        x0: Optional[np.ndarray] = None,
+        bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        max_nfev: int = 5000,
+        validate: bool = True,
+        min_margin_kelvin: float = 1.0,
+        loss: str = "linear",
+        f_scale: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fit the correlation to experimental VaPr(T) data.
+
+        Parameters
+        ----------
+        T_data : np.ndarray
+            Array of temperature data points.
+        P_data : np.ndarray
+            Array of vapor pressure data points.
+        T_unit : str, optional
+            Unit of temperature data: 'K' or 'C' (default 'K').
+        p_unit : str, optional
+            Unit of pressure data: 'Pa', 'kPa', 'bar', 'atm' or 'psi' (default 'Pa').
+        fit_in_log_space : bool, optional
+            If True, fit ln P; else fit P (default True).
+        weights : Optional[np.ndarray], optional
+            Optional weights for each data point (default None = equal weights).
+        x0 : Optional[np.ndarray], optional
+            Initial guess of the parameters (default None = correlation guess).
+        bounds : Optional[Tuple[np.ndarray, np.ndarray]], optional
+            Parameter bounds (default None = correlation defaults).
+        max_nfev : int, optional
+            Maximum number of function evaluations (default 5000).
+        validate : bool, optional
+            If True, perform fit validation checks (default True).
+        min_margin_kelvin : float, optional
+            Minimum margin for denominators such as (T + C) (default 1.0 K).
+        loss : str, optional
+            Loss function for robust fitting: 'linear', 'soft_l1', 'huber', 'cauchy', 'arctan' (default 'linear').
+        f_scale : Optional[float], optional
+            Scaling parameter for robust loss (default None = auto).
+
+        Returns
+        -------
+        Dict[str, Any]
+            Fit report with the correlation name, constants and parameters, metrics in ln P and P, covariance, warnings and solver info; an empty dict on invalid input.
+        """
+        # SECTION: Input validation and conversion
+        T = np.asarray(T_data, dtype=float).ravel()
+        P = np.asarray(P_data, dtype=float).ravel()
+        k = len(self.parameters)
+
+        if T.size != P.size or T.size < k:
+            logger.error(
+                f"T_data and P_data must have same length and at least {k} points.")
+            return {}
+
+        with stage(f'{self.name}.unit_normalization'):
+            normalized = Antoine.normalize_data(T, P, T_unit=T_unit, p_unit=p_unit)
+            if normalized is None:
+                return {}
+            T_k, P_pa = normalized
+            y = np.log(P_pa)
+            loss = loss.lower()
+
+            # NOTE: weights (sqrt form)
+            if weights is None:
+                w = np.ones_like(T_k)
+            else:
+                w_raw = np.asarray(weights, dtype=float).ravel()
+                if w_raw.size != T_k.size:
+                    logger.error("weights must have same length as data.")
+                    return {}
+                w = np.sqrt(np.clip(w_raw, 0.0, np.inf))
+
+        # SECTION: residual kernel and analytic Jacobian
+        def residuals(params: np.ndarray) -> np.ndarray:
+            m = self.ln_p(T_k, params)
+            if fit_in_log_space:
+                return w * (m - y)
+            return w * (np.exp(m) - P_pa)
+
+        def jacobian(params: np.ndarray) -> np.ndarray:
+            J = self.jacobian(T_k, params)
+            if fit_in_log_space:
+                return w[:, None] * J
+            return (w * np.exp(self.ln_p(T_k, params)))[:, None] * J
+
+        # NOTE: start, bounds, f_scale
+        with stage(f'{self.name}.initial_guess'):
+            if bounds is None:
+                bounds = self.default_bounds(T_k, min_margin_kelvin)
+            lo, hi = np.asarray(bounds[0], dtype=float), np.asarray(
+                bounds[1], dtype=float)
+            x0_array = self.initial_guess(
+                T_k, y) if x0 is None else np.asarray(x0, dtype=float)
+            # ! keep the start strictly inside the bounds
+            span = np.where(np.isfinite(hi - lo), hi - lo, 1.0)
+            x0_array = np.clip(x0_array, lo + 1e-9 * span, hi - 1e-9 * span)
+
+            # NOTE: pressure-space fits start from the log-space solution
+            if x0 is None and not fit_in_log_space:
+                with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+                    pre = least_squares(
+                        lambda p_: w * (self.ln_p(T_k, p_) - y),
+                        x0=x0_array,
+                        jac=lambda p_: w[:, None] * self.jacobian(T_k, p_),
+                        bounds=(lo, hi),
+                        x_scale="jac",
+                        max_nfev=max_nfev,
+                    )
+                if np.all(np.isfinite(pre.x)):
+                    x0_array = pre.x
+
+            if f_scale is None:
+                f_scale = Antoine.auto_f_scale(loss, fit_in_log_space, P_pa)
+
+        # SECTION: Perform least squares fitting
+        with stage(f'{self.name}.least_squares'):
+            with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+                res = least_squares(
+                    residuals,
+                    x0=x0_array,
+                    jac=jacobian,
+                    bounds=(lo, hi),
+                    x_scale="jac",
+                    max_nfev=max_nfev,
+                    loss=loss,
+                    f_scale=float(f_scale),
+                )
+        x = np.asarray(res.x, dtype=float)
+
+        # SECTION: Metrics and validation
+        with stage(f'{self.name}.metrics'):
+            # NOTE: Predictions and metrics
+            y_hat = self.ln_p(T_k, x)
+            P_hat = np.exp(y_hat)
+            log_res = y_hat - y
+            P_res = P_hat - P_pa
+            ss_res = float(np.sum(log_res ** 2))
+            ss_tot = float(np.sum((y - np.mean(y)) ** 2))
+
+            # NOTE: Covariance estimate (approx)
+            cov = None
+            try:
+                J = res.jac
+                dof = max(1, T_k.size - k)
+                s2 = 2.0 * float(res.cost) / dof
+                cov = (s2 * np.linalg.inv(J.T @ J)).tolist()
+            except Exception:
+                cov = None
+
+            # NOTE: Validation checks
+            warnings: List[str] = []
+            if validate:
+                if not np.all(np.isfinite(P_hat)):
+                    warnings.append(
+                        "Non-finite fitted pressures over the data range.")
+                idx = np.argsort(T_k)
+                if np.any(np.diff(P_hat[idx]) <= 0):
+                    warnings.append(
+                        "Non-physical trend: fitted VaPr(T) is not strictly increasing over the data range.")
+                warnings.extend(self.check(T_k, x, min_margin_kelvin))
+
+        # SECTION: Return fit report
+        return {
+            "correlation": self.name,
+            "constants": self.constants(),
+            "parameters": dict(zip(self.parameters, map(float, x))),
+            "p_unit": "Pa",
+            "T_unit_internal": "K",
+            "fit_in_log_space": bool(fit_in_log_space),
+            "success": bool(res.success),
+            "message": str(res.message),
+            "cost": float(res.cost),
+            "rmse_lnP": float(np.sqrt(np.mean(log_res ** 2))),
+            "mae_lnP": float(np.mean(np.abs(log_res))),
+            "r2_lnP": float(1.0 - ss_res / ss_tot) if ss_tot > 0 else float("nan"),
+            "rmse_P": float(np.sqrt(np.mean(P_res ** 2))),
+            "mae_P": float(np.mean(np.abs(P_res))),
+            "cov": cov,
+            "warnings": warnings,
+            "Tmin_K": float(np.min(T_k)),
+            "Tmax_K": float(np.max(T_k)),
+            # robust metadata
+            "loss": loss,
+            "f_scale": float(f_scale),
+        }
+
+    def fit_many(
+        self,
+        datasets: List[Tuple[np.ndarray, np.ndarray]],
+        **fit_options: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fit the correlation to several independent datasets.
+
+        Parameters
+        ----------
+        datasets : List[Tuple[np.ndarray, np.ndarray]]
+            List of (T_data, P_data) pairs.
+        **fit_options : Any
+            Keyword options forwarded to fit().
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One fit report per dataset in input order; an empty dict marks a failed fit.
+        """
+        reports: List[Dict[str, Any]] = []
+        for i, (T_data, P_data) in enumerate(datasets):
+            try:
+                reports.append(self.fit(T_data, P_data, **fit_options))
+            except Exception as e:
+                logger.error(f"{self.name} fit failed for dataset {i}: {e}")
+                reports.append({})
+        return reports
+
+    @staticmethod
+    def params_table(
+        reports: List[Optional[Dict[str, Any]]],
+        parameters: Tuple[str, ...],
+    ) -> np.ndarray:
+        """
+        Stack the parameters of fit reports into an (N, k) table; failed fits are NaN rows.
+        """
+        table = np.full((len(reports), len(parameters)), np.nan)
+        for i, r in enumerate(reports):
+            if r and r.get("parameters"):
+                table[i] = [r["parameters"][p] for p in parameters]
+        return table
+
+
+class AntoineCorrelation(VaporPressureCorrelation):
+    """
+    Antoine equation: log_b(P) = A - B / (T + C), with b = 10 ('log10') or e ('ln').
+    """
+
+    name = "antoine"
+    parameters = ("A", "B", "C")
+
+    def __init__(self, base: str = "log10"):
+        base = base.lower()
+        if base not in ("log10", "ln"):
+            raise ValueError("base must be 'log10' or 'ln'.")
+        self.base = base
+        self._s = math.log(10.0) if base == "log10" else 1.0
+
+    def constants(self) -> Dict[str, Any]:
+        return {"base": self.base}
+
+    def ln_p(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, (A, B, C) = self._split(T, params)
+        return self._s * (A - B / (T + C))
+
+    def jacobian(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, (A, B, C) = self._split(T, params)
+        inv = 1.0 / (T + C)
+        return self._s * np.stack(np.broadcast_arrays(
+            np.ones_like(inv), -inv, B * inv**2), axis=-1)
+
+    def initial_guess(self, T_k: np.ndarray, ln_P: np.ndarray) -> np.ndarray:
+        # NOTE: C0 as in fit_antoine, then A and B are linear
+        C0 = -50.0
+        if np.min(T_k + C0) <= 1.0:
+            C0 = -np.min(T_k) + 10.0
+        X = np.column_stack([np.ones_like(T_k), -1.0 / (T_k + C0)])
+        A0, B0 = _lstsq_scaled(X, ln_P / self._s)
+        if not np.isfinite(B0) or B0 <= 1e-6:
+            B0 = 2000.0
+        return np.array([A0, B0, C0])
+
+    def default_bounds(
+        self,
+        T_k: np.ndarray,
+        min_margin_kelvin: float = 1.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        lo, hi = Antoine.DEFAULT_BOUNDS
+        return np.array(lo, dtype=float), np.array(hi, dtype=float)
+
+    @staticmethod
+    def margin_warnings(
+        T_k: np.ndarray,
+        C: float,
+        min_margin_kelvin: float = 1.0,
+    ) -> List[str]:
+        '''
+        Warns when T + C comes within `min_margin_kelvin` of zero over the data.
+        '''
+        denom_min = float(np.min(T_k + C))
+        if denom_min <= min_margin_kelvin:
+            return [
+                f"Risky fit: min(T + C) = {denom_min:.6g} K (<= {min_margin_kelvin} K). "
+                "Denominator near zero can make the fit unstable."
+            ]
+        return []
+
+    def check(
+        self,
+        T_k: np.ndarray,
+        params: np.ndarray,
+        min_margin_kelvin: float = 1.0,
+    ) -> List[str]:
+        warnings = self.margin_warnings(T_k, params[2], min_margin_kelvin)
+        if params[1] < 10.0:
+            warnings.append(
+                "Unusually small B; data range may be too narrow or units may be inconsistent.")
+        if params[1] > 1e6:
+            warnings.append(
+                "Very large B; check units and outliers in experimental data.")
+        return warnings
+
+
+class ExtendedAntoineCorrelation(VaporPressureCorrelation):
+    """
+    Extended Antoine equation: ln P = A - B / (T + C) + D·T + E·ln T + F·T^n, with a fixed exponent n (default 2).
+    """
+
+    name = "extended_antoine"
+    parameters = ("A", "B", "C", "D", "E", "F")
+
+    def __init__(self, exponent: float = 2.0):
+        self.exponent = float(exponent)
+
+    def constants(self) -> Dict[str, Any]:
+        return {"exponent": self.exponent}
+
+    def ln_p(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, (A, B, C, D, E, F) = self._split(T, params)
+        return A - B / (T + C) + D * T + E * np.log(T) + F * T**self.exponent
+
+    def jacobian(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, (A, B, C, D, E, F) = self._split(T, params)
+        inv = 1.0 / (T + C)
+        return np.stack(np.broadcast_arrays(
+            np.ones_like(inv), -inv, B * inv**2, T,
+            np.log(T), T**self.exponent), axis=-1)
+
+    def initial_guess(self, T_k: np.ndarray, ln_P: np.ndarray) -> np.ndarray:
+        # NOTE: plain Antoine start; the extra terms begin at zero
+        A0, B0, C0 = AntoineCorrelation("ln").initial_guess(T_k, ln_P)
+        return np.array([A0, B0, C0, 0.0, 0.0, 0.0])
+
+    def default_bounds(
+        self,
+        T_k: np.ndarray,
+        min_margin_kelvin: float = 1.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        lo = np.full(6, -np.inf)
+        hi = np.full(6, np.inf)
+        # NOTE: keep T + C positive over the data
+        lo[2] = -float(np.min(T_k)) + min_margin_kelvin
+        return lo, hi
+
+    def check(
+        self,
+        T_k: np.ndarray,
+        params: np.ndarray,
+        min_margin_kelvin: float = 1.0,
+    ) -> List[str]:
+        return AntoineCorrelation.margin_warnings(T_k, params[2], min_margin_kelvin)
+
+
+class WagnerCorrelation(VaporPressureCorrelation):
+    """
+    Wagner 2.5-5 equation: ln(P / Pc) = (Tc / T)·(a·τ + b·τ^1.5 + c·τ^2.5 + d·τ^5), τ = 1 - T / Tc, with fixed Tc (K) and Pc (Pa).
+    """
+
+    name = "wagner"
+    parameters = ("a", "b", "c", "d")
+    exponents = (1.0, 1.5, 2.5, 5.0)
+
+    def __init__(self, Tc: float, Pc: float):
+        if Tc <= 0 or Pc <= 0:
+            raise ValueError("Tc and Pc must be positive.")
+        self.Tc = float(Tc)
+        self.Pc = float(Pc)
+
+    def constants(self) -> Dict[str, Any]:
+        return {"Tc": self.Tc, "Pc": self.Pc}
+
+    def _terms(self, T: np.ndarray) -> np.ndarray:
+        '''
+        (Tc / T)·τ^e for the four exponents, shape (*T.shape, 4); τ is clipped at zero above Tc.
+        '''
+        tau = np.clip(1.0 - T / self.Tc, 0.0, None)
+        return np.stack([(self.Tc / T) * tau**e for e in self.exponents], axis=-1)
+
+    def ln_p(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, cols = self._split(T, params)
+        X = self._terms(T)
+        return math.log(self.Pc) + sum(c * X[..., j] for j, c in enumerate(cols))
+
+    def jacobian(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, cols = self._split(T, params)
+        return self._linear_jacobian(self._terms(T), cols)
+
+    def initial_guess(self, T_k: np.ndarray, ln_P: np.ndarray) -> np.ndarray:
+        # NOTE: linear in (a, b, c, d), the start is the least squares solution
+        return _lstsq_scaled(self._terms(T_k), ln_P - math.log(self.Pc))
+
+    def check(
+        self,
+        T_k: np.ndarray,
+        params: np.ndarray,
+        min_margin_kelvin: float = 1.0,
+    ) -> List[str]:
+        if np.any(T_k >= self.Tc):
+            return [f"Data at or above Tc = {self.Tc:.6g} K; the Wagner equation is only defined below Tc."]
+        return []
+
+
+class DIPPR101Correlation(VaporPressureCorrelation):
+    """
+    DIPPR-101 (Riedel) equation: ln P = A + B / T + C·ln T + D·T^E, with a fixed exponent E (default 6, Riedel).
+    """
+
+    name = "dippr101"
+    parameters = ("A", "B", "C", "D")
+
+    def __init__(self, exponent: float = 6.0):
+        self.exponent = float(exponent)
+
+    def constants(self) -> Dict[str, Any]:
+        return {"E": self.exponent}
+
+    def _terms(self, T: np.ndarray) -> np.ndarray:
+        return np.stack([np.ones_like(T), 1.0 / T, np.log(T), T**self.exponent], axis=-1)
+
+    def ln_p(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, (A, B, C, D) = self._split(T, params)
+        return A + B / T + C * np.log(T) + D * T**self.exponent
+
+    def jacobian(self, T: np.ndarray, params: np.ndarray) -> np.ndarray:
+        T, cols = self._split(T, params)
+        return self._linear_jacobian(self._terms(T), cols)
+
+    def initial_guess(self, T_k: np.ndarray, ln_P: np.ndarray) -> np.ndarray:
+        # NOTE: linear in (A, B, C, D), the start is the least squares solution
+        return _lstsq_scaled(self._terms(T_k), ln_P)
+
+
+# NOTE: correlation registry
+CORRELATIONS: Dict[str, type] = {
+    AntoineCorrelation.name: AntoineCorrelation,
+    ExtendedAntoineCorrelation.name: ExtendedAntoineCorrelation,
+    WagnerCorrelation.name: WagnerCorrelation,
+    DIPPR101Correlation.name: DIPPR101Correlation,
+}
+
+
+def get_correlation(
+    correlation: str | VaporPressureCorrelation,
+    **constants: Any,
+) -> VaporPressureCorrelation:
+    '''
+    Returns a correlation instance from its name ('antoine', 'extended_antoine', 'wagner', 'dippr101') and constants, or the instance itself.
+    '''
+    if isinstance(correlation, VaporPressureCorrelation):
+        return correlation
+    key = str(correlation).lower().replace("-", "_")
+    if key not in CORRELATIONS:
+        raise ValueError(
+            f"Unknown correlation '{correlation}', expected one of {sorted(CORRELATIONS)}.")
+    return CORRELATIONS[key](**constants)
@@ -2,16 +2,18 @@
 import logging
 from typing import Dict, Any, Literal, Optional
 from math import pow
-import os
 # locals
 from ..models import (
     GroupUnit,
     ZabranskyRuzickaGroupContributions,
     ZabranskyRuzickaGroupContributionsCorrections,
     ZabranskyRuzickaGroupData,
+    ZabranskyRuzickaHeatCapacity,
+    ZabranskyRuzickaCpEvaluator,
     EstimatedProp
 )
-from ..util import ReferenceLoader
+from .tables import load_reference_dataframe, resolve_group_names
+from ..util.timing import stage
 from ..configs import (
     ZABRANSKY_RUZICKA_DATA_FILE_1,
     ZABRANSKY_RUZICKA_DATA_FILE_2,
@@ -55,24 +57,30 @@ class ZabranskyRuzicka:
         self.group_corrections = group_corrections if group_corrections else {}
 
         # SECTION: load parameters from reference file
-        self.params, self.corrections = self.load_parameters()
-
-        # NOTE: get group contribution (from reference)
-        self.group_id = self._get_group_contribution()
-        # NOTE: get correction contribution (from reference)
-        self.correction_id = self._get_correction_contribution()
+        with stage('zabransky_ruzicka.table_load'):
+            # NOTE: shared cached tables, only read by the instance
+            self.params = load_reference_dataframe(
+                ZABRANSKY_RUZICKA_DATA_FILE_1, shared=True)
+            self.corrections = load_reference_dataframe(
+                ZABRANSKY_RUZICKA_DATA_FILE_2, shared=True)
+
+            # NOTE: get group contribution (from reference)
+            self.group_id = self._get_group_contribution()
+            # NOTE: get correction contribution (from reference)
+            self.correction_id = self._get_correction_contribution()
 
         # SECTION: valid groups
-        # NOTE: check group contributions
-        self.valid_group_contribution = self._check_group_contributions(
-            group_x=self.group_contributions,
-            group_id=self.group_id
-        )
-        # NOTE: check group corrections
-        self.valid_group_corrections = self._check_group_contributions(
-            group_x=self.group_corrections,
-            group_id=self.correction_id
-        )
+        with stage('zabransky_ruzicka.group_validation'):
+            # NOTE: check group contributions
+            self.valid_group_contribution = self._check_group_contributions(
+                group_x=self.group_contributions,
+                group_id=self.group_id
+            )
+            # NOTE: check group corrections
+            self.valid_group_corrections = self._check_group_contributions(
+                group_x=self.group_corrections,
+                group_id=self.correction_id
+            )
 
         # >> merge valid groups
         self.valid_groups = {
@@ -108,32 +116,15 @@ class ZabranskyRuzicka:
         Returns
         -------
         params_df, corrections_df : pd.DataFrame, pd.DataFrame
-            DataFrames of parameters and corrections.
+            Copies of the parameters and corrections; the parsed files are cached per process.
         '''
         try:
-            # load reference file
-            ref_loader = ReferenceLoader()
-
-            # current folder
-            current_folder = os.path.dirname(os.path.abspath(__file__))
-            #  data folder
-            data_folder = os.path.join(
-                current_folder,
-                '..',
-                'data',
-            )
-
-            # NOTE: load CSV reference
-            params_df = ref_loader.load_csv_ref(
-                reference_name=ZABRANSKY_RUZICKA_DATA_FILE_1,
-                reference_folder=data_folder,
-            )
+            # NOTE: load CSV reference (copies of the cached tables)
+            params_df = load_reference_dataframe(ZABRANSKY_RUZICKA_DATA_FILE_1)
 
             # NOTE: corrections
-            corrections_df = ref_loader.load_csv_ref(
-                reference_name=ZABRANSKY_RUZICKA_DATA_FILE_2,
-                reference_folder=data_folder,
-            )
+            corrections_df = load_reference_dataframe(
+                ZABRANSKY_RUZICKA_DATA_FILE_2)
 
             # return parameters dataframe
             return params_df, corrections_df
@@ -279,22 +270,35 @@ class ZabranskyRuzicka:
             # count each group
             if isinstance(group_x, dict):
                 # ! dictionary type
+                # NOTE: keys are group names or model field names, as in the batch path
+                is_contribution = group_id is self.group_id
+                names = resolve_group_names(
+                    group_id.values(),
+                    ZabranskyRuzickaGroupContributions if is_contribution
+                    else ZabranskyRuzickaGroupContributionsCorrections
+                )
+                unknown = []
                 # iterate over group contributions
                 for group_name, group_value in group_x.items():
                     # check if group exists in  parameters
-                    if group_name in group_id.values():
-                        # add to count dictionary
-                        res_ = ZabranskyRuzickaGroupData(
-                            id=group_name,
-                            name=group_name,
-                            count=float(group_value),
-                            data=self._get_group_x_data(
-                                group_name=group_name,
-                                group_mode='contribution' if group_name in self.group_id.values() else 'correction'
-                            )
+                    alias = names.get(group_name)
+                    if alias is None:
+                        unknown.append(group_name)
+                        continue
+                    # add to count dictionary
+                    res_ = ZabranskyRuzickaGroupData(
+                        id=alias,
+                        name=group_name,
+                        count=float(group_value),
+                        data=self._get_group_x_data(
+                            group_name=alias,
+                            group_mode='contribution' if is_contribution else 'correction'
                         )
-                        # append
-                        valid_groups[group_name] = res_
+                    )
+                    # append
+                    valid_groups[alias] = res_
+                if unknown:
+                    logger.warning(f"Ignoring unknown Zabransky-Ruzicka groups: {unknown}")
             elif isinstance(
                 group_x,
                 ZabranskyRuzickaGroupContributions,
@@ -466,42 +470,49 @@ class ZabranskyRuzicka:
         Returns
         -------
         EstimatedProp
-            Calculated thermodynamic properties.
+            Calculated thermodynamic properties; the value is a picklable `ZabranskyRuzickaCpEvaluator` holding only A, B and D.
         '''
         try:
-            # SECTION: create function
-            def Cp_LIQ(T: float) -> float:
-                '''
-                Calculates liquid heat capacity at temperature T.
-
-                Parameters
-                ----------
-                T : float
-                    Temperature in Kelvin.
-
-                Returns
-                -------
-                Cp_LIQ : float
-                    Liquid heat capacity in J/mol·K.
-                '''
-                # create sigma delta C
-                delta_c = self._build_delta_c()
-
-                # calculate sigma delta C
-                sigma_delta_c = self._calc_sigma_delta_c(delta_c, T)
-
-                # sum over all groups
-                Cp_LIQ_value = sum(sigma_delta_c.values())
-                # times 8.314472
-                Cp_LIQ_value *= 8.314472
-
-                return Cp_LIQ_value
-
-            # return
-            return EstimatedProp(
-                value=Cp_LIQ,
-                unit="J/mol·K",
-                symbol="Cp_LIQ"
-            )
+            # SECTION: aggregate coefficients once
+            model = self._calc_heat_capacity_model()
+
+            with stage('zabransky_ruzicka.cp_closure'):
+                # SECTION: create function
+                Cp_LIQ = ZabranskyRuzickaCpEvaluator(
+                    A=model.A,
+                    B=model.B,
+                    D=model.D
+                )
+
+                # return
+                return EstimatedProp(
+                    value=Cp_LIQ,
+                    unit="J/mol·K",
+                    symbol="Cp_LIQ"
+                )
         except Exception as e:
             raise Exception("Calculating properties failed!, ", e)
+
+    def _calc_heat_capacity_model(
+        self
+    ) -> ZabranskyRuzickaHeatCapacity:
+        '''
+        Aggregates the group and correction contributions into A, B and D.
+
+        Returns
+        -------
+        ZabranskyRuzickaHeatCapacity
+            Liquid heat capacity with closed-form enthalpy and entropy changes.
+        '''
+        try:
+            # NOTE: sum count-weighted contributions
+            with stage('zabransky_ruzicka.sigma'):
+                A, B, D = 0.0, 0.0, 0.0
+                for data in self._build_delta_c().values():
+                    A += data['count'] * data['a_i']
+                    B += data['count'] * data['b_i']
+                    D += data['count'] * data['d_i']
+
+            return ZabranskyRuzickaHeatCapacity(A=A, B=B, D=D)
+        except Exception as e:
+            raise Exception("Aggregating heat capacity coefficients failed!, ", e)
@@ -1,14 +1,15 @@
 # import libs
 import logging
-from typing import List, Tuple, Optional, Literal
+from typing import Any, Dict, List, Sequence, Tuple, Optional, Literal
 import numpy as np
 from pythermodb_settings.models import Temperature, Pressure
 from pathlib import Path
 import pycuc
 # local
-from ..core import Antoine
+from ..core import Antoine, ParallelEstimator
 from ..util import normalize_unit
-from ..models.antoine import AntoineFitResult
+from ..models.antoine import AntoineFitResult, AntoineBootstrapResult
+from ..models.batch import AntoineVaporPressureBatch, VaporPressureBand
 
 # NOTE: set up logger
 logger = logging.getLogger(__name__)
@@ -98,6 +99,8 @@ def estimate_coefficients(
             Mean Absolute Error in log space.
         - r2_logP: float
             R-squared value in log space.
+        - rmse_lnP, mae_lnP, r2_lnP: float
+            The same metrics in ln P, as reported by every vapor pressure correlation.
         - rmse_P: float
             Root Mean Square Error in original pressure space.
         - mae_P: float
@@ -274,6 +277,8 @@ def estimate_coefficients_from_experimental_data(
             Mean Absolute Error in log space.
         - r2_logP: float
             R-squared value in log space.
+        - rmse_lnP, mae_lnP, r2_lnP: float
+            The same metrics in ln P, as reported by every vapor pressure correlation.
         - rmse_P: float
             Root Mean Square Error in original pressure space.
         - mae_P: float
@@ -432,3 +437,475 @@ def calc_vapor_pressure(
     except Exception as e:
         logger.exception(f"An error occurred during pressure calculation: {e}")
         return None
+
+
+def fit_antoine_many(
+    datasets: List[Tuple[np.ndarray, np.ndarray]],
+    *,
+    base: Literal['log10', 'ln'] = "log10",
+    fit_in_log_space: bool = True,
+    x0: Optional[Tuple[float, float, float]] = None,
+    bounds: Optional[
+        Tuple[
+            Tuple[float, float, float],
+            Tuple[float, float, float]
+        ]
+    ] = None,
+    max_nfev: int = 5000,
+    validate: bool = True,
+    min_margin_kelvin: float = 1.0,
+    # robust options
+    loss: Literal['linear', 'soft_l1', 'huber', 'cauchy', 'arctan'] = "linear",
+    f_scale: Optional[float] = None,
+) -> List[Optional[AntoineFitResult]]:
+    """
+    Estimate Antoine coefficients for many independent datasets with the same fitting options.
+
+    Parameters
+    ----------
+    datasets : List[Tuple[np.ndarray, np.ndarray]]
+        List of (temperatures, pressures) array pairs in K and Pa.
+    base : str, optional
+        Logarithm base used in the Antoine equation ('log10' or 'ln'), by default "log10".
+    fit_in_log_space : bool, optional
+        Whether to perform fitting in logarithmic space, by default True.
+    x0 : Optional[Tuple[float, float, float]], optional
+        Initial guess for coefficients (A, B, C), by default None.
+    bounds : Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]], optional
+        Bounds for coefficients (A, B, C), by default None.
+    max_nfev : int, optional
+        Maximum number of function evaluations for the optimizer, by default 5000.
+    validate : bool, optional
+        Whether to perform validation checks on the fitted coefficients, by default True.
+    min_margin_kelvin : float, optional
+        Minimum margin for (T + C) to avoid denominator issues (default 1.0 K).
+    loss : str, Literal['linear', 'soft_l1', 'huber', 'cauchy', 'arctan'], optional
+        Loss function for robust fitting (default 'linear').
+    f_scale : Optional[float], optional
+        Scaling parameter for robust loss (default None = auto).
+
+    Returns
+    -------
+    List[Optional[AntoineFitResult]]
+        One AntoineFitResult per dataset in input order, None where the fit failed.
+
+    Notes
+    -----
+    To spread the fits over several workers, use `ParallelEstimator.fit_antoine` with the same options.
+    """
+    try:
+        # SECTION: Estimate coefficients
+        reports = Antoine.fit_antoine_many(
+            datasets,
+            base=base,
+            T_unit="K",  # ! internal unit for fitting
+            p_unit="Pa",  # ! internal unit for fitting
+            fit_in_log_space=fit_in_log_space,
+            x0=x0,
+            bounds=bounds,
+            max_nfev=max_nfev,
+            validate=validate,
+            min_margin_kelvin=min_margin_kelvin,
+            loss=loss,
+            f_scale=f_scale,
+        )
+
+        # >> return result models
+        return [
+            AntoineFitResult(**report) if report else None
+            for report in reports
+        ]
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during batch coefficient estimation: {e}")
+        return [None] * len(datasets)
+
+
+def fit_antoine_batch(
+    datasets: List[Tuple[np.ndarray, np.ndarray]],
+    *,
+    base: Literal['log10', 'ln'] = "log10",
+    fit_in_log_space: bool = True,
+    weights: Optional[List[Optional[np.ndarray]]] = None,
+    bounds: Optional[
+        Tuple[
+            Tuple[float, float, float],
+            Tuple[float, float, float]
+        ]
+    ] = None,
+    max_nfev: int = 200,
+    min_margin_kelvin: float = 1.0,
+) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Fit Antoine coefficients to many small datasets in one batched solve, returning arrays instead of fit reports.
+
+    Parameters
+    ----------
+    datasets : List[Tuple[np.ndarray, np.ndarray]]
+        List of (temperatures, pressures) array pairs in K and Pa.
+    base : str, optional
+        Logarithm base used in the Antoine equation ('log10' or 'ln'), by default "log10".
+    fit_in_log_space : bool, optional
+        Whether to perform fitting in logarithmic space, by default True.
+    weights : Optional[List[Optional[np.ndarray]]], optional
+        Weights per dataset, None entries for equal weights, by default None.
+    bounds : Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]], optional
+        Bounds for coefficients (A, B, C), by default None.
+    max_nfev : int, optional
+        Maximum number of iterations per dataset, by default 200.
+    min_margin_kelvin : float, optional
+        Minimum margin for (T + C) of the initial guess (default 1.0 K).
+
+    Returns
+    -------
+    Optional[Dict[str, np.ndarray]]
+        Arrays 'A', 'B', 'C', 'cost', 'rmse_logP' and 'success' of shape (n_datasets,), or None on error.
+
+    Notes
+    -----
+    With numba installed (pip install pyThermoEst[jit]) the solve runs in compiled kernels; `pyThermoEst.core.kernels.set_kernel_backend("numpy")` selects the NumPy path.
+    """
+    try:
+        return Antoine.fit_antoine_batch(
+            datasets,
+            base=base,
+            fit_in_log_space=fit_in_log_space,
+            weights=weights,
+            bounds=bounds,
+            max_nfev=max_nfev,
+            min_margin_kelvin=min_margin_kelvin,
+        )
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during batched coefficient estimation: {e}")
+        return None
+
+
+def bootstrap_coefficients(
+    T_data: np.ndarray,
+    P_data: np.ndarray,
+    fit_report: Optional[AntoineFitResult] = None,
+    *,
+    n_boot: int = 1000,
+    method: Literal['residual', 'pairs'] = "residual",
+    temperatures: Optional[List[float]] = None,
+    level: float = 0.95,
+    base: Literal['log10', 'ln'] = "log10",
+    fit_in_log_space: bool = True,
+    weights: Optional[np.ndarray] = None,
+    bounds: Optional[
+        Tuple[
+            Tuple[float, float, float],
+            Tuple[float, float, float]
+        ]
+    ] = None,
+    max_nfev: int = 100,
+    loss: Literal['linear', 'soft_l1', 'huber', 'cauchy', 'arctan'] = "linear",
+    f_scale: Optional[float] = None,
+    seed: Optional[int] = None,
+    executor: Literal['thread', 'process'] = "thread",
+    max_workers: Optional[int] = None,
+    boot_chunk_size: int = 64,
+    return_samples: bool = False,
+) -> Optional[AntoineBootstrapResult]:
+    """
+    Bootstrap percentile confidence intervals for the Antoine coefficients and for Psat.
+
+    The base fit is resampled n_boot times ('residual': resampled residuals added to the fitted curve; 'pairs': resampled (T, P) points) and each resample is refitted, warm-started from the base (A, B, C) with a capped number of function evaluations, on a worker pool.
+
+    Parameters
+    ----------
+    T_data : np.ndarray
+        Temperatures in K.
+    P_data : np.ndarray
+        Vapor pressures in Pa.
+    fit_report : Optional[AntoineFitResult], optional
+        Base fit; fitted here with the options below when None, by default None.
+    n_boot : int, optional
+        Number of bootstrap refits, by default 1000.
+    method : str, optional
+        Resampling scheme: 'residual' or 'pairs', by default "residual".
+    temperatures : Optional[List[float]], optional
+        Temperatures in K at which Psat intervals are reported, by default None.
+    level : float, optional
+        Confidence level, by default 0.95.
+    base : str, optional
+        Logarithm base of the base fit, by default "log10".
+    fit_in_log_space : bool, optional
+        Whether the base fit is made in log space, by default True.
+    weights : Optional[np.ndarray], optional
+        Weights for each data point, by default None.
+    bounds : Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]], optional
+        Bounds for coefficients (A, B, C), by default None.
+    max_nfev : int, optional
+        Function evaluations allowed per refit, by default 100.
+    loss : str, optional
+        Loss function of the base fit, by default "linear".
+    f_scale : Optional[float], optional
+        Scaling parameter for robust loss, by default None.
+    seed : Optional[int], optional
+        Seed for the resampling, by default None.
+    executor : str, optional
+        Worker pool type: 'thread' or 'process', by default "thread".
+    max_workers : Optional[int], optional
+        Maximum number of workers, by default None.
+    boot_chunk_size : int, optional
+        Refits per worker task, by default 64.
+    return_samples : bool, optional
+        Whether to include the (n_boot, 3) coefficient samples, by default False.
+
+    Returns
+    -------
+    Optional[AntoineBootstrapResult]
+        Percentile intervals (estimate, lower, upper, std) for A, B, C and Psat at each temperature, or None if the bootstrap fails.
+
+    Notes
+    -----
+    When fit_report is given, its base, fit space, loss and f_scale are used for the refits; weights and bounds must match the ones of the base fit.
+    """
+    try:
+        T = np.asarray(T_data, dtype=float).ravel()
+        P = np.asarray(P_data, dtype=float).ravel()
+
+        # SECTION: Base fit
+        if fit_report is None:
+            report = Antoine.fit_antoine(
+                T_data=T,
+                P_data=P,
+                base=base,
+                T_unit="K",  # ! internal unit for fitting
+                p_unit="Pa",  # ! internal unit for fitting
+                fit_in_log_space=fit_in_log_space,
+                weights=weights,
+                bounds=bounds,
+                loss=loss,
+                f_scale=f_scale,
+            )
+            if not report:
+                logger.error("Base Antoine fit failed.")
+                return None
+        else:
+            report = fit_report.model_dump()
+
+        # SECTION: Bootstrap refits
+        with ParallelEstimator(executor=executor, max_workers=max_workers) as pe:
+            res = pe.bootstrap_antoine(
+                T,
+                P,
+                report,
+                n_boot=n_boot,
+                method=method,
+                temperatures=temperatures,
+                level=level,
+                weights=weights,
+                bounds=bounds,
+                max_nfev=max_nfev,
+                boot_chunk_size=boot_chunk_size,
+                seed=seed,
+                return_samples=return_samples,
+            )
+
+        # >> return result model
+        return AntoineBootstrapResult(**res)
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during Antoine bootstrap: {e}")
+        return None
+
+
+def vapor_pressure_band(
+    T_array: float | np.ndarray | List[float],
+    fit_report: AntoineFitResult | Dict[str, Any] | Sequence[
+        Optional[AntoineFitResult | Dict[str, Any]]
+    ],
+    level: float = 0.95,
+) -> Optional[VaporPressureBand]:
+    """
+    Predicted vapor pressure with delta-method confidence bands from the covariance of (A, B, C).
+
+    For every fit and temperature the variance of log P is the quadratic form g·cov·g, with g = (1, -1/(T + C), B/(T + C)^2), evaluated in one batched product:
+
+        log P ± z * sqrt(g·cov·g)  ->  [lower, upper] in Pa
+
+    Parameters
+    ----------
+    T_array : float | np.ndarray | List[float]
+        Temperatures in K.
+    fit_report : AntoineFitResult | Dict[str, Any] | Sequence[Optional[AntoineFitResult | Dict[str, Any]]]
+        One fit report with `cov`, or a table of them (e.g. from `fit_antoine_many`); failed fits (None) and fits without `cov` give NaN rows or bands.
+    level : float, optional
+        Confidence level, by default 0.95.
+
+    Returns
+    -------
+    Optional[VaporPressureBand]
+        'T', 'Psat', 'lower' and 'upper' in Pa, of shape (n_T,) for one fit or (n_fits, n_T) for a table, plus 'level' and 'unit'; None if the calculation fails.
+
+    Notes
+    -----
+    All fits of a table must share the logarithm base.
+    """
+    try:
+        # SECTION: Collect fits
+        single = isinstance(fit_report, (AntoineFitResult, dict))
+        reports = [fit_report] if single else list(fit_report)
+        reports = [
+            r.model_dump() if isinstance(r, AntoineFitResult) else (r or {})
+            for r in reports
+        ]
+
+        bases = {str(r.get("base") or "log10").lower()
+                 for r in reports if r}
+        if len(bases) > 1:
+            logger.error("All fits must use the same logarithm base.")
+            return None
+
+        # NOTE: coefficient and covariance stacks, NaN for missing entries
+        n = len(reports)
+        coeffs = np.full((n, 3), np.nan)
+        cov = np.full((n, 3, 3), np.nan)
+        for i, r in enumerate(reports):
+            if r.get("A") is not None:
+                coeffs[i] = [r["A"], r["B"], r["C"]]
+            if r.get("cov") is not None:
+                cov[i] = np.asarray(r["cov"], dtype=float)
+
+        # SECTION: Batched band
+        T = np.atleast_1d(np.asarray(T_array, dtype=float)).ravel()
+        model = AntoineVaporPressureBatch(
+            A=coeffs[:, 0],
+            B=coeffs[:, 1],
+            C=coeffs[:, 2],
+            base=bases.pop() if bases else "log10",
+            cov=cov,
+        )
+        P, lower, upper = model.band(T, level=level)
+
+        if single:
+            P, lower, upper = P[0], lower[0], upper[0]
+
+        return VaporPressureBand(
+            T=T,
+            Psat=P,
+            lower=lower,
+            upper=upper,
+            level=float(level),
+            unit="Pa",
+        )
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during vapor pressure band calculation: {e}")
+        return None
+
+
+def fit_antoine_multistart(
+    T_data: np.ndarray,
+    P_data: np.ndarray,
+    *,
+    n_starts: int = 32,
+    early_stop: Optional[int] = 3,
+    rtol: float = 1e-6,
+    search_bounds: Optional[
+        Tuple[
+            Tuple[float, float, float],
+            Tuple[float, float, float]
+        ]
+    ] = None,
+    seed: Optional[int] = None,
+    base: Literal['log10', 'ln'] = "log10",
+    fit_in_log_space: bool = True,
+    weights: Optional[np.ndarray] = None,
+    bounds: Optional[
+        Tuple[
+            Tuple[float, float, float],
+            Tuple[float, float, float]
+        ]
+    ] = None,
+    max_nfev: int = 5000,
+    validate: bool = True,
+    min_margin_kelvin: float = 1.0,
+    # robust options
+    loss: Literal['linear', 'soft_l1', 'huber', 'cauchy', 'arctan'] = "linear",
+    f_scale: Optional[float] = None,
+    # parallel options
+    executor: Literal['thread', 'process'] = "thread",
+    max_workers: Optional[int] = None,
+    starts_per_task: int = 4,
+) -> Optional[AntoineFitResult]:
+    """
+    Global Antoine fit from a Latin-hypercube set of (A, B, C) starts, run concurrently, avoiding local minima such as C close to -min(T).
+
+    Parameters
+    ----------
+    T_data : np.ndarray
+        Temperatures in K.
+    P_data : np.ndarray
+        Vapor pressures in Pa.
+    n_starts : int, optional
+        Number of starting points, by default 32.
+    early_stop : Optional[int], optional
+        Stop once starts from this many distinct worker tasks reach the best cost within rtol, by default 3; None runs every start.
+    rtol : float, optional
+        Relative cost tolerance of the best basin, by default 1e-6.
+    search_bounds : Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]], optional
+        Box the starts are drawn from, by default a data-driven box inside bounds.
+    seed : Optional[int], optional
+        Seed for the starts, by default None.
+    base : str, optional
+        Logarithm base used in the Antoine equation ('log10' or 'ln'), by default "log10".
+    fit_in_log_space : bool, optional
+        Whether to perform fitting in logarithmic space, by default True.
+    weights : Optional[np.ndarray], optional
+        Optional weights for each data point, by default None.
+    bounds : Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]], optional
+        Bounds for coefficients (A, B, C), by default None.
+    max_nfev : int, optional
+        Maximum number of function evaluations of the final fit, by default 5000.
+    validate : bool, optional
+        Whether to perform validation checks on the fitted coefficients, by default True.
+    min_margin_kelvin : float, optional
+        Minimum margin for (T + C) to avoid denominator issues (default 1.0 K).
+    loss : str, optional
+        Loss function for robust fitting, by default "linear".
+    f_scale : Optional[float], optional
+        Scaling parameter for robust loss, by default None.
+    executor : str, optional
+        Worker pool type: 'thread' or 'process', by default "thread".
+    max_workers : Optional[int], optional
+        Maximum number of workers, by default None.
+    starts_per_task : int, optional
+        Starts refitted per worker task, by default 4.
+
+    Returns
+    -------
+    Optional[AntoineFitResult]
+        Fit of the best start, with `multistart` holding n_starts, n_evaluated, n_converged, n_best_basin (starts that reached the best cost), n_best_basin_tasks, early_stopped and best_start; None if every start fails.
+    """
+    try:
+        with ParallelEstimator(executor=executor, max_workers=max_workers) as pe:
+            report = pe.fit_antoine_multistart(
+                T_data,
+                P_data,
+                n_starts=n_starts,
+                starts_per_task=starts_per_task,
+                early_stop=early_stop,
+                rtol=rtol,
+                search_bounds=search_bounds,
+                seed=seed,
+                base=base,
+                fit_in_log_space=fit_in_log_space,
+                weights=weights,
+                bounds=bounds,
+                max_nfev=max_nfev,
+                validate=validate,
+                min_margin_kelvin=min_margin_kelvin,
+                loss=loss,
+                f_scale=f_scale,
+            )
+
+        # >> return result model
+        return AntoineFitResult(**report)
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during multistart Antoine fitting: {e}")
+        return None
@@ -0,0 +1,205 @@
+# import libs
+import logging
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+import numpy as np
+# local
+from ..core import ParallelEstimator, VaporPressureCorrelation, get_correlation
+from ..models.vapor_pressure import VaporPressureFitResult
+
+# NOTE: set up logger
+logger = logging.getLogger(__name__)
+
+
+def fit_vapor_pressure(
+    T_data: np.ndarray,
+    P_data: np.ndarray,
+    correlation: Literal['antoine', 'extended_antoine', 'wagner', 'dippr101'] | VaporPressureCorrelation = "antoine",
+    *,
+    correlation_options: Optional[Dict[str, Any]] = None,
+    T_unit: Literal['K', 'C'] = "K",
+    p_unit: Literal['Pa', 'kPa', 'bar', 'atm', 'psi'] = "Pa",
+    fit_in_log_space: bool = True,
+    weights: Optional[np.ndarray] = None,
+    x0: Optional[np.ndarray] = None,
+    bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    max_nfev: int = 5000,
+    validate: bool = True,
+    min_margin_kelvin: float = 1.0,
+    # robust options
+    loss: Literal['linear', 'soft_l1', 'huber', 'cauchy', 'arctan'] = "linear",
+    f_scale: Optional[float] = None,
+) -> Optional[VaporPressureFitResult]:
+    """
+    Fit a vapor pressure correlation to experimental data:
+
+        antoine:           log10(P) = A - B / (T + C)      (or ln with base='ln')
+        extended_antoine:  ln(P) = A - B / (T + C) + D*T + E*ln(T) + F*T^n
+        wagner:            ln(P/Pc) = (Tc/T) * (a*tau + b*tau^1.5 + c*tau^2.5 + d*tau^5),  tau = 1 - T/Tc
+        dippr101:          ln(P) = A + B/T + C*ln(T) + D*T^E
+
+    Parameters
+    ----------
+    T_data : np.ndarray
+        Temperatures in T_unit.
+    P_data : np.ndarray
+        Vapor pressures in p_unit.
+    correlation : str | VaporPressureCorrelation, optional
+        Correlation name or instance, by default "antoine".
+    correlation_options : Optional[Dict[str, Any]], optional
+        Constants of the correlation, e.g. {'Tc': 647.096, 'Pc': 22.064e6} for 'wagner', {'exponent': 6} for 'dippr101', {'base': 'ln'} for 'antoine', by default None.
+    T_unit : str, optional
+        Unit of temperature data, by default "K".
+    p_unit : str, optional
+        Unit of pressure data, by default "Pa".
+    fit_in_log_space : bool, optional
+        Whether to fit ln P (True) or P (False), by default True.
+    weights : Optional[np.ndarray], optional
+        Optional weights for each data point, by default None.
+    x0 : Optional[np.ndarray], optional
+        Initial guess of the parameters, by default None (correlation guess).
+    bounds : Optional[Tuple[np.ndarray, np.ndarray]], optional
+        Parameter bounds, by default None (correlation defaults).
+    max_nfev : int, optional
+        Maximum number of function evaluations, by default 5000.
+    validate : bool, optional
+        Whether to perform validation checks on the fitted parameters, by default True.
+    min_margin_kelvin : float, optional
+        Minimum margin for denominators such as (T + C), by default 1.0 K.
+    loss : str, optional
+        Loss function for robust fitting, by default "linear".
+    f_scale : Optional[float], optional
+        Scaling parameter for robust loss, by default None (auto).
+
+    Returns
+    -------
+    Optional[VaporPressureFitResult]
+        Fitted parameters, constants, metrics (in ln P and P), covariance and warnings, or None if the fit fails.
+    """
+    try:
+        model = get_correlation(correlation, **(correlation_options or {}))
+
+        report = model.fit(
+            T_data,
+            P_data,
+            T_unit=T_unit,
+            p_unit=p_unit,
+            fit_in_log_space=fit_in_log_space,
+            weights=weights,
+            x0=x0,
+            bounds=bounds,
+            max_nfev=max_nfev,
+            validate=validate,
+            min_margin_kelvin=min_margin_kelvin,
+            loss=loss,
+            f_scale=f_scale,
+        )
+        if not report:
+            logger.error(f"{model.name} fit failed.")
+            return None
+
+        # >> return result model
+        return VaporPressureFitResult(**report)
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during vapor pressure correlation fitting: {e}")
+        return None
+
+
+def fit_vapor_pressure_many(
+    datasets: List[Tuple[np.ndarray, np.ndarray]],
+    correlation: Literal['antoine', 'extended_antoine', 'wagner', 'dippr101'] | VaporPressureCorrelation = "antoine",
+    *,
+    correlation_options: Optional[Dict[str, Any]] = None,
+    executor: Literal['thread', 'process'] = "thread",
+    max_workers: Optional[int] = None,
+    fit_chunk_size: int = 8,
+    **fit_options: Any,
+) -> List[Optional[VaporPressureFitResult]]:
+    """
+    Fit one vapor pressure correlation to many independent (T, P) datasets in K and Pa on a worker pool.
+
+    Parameters
+    ----------
+    datasets : List[Tuple[np.ndarray, np.ndarray]]
+        List of (temperatures, pressures) array pairs in K and Pa.
+    correlation : str | VaporPressureCorrelation, optional
+        Correlation name or instance, by default "antoine".
+    correlation_options : Optional[Dict[str, Any]], optional
+        Constants of the correlation, shared by every dataset, by default None.
+    executor : str, optional
+        Worker pool type: 'thread' or 'process', by default "thread".
+    max_workers : Optional[int], optional
+        Maximum number of workers, by default None.
+    fit_chunk_size : int, optional
+        Datasets per worker task, by default 8.
+    **fit_options : Any
+        Options of `fit_vapor_pressure` (fit_in_log_space, weights, bounds, loss, ...).
+
+    Returns
+    -------
+    List[Optional[VaporPressureFitResult]]
+        One result per dataset in input order, None where the fit failed.
+    """
+    try:
+        model = get_correlation(correlation, **(correlation_options or {}))
+        with ParallelEstimator(
+            executor=executor, max_workers=max_workers, fit_chunk_size=fit_chunk_size
+        ) as pe:
+            return pe.fit_vapor_pressure(model, datasets, **fit_options)
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during batch vapor pressure correlation fitting: {e}")
+        return [None] * len(datasets)
+
+
+def calc_vapor_pressure_correlation(
+    T_array: float | np.ndarray | List[float],
+    fit_result: VaporPressureFitResult | Sequence[Optional[VaporPressureFitResult]],
+) -> Optional[np.ndarray]:
+    """
+    Evaluate fitted correlations at many temperatures.
+
+    Parameters
+    ----------
+    T_array : float | np.ndarray | List[float]
+        Temperatures in K.
+    fit_result : VaporPressureFitResult | Sequence[Optional[VaporPressureFitResult]]
+        One fit, or a table of fits of the same correlation and constants; failed fits (None) give NaN rows.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Vapor pressures in Pa of shape T.shape for one fit, or (n_fits, *T.shape) for a table; None on failure.
+    """
+    try:
+        T = np.asarray(T_array, dtype=float)
+
+        # SECTION: one fit
+        if isinstance(fit_result, VaporPressureFitResult):
+            model = get_correlation(
+                fit_result.correlation, **fit_result.constants)
+            params = np.array([fit_result.parameters[p]
+                              for p in model.parameters])
+            return model.vapor_pressure(T, params)
+
+        # SECTION: table of fits
+        fits = [f for f in fit_result if f is not None]
+        if not fits:
+            return np.full((len(fit_result),) + T.shape, np.nan)
+        keys = {(f.correlation, tuple(sorted(f.constants.items())))
+                for f in fits}
+        if len(keys) > 1:
+            logger.error(
+                "All fits must share the correlation and its constants.")
+            return None
+
+        model = get_correlation(fits[0].correlation, **fits[0].constants)
+        table = VaporPressureCorrelation.params_table(
+            [f.model_dump() if f is not None else None for f in fit_result],
+            model.parameters,
+        )
+        return model.vapor_pressure(T, table)
+    except Exception as e:
+        logger.exception(
+            f"An error occurred during vapor pressure correlation evaluation: {e}")
+        return None
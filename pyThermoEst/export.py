@@ -0,0 +1,350 @@
+# import libs
+import logging
+import re
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+# locals
+from .configs import __version__
+from .models import (
+    EstimatedBatchProp,
+    JobackHeatCapacityBatch,
+    ZabranskyRuzickaHeatCapacityBatch,
+)
+from .core.batch import JOBACK_BATCH_PROPERTIES
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: default rows per parquet row group
+ROW_GROUP_SIZE = 65536
+
+# NOTE: heat capacity equations stored in the schema metadata
+JOBACK_CP_EQUATION = (
+    "Cp_IG = (Cp_IG_a - 37.93) + (Cp_IG_b + 0.210) T + (Cp_IG_c - 3.91e-4) T^2 "
+    "+ (Cp_IG_d + 2.06e-7) T^3 [J/mol·K], T in K"
+)
+JOBACK_ETA_EQUATION = (
+    "eta_L = molecular_weight exp((eta_L_a - 597.82)/T + eta_L_b - 11.202) [Pa·s], T in K"
+)
+ZABRANSKY_RUZICKA_CP_EQUATION = (
+    "Cp_LIQ = 8.314472 (Cp_LIQ_A + Cp_LIQ_B θ + Cp_LIQ_D θ^2) [J/mol·K], θ = T/100 K"
+)
+
+# NOTE: schema metadata per method
+METHOD_METADATA: Dict[str, Dict[str, str]] = {
+    'joback': {
+        'pythermoest.method': 'joback',
+        'pythermoest.heat_capacity': JOBACK_CP_EQUATION,
+        'pythermoest.liquid_viscosity': JOBACK_ETA_EQUATION,
+    },
+    'zabransky_ruzicka': {
+        'pythermoest.method': 'zabransky_ruzicka',
+        'pythermoest.heat_capacity': ZABRANSKY_RUZICKA_CP_EQUATION,
+    },
+}
+
+# NOTE: field metadata of the fixed output columns (name: (unit, symbol))
+COLUMN_METADATA: Dict[str, Dict[str, str]] = {
+    **{
+        name: {'unit': unit, 'symbol': symbol}
+        for name, (unit, symbol) in JOBACK_BATCH_PROPERTIES.items()
+    },
+    'Cp_IG_a': {'unit': 'J/mol·K', 'symbol': 'a', 'description': 'sum of group a contributions'},
+    'Cp_IG_b': {'unit': 'J/mol·K2', 'symbol': 'b', 'description': 'sum of group b contributions'},
+    'Cp_IG_c': {'unit': 'J/mol·K3', 'symbol': 'c', 'description': 'sum of group c contributions'},
+    'Cp_IG_d': {'unit': 'J/mol·K4', 'symbol': 'd', 'description': 'sum of group d contributions'},
+    'eta_L_a': {'unit': '1', 'symbol': 'ηa', 'description': 'sum of group ηa contributions'},
+    'eta_L_b': {'unit': '1', 'symbol': 'ηb', 'description': 'sum of group ηb contributions'},
+    'molecular_weight': {'unit': 'g/mol', 'symbol': 'MW'},
+    'Cp_LIQ_A': {'unit': '1', 'symbol': 'A', 'description': 'sum of group and correction a_i'},
+    'Cp_LIQ_B': {'unit': '1', 'symbol': 'B', 'description': 'sum of group and correction b_i'},
+    'Cp_LIQ_D': {'unit': '1', 'symbol': 'D', 'description': 'sum of group and correction d_i'},
+    'Cp_LIQ_Tmin': {'unit': 'K', 'symbol': 'Tmin', 'description': 'lower bound of the validity window'},
+    'Cp_LIQ_Tmax': {'unit': 'K', 'symbol': 'Tmax', 'description': 'upper bound of the validity window'},
+}
+
+# NOTE: tabulated heat capacity columns, e.g. Cp_IG@298.15K
+_TABULATED_COLUMN = re.compile(r"^(Cp_IG|Cp_LIQ)@(.+)K$")
+
+
+def _import_pyarrow():
+    '''
+    Imports pyarrow, which is an optional dependency.
+    '''
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Arrow/Parquet export requires pyarrow (pip install pyThermoEst[parquet]).")
+    return pa, pq
+
+
+def column_metadata(name: str) -> Dict[str, str]:
+    '''
+    Returns the field metadata of an output column.
+
+    Parameters
+    ----------
+    name : str
+        Column name, e.g. 'critical_temperature', 'Cp_IG_a' or 'Cp_LIQ@298.15K'.
+
+    Returns
+    -------
+    Dict[str, str]
+        Unit, symbol and description where known, empty otherwise.
+    '''
+    if name in COLUMN_METADATA:
+        return COLUMN_METADATA[name]
+
+    match = _TABULATED_COLUMN.match(name)
+    if match:
+        return {
+            'unit': 'J/mol·K',
+            'symbol': match.group(1),
+            'temperature': match.group(2),
+            'temperature_unit': 'K',
+        }
+    return {}
+
+
+def _to_arrow_array(pa, values: Any):
+    '''
+    Converts a column to an Arrow array.
+
+    C-contiguous float64 arrays are wrapped without copying; NaN is kept as a float value, not as null.
+    '''
+    if isinstance(values, np.ndarray) and values.ndim == 1:
+        if values.dtype.kind == 'f' and not values.flags.c_contiguous:
+            values = np.ascontiguousarray(values)
+        return pa.array(values)
+    return pa.array(list(values))
+
+
+def columns_to_arrow(
+    columns: Dict[str, Any],
+    schema_metadata: Optional[Dict[str, str]] = None,
+):
+    '''
+    Builds an Arrow table from named columns.
+
+    Parameters
+    ----------
+    columns : Dict[str, Any]
+        Column name to 1-D array or sequence; all columns must have the same length.
+    schema_metadata : Dict[str, str], optional
+        Extra key-value metadata stored on the schema, by default None.
+
+    Returns
+    -------
+    pyarrow.Table
+        Table with one field per column; known columns carry unit and symbol field metadata.
+    '''
+    pa, _ = _import_pyarrow()
+
+    arrays, fields = [], []
+    for name, values in columns.items():
+        array = _to_arrow_array(pa, values)
+        arrays.append(array)
+        fields.append(pa.field(name, array.type,
+                      metadata=column_metadata(name) or None))
+
+    metadata = {'pythermoest.version': __version__}
+    metadata.update(schema_metadata or {})
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+
+
+def to_arrow_table(
+    result: Dict[str, EstimatedBatchProp] | EstimatedBatchProp,
+    ids: Optional[Sequence[Any]] = None,
+    temperatures: Sequence[float] = (),
+):
+    '''
+    Converts a batch estimation result into a columnar Arrow table.
+
+    Parameters
+    ----------
+    result : Dict[str, EstimatedBatchProp] | EstimatedBatchProp
+        Output of `joback_batch_calc` or `zabransky_ruzicka_batch_calc`.
+    ids : Sequence[Any], optional
+        Molecule identifiers stored in an 'id' column, by default None.
+    temperatures : Sequence[float], optional
+        Temperatures (K) at which heat capacity is tabulated as extra columns, by default none.
+
+    Returns
+    -------
+    pyarrow.Table
+        One column per scalar property and per heat capacity coefficient, with units in the field metadata and the heat capacity equation in the schema metadata.
+
+    Notes
+    -----
+    Property arrays are shared with the table, not copied; the result must not be modified afterwards.
+    '''
+    T = np.asarray(temperatures, dtype=float).ravel()
+    columns: Dict[str, Any] = {}
+
+    if isinstance(result, dict) and isinstance(result.get('value'), ZabranskyRuzickaHeatCapacityBatch):
+        # NOTE: Zabransky-Ruzicka
+        cp: ZabranskyRuzickaHeatCapacityBatch = result['value']
+        method = 'zabransky_ruzicka'
+        coefficients = {'A': cp.A, 'B': cp.B, 'D': cp.D}
+        if cp.Tmin is not None and cp.Tmax is not None:
+            coefficients.update(Tmin=cp.Tmin, Tmax=cp.Tmax)
+        n_rows = cp.A.shape[0]
+        if ids is not None:
+            columns['id'] = ids
+        for k, v in coefficients.items():
+            columns[f"Cp_LIQ_{k}"] = v
+    elif isinstance(result, dict) and 'heat_capacity' in result:
+        # NOTE: Joback
+        cp: JobackHeatCapacityBatch = result['heat_capacity']['value']
+        method = 'joback'
+        n_rows = cp.a.shape[0]
+        if ids is not None:
+            columns['id'] = ids
+        for name in JOBACK_BATCH_PROPERTIES:
+            columns[name] = result[name]['value']
+        for k in ('a', 'b', 'c', 'd'):
+            columns[f"Cp_IG_{k}"] = getattr(cp, k)
+        if 'liquid_viscosity' in result:
+            eta = result['liquid_viscosity']['value']
+            columns['eta_L_a'] = eta.eta_a
+            columns['eta_L_b'] = eta.eta_b
+            columns['molecular_weight'] = eta.molecular_weight
+    else:
+        raise TypeError(
+            "result must be the output of joback_batch_calc or zabransky_ruzicka_batch_calc.")
+
+    if ids is not None and len(ids) != n_rows:
+        raise ValueError("ids must have one entry per molecule.")
+
+    # NOTE: tabulated heat capacity, (N, n_T)
+    if T.size:
+        values = cp(T)
+        symbol = 'Cp_IG' if method == 'joback' else 'Cp_LIQ'
+        for j, t in enumerate(T):
+            columns[f"{symbol}@{t:g}K"] = values[:, j]
+
+    return columns_to_arrow(columns, schema_metadata=METHOD_METADATA[method])
+
+
+class ParquetBatchWriter:
+    '''
+    Incremental Parquet writer for batch estimation results.
+
+    Each written table is appended as one or more row groups of at most `row_group_size` rows, so large runs are written chunk by chunk without holding the whole result in memory. The schema is fixed by the first table.
+    '''
+
+    def __init__(
+        self,
+        path: str,
+        row_group_size: int = ROW_GROUP_SIZE,
+        compression: str = 'snappy',
+    ):
+        '''
+        Initializes the writer.
+
+        Parameters
+        ----------
+        path : str
+            Output file path.
+        row_group_size : int, optional
+            Maximum rows per row group, by default 65536.
+        compression : str, optional
+            Parquet compression codec, by default 'snappy'.
+        '''
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive.")
+        _import_pyarrow()
+
+        self.path = path
+        self.row_group_size = int(row_group_size)
+        self.compression = compression
+        self.rows_written = 0
+        self._writer: Optional[Any] = None
+
+    def __repr__(self) -> str:
+        return f"ParquetBatchWriter(path={self.path!r}, rows_written={self.rows_written})"
+
+    def __enter__(self) -> "ParquetBatchWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(
+        self,
+        table: Any,
+        ids: Optional[Sequence[Any]] = None,
+        temperatures: Sequence[float] = (),
+    ) -> None:
+        '''
+        Appends a chunk.
+
+        Parameters
+        ----------
+        table : pyarrow.Table | Dict[str, EstimatedBatchProp] | EstimatedBatchProp
+            Arrow table, or a batch result converted with `to_arrow_table`.
+        ids : Sequence[Any], optional
+            Molecule identifiers, used when `table` is a batch result.
+        temperatures : Sequence[float], optional
+            Tabulation temperatures (K), used when `table` is a batch result.
+        '''
+        pa, pq = _import_pyarrow()
+
+        if not isinstance(table, pa.Table):
+            table = to_arrow_table(table, ids=ids, temperatures=temperatures)
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self.path, table.schema, compression=self.compression)
+        elif not table.schema.equals(self._writer.schema, check_metadata=False):
+            # NOTE: e.g. an all-null id column in a later chunk
+            table = table.cast(self._writer.schema)
+
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows_written += table.num_rows
+
+    def close(self) -> None:
+        '''
+        Finalizes the file.
+        '''
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def write_parquet(
+    result: Any,
+    path: str,
+    ids: Optional[Sequence[Any]] = None,
+    temperatures: Sequence[float] = (),
+    row_group_size: int = ROW_GROUP_SIZE,
+    compression: str = 'snappy',
+) -> int:
+    '''
+    Writes a batch estimation result to a Parquet file.
+
+    Parameters
+    ----------
+    result : pyarrow.Table | Dict[str, EstimatedBatchProp] | EstimatedBatchProp
+        Arrow table, or the output of `joback_batch_calc` or `zabransky_ruzicka_batch_calc`.
+    path : str
+        Output file path.
+    ids : Sequence[Any], optional
+        Molecule identifiers stored in an 'id' column, by default None.
+    temperatures : Sequence[float], optional
+        Temperatures (K) at which heat capacity is tabulated, by default none.
+    row_group_size : int, optional
+        Maximum rows per row group, by default 65536.
+    compression : str, optional
+        Parquet compression codec, by default 'snappy'.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    '''
+    with ParquetBatchWriter(path, row_group_size=row_group_size, compression=compression) as writer:
+        writer.write(result, ids=ids, temperatures=temperatures)
+        return writer.rows_written
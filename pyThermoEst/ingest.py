@@ -0,0 +1,378 @@
+# import libs
+import logging
+import os
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
+import numpy as np
+import pandas as pd
+from scipy.sparse import vstack
+# locals
+from .models import GroupCountChunk, GroupTable
+from .core.batch import (
+    build_count_matrix_from_long,
+    map_group_columns,
+    scatter_count_columns,
+)
+from .core.tables import load_joback_table, load_zabransky_ruzicka_tables
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: reserved wide-table columns
+ID_COLUMN = 'id'
+ATOMS_COLUMN = 'total_atoms_number'
+
+# NOTE: default rows per streamed chunk
+CHUNK_SIZE = 100000
+
+
+# SECTION: sources
+
+def _import_pyarrow_parquet():
+    '''
+    Imports pyarrow.parquet, which is an optional dependency.
+    '''
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Parquet input requires pyarrow (pip install pyThermoEst[parquet]).")
+    return pq
+
+
+def _guess_format(source: Any) -> str:
+    '''
+    Guesses the input format from a file name; streams and unknown suffixes are read as CSV.
+    '''
+    if isinstance(source, pd.DataFrame):
+        return 'dataframe'
+    if isinstance(source, (str, os.PathLike)):
+        if os.fspath(source).lower().endswith(('.parquet', '.pq')):
+            return 'parquet'
+    return 'csv'
+
+
+def iter_frames(
+    source: Any,
+    input_format: Optional[Literal['csv', 'parquet', 'dataframe']] = None,
+    chunk_size: Optional[int] = CHUNK_SIZE,
+    columns: Optional[List[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    '''
+    Streams a CSV file, Parquet file or DataFrame as DataFrames of at most `chunk_size` rows.
+
+    Parameters
+    ----------
+    source : Any
+        File path, text stream (CSV only) or DataFrame.
+    input_format : str, optional
+        'csv', 'parquet' or 'dataframe', by default guessed from the source.
+    chunk_size : Optional[int], optional
+        Rows per chunk, None for a single chunk, by default 100000.
+    columns : Optional[List[str]], optional
+        Columns to read, by default all.
+
+    Yields
+    ------
+    pd.DataFrame
+        Consecutive row chunks with stripped column names.
+    '''
+    input_format = input_format or _guess_format(source)
+
+    def _clean(df: pd.DataFrame) -> pd.DataFrame:
+        df.columns = [str(c).strip() for c in df.columns]
+        return df
+
+    if input_format == 'dataframe':
+        df = source if columns is None else source[columns]
+        step = chunk_size or max(len(df), 1)
+        for start in range(0, len(df), step):
+            yield _clean(df.iloc[start:start + step].copy())
+        return
+
+    if input_format == 'parquet':
+        pq = _import_pyarrow_parquet()
+        pf = pq.ParquetFile(source)
+        if chunk_size is None:
+            yield _clean(pf.read(columns=columns).to_pandas())
+            return
+        for batch in pf.iter_batches(batch_size=chunk_size, columns=columns):
+            yield _clean(batch.to_pandas())
+        return
+
+    if input_format != 'csv':
+        raise ValueError(f"Unknown input format '{input_format}'.")
+    if chunk_size is None:
+        yield _clean(pd.read_csv(source, usecols=columns))
+        return
+    for df in pd.read_csv(source, chunksize=chunk_size, usecols=columns):
+        yield _clean(df)
+
+
+def _method_tables(
+    method: str,
+) -> Tuple[GroupTable, Optional[GroupTable]]:
+    '''
+    Returns the (groups, corrections) tables of a method.
+    '''
+    if method == 'joback':
+        return load_joback_table(), None
+    if method in ('zabransky_ruzicka', 'zabransky-ruzicka'):
+        return load_zabransky_ruzicka_tables()
+    raise ValueError(f"Unknown method '{method}'.")
+
+
+def _merge_unknown(
+    total: Dict[str, int],
+    unknown: Dict[str, int],
+) -> None:
+    for name, n in unknown.items():
+        total[name] = total.get(name, 0) + n
+
+
+# SECTION: wide tables
+
+def read_wide(
+    source: Any,
+    method: Literal['joback', 'zabransky_ruzicka'] = 'joback',
+    *,
+    chunk_size: Optional[int] = CHUNK_SIZE,
+    sparse: bool = False,
+    input_format: Optional[Literal['csv', 'parquet', 'dataframe']] = None,
+    id_column: str = ID_COLUMN,
+    atoms_column: str = ATOMS_COLUMN,
+) -> Iterator[GroupCountChunk]:
+    '''
+    Streams a wide table (one row per molecule, one column per group) as count matrices.
+
+    Parameters
+    ----------
+    source : Any
+        CSV / Parquet path, CSV text stream or DataFrame.
+    method : str, optional
+        'joback' or 'zabransky_ruzicka', by default 'joback'.
+    chunk_size : Optional[int], optional
+        Rows per chunk, None for a single chunk, by default 100000.
+    sparse : bool, optional
+        Yield CSR matrices instead of dense arrays, by default False.
+    input_format : str, optional
+        'csv', 'parquet' or 'dataframe', by default guessed from the source.
+    id_column : str, optional
+        Molecule id column, by default 'id'.
+    atoms_column : str, optional
+        Total atom number column used by Joback, by default 'total_atoms_number'.
+
+    Yields
+    ------
+    GroupCountChunk
+        ids, counts, corrections (Zabransky-Ruzicka), atoms (when the column exists) and
+        the number of non-zero cells of each unknown column in the chunk.
+
+    Notes
+    -----
+    Headers are mapped to table rows once, from the first chunk; missing cells count as zero.
+    '''
+    table, corrections_table = _method_tables(method)
+    mapping = None
+
+    for df in iter_frames(source, input_format, chunk_size):
+        if mapping is None:
+            # NOTE: map headers once for the whole file
+            header = [c for c in df.columns if c not in (id_column, atoms_column)]
+            src, dst, unknown_cols = map_group_columns(header, table)
+            corr_src = corr_dst = None
+            if corrections_table is not None:
+                corr_src, corr_dst, _ = map_group_columns(header, corrections_table)
+                unknown_cols = [
+                    c for c in unknown_cols if c not in corrections_table.index]
+            unknown_pos = np.array(
+                [header.index(c) for c in unknown_cols], dtype=np.intp)
+            mapping = header
+
+        block = df[mapping].to_numpy(dtype=float)
+        counts = scatter_count_columns(
+            block, src, dst, len(table.groups), sparse)
+        corrections = None
+        if corrections_table is not None:
+            corrections = scatter_count_columns(
+                block, corr_src, corr_dst, len(corrections_table.groups), sparse)
+
+        unknown: Dict[str, int] = {}
+        if unknown_pos.size:
+            hits = np.count_nonzero(np.nan_to_num(block[:, unknown_pos]), axis=0)
+            unknown = {c: int(n) for c, n in zip(unknown_cols, hits) if n}
+
+        yield GroupCountChunk(
+            ids=df[id_column].tolist() if id_column in df.columns else None,
+            counts=counts,
+            corrections=corrections,
+            atoms=df[atoms_column].to_numpy(dtype=float)
+            if atoms_column in df.columns else None,
+            unknown=unknown,
+        )
+
+
+# SECTION: long tables
+
+def read_long(
+    source: Any,
+    method: Literal['joback', 'zabransky_ruzicka'] = 'joback',
+    *,
+    chunk_size: Optional[int] = CHUNK_SIZE,
+    sparse: bool = False,
+    input_format: Optional[Literal['csv', 'parquet', 'dataframe']] = None,
+    molecule_column: str = 'molecule_id',
+    group_column: str = 'group',
+    count_column: str = 'count',
+) -> Iterator[GroupCountChunk]:
+    '''
+    Streams a long table of (molecule_id, group, count) rows as count matrices.
+
+    Parameters
+    ----------
+    source : Any
+        CSV / Parquet path, CSV text stream or DataFrame.
+    method : str, optional
+        'joback' or 'zabransky_ruzicka', by default 'joback'.
+    chunk_size : Optional[int], optional
+        Input rows per chunk, None for a single chunk, by default 100000.
+    sparse : bool, optional
+        Yield CSR matrices instead of dense arrays, by default False.
+    input_format : str, optional
+        'csv', 'parquet' or 'dataframe', by default guessed from the source.
+    molecule_column, group_column, count_column : str, optional
+        Column names, by default 'molecule_id', 'group' and 'count'.
+
+    Yields
+    ------
+    GroupCountChunk
+        ids (first-appearance order), counts, corrections (Zabransky-Ruzicka) and the number
+        of rows of each unknown group in the chunk; atoms is None.
+
+    Notes
+    -----
+    When streaming, the rows of one molecule must be contiguous (e.g. sorted by molecule);
+    the trailing molecule of each chunk is carried over to the next one. Repeated
+    (molecule, group) rows accumulate. Use chunk_size=None for unordered tables.
+    '''
+    table, corrections_table = _method_tables(method)
+    needed = [molecule_column, group_column, count_column]
+
+    def _build(df: pd.DataFrame) -> GroupCountChunk:
+        codes, ids = pd.factorize(df[molecule_column], sort=False)
+        groups = df[group_column].astype(str).to_numpy()
+        values = df[count_column].to_numpy(dtype=float)
+
+        counts, unknown = build_count_matrix_from_long(
+            codes, groups, values, len(ids), table, sparse)
+        corrections = None
+        if corrections_table is not None:
+            corrections, unknown_corr = build_count_matrix_from_long(
+                codes, groups, values, len(ids), corrections_table, sparse)
+            # NOTE: a name is unknown only if neither table has it
+            unknown = {k: n for k, n in unknown.items() if k in unknown_corr}
+
+        return GroupCountChunk(
+            ids=ids.tolist(),
+            counts=counts,
+            corrections=corrections,
+            atoms=None,
+            unknown=unknown,
+        )
+
+    carry: Optional[pd.DataFrame] = None
+    for df in iter_frames(source, input_format, chunk_size, columns=needed):
+        missing = [c for c in needed if c not in df.columns]
+        if missing:
+            raise ValueError(f"Long input is missing columns: {missing}")
+        if carry is not None:
+            df = pd.concat([carry, df], ignore_index=True)
+        if df.empty:
+            continue
+
+        # NOTE: the last molecule may continue in the next chunk
+        last = df[molecule_column].iloc[-1]
+        tail = (df[molecule_column] == last).to_numpy()
+        carry = df[tail]
+        head = df[~tail]
+        if not head.empty:
+            yield _build(head)
+
+    if carry is not None and not carry.empty:
+        yield _build(carry)
+
+
+# SECTION: whole tables
+
+def load_group_counts(
+    source: Any,
+    method: Literal['joback', 'zabransky_ruzicka'] = 'joback',
+    layout: Literal['wide', 'long'] = 'wide',
+    *,
+    sparse: bool = False,
+    chunk_size: Optional[int] = CHUNK_SIZE,
+    **options: Any,
+) -> GroupCountChunk:
+    '''
+    Reads a whole wide or long table into one set of count matrices and reports unknown groups in bulk.
+
+    Parameters
+    ----------
+    source : Any
+        CSV / Parquet path, CSV text stream or DataFrame.
+    method : str, optional
+        'joback' or 'zabransky_ruzicka', by default 'joback'.
+    layout : str, optional
+        'wide' (one column per group) or 'long' (molecule_id, group, count), by default 'wide'.
+    sparse : bool, optional
+        Return CSR matrices instead of dense arrays, by default False.
+    chunk_size : Optional[int], optional
+        Rows per streamed chunk, by default 100000.
+    **options : Any
+        Options of `read_wide` or `read_long` (input_format, column names).
+
+    Returns
+    -------
+    GroupCountChunk
+        Stacked ids, counts, corrections and atoms, and the total count of every unknown group.
+    '''
+    if layout not in ('wide', 'long'):
+        raise ValueError(f"Unknown layout '{layout}'.")
+    reader = read_wide if layout == 'wide' else read_long
+
+    chunks = list(reader(source, method, chunk_size=chunk_size,
+                         sparse=sparse, **options))
+    table, corrections_table = _method_tables(method)
+
+    def _stack(blocks: List[Any], n_cols: int) -> Any:
+        if not blocks:
+            return scatter_count_columns(
+                np.zeros((0, 0)), np.zeros(0, dtype=np.intp),
+                np.zeros(0, dtype=np.intp), n_cols, sparse)
+        if sparse:
+            return vstack(blocks, format='csr')
+        return np.concatenate(blocks, axis=0)
+
+    unknown: Dict[str, int] = {}
+    for c in chunks:
+        _merge_unknown(unknown, c['unknown'])
+    if unknown:
+        logger.warning(
+            f"Ignored {len(unknown)} unknown group(s): "
+            + ", ".join(f"{k} ({n})" for k, n in sorted(unknown.items())))
+
+    ids = None
+    if chunks and all(c['ids'] is not None for c in chunks):
+        ids = [i for c in chunks for i in c['ids']]
+    atoms = None
+    if chunks and all(c['atoms'] is not None for c in chunks):
+        atoms = np.concatenate([c['atoms'] for c in chunks])
+
+    return GroupCountChunk(
+        ids=ids,
+        counts=_stack([c['counts'] for c in chunks], len(table.groups)),
+        corrections=_stack([c['corrections'] for c in chunks],
+                           len(corrections_table.groups))
+        if corrections_table is not None else None,
+        atoms=atoms,
+        unknown=unknown,
+    )
@@ -0,0 +1,585 @@
+# import libs
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+import numpy as np
+from scipy.sparse import issparse
+# locals
+from .configs import __version__
+from .models import GroupTable
+from .core import Antoine, JobackBatch, ZabranskyRuzickaBatch
+from .core.batch import split_rows, batch_dtype
+from .core.tables import load_joback_table, load_zabransky_ruzicka_tables
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: checkpoint layout and format version
+MANIFEST_FILE = 'manifest.json'
+PROGRESS_FILE = 'progress.jsonl'
+CHUNK_DIR = 'chunks'
+FORMAT_VERSION = 1
+
+# NOTE: default rows per checkpointed chunk
+CHUNK_SIZE = 65536
+
+# NOTE: manifest fields that must match to resume
+_RESUME_FIELDS = ('format_version', 'method', 'n_rows', 'chunk_size', 'store',
+                  'inputs', 'table_hash', 'options_hash')
+
+
+class CheckpointMismatch(Exception):
+    '''
+    Raised when a checkpoint directory was written for other inputs, tables or options.
+    '''
+
+    def __init__(self, path: str | Path, fields: List[str]):
+        self.path = str(path)
+        self.fields = fields
+        super().__init__(
+            f"Checkpoint {self.path} does not match this job!, changed: {', '.join(fields)}")
+
+
+# SECTION: hashing
+
+def _update_hash(h: Any, value: Any) -> None:
+    '''
+    Feeds dtype, shape and raw bytes of an input value into a hash.
+    '''
+    if issparse(value):
+        value = value.tocsr()
+        h.update(f"csr{value.shape}".encode())
+        for part in (value.data, value.indices, value.indptr):
+            _update_hash(h, part)
+    elif isinstance(value, np.ndarray):
+        h.update(f"{value.dtype.str}{value.shape}".encode())
+        h.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (list, tuple)):
+        h.update(f"[{len(value)}".encode())
+        for item in value:
+            _update_hash(h, item if isinstance(item, (list, tuple)) else np.asarray(item))
+    else:
+        _update_hash(h, np.asarray(value))
+
+
+def hash_inputs(chunk: Dict[str, Any]) -> str:
+    '''
+    Returns a digest of one chunk of job inputs.
+
+    Parameters
+    ----------
+    chunk : Dict[str, Any]
+        Input name to array, CSR matrix or sequence of arrays.
+
+    Returns
+    -------
+    str
+        128-bit BLAKE2b hex digest over names, dtypes, shapes and bytes.
+    '''
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(chunk):
+        h.update(name.encode())
+        _update_hash(h, chunk[name])
+    return h.hexdigest()
+
+
+def hash_tables(*tables: GroupTable) -> str:
+    '''
+    Returns a digest of group contribution tables.
+
+    Parameters
+    ----------
+    *tables : GroupTable
+        Tables as loaded by `load_joback_table` or `load_zabransky_ruzicka_tables`.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest over group names, column names and values.
+    '''
+    h = hashlib.sha256()
+    for table in tables:
+        h.update(json.dumps([list(table.groups), list(table.columns)]).encode())
+        h.update(np.ascontiguousarray(table.values, dtype=float).data)
+    return h.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    '''
+    Makes dtypes, paths and arrays in job options JSON serializable.
+    '''
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (np.generic,)):
+        return value.item()
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    try:
+        return np.dtype(value).name
+    except TypeError:
+        return repr(value)
+
+
+def _canonical_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    '''
+    Round-trips job options through JSON, so they hash and store the same way.
+    '''
+    return json.loads(json.dumps(options, sort_keys=True, default=_json_default))
+
+
+# SECTION: methods
+
+def _joback_method(
+    options: Dict[str, Any],
+) -> Tuple[Callable[[Dict[str, Any]], Dict[str, np.ndarray]], Tuple[str, ...], str]:
+    '''
+    Chunk evaluator of `JobackBatch.calc`; inputs 'counts' and 'total_atoms_number', options 'table_path', 'properties', 'dtype'.
+    '''
+    table = load_joback_table(options.get('table_path'))
+    properties = options.get('properties')
+    dtype = batch_dtype(options.get('dtype', np.float64))
+
+    def evaluate(chunk: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        return JobackBatch.calc(
+            chunk['counts'], chunk['total_atoms_number'], table, properties, dtype)
+
+    return evaluate, ('counts', 'total_atoms_number'), hash_tables(table)
+
+
+def _zabransky_ruzicka_method(
+    options: Dict[str, Any],
+) -> Tuple[Callable[[Dict[str, Any]], Dict[str, np.ndarray]], Tuple[str, ...], str]:
+    '''
+    Chunk evaluator of `ZabranskyRuzickaBatch.calc`; inputs 'counts' and optional 'corrections', options 'table_paths', 'dtype'.
+    '''
+    table_paths = options.get('table_paths')
+    tables = load_zabransky_ruzicka_tables(tuple(table_paths) if table_paths else None)
+    dtype = batch_dtype(options.get('dtype', np.float64))
+
+    def evaluate(chunk: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        return ZabranskyRuzickaBatch.calc(
+            chunk['counts'], chunk.get('corrections'), tables, dtype)
+
+    return evaluate, ('counts',), hash_tables(*tables)
+
+
+def _antoine_method(
+    options: Dict[str, Any],
+) -> Tuple[Callable[[Dict[str, Any]], Dict[str, np.ndarray]], Tuple[str, ...], str]:
+    '''
+    Chunk evaluator of `Antoine.fit_antoine_batch`; input 'datasets' of (T, P) pairs, options forwarded as keywords.
+    '''
+    def evaluate(chunk: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        return Antoine.fit_antoine_batch(chunk['datasets'], **options)
+
+    return evaluate, ('datasets',), ''
+
+
+# NOTE: method name: setup(options) -> (evaluate(chunk), required inputs, table hash)
+JOB_METHODS: Dict[str, Callable[..., Tuple[Callable[[Dict[str, Any]], Dict[str, np.ndarray]], Tuple[str, ...], str]]] = {
+    'joback': _joback_method,
+    'zabransky_ruzicka': _zabransky_ruzicka_method,
+    'antoine': _antoine_method,
+}
+
+
+# SECTION: checkpoint files
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    '''
+    Writes JSON to a temporary file and renames it over `path`.
+    '''
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _read_progress(path: Path) -> Dict[int, Dict[str, Any]]:
+    '''
+    Reads the completed chunk records; a torn last line from a crash is ignored.
+    '''
+    records: Dict[int, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[int(record['chunk'])] = record
+    return records
+
+
+def _repair_progress(path: Path) -> None:
+    '''
+    Truncates a torn last line, so the next record starts on a line of its own.
+    '''
+    if not path.exists():
+        return
+    with open(path, 'rb+') as f:
+        data = f.read()
+        if data and not data.endswith(b'\n'):
+            f.truncate(data.rfind(b'\n') + 1)
+
+
+def _chunk_file(chunk: int) -> str:
+    return f"{CHUNK_DIR}/part-{chunk:06d}.parquet"
+
+
+def _import_pyarrow():
+    '''
+    Imports pyarrow, which is an optional dependency.
+    '''
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "The parquet job store requires pyarrow (pip install pyThermoEst[parquet]).")
+    return pa, pq
+
+
+def _take(value: Any, rows: slice) -> Any:
+    '''
+    Rows of one input: arrays and CSR matrices are sliced, other sequences become lists.
+    '''
+    if value is None:
+        return None
+    if issparse(value) or isinstance(value, np.ndarray):
+        return value[rows]
+    return list(value[rows])
+
+
+def _clear(out_dir: Path, manifest: Dict[str, Any]) -> None:
+    '''
+    Removes the results and progress of a previous job.
+    '''
+    for column in manifest.get('columns', {}).values():
+        if 'file' in column:
+            (out_dir / column['file']).unlink(missing_ok=True)
+    shutil.rmtree(out_dir / CHUNK_DIR, ignore_errors=True)
+    (out_dir / PROGRESS_FILE).unlink(missing_ok=True)
+    (out_dir / MANIFEST_FILE).unlink(missing_ok=True)
+
+
+# SECTION: runner
+
+def run_job(
+    out_dir: str | Path,
+    method: str | Callable[[Dict[str, Any]], Dict[str, np.ndarray]],
+    inputs: Dict[str, Any],
+    options: Optional[Dict[str, Any]] = None,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    store: Literal['npy', 'parquet'] = 'npy',
+    verify: bool = True,
+    overwrite: bool = False,
+    max_chunks: Optional[int] = None,
+) -> "JobStore":
+    '''
+    Runs a batch estimation in numbered, checkpointed chunks, resuming a previous run in `out_dir`.
+
+    Parameters
+    ----------
+    out_dir : str | Path
+        Checkpoint directory; created if missing.
+    method : str | Callable[[Dict[str, Any]], Dict[str, np.ndarray]]
+        'joback' (inputs 'counts', 'total_atoms_number'), 'zabransky_ruzicka' (inputs 'counts', optional 'corrections'), 'antoine' (input 'datasets'), or a function mapping a chunk of inputs to equal-length output arrays.
+    inputs : Dict[str, Any]
+        Input name to array, CSR matrix or sequence, all with one entry per row.
+    options : Dict[str, Any], optional
+        Method options, e.g. {'properties': [...], 'dtype': 'float32', 'table_path': ...} for Joback or the `Antoine.fit_antoine_batch` keywords, by default None.
+    chunk_size : int, optional
+        Rows per chunk, by default 65536.
+    store : str, optional
+        'npy' writes one memory-mapped array per output column, 'parquet' one file per chunk, by default 'npy'.
+    verify : bool, optional
+        Re-hash the inputs of completed chunks before resuming, by default True.
+    overwrite : bool, optional
+        Discard a checkpoint that does not match instead of raising, by default False.
+    max_chunks : int, optional
+        Process at most this many pending chunks in this call, by default None for all.
+
+    Returns
+    -------
+    JobStore
+        Reader of the checkpoint directory.
+
+    Notes
+    -----
+    A chunk counts as done only after its results are flushed (npy) or renamed into place (parquet) and its record, with the digest of its inputs, is appended and fsynced to `progress.jsonl`. A run killed at any point therefore redoes at most the chunk in flight. `manifest.json` holds the method, row count, chunk size, store, options digest and table digest, and a restart with any of them changed raises `CheckpointMismatch`. So does a completed chunk whose inputs changed, when `verify` is set.
+    '''
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if store not in ('npy', 'parquet'):
+        raise ValueError("store must be 'npy' or 'parquet'.")
+    if store == 'parquet':
+        _import_pyarrow()
+    options = _canonical_options(options or {})
+
+    # SECTION: method
+    if callable(method):
+        evaluate = method
+        method_name = f"{method.__module__}.{getattr(method, '__qualname__', method.__name__)}"
+        required: Tuple[str, ...] = ()
+        table_hash = ''
+    elif method in JOB_METHODS:
+        evaluate, required, table_hash = JOB_METHODS[method](options)
+        method_name = method
+    else:
+        raise ValueError(
+            f"Unknown job method '{method}'; choose from {list(JOB_METHODS)} or pass a function.")
+
+    # NOTE: inputs share the row count
+    missing = [name for name in required if inputs.get(name) is None]
+    if missing:
+        raise ValueError(f"Missing inputs for '{method_name}': {missing}.")
+    names = sorted(name for name, value in inputs.items() if value is not None)
+    if not names:
+        raise ValueError("No inputs.")
+    lengths = {name: inputs[name].shape[0] if hasattr(inputs[name], 'shape') else len(inputs[name])
+               for name in names}
+    n_rows = int(lengths[names[0]])
+    if any(n != n_rows for n in lengths.values()):
+        raise ValueError(f"All inputs must have the same number of rows, got {lengths}.")
+    chunks = split_rows(n_rows, chunk_size)
+
+    # SECTION: manifest
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest: Dict[str, Any] = {
+        'format_version': FORMAT_VERSION,
+        'pythermoest_version': __version__,
+        'method': method_name,
+        'n_rows': n_rows,
+        'chunk_size': int(chunk_size),
+        'n_chunks': len(chunks),
+        'store': store,
+        'inputs': names,
+        'options': options,
+        'options_hash': hashlib.sha256(json.dumps(options, sort_keys=True).encode()).hexdigest(),
+        'table_hash': table_hash,
+        'input_hash': None,
+        'columns': {},
+    }
+
+    manifest_path = out_dir / MANIFEST_FILE
+    progress_path = out_dir / PROGRESS_FILE
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        changed = [k for k in _RESUME_FIELDS if previous.get(k) != manifest[k]]
+        if changed and not overwrite:
+            raise CheckpointMismatch(out_dir, changed)
+        if changed:
+            logger.warning(f"Discarding checkpoint {out_dir}; changed: {changed}")
+            _clear(out_dir, previous)
+        else:
+            manifest['columns'] = previous.get('columns', {})
+    if not manifest_path.exists():
+        _write_json_atomic(manifest_path, manifest)
+
+    _repair_progress(progress_path)
+    done = _read_progress(progress_path)
+    if store == 'parquet':
+        # NOTE: a record without its file (e.g. a deleted part) is redone
+        done = {k: r for k, r in done.items() if (out_dir / _chunk_file(k)).exists()}
+
+    # SECTION: verify completed chunks
+    if verify and done:
+        for k in sorted(done):
+            rows = chunks[k]
+            digest = hash_inputs({name: _take(inputs[name], rows) for name in names})
+            if digest != done[k]['input_hash']:
+                if not overwrite:
+                    raise CheckpointMismatch(out_dir, [f"inputs of chunk {k}"])
+                logger.warning(f"Discarding checkpoint {out_dir}; inputs of chunk {k} changed.")
+                _clear(out_dir, manifest)
+                manifest['columns'] = {}
+                _write_json_atomic(manifest_path, manifest)
+                done = {}
+                break
+
+    pending = [k for k in range(len(chunks)) if k not in done]
+    if done:
+        logger.info(f"Resuming {out_dir}: {len(done)}/{len(chunks)} chunks done.")
+    if max_chunks is not None:
+        pending = pending[:max(int(max_chunks), 0)]
+
+    # SECTION: chunks
+    columns: Dict[str, np.ndarray] = {}
+    if store == 'parquet':
+        (out_dir / CHUNK_DIR).mkdir(exist_ok=True)
+    with open(progress_path, 'a', encoding='utf-8') as progress:
+        for k in pending:
+            rows = chunks[k]
+            start = time.perf_counter()
+            chunk = {name: _take(inputs[name], rows) for name in names}
+            digest = hash_inputs(chunk)
+            result = {
+                name: np.asarray(value) for name, value in evaluate(chunk).items()
+            }
+            n = rows.stop - rows.start
+            bad = [name for name, value in result.items() if value.shape[:1] != (n,)]
+            if bad:
+                raise ValueError(f"Outputs {bad} do not have one entry per row of chunk {k}.")
+
+            # NOTE: first result fixes the output columns
+            if not manifest['columns']:
+                if store == 'npy':
+                    manifest['columns'] = {
+                        name: {'file': f"{name}.npy", 'dtype': value.dtype.str,
+                               'shape': [n_rows, *value.shape[1:]]}
+                        for name, value in result.items()
+                    }
+                    for name, column in manifest['columns'].items():
+                        np.lib.format.open_memmap(
+                            out_dir / column['file'], mode='w+',
+                            dtype=np.dtype(column['dtype']), shape=tuple(column['shape'])).flush()
+                else:
+                    manifest['columns'] = {
+                        name: {'dtype': value.dtype.str} for name, value in result.items()}
+                _write_json_atomic(manifest_path, manifest)
+            if set(result) != set(manifest['columns']):
+                raise ValueError(
+                    f"Chunk {k} returned columns {sorted(result)}, expected {sorted(manifest['columns'])}.")
+
+            # SECTION: write the chunk, then record it
+            if store == 'npy':
+                for name, value in result.items():
+                    if name not in columns:
+                        columns[name] = np.load(
+                            out_dir / manifest['columns'][name]['file'], mmap_mode='r+')
+                    columns[name][rows] = value
+                    columns[name].flush()
+            else:
+                from .export import columns_to_arrow
+                _, pq = _import_pyarrow()
+                table = columns_to_arrow(
+                    {'row': np.arange(rows.start, rows.stop), **result},
+                    schema_metadata={'pythermoest.job': method_name, 'pythermoest.chunk': str(k)})
+                path = out_dir / _chunk_file(k)
+                tmp = path.with_name(path.name + '.tmp')
+                pq.write_table(table, tmp)
+                os.replace(tmp, path)
+
+            record = {'chunk': k, 'start': rows.start, 'stop': rows.stop,
+                      'input_hash': digest, 'seconds': round(time.perf_counter() - start, 6)}
+            progress.write(json.dumps(record) + '\n')
+            progress.flush()
+            os.fsync(progress.fileno())
+            done[k] = record
+            logger.debug(f"Job chunk {k + 1}/{len(chunks)} done in {record['seconds']:.2f} s.")
+    del columns
+
+    # NOTE: all chunks done, record the digest of the whole input
+    if len(done) == len(chunks) and manifest.get('input_hash') is None:
+        h = hashlib.blake2b(digest_size=16)
+        for k in range(len(chunks)):
+            h.update(done[k]['input_hash'].encode())
+        manifest['input_hash'] = h.hexdigest()
+        _write_json_atomic(manifest_path, manifest)
+
+    return JobStore(out_dir)
+
+
+# SECTION: reader
+
+class JobStore:
+    '''
+    Reader of a checkpoint directory written by `run_job`.
+    '''
+
+    def __init__(self, path: str | Path):
+        '''
+        Opens a checkpoint directory.
+
+        Parameters
+        ----------
+        path : str | Path
+            Directory that holds `manifest.json`.
+        '''
+        self.path = Path(path)
+        with open(self.path / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            self.manifest: Dict[str, Any] = json.load(f)
+        self.progress = _read_progress(self.path / PROGRESS_FILE)
+
+    def __repr__(self) -> str:
+        return (
+            f"JobStore(path={str(self.path)!r}, method={self.manifest['method']!r}, "
+            f"chunks={len(self.completed)}/{self.n_chunks})"
+        )
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.manifest['n_rows'])
+
+    @property
+    def n_chunks(self) -> int:
+        return int(self.manifest['n_chunks'])
+
+    @property
+    def completed(self) -> List[int]:
+        '''
+        Completed chunk numbers in ascending order.
+        '''
+        return sorted(self.progress)
+
+    @property
+    def pending(self) -> List[int]:
+        '''
+        Chunk numbers still to run.
+        '''
+        return [k for k in range(self.n_chunks) if k not in self.progress]
+
+    @property
+    def is_complete(self) -> bool:
+        return len(self.progress) == self.n_chunks
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.manifest['columns'])
+
+    def column(self, name: str) -> np.ndarray:
+        '''
+        Returns one output column over all rows.
+
+        Parameters
+        ----------
+        name : str
+            Output name, e.g. 'critical_temperature' or 'A'.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only memory map (npy store) or array (parquet store); rows of pending chunks are zero (npy) or NaN (parquet).
+        '''
+        if name not in self.manifest['columns']:
+            raise KeyError(f"Unknown column '{name}'; available: {self.columns}.")
+        column = self.manifest['columns'][name]
+        if self.manifest['store'] == 'npy':
+            return np.load(self.path / column['file'], mmap_mode='r')
+
+        _, pq = _import_pyarrow()
+        dtype = np.dtype(column['dtype'])
+        out = np.full(self.n_rows, np.nan) if dtype.kind == 'f' \
+            else np.zeros(self.n_rows, dtype=dtype)
+        for k in self.completed:
+            table = pq.read_table(self.path / _chunk_file(k), columns=['row', name])
+            out[table.column('row').to_numpy()] = table.column(name).to_numpy()
+        return out.astype(dtype, copy=False)
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        '''
+        Returns every output column keyed by name.
+        '''
+        return {name: self.column(name) for name in self.columns}
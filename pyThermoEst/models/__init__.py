@@ -8,6 +8,8 @@ from .jb import (
     JobackGroupContributions,
     JobackGroupData,
     JobackHeatCapacity,
+    JobackIdealGas,
+    JobackLiquidViscosity,
     JobackProp,
     JobackCalcProp
 )
@@ -15,7 +17,34 @@ from .jb import (
 from .zr import (
     ZabranskyRuzickaGroupContributions,
     ZabranskyRuzickaGroupContributionsCorrections,
-    ZabranskyRuzickaGroupData
+    ZabranskyRuzickaGroupData,
+    ZabranskyRuzickaHeatCapacity
+)
+# batch
+from .batch import (
+    GroupTable,
+    EstimatedBatchProp,
+    UncertaintyProp,
+    RegressionReport,
+    GroupCountChunk,
+    JobackHeatCapacityBatch,
+    JobackIdealGasBatch,
+    JobackLiquidViscosityBatch,
+    ZabranskyRuzickaHeatCapacityBatch,
+    AntoineVaporPressureBatch,
+    VaporPressureBand
+)
+# tabulation
+from .tabulation import GridSpec
+# timing
+from .timing import StageTiming
+# benchmarks
+from .bench import MemoryBudget, MemoryReport, BackendTiming
+# evaluators
+from .evaluators import (
+    JobackCpEvaluator,
+    JobackViscosityEvaluator,
+    ZabranskyRuzickaCpEvaluator
 )
 
 __all__ = [
@@ -25,8 +54,30 @@ __all__ = [
     "JobackCalcProp",
     "JobackGroupData",
     "JobackHeatCapacity",
+    "JobackIdealGas",
+    "JobackLiquidViscosity",
     "ZabranskyRuzickaGroupContributions",
     "ZabranskyRuzickaGroupContributionsCorrections",
     "ZabranskyRuzickaGroupData",
-    "EstimatedProp"
+    "ZabranskyRuzickaHeatCapacity",
+    "EstimatedProp",
+    "GroupTable",
+    "EstimatedBatchProp",
+    "UncertaintyProp",
+    "RegressionReport",
+    "GroupCountChunk",
+    "JobackHeatCapacityBatch",
+    "JobackIdealGasBatch",
+    "JobackLiquidViscosityBatch",
+    "ZabranskyRuzickaHeatCapacityBatch",
+    "AntoineVaporPressureBatch",
+    "VaporPressureBand",
+    "GridSpec",
+    "StageTiming",
+    "MemoryBudget",
+    "MemoryReport",
+    "BackendTiming",
+    "JobackCpEvaluator",
+    "JobackViscosityEvaluator",
+    "ZabranskyRuzickaCpEvaluator",
 ]
@@ -1,6 +1,6 @@
 # import libs
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 import numpy as np
 
 
@@ -18,6 +18,9 @@ class AntoineFitResult(BaseModel):
     rmse_logP: Optional[float] = None
     mae_logP: Optional[float] = None
     r2_logP: Optional[float] = None
+    rmse_lnP: Optional[float] = None
+    mae_lnP: Optional[float] = None
+    r2_lnP: Optional[float] = None
     rmse_P: Optional[float] = None
     mae_P: Optional[float] = None
     cov: Optional[Any] = None
@@ -26,6 +29,7 @@ class AntoineFitResult(BaseModel):
     Tmax_K: Optional[float] = None
     loss: Optional[Any] = None
     f_scale: Optional[float] = None
+    multistart: Optional[Dict[str, Any]] = None
 
     @field_validator("*", mode="before")
     def _convert_numpy_types(cls, v):
@@ -40,3 +44,37 @@ class AntoineFitResult(BaseModel):
         extra="allow",
         from_attributes=True,
     )
+
+
+class AntoineInterval(BaseModel):
+    estimate: Optional[float] = None
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+    std: Optional[float] = None
+
+
+class AntoineBootstrapResult(BaseModel):
+    method: str = "residual"
+    level: float = 0.95
+    n_boot: int = 0
+    n_success: int = 0
+    A: AntoineInterval = Field(default_factory=AntoineInterval)
+    B: AntoineInterval = Field(default_factory=AntoineInterval)
+    C: AntoineInterval = Field(default_factory=AntoineInterval)
+    temperatures: List[float] = Field(default_factory=list)
+    Psat: List[AntoineInterval] = Field(default_factory=list)
+    p_unit: str = "Pa"
+    samples: Optional[Any] = None
+
+    @field_validator("*", mode="before")
+    def _convert_numpy_types(cls, v):
+        if isinstance(v, (np.floating, np.integer)):
+            return v.item()
+        if isinstance(v, np.ndarray):
+            return v.tolist()
+        return v
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra="allow",
+    )
@@ -0,0 +1,412 @@
+# import libs
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Callable
+from statistics import NormalDist
+import numpy as np
+from pydantic import BaseModel, Field, ConfigDict
+
+# SECTION: Shared tables
+
+
+class GroupTable(BaseModel):
+    """A read-only group contribution table shared by the batch kernels."""
+    groups: Tuple[str, ...] = Field(
+        ...,
+        description="Group identifiers in table row order."
+    )
+    columns: Tuple[str, ...] = Field(
+        ...,
+        description="Numeric column names in table column order."
+    )
+    values: np.ndarray = Field(
+        ...,
+        description="Read-only (groups × columns) contribution matrix."
+    )
+    index: Dict[str, int] = Field(
+        ...,
+        description="Row index keyed by group alias and model field name."
+    )
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return a contribution column by name.
+        """
+        return self.values[:, self.columns.index(name)]
+
+
+# SECTION: Batch results
+
+
+class EstimatedBatchProp(TypedDict):
+    value: np.ndarray | Callable[..., np.ndarray] | None
+    unit: str
+    symbol: str
+
+
+class RegressionReport(TypedDict):
+    columns: Tuple[str, ...]
+    n_observations: int
+    n_groups: int
+    rmse_before: float
+    rmse_after: float
+    success: bool
+    message: str
+
+
+class GroupCountChunk(TypedDict):
+    ids: Optional[List[Any]]
+    counts: Any
+    corrections: Any
+    atoms: Optional[np.ndarray]
+    unknown: Dict[str, int]
+
+
+class UncertaintyProp(TypedDict):
+    mean: float
+    std: float
+    percentiles: Dict[str, float]
+    n_samples: int
+    unit: str
+    symbol: str
+
+
+class JobackHeatCapacityBatch(BaseModel):
+    a: np.ndarray = Field(..., description="Cp correlation parameters a")
+    b: np.ndarray = Field(..., description="Cp correlation parameters b")
+    c: np.ndarray = Field(..., description="Cp correlation parameters c")
+    d: np.ndarray = Field(..., description="Cp correlation parameters d")
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def __call__(self, T: float | np.ndarray) -> np.ndarray:
+        """
+        Evaluate Cp (J/mol·K) for every molecule at temperature T (K).
+
+        A scalar T returns an (N,) array, an array of temperatures returns an (N, *T.shape) array.
+        """
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        return (
+            (self.a.reshape(shape) - 37.93) +
+            (self.b.reshape(shape) + 0.210) * T +
+            (self.c.reshape(shape) - 3.91e-4) * T**2 +
+            (self.d.reshape(shape) + 2.06e-7) * T**3
+        )
+
+
+    def _broadcast(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, Tuple[int, ...]]:
+        """
+        Broadcast a temperature pair and return the coefficient reshape.
+        """
+        T1, T2 = np.broadcast_arrays(
+            np.asarray(T1, dtype=float), np.asarray(T2, dtype=float))
+        return T1, T2, (-1,) + (1,) * T1.ndim
+
+    def enthalpy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        Closed-form ΔH = ∫Cp dT (J/mol) of every molecule from T1 to T2 (K).
+
+        T1 and T2 broadcast together to shape S; the result has shape (N, *S).
+        """
+        T1, T2, shape = self._broadcast(T1, T2)
+        return (
+            (self.a.reshape(shape) - 37.93) * (T2 - T1) +
+            (self.b.reshape(shape) + 0.210) * ((T2**2 - T1**2) / 2) +
+            (self.c.reshape(shape) - 3.91e-4) * ((T2**3 - T1**3) / 3) +
+            (self.d.reshape(shape) + 2.06e-7) * ((T2**4 - T1**4) / 4)
+        )
+
+    def entropy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        Closed-form ΔS = ∫Cp/T dT (J/mol·K) of every molecule from T1 to T2 (K).
+
+        T1 and T2 broadcast together to shape S; the result has shape (N, *S).
+        """
+        T1, T2, shape = self._broadcast(T1, T2)
+        return (
+            (self.a.reshape(shape) - 37.93) * np.log(T2 / T1) +
+            (self.b.reshape(shape) + 0.210) * (T2 - T1) +
+            (self.c.reshape(shape) - 3.91e-4) * ((T2**2 - T1**2) / 2) +
+            (self.d.reshape(shape) + 2.06e-7) * ((T2**3 - T1**3) / 3)
+        )
+
+
+class JobackLiquidViscosityBatch(BaseModel):
+    eta_a: np.ndarray = Field(..., description="Sums of group ηa contributions")
+    eta_b: np.ndarray = Field(..., description="Sums of group ηb contributions")
+    molecular_weight: np.ndarray = Field(..., description="Molecular weights (g/mol)")
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def __call__(
+        self,
+        T: float | np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Evaluate liquid viscosity (Pa·s) for every molecule at temperature T (K).
+
+        A scalar T returns an (N,) array, an array of temperatures returns an (N, *T.shape) array.
+        The result is computed in place in `out` when given (float64, same shape), so repeated grid evaluations reuse one buffer.
+        """
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        full = (self.eta_a.shape[0],) + T.shape
+        if out is None:
+            out = np.empty(full)
+        elif out.shape != full:
+            raise ValueError(f"out must have shape {full}.")
+
+        # NOTE: MW exp((ηa - 597.82)/T + ηb - 11.202)
+        np.divide(self.eta_a.reshape(shape) - 597.82, T, out=out)
+        out += self.eta_b.reshape(shape) - 11.202
+        np.exp(out, out=out)
+        out *= self.molecular_weight.reshape(shape)
+        return out
+
+
+class JobackIdealGasBatch(BaseModel):
+    """
+    Ideal-gas H, S and G of every molecule at 1 bar, referenced to the standard formation properties at T_ref.
+
+    See `JobackIdealGas` for the reference state; results have shape (N, *T.shape).
+    """
+    heat_capacity: JobackHeatCapacityBatch = Field(
+        ..., description="Vectorized ideal-gas heat capacity correlation")
+    EnFo_IG: np.ndarray = Field(
+        ..., description="Standard enthalpies of formation in ideal gas (kJ/mol)")
+    GiEnFo_IG: np.ndarray = Field(
+        ..., description="Standard Gibbs energies of formation in ideal gas (kJ/mol)")
+    T_ref: float = Field(
+        298.15, description="Reference temperature (K)")
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def enthalpy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        ΔH (J/mol) of every molecule from T1 to T2 (K).
+        """
+        return self.heat_capacity.enthalpy_change(T1, T2)
+
+    def entropy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        ΔS (J/mol·K) of every molecule from T1 to T2 (K).
+        """
+        return self.heat_capacity.entropy_change(T1, T2)
+
+    def enthalpy(self, T: float | np.ndarray) -> np.ndarray:
+        """
+        Ideal-gas enthalpy H(T) (J/mol) of every molecule.
+        """
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        return 1e3 * self.EnFo_IG.reshape(shape) + self.enthalpy_change(self.T_ref, T)
+
+    def entropy(self, T: float | np.ndarray) -> np.ndarray:
+        """
+        Ideal-gas entropy S(T) (J/mol·K) of every molecule.
+        """
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        S_ref = 1e3 * (self.EnFo_IG - self.GiEnFo_IG) / self.T_ref
+        return S_ref.reshape(shape) + self.entropy_change(self.T_ref, T)
+
+    def gibbs_energy(self, T: float | np.ndarray) -> np.ndarray:
+        """
+        Ideal-gas Gibbs energy G(T) = H(T) - T S(T) (J/mol) of every molecule.
+        """
+        T = np.asarray(T, dtype=float)
+        return self.enthalpy(T) - T * self.entropy(T)
+
+
+class ZabranskyRuzickaHeatCapacityBatch(BaseModel):
+    A: np.ndarray = Field(..., description="Aggregated a_i contributions")
+    B: np.ndarray = Field(..., description="Aggregated b_i contributions")
+    D: np.ndarray = Field(..., description="Aggregated d_i contributions")
+    Tmin: Optional[np.ndarray] = Field(
+        None, description="Lower bound of the validity window (K)")
+    Tmax: Optional[np.ndarray] = Field(
+        None, description="Upper bound of the validity window (K)")
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def __call__(
+        self,
+        T: float | np.ndarray,
+        out_of_range: Literal['extrapolate', 'nan'] = 'extrapolate'
+    ) -> np.ndarray:
+        """
+        Evaluate liquid Cp (J/mol·K) for every molecule at temperature T (K).
+
+        A scalar T returns an (N,) array, an array of temperatures returns an (N, *T.shape) array.
+        With out_of_range='nan', points outside each molecule's validity window are NaN.
+        """
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        theta = T / 100
+        Cp = 8.314472 * (
+            self.A.reshape(shape) +
+            self.B.reshape(shape) * theta +
+            self.D.reshape(shape) * theta**2
+        )
+        if out_of_range == 'nan':
+            Cp[~self.in_range(T)] = np.nan
+        return Cp
+
+    def in_range(self, T: float | np.ndarray) -> np.ndarray:
+        """
+        Boolean mask of shape (N, *T.shape), True where T (K) lies in the molecule's validity window.
+        """
+        if self.Tmin is None or self.Tmax is None:
+            raise ValueError("Validity window is not available.")
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        return (T >= self.Tmin.reshape(shape)) & (T <= self.Tmax.reshape(shape))
+
+    def enthalpy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        Closed-form liquid ΔH = ∫Cp dT (J/mol) of every molecule from T1 to T2 (K).
+
+        T1 and T2 broadcast together to shape S; the result has shape (N, *S).
+        """
+        T1, T2 = np.broadcast_arrays(
+            np.asarray(T1, dtype=float), np.asarray(T2, dtype=float))
+        shape = (-1,) + (1,) * T1.ndim
+        return 8.314472 * (
+            self.A.reshape(shape) * (T2 - T1) +
+            self.B.reshape(shape) * ((T2**2 - T1**2) / 200) +
+            self.D.reshape(shape) * ((T2**3 - T1**3) / 3e4)
+        )
+
+    def entropy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        Closed-form liquid ΔS = ∫Cp/T dT (J/mol·K) of every molecule from T1 to T2 (K).
+
+        T1 and T2 broadcast together to shape S; the result has shape (N, *S).
+        """
+        T1, T2 = np.broadcast_arrays(
+            np.asarray(T1, dtype=float), np.asarray(T2, dtype=float))
+        shape = (-1,) + (1,) * T1.ndim
+        return 8.314472 * (
+            self.A.reshape(shape) * np.log(T2 / T1) +
+            self.B.reshape(shape) * ((T2 - T1) / 100) +
+            self.D.reshape(shape) * ((T2**2 - T1**2) / 2e4)
+        )
+
+    def H_LIQ(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        Alias of `enthalpy_change`.
+        """
+        return self.enthalpy_change(T1, T2)
+
+    def S_LIQ(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        Alias of `entropy_change`.
+        """
+        return self.entropy_change(T1, T2)
+
+
+class VaporPressureBand(TypedDict):
+    T: np.ndarray
+    Psat: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    level: float
+    unit: str
+
+
+class AntoineVaporPressureBatch(BaseModel):
+    A: np.ndarray = Field(..., description="Antoine coefficients A")
+    B: np.ndarray = Field(..., description="Antoine coefficients B")
+    C: np.ndarray = Field(..., description="Antoine coefficients C")
+    base: Literal['log10', 'ln'] = Field(
+        'log10', description="Logarithm base of the Antoine equation")
+    cov: Optional[np.ndarray] = Field(
+        None, description="Covariance matrices of (A, B, C), shape (N, 3, 3)")
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def __call__(self, T: float | np.ndarray) -> np.ndarray:
+        """
+        Evaluate the vapor pressure (Pa) of every compound at temperature T (K).
+
+        A scalar T returns an (N,) array, an array of temperatures returns an (N, *T.shape) array.
+        """
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        log_P = self.A.reshape(shape) - self.B.reshape(shape) / \
+            (T + self.C.reshape(shape))
+        return 10.0**log_P if self.base == 'log10' else np.exp(log_P)
+
+    def band(
+        self,
+        T: float | np.ndarray,
+        level: float = 0.95,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Delta-method confidence band of the vapor pressure (Pa) at temperature T (K).
+
+        The variance of log P is the quadratic form g·cov·g with g = (1, -1/(T+C), B/(T+C)^2), evaluated for every compound and temperature at once; the symmetric log band maps to a positive, asymmetric band in P. Compounds without a covariance get NaN bands.
+
+        Returns (Psat, lower, upper), each of shape (N, *T.shape).
+        """
+        if not 0.0 < level < 1.0:
+            raise ValueError("level must be in (0, 1).")
+        if self.cov is None:
+            raise ValueError("cov is required for a confidence band.")
+
+        T = np.asarray(T, dtype=float)
+        shape = (-1,) + (1,) * T.ndim
+        B = self.B.reshape(shape)
+        inv = 1.0 / (T + self.C.reshape(shape))
+        log_P = self.A.reshape(shape) - B * inv
+
+        # NOTE: gradient of log P, (N, *T.shape, 3)
+        g = np.stack(np.broadcast_arrays(
+            np.ones_like(inv), -inv, B * inv**2), axis=-1)
+        cov = self.cov.reshape(-1, *(1,) * T.ndim, 3, 3)
+        var = np.einsum('...i,...ij,...j->...', g, cov, g)
+
+        z = NormalDist().inv_cdf(0.5 + 0.5 * level)
+        half = z * np.sqrt(np.clip(var, 0.0, None))
+
+        if self.base == 'log10':
+            return 10.0**log_P, 10.0**(log_P - half), 10.0**(log_P + half)
+        return np.exp(log_P), np.exp(log_P - half), np.exp(log_P + half)
@@ -0,0 +1,39 @@
+# import libs
+from typing import List, Optional, TypedDict
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class MemoryBudget(BaseModel):
+    """Memory limits of one benchmark scenario; unset limits are not checked."""
+    peak_bytes_per_row: Optional[float] = Field(
+        None, gt=0, description="Largest allowed traced peak per row")
+    steady_bytes_per_row: Optional[float] = Field(
+        None, gt=0, description="Largest allowed memory retained by the result per row")
+    peak_rss_bytes: Optional[float] = Field(
+        None, gt=0, description="Largest allowed process RSS growth over the run")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class MemoryReport(TypedDict):
+    name: str
+    rows: int
+    traced: bool
+    seconds: float
+    peak_bytes: int
+    steady_bytes: int
+    peak_bytes_per_row: float
+    steady_bytes_per_row: float
+    rss_before_bytes: Optional[int]
+    peak_rss_bytes: Optional[int]
+    passed: bool
+    violations: List[str]
+
+
+class BackendTiming(TypedDict):
+    name: str
+    rows: int
+    numpy_seconds: float
+    numba_seconds: Optional[float]
+    speedup: Optional[float]
+    max_abs_diff: Optional[float]
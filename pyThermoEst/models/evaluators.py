@@ -0,0 +1,121 @@
+# import libs
+from math import exp
+from typing import Any, Tuple
+import numpy as np
+
+
+class _CoefficientEvaluator:
+    """
+    Immutable T -> value function defined only by its coefficients.
+
+    Instances hold no tables, pickle as (class, coefficients) and are callable on scalars (returning float) and arrays (returning np.ndarray).
+    """
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self):
+        return (type(self), self.coefficients)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.coefficients == other.coefficients
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__,) + self.coefficients)
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={getattr(self, k)!r}" for k in self._fields)
+        return f"{type(self).__name__}({args})"
+
+    @property
+    def coefficients(self) -> Tuple[float, ...]:
+        """
+        Coefficients in constructor order.
+        """
+        return tuple(getattr(self, k) for k in self._fields)
+
+
+class JobackCpEvaluator(_CoefficientEvaluator):
+    """
+    Joback ideal-gas heat capacity in J/mol·K:
+
+        Cp_IG = (a - 37.93) + (b + 0.210) T + (c - 3.91e-4) T^2 + (d + 2.06e-7) T^3,  T in K
+    """
+    __slots__ = ('a', 'b', 'c', 'd')
+    _fields = ('a', 'b', 'c', 'd')
+
+    def __init__(self, a: float, b: float, c: float, d: float):
+        object.__setattr__(self, 'a', float(a))
+        object.__setattr__(self, 'b', float(b))
+        object.__setattr__(self, 'c', float(c))
+        object.__setattr__(self, 'd', float(d))
+
+    def __call__(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Evaluate Cp at temperature T (K).
+        """
+        if not isinstance(T, (int, float)):
+            T = np.asarray(T, dtype=float)
+        return (
+            (self.a - 37.93) +
+            (self.b + 0.210) * T +
+            (self.c - 3.91e-4) * T**2 +
+            (self.d + 2.06e-7) * T**3
+        )
+
+
+class JobackViscosityEvaluator(_CoefficientEvaluator):
+    """
+    Joback liquid viscosity in Pa·s:
+
+        eta_L = MW exp((eta_a - 597.82) / T + eta_b - 11.202),  T in K
+    """
+    __slots__ = ('eta_a', 'eta_b', 'molecular_weight')
+    _fields = ('eta_a', 'eta_b', 'molecular_weight')
+
+    def __init__(self, eta_a: float, eta_b: float, molecular_weight: float):
+        object.__setattr__(self, 'eta_a', float(eta_a))
+        object.__setattr__(self, 'eta_b', float(eta_b))
+        object.__setattr__(self, 'molecular_weight', float(molecular_weight))
+
+    def __call__(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Evaluate liquid viscosity (Pa·s) at temperature T (K).
+        """
+        if isinstance(T, (int, float)):
+            return self.molecular_weight * exp(
+                (self.eta_a - 597.82) / T + self.eta_b - 11.202)
+        return self.molecular_weight * np.exp(
+            (self.eta_a - 597.82) / np.asarray(T, dtype=float) + self.eta_b - 11.202
+        )
+
+
+class ZabranskyRuzickaCpEvaluator(_CoefficientEvaluator):
+    """
+    Zabransky-Ruzicka liquid heat capacity in J/mol·K:
+
+        Cp_LIQ = 8.314472 (A + B θ + D θ^2),  θ = T / 100 K
+    """
+    __slots__ = ('A', 'B', 'D')
+    _fields = ('A', 'B', 'D')
+
+    def __init__(self, A: float, B: float, D: float):
+        object.__setattr__(self, 'A', float(A))
+        object.__setattr__(self, 'B', float(B))
+        object.__setattr__(self, 'D', float(D))
+
+    def __call__(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Evaluate liquid Cp (J/mol·K) at temperature T (K).
+        """
+        if not isinstance(T, (int, float)):
+            T = np.asarray(T, dtype=float)
+        theta = T / 100
+        return 8.314472 * (self.A + self.B * theta + self.D * theta**2)
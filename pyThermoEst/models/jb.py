@@ -1,9 +1,11 @@
 # import libs
 from typing import Optional, Dict, TypedDict, Callable
+import numpy as np
 from pydantic import BaseModel, Field, ConfigDict
 
 # local
 from .ref import GroupUnit
+from .evaluators import JobackCpEvaluator, JobackViscosityEvaluator
 
 # SECTION: Joback Group Contributions
 
@@ -379,6 +381,137 @@ class JobackHeatCapacity(BaseModel):
         """
         return self(T)
 
+    def to_evaluator(self) -> JobackCpEvaluator:
+        """
+        Return the coefficients-only, picklable Cp(T) function.
+        """
+        return JobackCpEvaluator(a=self.a, b=self.b, c=self.c, d=self.d)
+
+    def enthalpy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        Closed-form ΔH = ∫Cp dT (J/mol) from T1 to T2 (K); arrays broadcast.
+        """
+        T1 = np.asarray(T1, dtype=float)
+        T2 = np.asarray(T2, dtype=float)
+        return (
+            (self.a - 37.93) * (T2 - T1) +
+            (self.b + 0.210) * (T2**2 - T1**2) / 2 +
+            (self.c - 3.91e-4) * (T2**3 - T1**3) / 3 +
+            (self.d + 2.06e-7) * (T2**4 - T1**4) / 4
+        )
+
+    def entropy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        Closed-form ΔS = ∫Cp/T dT (J/mol·K) from T1 to T2 (K); arrays broadcast.
+        """
+        T1 = np.asarray(T1, dtype=float)
+        T2 = np.asarray(T2, dtype=float)
+        return (
+            (self.a - 37.93) * np.log(T2 / T1) +
+            (self.b + 0.210) * (T2 - T1) +
+            (self.c - 3.91e-4) * (T2**2 - T1**2) / 2 +
+            (self.d + 2.06e-7) * (T2**3 - T1**3) / 3
+        )
+
+
+class JobackLiquidViscosity(BaseModel):
+    eta_a: float = Field(..., description="Sum of group ηa contributions")
+    eta_b: float = Field(..., description="Sum of group ηb contributions")
+    molecular_weight: float = Field(..., description="Molecular weight (g/mol)")
+
+    model_config = ConfigDict(frozen=True)
+
+    def __call__(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Evaluate liquid viscosity (Pa·s) at temperature T (K).
+        """
+        return self.molecular_weight * np.exp(
+            (self.eta_a - 597.82) / np.asarray(T, dtype=float) + self.eta_b - 11.202
+        )
+
+    def eta_L(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Alias method if you prefer eta_L(T) instead of obj(T).
+        """
+        return self(T)
+
+    def to_evaluator(self) -> JobackViscosityEvaluator:
+        """
+        Return the coefficients-only, picklable eta_L(T) function.
+        """
+        return JobackViscosityEvaluator(
+            eta_a=self.eta_a, eta_b=self.eta_b, molecular_weight=self.molecular_weight)
+
+
+class JobackIdealGas(BaseModel):
+    """
+    Ideal-gas H, S and G of one molecule at 1 bar, referenced to the standard formation properties at T_ref.
+
+    - H(T) = ΔHf°(T_ref) + ∫Cp dT
+    - S(T) = (ΔHf° - ΔGf°)/T_ref + ∫Cp/T dT
+    - G(T) = H(T) - T S(T), so G(T_ref) = ΔGf°
+
+    Heat capacities of the elements are not included, so G(T) is not the Gibbs energy of formation at T.
+    """
+    heat_capacity: JobackHeatCapacity = Field(
+        ..., description="Ideal-gas heat capacity correlation")
+    EnFo_IG: float = Field(
+        ..., description="Standard enthalpy of formation in ideal gas (kJ/mol)")
+    GiEnFo_IG: float = Field(
+        ..., description="Standard Gibbs energy of formation in ideal gas (kJ/mol)")
+    T_ref: float = Field(
+        298.15, description="Reference temperature (K)")
+
+    model_config = ConfigDict(frozen=True)
+
+    def enthalpy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        ΔH (J/mol) from T1 to T2 (K).
+        """
+        return self.heat_capacity.enthalpy_change(T1, T2)
+
+    def entropy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        ΔS (J/mol·K) from T1 to T2 (K).
+        """
+        return self.heat_capacity.entropy_change(T1, T2)
+
+    def enthalpy(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Ideal-gas enthalpy H(T) (J/mol).
+        """
+        return 1e3 * self.EnFo_IG + self.enthalpy_change(self.T_ref, T)
+
+    def entropy(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Ideal-gas entropy S(T) (J/mol·K).
+        """
+        S_ref = 1e3 * (self.EnFo_IG - self.GiEnFo_IG) / self.T_ref
+        return S_ref + self.entropy_change(self.T_ref, T)
+
+    def gibbs_energy(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Ideal-gas Gibbs energy G(T) = H(T) - T S(T) (J/mol).
+        """
+        T = np.asarray(T, dtype=float)
+        return self.enthalpy(T) - T * self.entropy(T)
+
 
 class JobackProp(TypedDict):
     value: float | None
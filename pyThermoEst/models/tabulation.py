@@ -0,0 +1,27 @@
+# import libs
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+
+class GridSpec(BaseModel):
+    """Temperature grid of a tabulated property."""
+    T_min: float = Field(..., gt=0, description="Lowest grid temperature (K)")
+    T_max: float = Field(..., gt=0, description="Highest grid temperature (K)")
+    n_points: int = Field(
+        101, ge=2, description="Initial number of grid points")
+    spacing: Literal['linear', 'inverse'] = Field(
+        'linear', description="Uniform spacing in T ('linear') or in 1/T ('inverse')")
+    tolerance: Optional[float] = Field(
+        None, gt=0, description="Maximum relative interpolation error; enables adaptive refinement")
+    max_points: int = Field(
+        4097, ge=2, description="Upper bound on the refined grid size")
+
+    model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode='after')
+    def _check_range(self) -> "GridSpec":
+        if self.T_max <= self.T_min:
+            raise ValueError("T_max must be greater than T_min.")
+        if self.max_points < self.n_points:
+            raise ValueError("max_points must be at least n_points.")
+        return self
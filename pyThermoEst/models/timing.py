@@ -0,0 +1,10 @@
+# import libs
+from typing import TypedDict
+
+
+class StageTiming(TypedDict):
+    count: int
+    total: float
+    mean: float
+    min: float
+    max: float
@@ -1,8 +1,10 @@
 # import libs
 from typing import Optional, Dict
+import numpy as np
 from pydantic import BaseModel, Field, ConfigDict
 # local
 from .ref import GroupUnit
+from .evaluators import ZabranskyRuzickaCpEvaluator
 
 # SECTION: Zabransky-Ruzicka Group Contributions
 
@@ -341,3 +343,83 @@ class ZabranskyRuzickaGroupData(BaseModel):
     name: str
     count: float
     data: Dict[str, str]
+
+
+class ZabranskyRuzickaHeatCapacity(BaseModel):
+    """Liquid heat capacity Cp/R = A + B (T/100) + D (T/100)² from the aggregated group and correction sums."""
+    A: float = Field(..., description="Aggregated a_i contributions")
+    B: float = Field(..., description="Aggregated b_i contributions")
+    D: float = Field(..., description="Aggregated d_i contributions")
+
+    model_config = ConfigDict(frozen=True)
+
+    def __call__(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Evaluate liquid Cp (J/mol·K) at temperature T (K).
+        """
+        theta = np.asarray(T, dtype=float) / 100
+        return 8.314472 * (self.A + self.B * theta + self.D * theta**2)
+
+    def Cp_LIQ(self, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Alias method if you prefer Cp_LIQ(T) instead of obj(T).
+        """
+        return self(T)
+
+    def to_evaluator(self) -> ZabranskyRuzickaCpEvaluator:
+        """
+        Return the coefficients-only, picklable Cp_LIQ(T) function.
+        """
+        return ZabranskyRuzickaCpEvaluator(A=self.A, B=self.B, D=self.D)
+
+    def enthalpy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        Closed-form liquid ΔH = ∫Cp dT (J/mol) from T1 to T2 (K); arrays broadcast.
+        """
+        T1 = np.asarray(T1, dtype=float)
+        T2 = np.asarray(T2, dtype=float)
+        return 8.314472 * (
+            self.A * (T2 - T1) +
+            self.B * (T2**2 - T1**2) / 200 +
+            self.D * (T2**3 - T1**3) / 3e4
+        )
+
+    def entropy_change(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        Closed-form liquid ΔS = ∫Cp/T dT (J/mol·K) from T1 to T2 (K); arrays broadcast.
+        """
+        T1 = np.asarray(T1, dtype=float)
+        T2 = np.asarray(T2, dtype=float)
+        return 8.314472 * (
+            self.A * np.log(T2 / T1) +
+            self.B * (T2 - T1) / 100 +
+            self.D * (T2**2 - T1**2) / 2e4
+        )
+
+    def H_LIQ(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        Alias of `enthalpy_change`.
+        """
+        return self.enthalpy_change(T1, T2)
+
+    def S_LIQ(
+        self,
+        T1: float | np.ndarray,
+        T2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """
+        Alias of `entropy_change`.
+        """
+        return self.entropy_change(T1, T2)
@@ -0,0 +1,709 @@
+# import libs
+import argparse
+import inspect
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+import numpy as np
+# locals
+from .configs import __version__
+from .core import Antoine, JobackBatch, ZabranskyRuzickaBatch, ParallelEstimator
+from .core.batch import JOBACK_BATCH_PROPERTIES
+from .core.tables import load_joback_table, load_zabransky_ruzicka_tables
+from .models import JobackHeatCapacityBatch, ZabranskyRuzickaHeatCapacityBatch
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class FitFailedError(Exception):
+    '''
+    A well-formed fit request whose fit failed or did not converge (HTTP 422).
+    '''
+
+
+class MicroBatcher:
+    '''
+    Coalesces concurrent single-item requests into one batch call.
+
+    The first queued item opens a collection window of `window` seconds; every item that arrives before the window closes (up to `max_batch_size`) is evaluated together by `fn`, and each caller receives its own result through a future.
+    '''
+
+    def __init__(
+        self,
+        fn: Callable[[List[Any]], List[Any]],
+        window: float = 0.002,
+        max_batch_size: int = 1024,
+        name: str = "batcher",
+    ):
+        '''
+        Initializes the batcher and starts its worker thread.
+
+        Parameters
+        ----------
+        fn : Callable[[List[Any]], List[Any]]
+            Batch function returning one result per item, in order.
+        window : float, optional
+            Collection window in seconds, by default 0.002.
+        max_batch_size : int, optional
+            Maximum items per batch, by default 1024.
+        name : str, optional
+            Thread name, by default "batcher".
+        '''
+        self.fn = fn
+        self.window = float(window)
+        self.max_batch_size = int(max_batch_size)
+        self.name = name
+
+        # NOTE: stats
+        self.batches = 0
+        self.items = 0
+
+        self._queue: "queue.Queue[Optional[Tuple[Any, Future]]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"pythermoest-{name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, item: Any) -> Future:
+        '''
+        Queues an item and returns a future for its result.
+        '''
+        fut: Future = Future()
+        self._queue.put((item, fut))
+        return fut
+
+    def close(self) -> None:
+        '''
+        Stops the worker thread after the queued items are served.
+        '''
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            # NOTE: collect until the window closes or the batch is full
+            batch = [first]
+            deadline = time.perf_counter() + self.window
+            stop = False
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: List[Tuple[Any, Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = list(self.fn(items))
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self.name} returned {len(results)} results for {len(batch)} items.")
+            for (_, fut), res in zip(batch, results):
+                _set_outcome(fut, res)
+        except Exception as e:
+            if len(batch) == 1:
+                _set_exception(batch[0][1], e)
+            else:
+                # NOTE: isolate the failing request(s) from the rest of the batch
+                for item, fut in batch:
+                    try:
+                        res = list(self.fn([item]))
+                        if len(res) != 1:
+                            raise RuntimeError(
+                                f"{self.name} returned {len(res)} results for 1 item.")
+                        _set_outcome(fut, res[0])
+                    except Exception as e_item:
+                        _set_exception(fut, e_item)
+        finally:
+            # NOTE: never leave a caller waiting on an unresolved future
+            for _, fut in batch:
+                _set_exception(fut, RuntimeError(f"{self.name} did not return a result."))
+
+        self.batches += 1
+        self.items += len(batch)
+
+
+def _set_outcome(fut: Future, res: Any) -> None:
+    '''
+    Resolves a future with a result, or fails it when the batch function returned an exception for that item.
+    '''
+    if isinstance(res, BaseException):
+        _set_exception(fut, res)
+    else:
+        _set_result(fut, res)
+
+
+def _set_result(fut: Future, res: Any) -> None:
+    '''
+    Resolves a future unless it is already done (e.g. cancelled after a timeout).
+    '''
+    if not fut.done():
+        fut.set_result(res)
+
+
+def _set_exception(fut: Future, e: BaseException) -> None:
+    '''
+    Fails a future unless it is already done (e.g. cancelled after a timeout).
+    '''
+    if not fut.done():
+        fut.set_exception(e)
+
+
+class LatencyStats:
+    '''
+    Thread-safe request counters and a bounded window of recent latencies.
+    '''
+
+    def __init__(self, window: int = 10000):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self.window = int(window)
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._latencies.setdefault(
+                endpoint, deque(maxlen=self.window)).append(seconds)
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+            if not ok:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            snapshot = {k: np.array(v) for k, v in self._latencies.items()}
+            counts = dict(self._counts)
+            errors = dict(self._errors)
+
+        res: Dict[str, Dict[str, float]] = {}
+        for endpoint, lat in snapshot.items():
+            ms = lat * 1e3
+            res[endpoint] = {
+                "requests": counts.get(endpoint, 0),
+                "errors": errors.get(endpoint, 0),
+                "mean_ms": float(ms.mean()),
+                "p50_ms": float(np.percentile(ms, 50)),
+                "p95_ms": float(np.percentile(ms, 95)),
+                "p99_ms": float(np.percentile(ms, 99)),
+                "max_ms": float(ms.max()),
+            }
+        return res
+
+
+# SECTION: batch functions
+
+# NOTE: options accepted by Antoine.fit_antoine and Antoine.fit_antoine_batch
+_FIT_OPTIONS = set(inspect.signature(Antoine.fit_antoine).parameters) - {"T_data", "P_data"}
+_BATCHED_FIT_OPTIONS = {
+    "batched", "base", "fit_in_log_space", "weights", "bounds", "max_nfev", "min_margin_kelvin"}
+_FIT_LOSSES = {"linear", "soft_l1", "huber", "cauchy", "arctan"}
+
+def _temperature_groups(
+    items: List[Dict[str, Any]],
+) -> Dict[Tuple[float, ...], List[int]]:
+    '''
+    Groups the requests that ask for Cp values by their temperature list.
+    '''
+    groups: Dict[Tuple[float, ...], List[int]] = {}
+    for i, item in enumerate(items):
+        temps = item.get("temperatures")
+        if temps:
+            groups.setdefault(tuple(float(t) for t in temps), []).append(i)
+    return groups
+
+
+def _joback_batch(
+    items: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    '''
+    Evaluates queued Joback requests in one vectorized call.
+    '''
+    counts = JobackBatch.count_matrix([item["groups"] for item in items])
+    atoms = [item["total_atoms_number"] for item in items]
+    props = JobackBatch.calc(counts, atoms)
+
+    out: List[Dict[str, Any]] = []
+    for i, item in enumerate(items):
+        res: Dict[str, Any] = {
+            name: {
+                "value": _json_float(props[name][i]),
+                "unit": unit,
+                "symbol": symbol
+            }
+            for name, (unit, symbol) in JOBACK_BATCH_PROPERTIES.items()
+        }
+        a, b, c, d = (float(props[k][i]) for k in ('a', 'b', 'c', 'd'))
+        res["heat_capacity"] = {
+            "coefficients": {"a": a, "b": b, "c": c, "d": d},
+            "unit": "J/mol·K",
+            "symbol": "Cp_IG"
+        }
+        out.append(res)
+
+    # NOTE: optional Cp evaluation, one call per distinct temperature list
+    for temps, rows in _temperature_groups(items).items():
+        cp = JobackHeatCapacityBatch(
+            **{k: np.asarray(props[k], dtype=float)[rows] for k in ('a', 'b', 'c', 'd')}
+        )(np.asarray(temps))
+        for j, i in enumerate(rows):
+            out[i]["heat_capacity"]["values"] = [_json_float(v) for v in cp[j]]
+    return out
+
+
+def _zabransky_ruzicka_batch(
+    items: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    '''
+    Evaluates queued Zabransky-Ruzicka requests in one vectorized call.
+    '''
+    counts, corrections = ZabranskyRuzickaBatch.count_matrices(
+        [item["group_contributions"] for item in items],
+        [item.get("group_corrections") for item in items],
+    )
+    coeffs = ZabranskyRuzickaBatch.calc(counts, corrections)
+
+    out: List[Dict[str, Any]] = []
+    for i, item in enumerate(items):
+        A, B, D = (float(coeffs[k][i]) for k in ('A', 'B', 'D'))
+        Tmin, Tmax = (float(coeffs[k][i]) for k in ('Tmin', 'Tmax'))
+        out.append({
+            "coefficients": {"A": A, "B": B, "D": D},
+            "validity_range": {"Tmin": _json_float(Tmin), "Tmax": _json_float(Tmax), "unit": "K"},
+            "unit": "J/mol·K",
+            "symbol": "Cp_LIQ"
+        })
+
+    # NOTE: optional Cp evaluation, one call per distinct temperature list
+    for temps, rows in _temperature_groups(items).items():
+        cp_batch = ZabranskyRuzickaHeatCapacityBatch(
+            **{k: np.asarray(coeffs[k], dtype=float)[rows]
+               for k in ('A', 'B', 'D', 'Tmin', 'Tmax')}
+        )
+        T = np.asarray(temps)
+        cp, in_range = cp_batch(T), cp_batch.in_range(T)
+        for j, i in enumerate(rows):
+            out[i]["values"] = [_json_float(v) for v in cp[j]]
+            out[i]["in_range"] = in_range[j].tolist()
+    return out
+
+
+def _antoine_fit_batch(
+    items: List[Dict[str, Any]],
+    estimator: ParallelEstimator,
+) -> List[Dict[str, Any] | FitFailedError]:
+    '''
+    Fits queued Antoine requests, one call per distinct set of options.
+
+    Requests with `"batched": true` in their options are solved together by `Antoine.fit_antoine_batch` and return coefficients, cost and rmse_logP only; the others are sharded over the estimator's worker pool and return the full fit report. A failed fit yields a FitFailedError for its request.
+    '''
+    # NOTE: group requests sharing their options; batched weights stay per request
+    groups: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        options = dict(item.get("options", {}))
+        if options.get("batched"):
+            options.pop("weights", None)
+        groups.setdefault(json.dumps(options, sort_keys=True), []).append(i)
+
+    out: List[Dict[str, Any] | FitFailedError] = [{} for _ in items]
+    for key, idx in groups.items():
+        options = json.loads(key)
+        datasets = [(items[i]["temperatures"], items[i]["pressures"]) for i in idx]
+
+        if options.pop("batched", False):
+            weights = [items[i].get("options", {}).get("weights") for i in idx]
+            fits = Antoine.fit_antoine_batch(
+                datasets,
+                weights=weights if any(w is not None for w in weights) else None,
+                **options
+            )
+            base = str(options.get("base", "log10")).lower()
+            for j, i in enumerate(idx):
+                if not fits["success"][j]:
+                    out[i] = FitFailedError("Batched Antoine fit did not converge.")
+                    continue
+                out[i] = {
+                    "A": float(fits["A"][j]),
+                    "B": float(fits["B"][j]),
+                    "C": float(fits["C"][j]),
+                    "base": base,
+                    "success": True,
+                    "cost": _json_float(fits["cost"][j]),
+                    "rmse_logP": _json_float(fits["rmse_logP"][j]),
+                }
+            continue
+
+        reports = estimator.fit_antoine(datasets, **options)
+        for i, report in zip(idx, reports):
+            if report is None:
+                out[i] = FitFailedError("Antoine fit failed; check the data and options.")
+            elif not report.success:
+                out[i] = FitFailedError(f"Antoine fit did not converge: {report.message}")
+            else:
+                out[i] = report.model_dump(exclude={"multistart"})
+    return out
+
+
+def _json_float(v: Any) -> Optional[float]:
+    '''
+    Converts a NumPy scalar to a JSON-safe float (NaN/inf become null).
+    '''
+    v = float(v)
+    return v if np.isfinite(v) else None
+
+
+class EstimationService:
+    '''
+    Warm estimation service with per-endpoint micro-batching.
+
+    Endpoints (JSON over HTTP):
+
+    - POST /joback: {"groups": {...}, "total_atoms_number": int, "temperatures": [...] (optional)}
+    - POST /zabransky-ruzicka: {"group_contributions": {...}, "group_corrections": {...} (optional), "temperatures": [...] (optional)}
+    - POST /antoine/fit: {"temperatures": [...K], "pressures": [...Pa], "options": {...} (optional, "batched": true for the batched solver)}
+    - POST /antoine/vapor-pressure: {"A", "B", "C", "base" (optional), "temperatures": [...K]}
+    - GET /health, GET /stats
+    '''
+
+    def __init__(
+        self,
+        window: float = 0.002,
+        max_batch_size: int = 1024,
+        timeout: float = 30.0,
+    ):
+        '''
+        Initializes the service, loads the parameter tables and starts the batchers.
+
+        Parameters
+        ----------
+        window : float, optional
+            Micro-batching window in seconds, by default 0.002.
+        max_batch_size : int, optional
+            Maximum requests per batch, by default 1024.
+        timeout : float, optional
+            Seconds a request waits for its batch result, by default 30.0.
+        '''
+        # NOTE: keep tables resident
+        load_joback_table()
+        load_zabransky_ruzicka_tables()
+
+        self.started = time.time()
+        self.timeout = float(timeout)
+        self.stats = LatencyStats()
+        # NOTE: worker pool of the full Antoine fits
+        self.estimator = ParallelEstimator('thread')
+        self.batchers: Dict[str, MicroBatcher] = {
+            "/joback": MicroBatcher(
+                _joback_batch, window, max_batch_size, "joback"),
+            "/zabransky-ruzicka": MicroBatcher(
+                _zabransky_ruzicka_batch, window, max_batch_size, "zabransky-ruzicka"),
+            "/antoine/fit": MicroBatcher(
+                lambda items: _antoine_fit_batch(items, self.estimator),
+                window, max_batch_size, "antoine-fit"),
+        }
+
+    @property
+    def endpoints(self) -> Tuple[str, ...]:
+        return tuple(self.batchers) + ("/antoine/vapor-pressure",)
+
+    def close(self) -> None:
+        for batcher in self.batchers.values():
+            batcher.close()
+        self.estimator.close()
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "version": __version__,
+            "uptime_s": time.time() - self.started,
+            "tables": {
+                "joback": len(load_joback_table().groups),
+                "zabransky_ruzicka": [len(t.groups) for t in load_zabransky_ruzicka_tables()],
+            },
+        }
+
+    def stats_summary(self) -> Dict[str, Any]:
+        return {
+            "latency": self.stats.summary(),
+            "batching": {
+                path: {
+                    "batches": b.batches,
+                    "items": b.items,
+                    "mean_batch_size": (b.items / b.batches) if b.batches else 0.0,
+                }
+                for path, b in self.batchers.items()
+            },
+        }
+
+    def handle(self, path: str, payload: Dict[str, Any]) -> Any:
+        '''
+        Serves a POST request and returns its JSON-serializable result.
+
+        Raises LookupError (not KeyError) for an unknown path and ValueError for a missing or malformed field.
+        '''
+        if path not in self.endpoints:
+            raise LookupError(path)
+
+        # NOTE: validate payload before queueing
+        self._validate(path, payload)
+
+        if path == "/antoine/vapor-pressure":
+            res = Antoine.calc(
+                T_value=np.asarray(payload["temperatures"], dtype=float),
+                T_unit="K",
+                A=float(payload["A"]),
+                B=float(payload["B"]),
+                C=float(payload["C"]),
+                base=str(payload.get("base", "log10")),
+            )
+            if res is None:
+                raise ValueError("Vapor pressure calculation failed.")
+            return {
+                "vapor_pressure": [_json_float(v) for v in np.atleast_1d(res["vapor_pressure"])],
+                "unit": "Pa",
+            }
+
+        fut = self.batchers[path].submit(payload)
+        try:
+            return fut.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            fut.cancel()
+            raise TimeoutError(f"No result for {path} within {self.timeout} s.")
+
+    @staticmethod
+    def _validate(path: str, payload: Dict[str, Any]) -> None:
+        '''
+        Raises ValueError for missing or malformed payload fields.
+        '''
+        if path == "/antoine/vapor-pressure":
+            for key in ("A", "B", "C"):
+                if not isinstance(payload.get(key), (int, float)):
+                    raise ValueError(f"'{key}' must be a number.")
+            if not isinstance(payload.get("temperatures"), (list, int, float)):
+                raise ValueError("'temperatures' must be a number or a list.")
+        elif path == "/joback":
+            if not isinstance(payload.get("groups"), dict):
+                raise ValueError("'groups' must be an object.")
+            _validate_counts("groups", payload["groups"])
+            if not isinstance(payload.get("total_atoms_number"), (int, float)):
+                raise ValueError("'total_atoms_number' must be a number.")
+            if not isinstance(payload.get("temperatures", []), list):
+                raise ValueError("'temperatures' must be a list.")
+        elif path == "/zabransky-ruzicka":
+            if not isinstance(payload.get("group_contributions"), dict):
+                raise ValueError("'group_contributions' must be an object.")
+            _validate_counts("group_contributions", payload["group_contributions"])
+            corr = payload.get("group_corrections")
+            if corr is not None and not isinstance(corr, dict):
+                raise ValueError("'group_corrections' must be an object.")
+            if corr is not None:
+                _validate_counts("group_corrections", corr)
+            if not isinstance(payload.get("temperatures", []), list):
+                raise ValueError("'temperatures' must be a list.")
+        elif path == "/antoine/fit":
+            if not isinstance(payload.get("temperatures"), list) or \
+                    not isinstance(payload.get("pressures"), list):
+                raise ValueError(
+                    "'temperatures' and 'pressures' must be lists.")
+            options = payload.get("options", {})
+            if not isinstance(options, dict):
+                raise ValueError("'options' must be an object.")
+            if options.get("batched"):
+                unknown = set(options) - _BATCHED_FIT_OPTIONS
+                if unknown:
+                    raise ValueError(
+                        f"Options {sorted(unknown)} are not supported with 'batched'.")
+            else:
+                unknown = set(options) - _FIT_OPTIONS - {"batched"}
+                if unknown:
+                    raise ValueError(
+                        f"Unknown options {sorted(unknown)}; choose from {sorted(_FIT_OPTIONS)}.")
+            if str(options.get("base", "log10")).lower() not in ("log10", "ln"):
+                raise ValueError("'base' must be 'log10' or 'ln'.")
+            if str(options.get("loss", "linear")).lower() not in _FIT_LOSSES:
+                raise ValueError(f"'loss' must be one of {sorted(_FIT_LOSSES)}.")
+
+
+def _validate_counts(field: str, groups: Dict[str, Any]) -> None:
+    '''
+    Raises ValueError unless every group count is a finite number.
+    '''
+    for name, value in groups.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)) \
+                or not np.isfinite(value):
+            raise ValueError(
+                f"'{field}' count for group '{name}' must be a finite number, got {value!r}.")
+
+
+class _EstimationHTTPServer(ThreadingHTTPServer):
+    # NOTE: bursts of concurrent clients are the point of micro-batching
+    request_queue_size = 256
+    daemon_threads = True
+
+
+def _make_handler(service: EstimationService) -> type:
+    '''
+    Builds a request handler bound to a service instance.
+    '''
+    class Handler(BaseHTTPRequestHandler):
+        server_version = f"pyThermoEst/{__version__}"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format, *args)
+
+        def _send(self, status: int, body: Any) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._send(200, service.health())
+            elif self.path == "/stats":
+                self._send(200, service.stats_summary())
+            else:
+                self._send(404, {"error": f"Unknown endpoint: {self.path}"})
+
+        def do_POST(self) -> None:
+            t0 = time.perf_counter()
+            ok = False
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(payload, dict):
+                    raise ValueError("Request body must be a JSON object.")
+                result = service.handle(self.path, payload)
+                ok = True
+                self._send(200, result)
+            except LookupError as e:
+                # NOTE: KeyError is a missing field deeper in a request, not an unknown path
+                if isinstance(e, KeyError):
+                    self._send(400, {"error": f"Missing field: {e}"})
+                else:
+                    self._send(404, {"error": f"Unknown endpoint: {self.path}"})
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+            except FitFailedError as e:
+                self._send(422, {"error": str(e)})
+            except TimeoutError as e:
+                self._send(504, {"error": str(e)})
+            except Exception as e:
+                logger.exception(f"Request failed: {e}")
+                self._send(500, {"error": str(e)})
+            finally:
+                # NOTE: unknown paths share one bucket to keep the stats bounded
+                endpoint = self.path if self.path in service.endpoints else "other"
+                service.stats.record(
+                    endpoint, time.perf_counter() - t0, ok)
+
+    return Handler
+
+
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    window: float = 0.002,
+    max_batch_size: int = 1024,
+    timeout: float = 30.0,
+) -> Tuple[ThreadingHTTPServer, EstimationService]:
+    '''
+    Creates the HTTP server and its estimation service without starting it.
+
+    Parameters
+    ----------
+    host : str, optional
+        Bind address, by default "127.0.0.1".
+    port : int, optional
+        Bind port, by default 8765 (0 picks a free port).
+    window : float, optional
+        Micro-batching window in seconds, by default 0.002.
+    max_batch_size : int, optional
+        Maximum requests per batch, by default 1024.
+    timeout : float, optional
+        Seconds a request waits for its batch result, by default 30.0.
+
+    Returns
+    -------
+    Tuple[ThreadingHTTPServer, EstimationService]
+        Server and service; call `server.serve_forever()` to start and `service.close()` after shutdown.
+    '''
+    service = EstimationService(
+        window=window, max_batch_size=max_batch_size, timeout=timeout)
+    server = _EstimationHTTPServer((host, port), _make_handler(service))
+    return server, service
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    window: float = 0.002,
+    max_batch_size: int = 1024,
+    timeout: float = 30.0,
+) -> None:
+    '''
+    Runs the estimation service until interrupted.
+
+    Parameters
+    ----------
+    host : str, optional
+        Bind address, by default "127.0.0.1".
+    port : int, optional
+        Bind port, by default 8765.
+    window : float, optional
+        Micro-batching window in seconds, by default 0.002.
+    max_batch_size : int, optional
+        Maximum requests per batch, by default 1024.
+    timeout : float, optional
+        Seconds a request waits for its batch result, by default 30.0.
+    '''
+    server, service = create_server(
+        host, port, window, max_batch_size, timeout)
+    logger.info(f"pyThermoEst service listening on {host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="pyThermoEst estimation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    serve(args.host, args.port, args.window_ms / 1e3,
+          args.max_batch_size, args.timeout)
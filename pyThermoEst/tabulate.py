@@ -0,0 +1,378 @@
+# import libs
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from pydantic import BaseModel
+# locals
+from .configs import __version__
+from .models import (
+    GridSpec,
+    JobackHeatCapacityBatch,
+    ZabranskyRuzickaHeatCapacityBatch,
+    AntoineVaporPressureBatch,
+)
+from .core.batch import split_rows
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: index file name and format version
+INDEX_FILE = 'index.json'
+FORMAT_VERSION = 1
+
+# NOTE: supported evaluators (type: (symbol, unit, x space, y space))
+# Psat is interpolated as ln(P) against 1/T, where the Antoine equation is nearly linear
+TABULATED_EVALUATORS: Dict[type, Tuple[str, str, str, str]] = {
+    JobackHeatCapacityBatch: ('Cp_IG', 'J/mol·K', 'linear', 'linear'),
+    ZabranskyRuzickaHeatCapacityBatch: ('Cp_LIQ', 'J/mol·K', 'linear', 'linear'),
+    AntoineVaporPressureBatch: ('Psat', 'Pa', 'inverse', 'log'),
+}
+
+
+# SECTION: helpers
+
+def _x(T: np.ndarray, space: str) -> np.ndarray:
+    '''
+    Maps temperatures to the ascending interpolation variable.
+    '''
+    return -1.0 / T if space == 'inverse' else T
+
+
+def _y(values: np.ndarray, space: str) -> np.ndarray:
+    if space == 'log':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.log(values)
+    return values
+
+
+def _y_inv(values: np.ndarray, space: str) -> np.ndarray:
+    return np.exp(values) if space == 'log' else values
+
+
+def _initial_grid(grid: GridSpec) -> np.ndarray:
+    '''
+    Builds the uniform starting grid.
+    '''
+    if grid.spacing == 'inverse':
+        return np.sort(1.0 / np.linspace(1.0 / grid.T_min, 1.0 / grid.T_max, grid.n_points))
+    return np.linspace(grid.T_min, grid.T_max, grid.n_points)
+
+
+def _take_rows(evaluator: BaseModel, rows: slice) -> BaseModel:
+    '''
+    Returns the evaluator restricted to a block of rows.
+    '''
+    return type(evaluator)(**{
+        k: (v[rows] if isinstance(v, np.ndarray) else v)
+        for k, v in evaluator
+    })
+
+
+def _n_rows(evaluator: BaseModel) -> int:
+    for _, v in evaluator:
+        if isinstance(v, np.ndarray):
+            return v.shape[0]
+    raise ValueError("Evaluator holds no coefficient arrays.")
+
+
+def _nanmax_rows(rel: np.ndarray) -> np.ndarray:
+    '''
+    Column-wise maximum ignoring non-finite entries.
+    '''
+    rel = np.where(np.isfinite(rel), rel, -np.inf)
+    return np.maximum(rel.max(axis=0), 0.0)
+
+
+def _refine_grid(
+    evaluator: BaseModel,
+    grid: GridSpec,
+    x_space: str,
+    y_space: str,
+    chunk_size: int,
+) -> Tuple[np.ndarray, Optional[float]]:
+    '''
+    Refines the grid until linear interpolation meets the tolerance.
+
+    Every interval whose midpoint (taken in the interpolation variable) deviates by more than `grid.tolerance` for any compound is split, until no interval fails or `grid.max_points` would be exceeded.
+
+    Returns
+    -------
+    T : np.ndarray
+        Grid temperatures (K), ascending.
+    max_rel_error : float | None
+        Largest relative midpoint error of the final grid, None without tolerance.
+    '''
+    T = _initial_grid(grid)
+    if grid.tolerance is None:
+        return T, None
+
+    n_rows = _n_rows(evaluator)
+    while True:
+        # NOTE: midpoints in the interpolation variable
+        x = _x(T, x_space)
+        x_mid = (x[:-1] + x[1:]) / 2
+        T_mid = -1.0 / x_mid if x_space == 'inverse' else x_mid
+
+        err = np.zeros(T_mid.size)
+        for rows in split_rows(n_rows, chunk_size):
+            block = _take_rows(evaluator, rows)
+            y_nodes = _y(block(T), y_space)
+            exact = block(T_mid)
+            approx = _y_inv((y_nodes[:, :-1] + y_nodes[:, 1:]) / 2, y_space)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rel = np.abs(approx - exact) / np.maximum(np.abs(exact), 1e-300)
+            if rel.size:
+                err = np.maximum(err, _nanmax_rows(rel))
+
+        bad = err > grid.tolerance
+        if not bad.any():
+            return T, float(err.max(initial=0.0))
+        if T.size + int(bad.sum()) > grid.max_points:
+            logger.warning(
+                f"Grid refinement stopped at {T.size} points "
+                f"(max relative error {err.max():.3g} > {grid.tolerance:g}).")
+            return T, float(err.max())
+        T = np.sort(np.concatenate([T, T_mid[bad]]))
+
+
+# SECTION: writer
+
+def tabulate(
+    out_dir: str | Path,
+    properties: Dict[str, BaseModel],
+    grid: GridSpec | Dict[str, GridSpec],
+    ids: Optional[Sequence[Any]] = None,
+    chunk_size: int = 4096,
+) -> Dict[str, Any]:
+    '''
+    Tabulates vectorized property functions on temperature grids.
+
+    Parameters
+    ----------
+    out_dir : str | Path
+        Output directory; created if missing.
+    properties : Dict[str, BaseModel]
+        Table name to batch evaluator, e.g. the 'heat_capacity' value of `joback_batch_calc`, the value of `zabransky_ruzicka_batch_calc` or an `AntoineVaporPressureBatch`. All evaluators must hold the same number of compounds.
+    grid : GridSpec | Dict[str, GridSpec]
+        Grid for every table, or one grid per table name.
+    ids : Sequence[Any], optional
+        Compound identifiers stored in the index, by default None.
+    chunk_size : int, optional
+        Compounds evaluated and written per chunk, by default 4096.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The index written to `out_dir/index.json`.
+
+    Notes
+    -----
+    Each table is stored as `<name>.npy`, an (N × N_T) float64 array written through a memory map, with its grid in `<name>.T.npy`. The index is written last, so an interrupted run leaves no index.
+    '''
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if not properties:
+        raise ValueError("No properties to tabulate.")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # NOTE: check evaluators
+    n_compounds: Optional[int] = None
+    for name, evaluator in properties.items():
+        if type(evaluator) not in TABULATED_EVALUATORS:
+            raise TypeError(
+                f"Unsupported evaluator for '{name}': {type(evaluator).__name__}.")
+        n = _n_rows(evaluator)
+        if n_compounds is not None and n != n_compounds:
+            raise ValueError("All evaluators must hold the same number of compounds.")
+        n_compounds = n
+
+    if ids is not None and len(ids) != n_compounds:
+        raise ValueError("ids must have one entry per compound.")
+
+    index: Dict[str, Any] = {
+        'format_version': FORMAT_VERSION,
+        'pythermoest_version': __version__,
+        'n_compounds': n_compounds,
+        'ids': None if ids is None else [str(i) for i in ids],
+        'properties': {},
+    }
+
+    for name, evaluator in properties.items():
+        spec = grid[name] if isinstance(grid, dict) else grid
+        symbol, unit, x_space, y_space = TABULATED_EVALUATORS[type(evaluator)]
+
+        # SECTION: grid
+        T, max_rel_error = _refine_grid(
+            evaluator, spec, x_space, y_space, chunk_size)
+
+        # SECTION: values, chunk by chunk
+        table_file, grid_file = f"{name}.npy", f"{name}.T.npy"
+        table = np.lib.format.open_memmap(
+            out_dir / table_file, mode='w+', dtype=np.float64,
+            shape=(n_compounds, T.size))
+        for rows in split_rows(n_compounds, chunk_size):
+            table[rows] = _take_rows(evaluator, rows)(T)
+        table.flush()
+        del table
+        np.save(out_dir / grid_file, T)
+
+        index['properties'][name] = {
+            'file': table_file,
+            'grid_file': grid_file,
+            'symbol': symbol,
+            'unit': unit,
+            'shape': [n_compounds, int(T.size)],
+            'T_min': float(T[0]),
+            'T_max': float(T[-1]),
+            'interpolation': {'x': x_space, 'y': y_space},
+            'tolerance': spec.tolerance,
+            'max_rel_error': max_rel_error,
+        }
+
+    # NOTE: index last
+    with open(out_dir / INDEX_FILE, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+
+    return index
+
+
+# SECTION: reader
+
+class TabulatedProperties:
+    '''
+    Memory-mapped reader of tables written by `tabulate`.
+
+    Tables are opened read-only with `mmap_mode='r'`, so start-up cost is independent of the library size; values are interpolated linearly in the space recorded in the index (ln P against 1/T for vapor pressure).
+    '''
+
+    def __init__(self, path: str | Path):
+        '''
+        Opens a tabulation directory.
+
+        Parameters
+        ----------
+        path : str | Path
+            Directory that holds `index.json`.
+        '''
+        self.path = Path(path)
+        with open(self.path / INDEX_FILE, 'r', encoding='utf-8') as f:
+            self.index: Dict[str, Any] = json.load(f)
+
+        if self.index.get('format_version') != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported tabulation format: {self.index.get('format_version')}.")
+
+        self._tables: Dict[str, np.ndarray] = {}
+        self._grids: Dict[str, np.ndarray] = {}
+        self._x: Dict[str, np.ndarray] = {}
+        for name, info in self.index['properties'].items():
+            self._tables[name] = np.load(self.path / info['file'], mmap_mode='r')
+            self._grids[name] = np.load(self.path / info['grid_file'])
+            self._x[name] = _x(self._grids[name], info['interpolation']['x'])
+
+        ids = self.index.get('ids')
+        self._row_of: Dict[str, int] = {} if ids is None else \
+            {i: k for k, i in enumerate(ids)}
+
+    def __repr__(self) -> str:
+        return f"TabulatedProperties(path={str(self.path)!r}, properties={self.names})"
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.index['properties'])
+
+    @property
+    def n_compounds(self) -> int:
+        return int(self.index['n_compounds'])
+
+    @property
+    def ids(self) -> Optional[List[str]]:
+        return self.index.get('ids')
+
+    def grid(self, name: str) -> np.ndarray:
+        '''
+        Returns the grid temperatures (K) of a table.
+        '''
+        return self._grids[name]
+
+    def table(self, name: str) -> np.ndarray:
+        '''
+        Returns the read-only (N × N_T) memory-mapped table.
+        '''
+        return self._tables[name]
+
+    def rows(self, ids: Sequence[Any]) -> np.ndarray:
+        '''
+        Returns the row numbers of compound identifiers.
+        '''
+        try:
+            return np.array([self._row_of[str(i)] for i in ids], dtype=np.intp)
+        except KeyError as e:
+            raise KeyError(f"Unknown compound id: {e.args[0]}")
+
+    def interpolate(
+        self,
+        name: str,
+        T: float | np.ndarray,
+        rows: Optional[Sequence[int] | np.ndarray | slice] = None,
+        pairwise: bool = False,
+        extrapolate: bool = False,
+    ) -> np.ndarray:
+        '''
+        Interpolates a table at arbitrary temperatures.
+
+        Parameters
+        ----------
+        name : str
+            Table name.
+        T : float | np.ndarray
+            Temperatures (K).
+        rows : Sequence[int] | np.ndarray | slice, optional
+            Compound rows, by default all compounds.
+        pairwise : bool, optional
+            If True, T holds one temperature per selected row and the result has shape (n_rows,), by default False.
+        extrapolate : bool, optional
+            Extend the end segments beyond the grid instead of returning NaN, by default False.
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated values of shape (n_rows, *T.shape), or (n_rows,) when pairwise.
+        '''
+        info = self.index['properties'][name]
+        x_space, y_space = info['interpolation']['x'], info['interpolation']['y']
+        table, xs = self._tables[name], self._x[name]
+
+        if rows is None:
+            rows = slice(None)
+        elif not isinstance(rows, slice):
+            rows = np.asarray(rows, dtype=np.intp)
+
+        T = np.asarray(T, dtype=float)
+        x = _x(T, x_space)
+
+        # NOTE: bracketing interval and weight
+        i = np.clip(np.searchsorted(xs, x, side='right'), 1, xs.size - 1)
+        w = (x - xs[i - 1]) / (xs[i] - xs[i - 1])
+
+        if pairwise:
+            r = np.arange(self.n_compounds)[rows]
+            if T.shape != r.shape:
+                raise ValueError("pairwise T must have one value per row.")
+            y0, y1 = table[r, i - 1], table[r, i]
+        else:
+            block = table[rows]
+            flat = i.ravel()
+            y0 = block[:, flat - 1].reshape((-1,) + T.shape)
+            y1 = block[:, flat].reshape((-1,) + T.shape)
+
+        values = _y_inv((1 - w) * _y(y0, y_space) + w * _y(y1, y_space), y_space)
+
+        if not extrapolate:
+            outside = (T < self._grids[name][0]) | (T > self._grids[name][-1])
+            values = np.where(outside, np.nan, values)
+        return values
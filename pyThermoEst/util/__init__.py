@@ -1,7 +1,19 @@
 from .tools import ReferenceLoader
 from .unit_tools import normalize_unit
+from .timing import (
+    stage,
+    add_stage_callback,
+    remove_stage_callback,
+    record_stages,
+    StageRecorder,
+)
 
 __all__ = [
     'ReferenceLoader',
     'normalize_unit',
+    'stage',
+    'add_stage_callback',
+    'remove_stage_callback',
+    'record_stages',
+    'StageRecorder',
 ]
@@ -0,0 +1,190 @@
+# import libs
+import logging
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator, Tuple
+# locals
+from ..models import StageTiming
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: registered stage callbacks; the tuple is replaced, never mutated, so readers need no lock
+_callbacks: Tuple[Callable[[str, float], None], ...] = ()
+_callbacks_lock = threading.Lock()
+
+
+class _NullStage:
+    '''
+    Shared no-op stage returned while no callback is registered.
+    '''
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    '''
+    Times one stage and reports it to every registered callback.
+    '''
+    __slots__ = ('name', 't0')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.t0 = 0.0
+
+    def __enter__(self) -> "_Stage":
+        self.t0 = perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        elapsed = perf_counter() - self.t0
+        for callback in _callbacks:
+            try:
+                callback(self.name, elapsed)
+            except Exception as e:
+                # ! instrumentation must never break an estimate
+                logger.error(f"Stage callback failed for '{self.name}': {e}")
+        return False
+
+
+def stage(name: str) -> _Stage | _NullStage:
+    '''
+    Returns a context manager that times one estimator stage.
+
+    Parameters
+    ----------
+    name : str
+        Stage name, e.g. 'joback.sigma'.
+
+    Returns
+    -------
+    _Stage | _NullStage
+        A timing context while any callback is registered, otherwise a shared no-op context.
+
+    Notes
+    -----
+    With no callback registered the cost is one function call and one tuple truth test.
+    '''
+    return _Stage(name) if _callbacks else _NULL_STAGE
+
+
+def add_stage_callback(
+    callback: Callable[[str, float], None],
+) -> Callable[[str, float], None]:
+    '''
+    Registers a callback called as callback(stage_name, seconds) after each timed stage.
+
+    Parameters
+    ----------
+    callback : Callable[[str, float], None]
+        Callback, called from the thread that ran the stage.
+
+    Returns
+    -------
+    callback : Callable[[str, float], None]
+        The registered callback, so the function can be used as a decorator.
+    '''
+    global _callbacks
+    with _callbacks_lock:
+        _callbacks = _callbacks + (callback,)
+    return callback
+
+
+def remove_stage_callback(
+    callback: Callable[[str, float], None],
+) -> None:
+    '''
+    Unregisters a stage callback; unknown callbacks are ignored.
+
+    Parameters
+    ----------
+    callback : Callable[[str, float], None]
+        Callback registered with `add_stage_callback`.
+    '''
+    global _callbacks
+    with _callbacks_lock:
+        callbacks = list(_callbacks)
+        if callback in callbacks:
+            callbacks.remove(callback)
+        _callbacks = tuple(callbacks)
+
+
+class StageRecorder:
+    '''
+    Aggregates stage timings (count, total, min, max) reported by the estimators.
+
+    An instance is a stage callback; it is safe to share between threads.
+    '''
+
+    def __init__(self):
+        self._stats: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, name: str, seconds: float) -> None:
+        with self._lock:
+            s = self._stats.get(name)
+            if s is None:
+                self._stats[name] = [1, seconds, seconds, seconds]
+            else:
+                s[0] += 1
+                s[1] += seconds
+                if seconds < s[2]:
+                    s[2] = seconds
+                if seconds > s[3]:
+                    s[3] = seconds
+
+    def summary(self) -> Dict[str, StageTiming]:
+        '''
+        Returns the timings of every stage seen so far.
+
+        Returns
+        -------
+        Dict[str, StageTiming]
+            Call count, total, mean, min and max time in seconds, keyed by stage name.
+        '''
+        with self._lock:
+            return {
+                name: StageTiming(
+                    count=n, total=total, mean=total / n, min=t_min, max=t_max)
+                for name, (n, total, t_min, t_max) in sorted(self._stats.items())
+            }
+
+    def reset(self) -> None:
+        '''
+        Clears all recorded timings.
+        '''
+        with self._lock:
+            self._stats.clear()
+
+
+@contextmanager
+def record_stages() -> Iterator[StageRecorder]:
+    '''
+    Records the stage timings of every estimator call made while the block is active.
+
+    Yields
+    ------
+    StageRecorder
+        Recorder holding the aggregated timings, readable during and after the block.
+
+    Examples
+    --------
+    >>> with record_stages() as rec:
+    ...     joback_calc(groups, total_atoms_number=9)
+    >>> rec.summary()['joback.sigma']['mean']
+    '''
+    recorder = StageRecorder()
+    add_stage_callback(recorder)
+    try:
+        yield recorder
+    finally:
+        remove_stage_callback(recorder)